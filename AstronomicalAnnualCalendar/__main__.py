@@ -1,11 +1,16 @@
+# standard library
+from contextlib import suppress
+from pathlib import Path
+
 # third party
 import click
 
 # first party
-from AstronomicalAnnualCalendar.enums import ObservableObjectEnum
+from AstronomicalAnnualCalendar.enums import ObservableObjectEnum, OutputFormatEnum
+from AstronomicalAnnualCalendar.models import DataModel, ObservableObjectModel
 
 
-def main():  # noqa: D103
+def _print_debug_output() -> None:
     click.secho("Not implemented yet...", err=True, fg="red")
     click.secho(
         f"Debug output:"
@@ -44,5 +49,287 @@ def main():  # noqa: D103
     )
 
 
+@click.group(invoke_without_command=True)
+@click.pass_context
+def main(ctx: click.Context):  # noqa: D103
+    if ctx.invoked_subcommand is None:
+        _print_debug_output()
+
+
+def _parse_tolerances(ctx: click.Context, param: click.Parameter, values: tuple[str, ...]) -> dict[str, float]:
+    tolerances: dict[str, float] = {}
+    for value in values:
+        field, _, tolerance = value.partition("=")
+        try:
+            tolerances[field.strip()] = float(tolerance)
+        except ValueError:
+            message = f"expected FIELD=VALUE, got {value!r}"
+            raise click.BadParameter(message, ctx=ctx, param=param) from None
+    return tolerances
+
+
+def _parse_objects(
+    ctx: click.Context, param: click.Parameter, values: tuple[str, ...]
+) -> list[ObservableObjectModel] | None:
+    # first party
+    from AstronomicalAnnualCalendar.errors import AliasNotAssignedError
+    from AstronomicalAnnualCalendar.utils import observable_object_from_alias
+
+    try:
+        return [observable_object_from_alias(value) for value in values] or None
+    except AliasNotAssignedError as error:
+        raise click.BadParameter(str(error), ctx=ctx, param=param) from None
+
+
+@main.command()
+@click.argument("left", type=click.Path(exists=True, dir_okay=False, allow_dash=True, path_type=Path))
+@click.argument("right", type=click.Path(exists=True, dir_okay=False, allow_dash=True, path_type=Path))
+@click.option(
+    "--tolerance",
+    "-t",
+    "tolerances",
+    multiple=True,
+    callback=_parse_tolerances,
+    metavar="FIELD=VALUE",
+    help="Override the tolerance of a column (hours for times and right ascension, degrees for angles).",
+)
+@click.option(
+    "--object",
+    "-o",
+    "objects",
+    multiple=True,
+    callback=_parse_objects,
+    metavar="NAME",
+    help="Only compare these objects.",
+)
+def diff(left: Path, right: Path, tolerances: dict[str, float], objects: list[ObservableObjectModel] | None):
+    """Compare two exports object by object and timestamp by timestamp; either may be - to read stdin."""
+    # first party
+    from AstronomicalAnnualCalendar.diff import diff_datasets
+    from AstronomicalAnnualCalendar.errors import SectionNotFoundError
+    from AstronomicalAnnualCalendar.parser import Parser
+
+    if left == right == Path("-"):
+        message = "only one side can be read from stdin"
+        raise click.UsageError(message)
+    left_parser, right_parser = (
+        Parser.from_stdin() if path == Path("-") else Parser(file_path=path) for path in (left, right)
+    )
+
+    def parse(parser: Parser) -> dict[ObservableObjectModel, DataModel]:
+        if objects is None:
+            return parser.parse()
+        data: dict[ObservableObjectModel, DataModel] = {}
+        for observable_object in objects:
+            with suppress(SectionNotFoundError):  # reported as "only in left/right"
+                data |= parser.parse([observable_object])
+        return data
+
+    left_data, right_data = parse(left_parser), parse(right_parser)
+    for side, parser in (("left", left_parser), ("right", right_parser)):
+        click.echo(
+            f"{side}: {parser.file or "<stdin>"} "
+            f"({parser.metadata.place}, DeltaT = {parser.metadata.delta_t.total_seconds()} s)"
+        )
+
+    result = diff_datasets(left_data, right_data, tolerances=tolerances)
+    for observable_object in sorted(result.only_left | result.only_right, key=lambda oo: oo.name):
+        side = "left" if observable_object in result.only_left else "right"
+        click.secho(f"{observable_object.name}: only in {side}", fg="yellow")
+    for observable_object, object_diff in result.objects.items():
+        click.secho(
+            f"{observable_object.name}: {object_diff.aligned} aligned rows, {object_diff.only_left.size} only left, "
+            f"{object_diff.only_right.size} only right",
+            bold=True,
+            fg="green" if object_diff.ok else "red",
+        )
+        for field in sorted(object_diff.columns_only_left | object_diff.columns_only_right):
+            side = "left" if field in object_diff.columns_only_left else "right"
+            click.secho(f"  {field}: only in {side}", fg="yellow")
+        for column in object_diff.columns.values():
+            click.secho(
+                f"  {column.field:<20} max {column.max:<12.6g} rms {column.rms:<12.6g} tol {column.tolerance:<10.4g}"
+                f" exceeding {column.exceeding.size:>4} missing {column.missing.size:>4}",
+                fg=None if column.ok else "red",
+            )
+    raise SystemExit(0 if result.ok else 1)
+
+
+@main.command()
+@click.argument("directory", type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.option("--host", "-h", default="127.0.0.1", show_default=True, help="Address to listen on.")
+@click.option("--port", "-p", default=8000, show_default=True, help="Port to listen on.")
+@click.option("--workers", "-w", default=8, show_default=True, help="Number of threads handling requests.")
+@click.option("--datasets", default=32, show_default=True, help="Number of parsed exports kept in memory.")
+@click.option("--renders", default=64, show_default=True, help="Number of rendered images kept in memory.")
+@click.option(
+    "--idle-timeout", default=15.0, show_default=True, help="Seconds after which an idle connection gets closed."
+)
+def serve(directory: Path, host: str, port: int, workers: int, datasets: int, renders: int, idle_timeout: float):
+    """Serve the exports of DIRECTORY as JSON and rendered calendars over HTTP."""
+    # first party
+    from AstronomicalAnnualCalendar.serve import CalendarServer
+
+    server = CalendarServer(
+        (host, port), directory, workers=workers, datasets=datasets, renders=renders, idle_timeout=idle_timeout
+    )
+    click.secho(f"Serving {server.directory} on http://{host}:{server.server_address[1]}/", fg="green")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+@main.command()
+@click.argument("files", nargs=-1, required=True, type=click.Path(dir_okay=False, path_type=Path))
+@click.option(
+    "--output",
+    "-o",
+    default=Path(),
+    show_default=True,
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Directory to render the calendars (<file stem>.png) into.",
+)
+@click.option("--interval", default=0.2, show_default=True, help="Seconds between two polls.")
+@click.option("--debounce", default=0.3, show_default=True, help="Seconds without writes before re-rendering.")
+@click.option("--width", default=1200, show_default=True, help="Width of the calendars in pixels.")
+@click.option("--height", default=1600, show_default=True, help="Height of the calendars in pixels.")
+def watch(files: tuple[Path, ...], output: Path, interval: float, debounce: float, width: int, height: int):
+    """Re-render the calendars of FILES whenever they change."""
+    # standard library
+    from datetime import timedelta
+
+    # first party
+    from AstronomicalAnnualCalendar.watch import CycleReportModel, Watcher
+
+    def report(cycle: CycleReportModel) -> None:
+        for path, names in cycle.parsed.items():
+            click.echo(f"{path.name}: re-parsed {", ".join(names) if names else "nothing"}")
+        for path, error in cycle.errors.items():
+            click.secho(f"{path.name}: not updated, {error}", fg="red", err=True)
+        click.secho(
+            f"rendered {len(cycle.outputs)} output(s); parse {cycle.parse_time.total_seconds() * 1000:.0f} ms,"
+            f" render {cycle.render_time.total_seconds() * 1000:.0f} ms,"
+            f" save to preview {cycle.latency.total_seconds() * 1000:.0f} ms",
+            fg="green",
+        )
+
+    watcher = Watcher(
+        files,
+        output,
+        canvas={"width": width, "height": height},
+        interval=timedelta(seconds=interval),
+        debounce=timedelta(seconds=debounce),
+    )
+    with suppress(KeyboardInterrupt):
+        watcher.run(report)
+
+
+@main.command()
+@click.argument("queue", type=click.Path(dir_okay=False, path_type=Path))
+@click.argument("files", nargs=-1, type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option("--year", "-y", "years", multiple=True, type=int, help="Year to produce the calendars for.")
+@click.option(
+    "--format",
+    "-f",
+    "formats",
+    multiple=True,
+    default=(OutputFormatEnum.PNG.value,),
+    show_default=True,
+    type=click.Choice([output_format.value for output_format in OutputFormatEnum]),
+    help="Format to produce the calendars in.",
+)
+@click.option(
+    "--output",
+    "-o",
+    default=Path(),
+    show_default=True,
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Directory to produce the calendars (<file stem>-<path digest>-<year>.<format>) in.",
+)
+@click.option("--workers", "-w", default=1, show_default=True, help="Number of worker processes on this host.")
+@click.option("--lease", default=600, show_default=True, help="Seconds until the job of a silent worker gets retried.")
+@click.option("--max-attempts", default=3, show_default=True, help="Number of times a job gets claimed at most.")
+@click.option("--retry-failed", is_flag=True, help="Retry the jobs which failed before.")
+@click.option("--width", default=1200, show_default=True, help="Width of the calendars in pixels.")
+@click.option("--height", default=1600, show_default=True, help="Height of the calendars in pixels.")
+def batch(
+    queue: Path,
+    files: tuple[Path, ...],
+    years: tuple[int, ...],
+    formats: tuple[str, ...],
+    output: Path,
+    workers: int,
+    lease: float,
+    max_attempts: int,
+    retry_failed: bool,  # noqa: FBT001
+    width: int,
+    height: int,
+):
+    """
+    Produce the calendars of FILES for every year and format with the job queue QUEUE.
+
+    Jobs done before get skipped, so an interrupted batch continues where it stopped. Further workers (e.g. on other
+    hosts sharing the file system) join a batch by running this command on QUEUE without FILES.
+    """
+    # standard library
+    from datetime import timedelta
+
+    # first party
+    from AstronomicalAnnualCalendar.batch import BatchProgressModel, JobQueue, add_jobs, run_workers
+    from AstronomicalAnnualCalendar.enums import JobStateEnum
+
+    if files and not years:
+        message = "at least one --year is required to add FILES"
+        raise click.UsageError(message)
+    job_queue = JobQueue(queue, max_attempts=max_attempts)
+    if retry_failed:
+        click.echo(f"retrying {job_queue.retry_failed()} failed job(s)")
+    jobs = add_jobs(job_queue, files, years, formats, output, width=width, height=height)
+    if skipped := sum(job.state == JobStateEnum.DONE for job in jobs):
+        click.echo(f"skipping {skipped} job(s) done before")
+
+    def report(progress: BatchProgressModel) -> None:
+        click.echo(
+            f"{progress.done + progress.failed}/{progress.total} finished: {progress.done} done,"
+            f" {progress.failed} failed, {progress.running} running, {progress.pending} pending"
+        )
+
+    progress = run_workers(job_queue, workers, lease=timedelta(seconds=lease), on_progress=report)
+    for job in job_queue.jobs(JobStateEnum.FAILED):
+        click.secho(f"{job.source.name} {job.year} {job.format}: {job.error}", fg="red")
+    raise SystemExit(1 if progress.failed else 0)
+
+
+@main.group()
+def archive():
+    """Manage an archive store of parsed exports."""
+
+
+@archive.command()
+@click.argument("store", type=click.Path(file_okay=False, path_type=Path))
+@click.argument("files", nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False, path_type=Path))
+def ingest(store: Path, files: tuple[Path, ...]):
+    """Ingest FILES into the archive STORE; data ingested before gets skipped."""
+    # first party
+    from AstronomicalAnnualCalendar.archive import ArchiveStore
+
+    archive_store = ArchiveStore(store)
+    for path in files:
+        click.echo(f"{path.name}: {archive_store.ingest_file(path)} new segment(s)")
+
+
+@archive.command()
+@click.argument("store", type=click.Path(exists=True, file_okay=False, path_type=Path))
+def compact(store: Path):
+    """Merge the segments of every partition of the archive STORE."""
+    # first party
+    from AstronomicalAnnualCalendar.archive import ArchiveStore
+
+    click.echo(f"removed {ArchiveStore(store).compact()} segment(s)")
+
+
 if __name__ == "__main__":
     main()
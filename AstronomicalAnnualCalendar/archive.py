@@ -0,0 +1,322 @@
+# standard library
+import hashlib
+import re
+import shutil
+from collections.abc import Iterable
+from datetime import datetime
+from pathlib import Path
+from typing import Self
+
+# third party
+import numpy as np
+import numpy.typing as npt
+from pydantic import BaseModel
+from pydantic.config import ConfigDict
+from pydantic.fields import Field
+
+# local
+from .columns import decode_rows
+from .models import BoundToObservableObjectBaseModel, DataModel, MetaDataModel, ObservableObjectModel
+from .parser import Parser
+from .utils import observable_object_from_alias
+
+
+__all__ = (
+    "MANIFEST_NAME",
+    "LocationModel",
+    "SegmentModel",
+    "PartitionModel",
+    "ManifestModel",
+    "ColumnarDataModel",
+    "ArchiveStore",
+)
+
+
+MANIFEST_NAME: str = "manifest.json"
+_TIME_COLUMN: str = "date_and_time"
+
+type DatetimeArray = npt.NDArray[np.datetime64]
+type FloatArray = npt.NDArray[np.float64]
+
+
+class LocationModel(BaseModel):
+    """Place and coordinate the data of a partition was computed for."""
+
+    model_config = ConfigDict(frozen=True)
+
+    place: str
+    latitude: float
+    longitude: float
+
+    @classmethod
+    def from_metadata(cls: type[Self], metadata: MetaDataModel) -> Self:
+        """Take the location from the first line of an export."""
+        return cls(
+            place=metadata.place.strip(),
+            latitude=round(metadata.coordinate.latitude, 6),
+            longitude=round(metadata.coordinate.longitude, 6),
+        )
+
+    @property
+    def key(self) -> str:
+        """Name of the location's directory."""
+        slug = re.sub(r"[^0-9a-z]+", "-", self.place.lower()).strip("-") or "unnamed"
+        return f"{slug}_{self.latitude:+.4f}_{self.longitude:+.4f}"
+
+
+class SegmentModel(BaseModel):
+    """A directory of ``.npy``-columns written once by a single ingest (or compaction)."""
+
+    model_config = ConfigDict(frozen=True)
+
+    name: str
+    rows: int = Field(ge=0)
+    start: datetime  # UTC (naive) of the first row
+    stop: datetime  # UTC (naive) of the last row
+    fields: list[str]
+    sources: list[str]  # digests of the ingested data, used to skip re-ingested data
+
+
+class PartitionModel(BaseModel):
+    """Data of a single object at a single location in a single (local) year."""
+
+    model_config = ConfigDict(frozen=True)
+
+    location: LocationModel
+    object: str
+    year: int
+    segments: list[SegmentModel]
+
+    @property
+    def path(self) -> Path:
+        """Directory of the partition relative to the archive's root."""
+        return Path(self.location.key, self.object, str(self.year))
+
+
+class ManifestModel(BaseModel):
+    """Index of every partition and segment of an archive."""
+
+    model_config = ConfigDict(frozen=True)
+
+    version: int = 1
+    next_segment: int = 0
+    partitions: list[PartitionModel] = []
+
+
+class ColumnarDataModel(BoundToObservableObjectBaseModel, BaseModel):
+    """Result of an archive query: the decoded columns of an object at a location."""
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    location: LocationModel
+    date_and_time: np.ndarray  # datetime64[ns] (UTC)
+    columns: dict[str, np.ndarray]  # float64, ``nan`` where a value is missing
+
+
+def _digest(date_and_time: DatetimeArray, columns: dict[str, FloatArray]) -> str:
+    digest = hashlib.blake2b(date_and_time.astype("datetime64[ns]").tobytes())
+    for field in sorted(columns):
+        digest.update(field.encode())
+        digest.update(np.ascontiguousarray(columns[field]).tobytes())
+    return digest.hexdigest()
+
+
+def _latest(date_and_time: DatetimeArray) -> npt.NDArray[np.intp]:
+    """Return the indices of the last occurrence of every timestamp, sorted by time."""
+    _, first_of_reversed = np.unique(date_and_time[::-1], return_index=True)
+    return len(date_and_time) - 1 - first_of_reversed
+
+
+class ArchiveStore:
+    """
+    Append-only store of parsed exports below ``root``, partitioned by location, object and (local) year.
+
+    Every ingest writes new segments (one ``.npy`` file per column) and never touches existing ones; rows of later
+    segments supersede rows of earlier ones with the same timestamp. Columns are read memory mapped, so a query only
+    touches the rows it selects. ``compact`` merges the segments of every partition. Writers have to be serialized.
+    """
+
+    def __init__(self, root: Path | str):
+        self.root = Path(root)
+
+    @property
+    def manifest(self) -> ManifestModel:
+        """The manifest as currently stored; an empty one for a new archive."""
+        path = self.root / MANIFEST_NAME
+        if not path.exists():
+            return ManifestModel()
+        return ManifestModel.model_validate_json(path.read_bytes())
+
+    def _store_manifest(self, manifest: ManifestModel) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        temporary = self.root / f"{MANIFEST_NAME}.tmp"
+        temporary.write_text(manifest.model_dump_json(indent=1), "utf-8")
+        temporary.replace(self.root / MANIFEST_NAME)  # atomic, readers never see a partial manifest
+
+    def locations(self) -> list[LocationModel]:
+        """Every location held by the archive."""
+        return sorted({partition.location for partition in self.manifest.partitions}, key=lambda item: item.key)
+
+    def ingest_file(self, path: Path) -> int:
+        """Parse the export ``path`` and ingest every object of it; returns the number of written segments."""
+        return self.ingest(Parser(file_path=path).parse().values())
+
+    def ingest(self, data: Iterable[DataModel]) -> int:
+        """Ingest parsed ``data`` (skipping data ingested before); returns the number of written segments."""
+        manifest = self.manifest
+        partitions = {(p.location, p.object, p.year): p for p in manifest.partitions}
+        next_segment, written = manifest.next_segment, 0
+        for item in data:
+            location = LocationModel.from_metadata(item.metadata)
+            date_and_time = item.date_and_time
+            years = item.local_date_and_time.astype("datetime64[Y]").astype(np.int64) + 1970
+            columns = decode_rows(item.rows)
+            for year in np.unique(years).tolist():
+                selected = years == year
+                key = location, item.bound_object.name, year
+                partition = partitions.get(key) or PartitionModel(
+                    location=location, object=item.bound_object.name, year=year, segments=[]
+                )
+                selected_columns = {field: column[selected] for field, column in columns.items()}
+                digest = _digest(date_and_time[selected], selected_columns)
+                if any(digest in segment.sources for segment in partition.segments):
+                    continue
+                segment = self._write_segment(
+                    partition, f"{next_segment:08d}", date_and_time[selected], selected_columns, [digest]
+                )
+                partitions[key] = partition.model_copy(update={"segments": [*partition.segments, segment]})
+                next_segment, written = next_segment + 1, written + 1
+        if written:
+            self._store_manifest(
+                manifest.model_copy(update={"next_segment": next_segment, "partitions": list(partitions.values())})
+            )
+        return written
+
+    def _write_segment(
+        self,
+        partition: PartitionModel,
+        name: str,
+        date_and_time: DatetimeArray,
+        columns: dict[str, FloatArray],
+        sources: list[str],
+    ) -> SegmentModel:
+        order = np.argsort(date_and_time, kind="stable")
+        directory = self.root / partition.path / name
+        shutil.rmtree(directory, ignore_errors=True)  # left over by an ingest which didn't get to store the manifest
+        directory.mkdir(parents=True)
+        np.save(directory / f"{_TIME_COLUMN}.npy", date_and_time[order].astype("datetime64[ns]"))
+        for field, column in columns.items():
+            np.save(directory / f"{field}.npy", column[order].astype(np.float64))
+        return SegmentModel(
+            name=name,
+            rows=len(order),
+            start=date_and_time[order[0]].astype("datetime64[us]").item(),
+            stop=date_and_time[order[-1]].astype("datetime64[us]").item(),
+            fields=sorted(columns),
+            sources=sources,
+        )
+
+    def _read_partition(
+        self,
+        partition: PartitionModel,
+        start: np.datetime64 | None,
+        stop: np.datetime64 | None,
+        fields: Iterable[str] | None,
+    ) -> tuple[DatetimeArray, dict[str, FloatArray]]:
+        fields = sorted(
+            {field for segment in partition.segments for field in segment.fields} if fields is None else fields
+        )
+        times: list[DatetimeArray] = []
+        columns: dict[str, list[FloatArray]] = {field: [] for field in fields}
+        for segment in partition.segments:
+            directory = self.root / partition.path / segment.name
+            time = np.load(directory / f"{_TIME_COLUMN}.npy", mmap_mode="r")
+            # segments are sorted by time, so the selected rows are a contiguous slice of every memory mapped column
+            first = 0 if start is None else int(np.searchsorted(time, start, side="left"))
+            last = len(time) if stop is None else int(np.searchsorted(time, stop, side="left"))
+            times.append(np.array(time[first:last]))
+            for field in fields:
+                if field in segment.fields:
+                    columns[field].append(np.array(np.load(directory / f"{field}.npy", mmap_mode="r")[first:last]))
+                else:
+                    columns[field].append(np.full(last - first, np.nan))
+        date_and_time = np.concatenate(times) if times else np.empty(0, dtype="datetime64[ns]")
+        latest = _latest(date_and_time)
+        return date_and_time[latest], {field: np.concatenate(parts)[latest] for field, parts in columns.items()}
+
+    def query(
+        self,
+        observable_object: ObservableObjectModel | str,
+        *,
+        start: np.datetime64 | datetime | str | None = None,
+        stop: np.datetime64 | datetime | str | None = None,
+        locations: Iterable[LocationModel] | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> list[ColumnarDataModel]:
+        """
+        Read the rows of ``observable_object`` with ``start <= date_and_time < stop`` (UTC) per location.
+
+        ``locations`` and ``fields`` limit the query (defaulting to all); only overlapping partitions get read.
+        """
+        if isinstance(observable_object, str):
+            observable_object = observable_object_from_alias(observable_object)
+        start = None if start is None else np.datetime64(start, "ns")
+        stop = None if stop is None else np.datetime64(stop, "ns")
+        locations = None if locations is None else set(locations)
+        fields = None if fields is None else list(fields)
+
+        by_location: dict[LocationModel, list[PartitionModel]] = {}
+        for partition in self.manifest.partitions:
+            if partition.object != observable_object.name or (
+                locations is not None and partition.location not in locations
+            ):
+                continue
+            if not any(
+                (start is None or np.datetime64(segment.stop, "ns") >= start)
+                and (stop is None or np.datetime64(segment.start, "ns") < stop)
+                for segment in partition.segments
+            ):
+                continue
+            by_location.setdefault(partition.location, []).append(partition)
+
+        results: list[ColumnarDataModel] = []
+        for location, partitions in sorted(by_location.items(), key=lambda item: item[0].key):
+            parts = [self._read_partition(partition, start, stop, fields) for partition in partitions]
+            names = sorted({field for _, columns in parts for field in columns})
+            date_and_time = np.concatenate([time for time, _ in parts])
+            columns = {
+                field: np.concatenate([part.get(field, np.full(len(time), np.nan)) for time, part in parts])
+                for field in names
+            }
+            order = np.argsort(date_and_time, kind="stable")
+            results.append(
+                ColumnarDataModel(
+                    bound_object=observable_object,
+                    location=location,
+                    date_and_time=date_and_time[order],
+                    columns={field: column[order] for field, column in columns.items()},
+                )
+            )
+        return results
+
+    def compact(self) -> int:
+        """Merge the segments of every partition into one (keeping the latest rows); returns the removed segments."""
+        manifest = self.manifest
+        next_segment, removed = manifest.next_segment, 0
+        partitions: list[PartitionModel] = []
+        obsolete: list[Path] = []
+        for partition in manifest.partitions:
+            if len(partition.segments) < 2:
+                partitions.append(partition)
+                continue
+            date_and_time, columns = self._read_partition(partition, None, None, None)
+            sources = [source for segment in partition.segments for source in segment.sources]
+            segment = self._write_segment(partition, f"{next_segment:08d}", date_and_time, columns, sources)
+            partitions.append(partition.model_copy(update={"segments": [segment]}))
+            obsolete.extend(self.root / partition.path / old.name for old in partition.segments)
+            next_segment, removed = next_segment + 1, removed + len(partition.segments) - 1
+        if obsolete:
+            self._store_manifest(manifest.model_copy(update={"next_segment": next_segment, "partitions": partitions}))
+            for directory in obsolete:  # only unreferenced once the new manifest is in place
+                shutil.rmtree(directory)
+        return removed
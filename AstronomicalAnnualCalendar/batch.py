@@ -0,0 +1,409 @@
+# standard library
+import hashlib
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+from itertools import product
+from pathlib import Path
+
+# third party
+from pydantic import BaseModel
+from pydantic.config import ConfigDict
+
+# local
+from .enums import JobStateEnum, OutputFormatEnum
+from .parser import Parser
+from .render import CanvasModel, Renderer, calendar_layers
+from .stream import month_pages, sliced_layers, write_pdf
+from .svg import write_svg
+
+
+__all__ = (
+    "DEFAULT_LEASE",
+    "JobModel",
+    "BatchProgressModel",
+    "JobQueue",
+    "output_path",
+    "add_jobs",
+    "render_job",
+    "work",
+    "run_workers",
+)
+
+
+DEFAULT_LEASE: timedelta = timedelta(minutes=10)
+"""How long a claimed job stays with its worker without a heartbeat; crashed workers' jobs are retried after it."""
+
+_SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    format TEXT NOT NULL,
+    output TEXT NOT NULL,
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    state TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    owner TEXT,
+    lease_expires REAL,
+    error TEXT,
+    UNIQUE (source, year, format)
+);
+CREATE INDEX IF NOT EXISTS jobs_by_state ON jobs (state, lease_expires);
+"""
+_BUSY_TIMEOUT: float = 60  # seconds to wait for the lock of another process or host
+
+
+class JobModel(BaseModel):
+    """A calendar to produce: the export ``source`` (a location) rendered for ``year`` as ``format`` to ``output``."""
+
+    model_config = ConfigDict(frozen=True)
+
+    id: int
+    source: Path
+    year: int
+    format: OutputFormatEnum
+    output: Path
+    width: int
+    height: int
+    state: JobStateEnum
+    attempts: int = 0  # claims so far
+    owner: str | None = None  # the worker holding the lease
+    lease_expires: datetime | None = None
+    error: str | None = None  # of the last failed attempt
+
+
+class BatchProgressModel(BaseModel):
+    """Number of jobs per state of a whole batch."""
+
+    model_config = ConfigDict(frozen=True)
+
+    pending: int = 0
+    running: int = 0
+    done: int = 0
+    failed: int = 0
+
+    @property
+    def total(self) -> int:
+        """Number of jobs."""
+        return self.pending + self.running + self.done + self.failed
+
+    @property
+    def finished(self) -> bool:
+        """Whether no job is left to do (failed ones included)."""
+        return not (self.pending or self.running)
+
+
+def _job(row: sqlite3.Row) -> JobModel:
+    values = dict(row)
+    if values["lease_expires"] is not None:
+        values["lease_expires"] = datetime.fromtimestamp(values["lease_expires"], UTC)
+    return JobModel(**values)
+
+
+class JobQueue:
+    """
+    Queue of calendar jobs in the SQLite database ``path``, shared by any number of worker processes.
+
+    A worker ``claim``s a job, which holds it for a lease that ``renew`` extends; a job whose lease expired (e.g. as
+    its worker crashed) gets claimed again, up to ``max_attempts`` claims. Several hosts can share the queue on a
+    file system with working locks (SQLite's rollback journal is used, not its WAL); their clocks have to agree on
+    the leases. Every change runs in its own short transaction.
+    """
+
+    def __init__(self, path: Path | str, *, max_attempts: int = 3):
+        self.path = Path(path)
+        self.max_attempts = max_attempts
+        connection = sqlite3.connect(self.path, timeout=_BUSY_TIMEOUT)
+        try:
+            connection.executescript(_SCHEMA)  # idempotent: every worker may run it
+        finally:
+            connection.close()
+
+    @contextmanager
+    def _transaction(self, *, write: bool = True) -> Iterator[sqlite3.Connection]:
+        """Open a connection in a transaction (write-locked from the start if ``write``), committed unless it raises."""
+        connection = sqlite3.connect(self.path, timeout=_BUSY_TIMEOUT, isolation_level=None)
+        connection.row_factory = sqlite3.Row
+        try:
+            connection.execute("BEGIN IMMEDIATE" if write else "BEGIN")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        finally:
+            connection.close()
+
+    def add(
+        self,
+        source: Path | str,
+        year: int,
+        output_format: OutputFormatEnum | str,
+        output: Path | str,
+        *,
+        width: int,
+        height: int,
+    ) -> JobModel:
+        """
+        Add the job (or return the existing one of ``source``, ``year`` and ``output_format``).
+
+        A done job is kept as is, unless its output is gone or it was added with another ``output`` or size; then it's
+        (just like a failed one) reset to pending.
+        """
+        source, output = str(Path(source).absolute()), str(Path(output).absolute())
+        output_format = OutputFormatEnum(output_format)
+        with self._transaction() as connection:
+            row = connection.execute(
+                "SELECT * FROM jobs WHERE source = ? AND year = ? AND format = ?", (source, year, output_format)
+            ).fetchone()
+            if row is None:
+                connection.execute(
+                    "INSERT INTO jobs (source, year, format, output, width, height, state)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (source, year, output_format, output, width, height, JobStateEnum.PENDING),
+                )
+            elif (
+                (row["output"], row["width"], row["height"]) != (output, width, height)
+                or row["state"] == JobStateEnum.FAILED
+                or (row["state"] == JobStateEnum.DONE and not Path(output).exists())
+            ):
+                connection.execute(
+                    "UPDATE jobs SET output = ?, width = ?, height = ?, state = ?, attempts = 0, owner = NULL,"
+                    " lease_expires = NULL, error = NULL WHERE id = ? AND state != ?",
+                    (output, width, height, JobStateEnum.PENDING, row["id"], JobStateEnum.RUNNING),
+                )
+            return _job(
+                connection.execute(
+                    "SELECT * FROM jobs WHERE source = ? AND year = ? AND format = ?", (source, year, output_format)
+                ).fetchone()
+            )
+
+    def claim(self, owner: str, lease: timedelta = DEFAULT_LEASE) -> JobModel | None:
+        """
+        Hand the oldest pending job (or one whose lease expired) to ``owner`` for ``lease``; ``None`` if there's none.
+
+        Jobs whose lease expired after their last allowed attempt get failed instead.
+        """
+        now = time.time()
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE jobs SET state = ?, owner = NULL, lease_expires = NULL, error = ?"
+                " WHERE state = ? AND lease_expires < ? AND attempts >= ?",
+                (
+                    JobStateEnum.FAILED,
+                    f"the lease expired {self.max_attempts} times",
+                    JobStateEnum.RUNNING,
+                    now,
+                    self.max_attempts,
+                ),
+            )
+            row = connection.execute(
+                "SELECT id FROM jobs WHERE state = ? OR (state = ? AND lease_expires < ?) ORDER BY id LIMIT 1",
+                (JobStateEnum.PENDING, JobStateEnum.RUNNING, now),
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                "UPDATE jobs SET state = ?, owner = ?, lease_expires = ?, attempts = attempts + 1 WHERE id = ?",
+                (JobStateEnum.RUNNING, owner, now + lease.total_seconds(), row["id"]),
+            )
+            return _job(connection.execute("SELECT * FROM jobs WHERE id = ?", (row["id"],)).fetchone())
+
+    def _finish(self, job_id: int, owner: str, assignments: str, parameters: tuple) -> bool:
+        with self._transaction() as connection:
+            cursor = connection.execute(
+                f"UPDATE jobs SET {assignments} WHERE id = ? AND owner = ? AND state = ?",  # noqa: S608
+                (*parameters, job_id, owner, JobStateEnum.RUNNING),
+            )
+            return cursor.rowcount == 1
+
+    def renew(self, job_id: int, owner: str, lease: timedelta = DEFAULT_LEASE) -> bool:
+        """Extend the lease of ``owner`` on the job; ``False`` if it has lost the job (e.g. to another worker)."""
+        return self._finish(job_id, owner, "lease_expires = ?", (time.time() + lease.total_seconds(),))
+
+    def complete(self, job_id: int, owner: str) -> bool:
+        """Mark the job of ``owner`` as done; ``False`` if it has lost the job."""
+        return self._finish(
+            job_id, owner, "state = ?, owner = NULL, lease_expires = NULL, error = NULL", (JobStateEnum.DONE,)
+        )
+
+    def fail(self, job_id: int, owner: str, error: str) -> bool:
+        """Mark the job of ``owner`` as failed with ``error``; ``False`` if it has lost the job."""
+        return self._finish(
+            job_id, owner, "state = ?, owner = NULL, lease_expires = NULL, error = ?", (JobStateEnum.FAILED, error)
+        )
+
+    def retry_failed(self) -> int:
+        """Reset every failed job to pending; returns their number."""
+        with self._transaction() as connection:
+            return connection.execute(
+                "UPDATE jobs SET state = ?, attempts = 0, error = NULL WHERE state = ?",
+                (JobStateEnum.PENDING, JobStateEnum.FAILED),
+            ).rowcount
+
+    def jobs(self, state: JobStateEnum | None = None) -> list[JobModel]:
+        """Every job (in the given ``state``) in the order they were added."""
+        with self._transaction(write=False) as connection:
+            if state is None:
+                rows = connection.execute("SELECT * FROM jobs ORDER BY id").fetchall()
+            else:
+                rows = connection.execute("SELECT * FROM jobs WHERE state = ? ORDER BY id", (state,)).fetchall()
+        return [_job(row) for row in rows]
+
+    def progress(self) -> BatchProgressModel:
+        """Count the jobs per state."""
+        with self._transaction(write=False) as connection:
+            rows = connection.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state").fetchall()
+        return BatchProgressModel(**dict(rows))
+
+
+def output_path(directory: Path | str, source: Path | str, year: int, output_format: OutputFormatEnum | str) -> Path:
+    """
+    Where the calendar of ``source`` for ``year`` goes: ``<directory>/<source stem>-<digest>-<year>.<format>``.
+
+    The digest of the absolute path of ``source`` tells exports of the same name in different directories apart
+    (e.g. ``berlin/2024.txt`` and ``paris/2024.txt``), as a job is identified by the whole path.
+    """
+    source = Path(source)
+    digest = hashlib.blake2b(str(source.absolute()).encode(), digest_size=4).hexdigest()
+    return Path(directory) / f"{source.stem}-{digest}-{year}.{OutputFormatEnum(output_format)}"
+
+
+def add_jobs(
+    queue: JobQueue,
+    sources: Iterable[Path],
+    years: Iterable[int],
+    formats: Iterable[OutputFormatEnum | str],
+    directory: Path | str,
+    *,
+    width: int,
+    height: int,
+) -> list[JobModel]:
+    """Add a job for every combination of ``sources``, ``years`` and ``formats`` with its output in ``directory``."""
+    return [
+        queue.add(
+            source, year, output_format, output_path(directory, source, year, output_format), width=width, height=height
+        )
+        for source, year, output_format in product(sources, years, formats)
+    ]
+
+
+def render_job(job: JobModel) -> Path:
+    """
+    Produce the calendar of ``job``; returns its output.
+
+    The calendar gets written next to the output first and moved into place when complete, so an output never is
+    partial (not even if two workers happen to run the same job).
+    """
+    canvas = CanvasModel(year=job.year, width=job.width, height=job.height)
+    parser = Parser(file_path=job.source)
+    layers = calendar_layers(parser.metadata, parser.parse().values(), job.year)
+    job.output.parent.mkdir(parents=True, exist_ok=True)
+    temporary = job.output.with_name(f".{job.output.stem}.{uuid.uuid4().hex}{job.output.suffix}")
+    try:
+        if job.format == OutputFormatEnum.PDF:
+            write_pdf(temporary, month_pages(canvas), sliced_layers(layers))
+        elif job.format == OutputFormatEnum.SVG:
+            write_svg(temporary, canvas, layers)
+        else:
+            Renderer(canvas).save(layers, temporary)
+        temporary.replace(job.output)
+    finally:
+        temporary.unlink(missing_ok=True)
+    return job.output
+
+
+@contextmanager
+def _heartbeat(queue: JobQueue, job: JobModel, owner: str, lease: timedelta) -> Iterator[None]:
+    """Renew the lease of the running ``job`` every third of ``lease`` in a background thread."""
+    stopped = threading.Event()
+
+    def renew() -> None:
+        while not stopped.wait(lease.total_seconds() / 3):
+            if not queue.renew(job.id, owner, lease):
+                return
+
+    thread = threading.Thread(target=renew, daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stopped.set()
+        thread.join()
+
+
+def _default_owner() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def work(
+    queue: JobQueue,
+    *,
+    owner: str | None = None,
+    lease: timedelta = DEFAULT_LEASE,
+    on_job: Callable[[JobModel], None] | None = None,
+) -> int:
+    """
+    Claim and run jobs of ``queue`` until none is left; returns the number of jobs run.
+
+    Errors of a job fail it (with the error message) and the worker moves on; ``on_job`` gets every job as claimed.
+    """
+    owner = owner or _default_owner()
+    count = 0
+    while (job := queue.claim(owner, lease)) is not None:
+        if on_job is not None:
+            on_job(job)
+        with _heartbeat(queue, job, owner, lease):
+            try:
+                render_job(job)
+            except Exception as error:  # noqa: BLE001  # a single broken export mustn't stop the batch
+                queue.fail(job.id, owner, f"{type(error).__name__}: {error}")
+            else:
+                queue.complete(job.id, owner)
+        count += 1
+    return count
+
+
+def run_workers(
+    queue: JobQueue,
+    workers: int,
+    *,
+    lease: timedelta = DEFAULT_LEASE,
+    on_progress: Callable[[BatchProgressModel], None] | None = None,
+    interval: float = 1,
+) -> BatchProgressModel:
+    """
+    Run ``workers`` worker processes on ``queue`` (a thread for a single one) until they ran out of jobs.
+
+    The progress of the whole batch (including workers on other hosts) gets reported to ``on_progress`` whenever it
+    changes, polled every ``interval`` seconds. Returns the final progress.
+    """
+    executor: Executor = ProcessPoolExecutor(workers) if workers > 1 else ThreadPoolExecutor(1)
+    last: BatchProgressModel | None = None
+
+    def report() -> BatchProgressModel:
+        nonlocal last
+        progress = queue.progress()
+        if on_progress is not None and progress != last:
+            on_progress(progress)
+        last = progress
+        return progress
+
+    with executor:
+        futures = [executor.submit(work, queue, lease=lease) for _ in range(max(workers, 1))]
+        report()
+        while wait(futures, timeout=interval).not_done:
+            report()
+        for future in futures:
+            future.result()  # re-raise errors of the queue itself
+    return report()
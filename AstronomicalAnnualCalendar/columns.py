@@ -0,0 +1,315 @@
+# standard library
+from collections.abc import Callable, Sequence
+from functools import partial
+
+# third party
+import numpy as np
+import numpy.typing as npt
+
+# local
+from .enums import HeaderEnum
+from .errors import WeekdayMismatchError
+from .models import EvaluatedHeaderModel, ObservableObjectModel, RowModel
+from .timezones import local_to_utc
+
+
+__all__ = (
+    "evaluate_header",
+    "extract_columns",
+    "timezone_label",
+    "WEEKDAYS",
+    "decode_date",
+    "decode_date_and_time",
+    "check_weekdays",
+    "decode_hms",
+    "decode_dms",
+    "decode_hm_time",
+    "decode_degree",
+    "decode_float",
+    "encode_hms",
+    "encode_dms",
+    "encode_hm_time",
+    "encode_degree",
+    "encode_float",
+    "COLUMN_DECODERS",
+    "COLUMN_ENCODERS",
+    "COLUMN_PERIODS",
+    "column_difference",
+    "decode_rows",
+    "available_fields",
+)
+
+
+type FloatArray = npt.NDArray[np.float64]
+type RawColumn = Sequence[str | None]
+type DatetimeArray = npt.NDArray[np.datetime64]
+
+
+_FIELD_NAMES: dict[HeaderEnum, str] = {header: header.name.lower() for header in HeaderEnum}  # type: ignore
+_FIELD_NAMES[HeaderEnum.AZIMUT_RIZE] = "azimut_rise"
+_UNIX_EPOCH_WEEKDAY: int = 3  # 1970-01-01 was a thursday
+
+WEEKDAYS: tuple[str, ...] = ("Mo", "Di", "Mi", "Do", "Fr", "Sa", "So")
+"""German weekday prefixes of the rows, starting with monday."""
+
+
+def evaluate_header(observable_object: ObservableObjectModel, header: str) -> dict[str, EvaluatedHeaderModel]:
+    """Locate every known column in ``header``; keys are ``RowModel``-fields (or weekday, date and timezone)."""
+    evaluated: dict[str, EvaluatedHeaderModel] = {}
+    for member in HeaderEnum:
+        if (match := member.value.search(header)) is not None:
+            evaluated[_FIELD_NAMES[member]] = EvaluatedHeaderModel(
+                bound_object=observable_object,
+                bound_header=member.value,
+                endpos=match.end(),
+            )
+    return evaluated
+
+
+def extract_columns(observable_object: ObservableObjectModel, header: str, body: str) -> dict[str, list[str]]:
+    """Slice the raw (stripped) cells of every known column out of the fixed-width ``body``."""
+    lines = body.splitlines()
+    return {
+        field: [evaluated.get_value(line).strip() for line in lines]
+        for field, evaluated in evaluate_header(observable_object, header).items()
+    }
+
+
+def timezone_label(header: str) -> str:
+    """Return the timezone label (``MEZ``, ``MESZ`` or ``UTC``) of ``header``."""
+    return HeaderEnum.TIMEZONE.value.search(header).group().strip()
+
+
+def _valid_mask(values: np.ndarray) -> npt.NDArray[np.bool_]:
+    """Mask of cells which hold a value (neither ``None`` nor a ``--``-placeholder)."""
+    return np.array([value is not None and value.strip("- ") != "" for value in values.tolist()], dtype=bool)
+
+
+def _split_numbers(values: np.ndarray, separators: str, fields: int) -> FloatArray:
+    """Split every (valid) cell at ``separators`` and decode the ``fields`` numbers of all cells in one go."""
+    text = " ".join(values.tolist()).translate(str.maketrans(separators, " " * len(separators)))
+    return np.array(text.split(), dtype=np.float64).reshape(-1, fields)
+
+
+def _decode(values: RawColumn, separators: str, weights: tuple[float, ...], *, signed: bool = False) -> FloatArray:
+    values = np.asarray(values, dtype=object)
+    result = np.full(values.shape, np.nan)
+    mask = _valid_mask(values)
+    if not mask.any():
+        return result
+    valid = values[mask]
+    decoded = _split_numbers(valid, separators, len(weights)) @ np.array(weights)
+    if signed:
+        decoded[np.char.startswith(np.char.lstrip(valid.astype(str)), "-")] *= -1
+    result[mask] = decoded
+    return result
+
+
+def decode_hms(values: RawColumn) -> FloatArray:
+    """Decode a column like ``18h42m04.3s`` to hours; missing cells become ``nan``."""
+    return _decode(values, "hms", (1, 1 / 60, 1 / 3600))
+
+
+def decode_dms(values: RawColumn) -> FloatArray:
+    """Decode a (signed) column like ``- 7°37'28"`` to degrees; missing cells become ``nan``."""
+    return _decode(values, "+-°'\"", (1, 1 / 60, 1 / 3600), signed=True)
+
+
+def decode_hm_time(values: RawColumn) -> FloatArray:
+    """Decode a column like ``8h44m`` to hours; ``--``-cells become ``nan``."""
+    return _decode(values, "hm", (1, 1 / 60))
+
+
+def decode_degree(values: RawColumn) -> FloatArray:
+    """Decode a column like ``131°`` to degrees; missing cells become ``nan``."""
+    return _decode(values, "°", (1,))
+
+
+def decode_float(values: Sequence[float | str | None]) -> FloatArray:
+    """Decode a numeric column; missing cells become ``nan``."""
+    return np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+
+
+def decode_date(values: RawColumn) -> DatetimeArray:
+    """Decode a column like ``01.01.2024`` to ``datetime64[D]``."""
+    day, month, year = _split_numbers(np.asarray(values, dtype=object), ".", 3).astype(np.int64).T
+    months = ((year - 1970) * 12 + month - 1).astype("datetime64[M]")
+    return months.astype("datetime64[D]") + (day - 1).astype("timedelta64[D]")
+
+
+def decode_date_and_time(
+    dates: RawColumn,
+    times: RawColumn,
+    timezone: str = "MEZ",
+    *,
+    weekdays: RawColumn | None = None,
+) -> DatetimeArray:
+    """
+    Decode the ``Datum`` and time columns (like ``01.01.2024`` and ``0:00:00``) to UTC ``datetime64[ns]`` in bulk.
+
+    ``timezone`` is the label of the time column (see ``timezone_label``); switches between MEZ and MESZ are
+    resolved via the cached transition tables of ``timezones``. If ``weekdays`` are given they're checked against
+    the dates (see ``check_weekdays``).
+    """
+    days = decode_date(dates)
+    if weekdays is not None:
+        check_weekdays(weekdays, days)
+    seconds = _split_numbers(np.asarray(times, dtype=object), ":", 3) @ np.array([3600, 60, 1])
+    local = days.astype("datetime64[ns]") + (seconds * 1e9).astype("timedelta64[ns]")
+    return local_to_utc(local, timezone)
+
+
+def check_weekdays(weekdays: RawColumn, dates: DatetimeArray) -> None:
+    """Raise ``WeekdayMismatchError`` if any weekday prefix doesn't match its (local) date."""
+    expected = np.array(WEEKDAYS)[(dates.astype("datetime64[D]").astype(np.int64) + _UNIX_EPOCH_WEEKDAY) % 7]
+    if (mismatches := np.flatnonzero(np.asarray(weekdays, dtype=str) != expected)).size:
+        raise WeekdayMismatchError(
+            rows=mismatches.tolist(),
+            weekdays=np.asarray(weekdays, dtype=object)[mismatches].tolist(),
+            expected=expected[mismatches].tolist(),
+        )
+
+
+def _split_sexagesimal(values: npt.ArrayLike, resolution: int) -> tuple[np.ndarray, ...]:
+    """Round ``values`` to ``1 / resolution`` and split them into whole parts, minutes and remaining units."""
+    total = np.rint(np.abs(np.asarray(values, dtype=np.float64)) * resolution).astype(np.int64)
+    whole, rest = np.divmod(total, resolution)
+    minute, rest = np.divmod(rest, resolution // 60)
+    return whole, minute, rest
+
+
+def encode_hms(hours: npt.ArrayLike) -> list[str]:
+    """Encode hours as right ascension like ``18h42m04.3s`` (wrapped to 0-24h)."""
+    hour, minute, tenths = _split_sexagesimal(np.mod(hours, 24), 36000)
+    hour %= 24
+    return [
+        f"{h}h{m:02d}m{t / 10:04.1f}s" for h, m, t in zip(hour.tolist(), minute.tolist(), tenths.tolist(), strict=False)
+    ]
+
+
+def encode_dms(degrees: npt.ArrayLike, *, signed: bool = True) -> list[str]:
+    """Encode degrees like ``- 7°37'28"`` (``signed``) or ``279°40'02"``."""
+    degrees = np.asarray(degrees, dtype=np.float64)
+    degree, minute, second = _split_sexagesimal(degrees, 3600)
+    if not signed:
+        return [
+            f"{d % 360}°{m:02d}'{s:02d}\""
+            for d, m, s in zip(degree.tolist(), minute.tolist(), second.tolist(), strict=False)
+        ]
+    signs = np.where(np.signbit(degrees), "-", "+").tolist()
+    return [
+        f"{sign}{d:2d}°{m:02d}'{s:02d}\""
+        for sign, d, m, s in zip(signs, degree.tolist(), minute.tolist(), second.tolist(), strict=False)
+    ]
+
+
+def encode_hm_time(hours: npt.ArrayLike) -> list[str]:
+    """Encode hours as time like ``8h44m``; ``nan`` becomes ``-----``."""
+    hours = np.asarray(hours, dtype=np.float64)
+    hour, minute, _ = _split_sexagesimal(np.nan_to_num(hours), 60)
+    return [
+        "-----" if missing else f"{h}h{m:02d}m"
+        for missing, h, m in zip(np.isnan(hours).tolist(), hour.tolist(), minute.tolist(), strict=False)
+    ]
+
+
+def encode_degree(degrees: npt.ArrayLike) -> list[str | None]:
+    """Encode degrees like ``131°``; ``nan`` becomes ``None``."""
+    degrees = np.asarray(degrees, dtype=np.float64)
+    return [
+        None if missing else f"{degree}°"
+        for missing, degree in zip(
+            np.isnan(degrees).tolist(), np.rint(np.nan_to_num(degrees)).astype(np.int64).tolist(), strict=False
+        )
+    ]
+
+
+def encode_float(values: npt.ArrayLike, decimals: int) -> list[float | None]:
+    """Round ``values`` to ``decimals`` like the export does; ``nan`` becomes ``None``."""
+    rounded = np.round(np.asarray(values, dtype=np.float64), decimals)
+    missing = np.isnan(rounded).tolist()
+    return [None if nan else value for nan, value in zip(missing, rounded.tolist(), strict=True)]
+
+
+COLUMN_DECODERS: dict[str, Callable[[RawColumn], FloatArray]] = {
+    "right_ascension": decode_hms,
+    "declination": decode_dms,
+    "ecliptic_longitude": decode_dms,
+    "ecliptic_latitude": decode_dms,
+    "rise": decode_hm_time,
+    "culmination": decode_hm_time,
+    "set": decode_hm_time,
+    "azimut_rise": decode_degree,
+    "azimut_set": decode_degree,
+    "distance": decode_float,
+    "brightness": decode_float,
+    "diameter": decode_float,
+    "dawn": decode_hm_time,
+    "dusk": decode_hm_time,
+    "phase": decode_float,
+    "age": decode_float,
+    "elongation": decode_float,
+}
+"""Decoder for every ``RowModel``-field holding a numeric value (possibly encoded as string)."""
+
+
+COLUMN_ENCODERS: dict[str, Callable[[npt.ArrayLike], list]] = {
+    "right_ascension": encode_hms,
+    "declination": encode_dms,
+    "ecliptic_longitude": partial(encode_dms, signed=False),
+    "ecliptic_latitude": encode_dms,
+    "rise": encode_hm_time,
+    "culmination": encode_hm_time,
+    "set": encode_hm_time,
+    "azimut_rise": encode_degree,
+    "azimut_set": encode_degree,
+    "distance": partial(encode_float, decimals=5),
+    "brightness": partial(encode_float, decimals=1),
+    "diameter": partial(encode_float, decimals=1),
+    "dawn": encode_hm_time,
+    "dusk": encode_hm_time,
+    "phase": partial(encode_float, decimals=2),
+    "age": partial(encode_float, decimals=1),
+    "elongation": partial(encode_float, decimals=1),
+}
+"""Inverse of ``COLUMN_DECODERS``; produces values as they would appear in an export."""
+
+
+COLUMN_PERIODS: dict[str, float] = {
+    "right_ascension": 24,
+    "ecliptic_longitude": 360,
+    "elongation": 360,  # signed, jumps from +180° to -180° at opposition
+    "rise": 24,
+    "culmination": 24,
+    "set": 24,
+    "dawn": 24,
+    "dusk": 24,
+}
+"""Period of every decoded column which wraps around (hours or degrees); differences have to respect it."""
+
+
+def column_difference(field: str, left: npt.ArrayLike, right: npt.ArrayLike) -> FloatArray:
+    """``left - right`` of a decoded column; for a wrapping one (see ``COLUMN_PERIODS``) the shortest signed one."""
+    difference = np.asarray(left, dtype=np.float64) - np.asarray(right, dtype=np.float64)
+    if (period := COLUMN_PERIODS.get(field)) is not None:
+        difference = (difference + period / 2) % period - period / 2
+    return difference
+
+
+def decode_rows(rows: Sequence[RowModel], *fields: str) -> dict[str, FloatArray]:
+    """
+    Decode ``fields`` (defaults to every field of ``COLUMN_DECODERS``) of ``rows`` column by column.
+
+    Columns which aren't set in any row are omitted.
+    """
+    decoded: dict[str, FloatArray] = {}
+    for field in fields or COLUMN_DECODERS:
+        column = [getattr(row, field) for row in rows]
+        if any(value is not None for value in column):
+            decoded[field] = COLUMN_DECODERS[field](column)
+    return decoded
+
+
+def available_fields(rows: Sequence[RowModel], *fields: str) -> set[str]:
+    """Return those of ``fields`` which are set in any of ``rows``, i.e. the columns ``decode_rows`` wouldn't omit."""
+    return {field for field in fields if any(getattr(row, field) is not None for row in rows)}
@@ -0,0 +1,82 @@
+# standard library
+import bz2
+import gzip
+import io
+import lzma
+from pathlib import Path
+from typing import IO
+
+
+__all__ = (
+    "MAGIC_BYTES",
+    "detect_compression",
+    "is_compressed",
+    "open_decompressed",
+)
+
+
+MAGIC_BYTES: dict[str, bytes] = {
+    "gzip": b"\x1f\x8b",
+    "bz2": b"BZh",
+    "xz": b"\xfd7zXZ\x00",
+}
+"""Leading bytes of every supported compression format."""
+
+_HEAD_SIZE: int = max(map(len, MAGIC_BYTES.values()))
+
+
+def detect_compression(head: bytes) -> str | None:
+    """Return the compression format (see ``MAGIC_BYTES``) the data starting with ``head`` is in, if any."""
+    for compression, magic in MAGIC_BYTES.items():
+        if head.startswith(magic):
+            return compression
+    return None
+
+
+def is_compressed(path: Path) -> bool:
+    """Check whether ``path`` holds compressed data."""
+    with path.open("rb") as f:
+        return detect_compression(f.read(_HEAD_SIZE)) is not None
+
+
+def _peek(stream: IO[bytes]) -> tuple[IO[bytes], bytes]:
+    """Return the first bytes of ``stream`` without consuming them (wrapping ``stream`` if it can't peek or seek)."""
+    if hasattr(stream, "peek"):
+        return stream, stream.peek(_HEAD_SIZE)[:_HEAD_SIZE]
+    if stream.seekable():
+        position = stream.tell()
+        head = stream.read(_HEAD_SIZE)
+        stream.seek(position)
+        return stream, head
+    stream = io.BufferedReader(stream)
+    return stream, stream.peek(_HEAD_SIZE)[:_HEAD_SIZE]
+
+
+def open_decompressed(source: Path | IO[bytes]) -> IO[bytes]:
+    """
+    Open ``source`` (a path or a binary stream) for reading and decompress it on the fly if it's compressed.
+
+    The format is detected by its magic bytes; uncompressed data is passed through as is. Nothing gets written to disk.
+    A stream returned for a path has to be closed by the caller; streams passed in are left open.
+    """
+    if isinstance(source, Path):
+        with source.open("rb") as f:
+            compression = detect_compression(f.read(_HEAD_SIZE))
+        match compression:
+            case "gzip":
+                return gzip.open(source, "rb")
+            case "bz2":
+                return bz2.open(source, "rb")
+            case "xz":
+                return lzma.open(source, "rb")
+        return source.open("rb")
+
+    stream, head = _peek(source)
+    match detect_compression(head):
+        case "gzip":
+            return gzip.GzipFile(fileobj=stream, mode="rb")
+        case "bz2":
+            return bz2.BZ2File(stream, "rb")
+        case "xz":
+            return lzma.LZMAFile(stream, "rb")
+    return stream
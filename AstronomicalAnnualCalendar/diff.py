@@ -0,0 +1,157 @@
+# standard library
+from collections.abc import Mapping
+
+# third party
+import numpy as np
+from pydantic import BaseModel
+from pydantic.config import ConfigDict
+
+# local
+from .columns import column_difference, decode_rows
+from .models import BoundToObservableObjectBaseModel, DataModel, ObservableObjectModel
+
+
+__all__ = (
+    "DEFAULT_TOLERANCES",
+    "ColumnDiffModel",
+    "ObjectDiffModel",
+    "DatasetDiffModel",
+    "diff_data",
+    "diff_datasets",
+)
+
+
+DEFAULT_TOLERANCES: dict[str, float] = {
+    "right_ascension": 0.1 / 3600,
+    "declination": 1 / 3600,
+    "ecliptic_longitude": 1 / 3600,
+    "ecliptic_latitude": 1 / 3600,
+    "rise": 1 / 60,
+    "culmination": 1 / 60,
+    "set": 1 / 60,
+    "azimut_rise": 1,
+    "azimut_set": 1,
+    "distance": 1e-5,
+    "brightness": 0.1,
+    "diameter": 0.1,
+    "dawn": 1 / 60,
+    "dusk": 1 / 60,
+    "phase": 0.01,
+    "age": 0.1,
+    "elongation": 0.1,
+}
+"""Maximum accepted absolute difference per column (in its decoded unit); one unit of the export's last digit."""
+
+_EPSILON: float = 1e-9  # absorbs the float noise of decoding equal values
+
+
+class ColumnDiffModel(BaseModel):
+    """Summary of the differences of a single column of the aligned rows."""
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    field: str
+    compared: int  # rows where both sides hold a value
+    max: float
+    rms: float
+    tolerance: float
+    exceeding: np.ndarray  # datetime64[ns] (UTC) of the rows exceeding ``tolerance``
+    missing: np.ndarray  # datetime64[ns] (UTC) of the rows with a value on just one side
+
+    @property
+    def ok(self) -> bool:
+        """Whether no row exceeds the tolerance and no value is missing on one side."""
+        return not (self.exceeding.size or self.missing.size)
+
+
+class ObjectDiffModel(BoundToObservableObjectBaseModel, BaseModel):
+    """Differences of the data of a single observable object."""
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    aligned: int
+    only_left: np.ndarray  # datetime64[ns] (UTC)
+    only_right: np.ndarray  # datetime64[ns] (UTC)
+    columns: dict[str, ColumnDiffModel]
+    columns_only_left: frozenset[str]
+    columns_only_right: frozenset[str]
+
+    @property
+    def ok(self) -> bool:
+        """Whether both sides cover the same rows and columns and every column is within its tolerance."""
+        return not (
+            self.only_left.size or self.only_right.size or self.columns_only_left or self.columns_only_right
+        ) and all(column.ok for column in self.columns.values())
+
+
+class DatasetDiffModel(BaseModel):
+    """Differences of two parsed datasets (see ``Parser.parse``)."""
+
+    model_config = ConfigDict(frozen=True)
+
+    objects: dict[ObservableObjectModel, ObjectDiffModel]
+    only_left: frozenset[ObservableObjectModel]
+    only_right: frozenset[ObservableObjectModel]
+
+    @property
+    def ok(self) -> bool:
+        """Whether both datasets hold the same objects and every object is within the tolerances."""
+        return not (self.only_left or self.only_right) and all(diff.ok for diff in self.objects.values())
+
+
+def diff_data(left: DataModel, right: DataModel, *, tolerances: Mapping[str, float] | None = None) -> ObjectDiffModel:
+    """
+    Align ``left`` and ``right`` by timestamp and compare every column they share in bulk.
+
+    Angles and times of day are compared wrap-aware (see ``COLUMN_PERIODS``); ``tolerances`` override single
+    entries of ``DEFAULT_TOLERANCES``.
+    """
+    tolerances = DEFAULT_TOLERANCES | dict(tolerances or {})
+    left_time, right_time = left.date_and_time, right.date_and_time
+    # not ``assume_unique``: an export may repeat a timestamp, the first row of each one is compared
+    time, left_index, right_index = np.intersect1d(left_time, right_time, return_indices=True)
+    left_columns, right_columns = decode_rows(left.rows), decode_rows(right.rows)
+
+    columns: dict[str, ColumnDiffModel] = {}
+    for field in left_columns.keys() & right_columns.keys():
+        left_values, right_values = left_columns[field][left_index], right_columns[field][right_index]
+        difference = np.abs(column_difference(field, left_values, right_values))
+        both = ~np.isnan(difference)
+        tolerance = tolerances[field]
+        columns[field] = ColumnDiffModel(
+            field=field,
+            compared=int(both.sum()),
+            max=float(difference[both].max()) if both.any() else 0.0,
+            rms=float(np.sqrt(np.mean(difference[both] ** 2))) if both.any() else 0.0,
+            tolerance=tolerance,
+            exceeding=time[both & (difference > tolerance + _EPSILON)],
+            missing=time[np.isnan(left_values) != np.isnan(right_values)],
+        )
+
+    return ObjectDiffModel(
+        bound_object=left.bound_object,
+        aligned=len(time),
+        only_left=np.setdiff1d(left_time, time),
+        only_right=np.setdiff1d(right_time, time),
+        columns=dict(sorted(columns.items())),
+        columns_only_left=frozenset(left_columns.keys() - right_columns.keys()),
+        columns_only_right=frozenset(right_columns.keys() - left_columns.keys()),
+    )
+
+
+def diff_datasets(
+    left: Mapping[ObservableObjectModel, DataModel],
+    right: Mapping[ObservableObjectModel, DataModel],
+    *,
+    tolerances: Mapping[str, float] | None = None,
+) -> DatasetDiffModel:
+    """Compare two parsed datasets object by object (see ``diff_data``)."""
+    return DatasetDiffModel(
+        objects={
+            observable_object: diff_data(data, right[observable_object], tolerances=tolerances)
+            for observable_object, data in left.items()
+            if observable_object in right
+        },
+        only_left=frozenset(left.keys() - right.keys()),
+        only_right=frozenset(right.keys() - left.keys()),
+    )
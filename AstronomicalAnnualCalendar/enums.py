@@ -4,7 +4,7 @@ from functools import reduce
 from operator import or_
 
 # third party
-from aenum import EnumMeta, IntFlag, NoAliasEnum, UniqueEnum, auto
+from aenum import EnumMeta, IntEnum, IntFlag, NoAliasEnum, StrEnum, UniqueEnum, auto
 from pydantic_extra_types.color import Color
 
 # local
@@ -16,6 +16,10 @@ __all__ = (
     "ObservableObjectEnum",
     "CLIFlags",
     "HeaderEnum",
+    "TwilightBandEnum",
+    "EventKindEnum",
+    "JobStateEnum",
+    "OutputFormatEnum",
 )
 
 
@@ -97,6 +101,50 @@ class HeaderEnum(UniqueEnum):
     MOON_SPECIFIC_BR: HModel = HModel(regex=re.compile(r"(?<=Colong\. {2})Br\."), length=4)
 
 
+class TwilightBandEnum(IntEnum):
+    """
+    Quantized sky brightness based on the altitude of the sun; ordered from bright to dark.
+
+    Members carry the lowest solar altitude (in degrees) of their band via ``.lower_altitude``.
+    """
+
+    _init_ = "value lower_altitude"
+
+    DAY = 0, -0.8333  # sun above the horizon (upper limb; refraction included)
+    CIVIL = 1, -6.0
+    NAUTICAL = 2, -12.0
+    ASTRONOMICAL = 3, -18.0
+    NIGHT = 4, -90.0
+
+
+class EventKindEnum(StrEnum):
+    """Kinds of events found by ``events.find_events``."""
+
+    CONJUNCTION = "conjunction"  # equal ecliptic longitudes
+    OPPOSITION = "opposition"  # ecliptic longitudes 180° apart
+    GREATEST_EASTERN_ELONGATION = "greatest eastern elongation"
+    GREATEST_WESTERN_ELONGATION = "greatest western elongation"
+    RETROGRADE_STATION = "retrograde station"  # the ecliptic longitude starts to decrease
+    DIRECT_STATION = "direct station"  # the ecliptic longitude starts to increase again
+
+
+class JobStateEnum(StrEnum):
+    """States of a job of ``batch.JobQueue``."""
+
+    PENDING = "pending"
+    RUNNING = "running"  # claimed by a worker until its lease expires
+    DONE = "done"
+    FAILED = "failed"
+
+
+class OutputFormatEnum(StrEnum):
+    """Formats a calendar can be produced in; the values are the file suffixes."""
+
+    PNG = "png"  # the whole year as a single image
+    PDF = "pdf"  # a page per month
+    SVG = "svg"  # the whole year as vector graphic, see ``svg.write_svg``
+
+
 class AntiIntFlag[T: int]:
     """Flag to represent a flag with the opposite value.
 
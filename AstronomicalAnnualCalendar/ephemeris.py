@@ -0,0 +1,476 @@
+# standard library
+from collections.abc import Iterable
+from datetime import timedelta
+
+# third party
+import numpy as np
+import numpy.typing as npt
+from pydantic import BaseModel
+from pydantic.config import ConfigDict
+
+# local
+from .columns import encode_dms, encode_hms
+from .errors import ObjectNotSupportedError
+from .models import BoundToObservableObjectBaseModel, ObservableObjectModel, RowModel
+from .transforms import (
+    datetime64_to_julian_day,
+    ecliptic_to_equatorial,
+    general_precession_in_longitude,
+    julian_centuries,
+    mean_obliquity,
+    nutation,
+)
+
+
+__all__ = (
+    "EphemerisModel",
+    "compute_ephemeris",
+    "compute_ephemerides",
+)
+
+
+type FloatArray = npt.NDArray[np.float64]
+
+
+_AU_IN_KM: float = 149597870.7
+_LIGHT_TIME_DAYS_PER_AU: float = 0.0057755183
+_SYNODIC_MONTH_DAYS: float = 29.530588853
+_ARCSECONDS_PER_RADIAN: float = 206264.80624709636
+_ABERRATION_CONSTANT: float = 20.49552 / 3600  # degrees
+
+_EQUATORIAL_RADIUS_KM: dict[str, float] = {
+    "sun": 696000.0,
+    "mercury": 2439.7,
+    "venus": 6051.8,
+    "moon": 1737.4,
+    "mars": 3396.2,
+    "jupiter": 71492.0,
+    "saturn": 60268.0,
+    "uranus": 25559.0,
+    "neptune": 24764.0,
+}
+
+_ORBITAL_ELEMENTS: dict[str, tuple[tuple[float, float], ...]] = {
+    # (value at J2000.0, rate per julian century) for a [AU], e, I [°], L [°], long. peri. [°], long. node [°]
+    # Keplerian elements for approximate positions of the major planets (E. M. Standish, JPL; 1800 AD - 2050 AD)
+    # referred to the mean ecliptic and equinox of J2000.0
+    "mercury": (
+        (0.38709927, 0.00000037),
+        (0.20563593, 0.00001906),
+        (7.00497902, -0.00594749),
+        (252.25032350, 149472.67411175),
+        (77.45779628, 0.16047689),
+        (48.33076593, -0.12534081),
+    ),
+    "venus": (
+        (0.72333566, 0.00000390),
+        (0.00677672, -0.00004107),
+        (3.39467605, -0.00078890),
+        (181.97909950, 58517.81538729),
+        (131.60246718, 0.00268329),
+        (76.67984255, -0.27769418),
+    ),
+    "earth": (  # earth-moon barycenter
+        (1.00000261, 0.00000562),
+        (0.01671123, -0.00004392),
+        (-0.00001531, -0.01294668),
+        (100.46457166, 35999.37244981),
+        (102.93768193, 0.32327364),
+        (0.0, 0.0),
+    ),
+    "mars": (
+        (1.52371034, 0.00001847),
+        (0.09339410, 0.00007882),
+        (1.84969142, -0.00813131),
+        (-4.55343205, 19140.30268499),
+        (-23.94362959, 0.44441088),
+        (49.55953891, -0.29257343),
+    ),
+    "jupiter": (
+        (5.20288700, -0.00011607),
+        (0.04838624, -0.00013253),
+        (1.30439695, -0.00183714),
+        (34.39644051, 3034.74612775),
+        (14.72847983, 0.21252668),
+        (100.47390909, 0.20469106),
+    ),
+    "saturn": (
+        (9.53667594, -0.00125060),
+        (0.05386179, -0.00050991),
+        (2.48599187, 0.00193609),
+        (49.95424423, 1222.49362201),
+        (92.59887831, -0.41897216),
+        (113.66242448, -0.28867794),
+    ),
+    "uranus": (
+        (19.18916464, -0.00196176),
+        (0.04725744, -0.00004397),
+        (0.77263783, -0.00242939),
+        (313.23810451, 428.48202785),
+        (170.95427630, 0.40805281),
+        (74.01692503, 0.04240589),
+    ),
+    "neptune": (
+        (30.06992276, 0.00026291),
+        (0.00859048, 0.00005105),
+        (1.77004347, 0.00035372),
+        (-55.12002969, 218.45945325),
+        (44.96476227, -0.32241464),
+        (131.78422574, -0.00508664),
+    ),
+}
+
+# Truncated ELP-2000/82 (Meeus, Astronomical Algorithms, tables 47.A and 47.B)
+# multiples of D, M, M', F; longitude [1e-6 °]; distance [1e-3 km]
+_MOON_LONGITUDE_DISTANCE_TERMS: npt.NDArray[np.float64] = np.array(
+    [
+        (0, 0, 1, 0, 6288774, -20905355),
+        (2, 0, -1, 0, 1274027, -3699111),
+        (2, 0, 0, 0, 658314, -2955968),
+        (0, 0, 2, 0, 213618, -569925),
+        (0, 1, 0, 0, -185116, 48888),
+        (0, 0, 0, 2, -114332, -3149),
+        (2, 0, -2, 0, 58793, 246158),
+        (2, -1, -1, 0, 57066, -152138),
+        (2, 0, 1, 0, 53322, -170733),
+        (2, -1, 0, 0, 45758, -204586),
+        (0, 1, -1, 0, -40923, -129620),
+        (1, 0, 0, 0, -34720, 108743),
+        (0, 1, 1, 0, -30383, 104755),
+        (2, 0, 0, -2, 15327, 10321),
+        (0, 0, 1, 2, -12528, 0),
+        (0, 0, 1, -2, 10980, 79661),
+        (4, 0, -1, 0, 10675, -34782),
+        (0, 0, 3, 0, 10034, -23210),
+        (4, 0, -2, 0, 8548, -21636),
+        (2, 1, -1, 0, -7888, 24208),
+        (2, 1, 0, 0, -6766, 30824),
+        (1, 0, -1, 0, -5163, -8379),
+        (1, 1, 0, 0, 4987, -16675),
+        (2, -1, 1, 0, 4036, -12831),
+        (2, 0, 2, 0, 3994, -10445),
+        (4, 0, 0, 0, 3861, -11650),
+        (2, 0, -3, 0, 3665, 14403),
+        (0, 1, -2, 0, -2689, -7003),
+        (2, 0, -1, 2, -2602, 0),
+        (2, -1, -2, 0, 2390, 10056),
+        (1, 0, 1, 0, -2348, 6322),
+        (2, -2, 0, 0, 2236, -9884),
+    ],
+    dtype=np.float64,
+)
+# multiples of D, M, M', F; latitude [1e-6 °]
+_MOON_LATITUDE_TERMS: npt.NDArray[np.float64] = np.array(
+    [
+        (0, 0, 0, 1, 5128122),
+        (0, 0, 1, 1, 280602),
+        (0, 0, 1, -1, 277693),
+        (2, 0, 0, -1, 173237),
+        (2, 0, -1, 1, 55413),
+        (2, 0, -1, -1, 46271),
+        (2, 0, 0, 1, 32573),
+        (0, 0, 2, 1, 17198),
+        (2, 0, 1, -1, 9266),
+        (0, 0, 2, -1, 8822),
+        (2, -1, 0, -1, 8216),
+        (2, 0, -2, -1, 4324),
+        (2, 0, 1, 1, 4200),
+        (2, 1, 0, -1, -3359),
+        (2, -1, -1, 1, 2463),
+        (2, -1, 0, 1, 2211),
+        (2, -1, -1, -1, 2065),
+        (0, 1, -1, -1, -1870),
+        (4, 0, -1, -1, 1828),
+        (0, 1, 0, 1, -1794),
+    ],
+    dtype=np.float64,
+)
+
+
+class EphemerisModel(BoundToObservableObjectBaseModel, BaseModel):
+    """
+    Computed positions of an observable object; every attribute is an array with one entry per timestamp.
+
+    Angles are given in degrees (right ascension in hours) and the distance in AU (km for the moon)
+    so they line up with the decoded ``RowModel``-columns (see ``columns.decode_rows``).
+    """
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    date_and_time: np.ndarray  # datetime64 (UTC)
+    right_ascension: np.ndarray
+    declination: np.ndarray
+    ecliptic_longitude: np.ndarray
+    ecliptic_latitude: np.ndarray
+    distance: np.ndarray
+    brightness: np.ndarray
+    diameter: np.ndarray
+    elongation: np.ndarray  # signed; negative west of the sun
+    phase: np.ndarray  # moon only; elongation / 180°; negative while waning
+    age: np.ndarray  # moon only; days since the last (positive) or until the next (negative) new moon
+
+    def to_rows(self) -> list[RowModel]:
+        """Convert the arrays to ``RowModel``s using the same columns as an export."""
+        columns = {
+            "right_ascension": encode_hms(self.right_ascension),
+            "declination": encode_dms(self.declination),
+            "ecliptic_longitude": encode_dms(self.ecliptic_longitude, signed=False),
+            "ecliptic_latitude": encode_dms(self.ecliptic_latitude),
+            "distance": np.round(self.distance, 0 if self.bound_object.is_moon else 5).tolist(),
+            "brightness": np.round(self.brightness, 1).tolist(),
+            "diameter": np.round(self.diameter, 1).tolist(),
+        }
+        if self.bound_object.is_moon:
+            columns["phase"] = np.round(self.phase, 2).tolist()
+            columns["age"] = np.round(self.age, 1).tolist()
+        elif self.bound_object.is_planet:
+            columns["elongation"] = np.round(self.elongation, 1).tolist()
+
+        date_and_time = self.date_and_time.astype("datetime64[us]").tolist()
+        return [
+            RowModel(
+                bound_object=self.bound_object, date_and_time=dt, **{key: value[i] for key, value in columns.items()}
+            )
+            for i, dt in enumerate(date_and_time)
+        ]
+
+
+def _heliocentric_ecliptic(name: str, t: FloatArray) -> FloatArray:
+    """Heliocentric ecliptic J2000.0 rectangular coordinates (AU) with shape ``(3, *t.shape)``."""
+    a, e, inclination, mean_longitude, perihelion, node = (value + rate * t for value, rate in _ORBITAL_ELEMENTS[name])
+    mean_anomaly = np.radians((mean_longitude - perihelion + 180) % 360 - 180)
+    eccentric_anomaly = mean_anomaly + e * np.sin(mean_anomaly)
+    for _ in range(6):  # Newton iterations for Kepler's equation
+        eccentric_anomaly -= (eccentric_anomaly - e * np.sin(eccentric_anomaly) - mean_anomaly) / (
+            1 - e * np.cos(eccentric_anomaly)
+        )
+    x_orbit = a * (np.cos(eccentric_anomaly) - e)
+    y_orbit = a * np.sqrt(1 - e**2) * np.sin(eccentric_anomaly)
+
+    argument = np.radians(perihelion - node)
+    node, inclination = np.radians(node), np.radians(inclination)
+    cos_w, sin_w, cos_n, sin_n, cos_i = (
+        np.cos(argument),
+        np.sin(argument),
+        np.cos(node),
+        np.sin(node),
+        np.cos(inclination),
+    )
+    return np.stack(
+        [
+            (cos_w * cos_n - sin_w * sin_n * cos_i) * x_orbit + (-sin_w * cos_n - cos_w * sin_n * cos_i) * y_orbit,
+            (cos_w * sin_n + sin_w * cos_n * cos_i) * x_orbit + (-sin_w * sin_n + cos_w * cos_n * cos_i) * y_orbit,
+            np.sin(argument) * np.sin(inclination) * x_orbit + np.cos(argument) * np.sin(inclination) * y_orbit,
+        ]
+    )
+
+
+def _moon_geocentric_ecliptic(t: FloatArray) -> tuple[FloatArray, FloatArray, FloatArray]:
+    """Longitude and latitude (mean ecliptic and equinox of date, degrees) and distance (km) of the moon."""
+    mean_longitude = 218.3164477 + 481267.88123421 * t
+    arguments = np.stack(
+        [
+            297.8501921 + 445267.1114034 * t,  # D
+            357.5291092 + 35999.0502909 * t,  # M
+            134.9633964 + 477198.8675055 * t,  # M'
+            93.2720950 + 483202.0175233 * t,  # F
+        ]
+    )
+    eccentricity = 1 - 0.002516 * t - 0.0000074 * t**2
+    a1, a2, a3 = (
+        np.radians(119.75 + 131.849 * t),
+        np.radians(53.09 + 479264.290 * t),
+        np.radians(313.45 + 481266.484 * t),
+    )
+
+    def series(terms: FloatArray) -> tuple[FloatArray, FloatArray]:
+        angle = np.radians(np.tensordot(terms[:, :4], arguments, axes=1))
+        correction = eccentricity ** np.abs(terms[:, 1]).reshape(-1, *(1,) * t.ndim)
+        return angle, correction
+
+    angle, correction = series(_MOON_LONGITUDE_DISTANCE_TERMS)
+    sigma_l = np.tensordot(_MOON_LONGITUDE_DISTANCE_TERMS[:, 4], correction * np.sin(angle), axes=1)
+    sigma_r = np.tensordot(_MOON_LONGITUDE_DISTANCE_TERMS[:, 5], correction * np.cos(angle), axes=1)
+    angle, correction = series(_MOON_LATITUDE_TERMS)
+    sigma_b = np.tensordot(_MOON_LATITUDE_TERMS[:, 4], correction * np.sin(angle), axes=1)
+
+    l_prime, m_prime, f = np.radians(mean_longitude), np.radians(arguments[2]), np.radians(arguments[3])
+    sigma_l += 3958 * np.sin(a1) + 1962 * np.sin(l_prime - f) + 318 * np.sin(a2)
+    sigma_b += (
+        -2235 * np.sin(l_prime)
+        + 382 * np.sin(a3)
+        + 175 * np.sin(a1 - f)
+        + 175 * np.sin(a1 + f)
+        + 127 * np.sin(l_prime - m_prime)
+        - 115 * np.sin(l_prime + m_prime)
+    )
+    return (mean_longitude + sigma_l / 1e6) % 360, sigma_b / 1e6, 385000.56 + sigma_r / 1e3
+
+
+def _to_spherical(xyz: FloatArray) -> tuple[FloatArray, FloatArray, FloatArray]:
+    distance = np.linalg.norm(xyz, axis=0)
+    return np.degrees(np.arctan2(xyz[1], xyz[0])) % 360, np.degrees(np.arcsin(xyz[2] / distance)), distance
+
+
+def _to_rectangular(longitude: FloatArray, latitude: FloatArray, distance: FloatArray) -> FloatArray:
+    lon, lat = np.radians(longitude), np.radians(latitude)
+    return distance * np.stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)])
+
+
+def _angle_between(a: FloatArray, b: FloatArray) -> FloatArray:
+    cos = np.sum(a * b, axis=0) / (np.linalg.norm(a, axis=0) * np.linalg.norm(b, axis=0))
+    return np.degrees(np.arccos(np.clip(cos, -1, 1)))
+
+
+def _signed_difference(a: FloatArray, b: FloatArray) -> FloatArray:
+    """Return ``a - b`` wrapped to -180° <-> 180°."""
+    return (a - b + 180) % 360 - 180
+
+
+def _magnitude(name: str, r: FloatArray, delta: FloatArray, i: FloatArray, **extra: FloatArray) -> FloatArray:
+    """Visual magnitude (Meeus, Astronomical Algorithms, chapter 41)."""
+    match name:
+        case "sun":
+            return -26.74 + 5 * np.log10(delta)
+        case "moon":
+            return -12.73 + 0.026 * i + 4e-9 * i**4
+        case "mercury":
+            return -0.42 + 5 * np.log10(r * delta) + 0.0380 * i - 0.000273 * i**2 + 0.000002 * i**3
+        case "venus":
+            return -4.40 + 5 * np.log10(r * delta) + 0.0009 * i + 0.000239 * i**2 - 0.00000065 * i**3
+        case "mars":
+            return -1.52 + 5 * np.log10(r * delta) + 0.016 * i
+        case "jupiter":
+            return -9.40 + 5 * np.log10(r * delta) + 0.005 * i
+        case "saturn":
+            sin_b = np.abs(np.sin(np.radians(extra["ring_tilt"])))
+            return -8.88 + 5 * np.log10(r * delta) - 2.60 * sin_b + 1.25 * sin_b**2
+        case "uranus":
+            return -7.19 + 5 * np.log10(r * delta)
+        case "neptune":
+            return -6.87 + 5 * np.log10(r * delta)
+        case _:
+            raise ObjectNotSupportedError(name)
+
+
+def _annual_aberration(
+    t: FloatArray, longitude: FloatArray, latitude: FloatArray, sun_longitude: FloatArray
+) -> tuple[FloatArray, FloatArray]:
+    """Annual aberration in ecliptic longitude and latitude (degrees; Meeus 23.2) in the frame of the arguments."""
+    _, eccentricity, _, _, perihelion, _ = (value + rate * t for value, rate in _ORBITAL_ELEMENTS["earth"])
+    sun, perihelion = np.radians(sun_longitude - longitude), np.radians(perihelion - longitude)
+    lat = np.radians(latitude)
+    return (
+        _ABERRATION_CONSTANT * (-np.cos(sun) + eccentricity * np.cos(perihelion)) / np.cos(lat),
+        -_ABERRATION_CONSTANT * np.sin(lat) * (np.sin(sun) - eccentricity * np.sin(perihelion)),
+    )
+
+
+def _saturn_ring_tilt(t: FloatArray, longitude: FloatArray, latitude: FloatArray) -> FloatArray:
+    """Saturnicentric latitude of the earth referred to the ring plane (Meeus 45.3) in degrees."""
+    inclination = np.radians(28.075216 - 0.012998 * t)
+    node = np.radians(169.508470 + 1.394681 * t)
+    lon, lat = np.radians(longitude), np.radians(latitude)
+    return np.degrees(
+        np.arcsin(np.sin(inclination) * np.cos(lat) * np.sin(lon - node) - np.cos(inclination) * np.sin(lat))
+    )
+
+
+def compute_ephemerides(
+    observable_objects: Iterable[ObservableObjectModel],
+    date_and_time: npt.ArrayLike,
+    *,
+    delta_t: timedelta = timedelta(0),
+    equinox: float | None = 2000.0,
+) -> dict[ObservableObjectModel, EphemerisModel]:
+    """
+    Compute geocentric low-precision positions for every object at every timestamp (UTC) in one vectorized pass.
+
+    The sun and the planets use Keplerian mean elements (corrected for light-time), the moon uses a truncated
+    ELP-2000/82 theory. Just like the exports state it in ``MetaDataModel.equinox``, the coordinates are either
+    astrometric ones referred to the mean equinox of ``equinox`` (a julian epoch like ``2000.0``) or, if ``equinox``
+    is ``None``, apparent ones referred to the true equinox of date, i.e. including nutation and annual aberration.
+    """
+    date_and_time = np.asarray(date_and_time, dtype="datetime64[ns]")
+    t = julian_centuries(datetime64_to_julian_day(date_and_time, delta_t))
+    earth = _heliocentric_ecliptic("earth", t)
+
+    apparent, nutation_in_longitude = equinox is None, np.zeros_like(t)
+    if apparent:
+        nutation_in_longitude, nutation_in_obliquity = nutation(t)
+        precession, obliquity = general_precession_in_longitude(t), mean_obliquity(t) + nutation_in_obliquity
+    else:
+        t_equinox = (equinox - 2000.0) / 100
+        precession, obliquity = general_precession_in_longitude(t_equinox), mean_obliquity(t_equinox)
+
+    geometric_sun_longitude, _, _ = _to_spherical(-earth)  # J2000.0
+    sun_longitude = geometric_sun_longitude + precession + nutation_in_longitude
+
+    result: dict[ObservableObjectModel, EphemerisModel] = {}
+    for observable_object in observable_objects:
+        name = observable_object.name
+        if name not in _EQUATORIAL_RADIUS_KM:
+            raise ObjectNotSupportedError(name)
+        extra: dict[str, FloatArray] = {}
+
+        if observable_object.is_sun:
+            heliocentric = np.zeros_like(earth)
+            geocentric = -earth
+        elif observable_object.is_moon:
+            longitude, latitude, distance_km = _moon_geocentric_ecliptic(t)
+            longitude = longitude - general_precession_in_longitude(t)  # of date -> J2000.0
+            geocentric = _to_rectangular(longitude, latitude, distance_km / _AU_IN_KM)
+            heliocentric = geocentric + earth
+        else:
+            geocentric = _heliocentric_ecliptic(name, t) - earth
+            light_time = np.linalg.norm(geocentric, axis=0) * _LIGHT_TIME_DAYS_PER_AU / 36525
+            heliocentric = _heliocentric_ecliptic(name, t - light_time)
+            geocentric = heliocentric - earth
+
+        longitude, latitude, distance = _to_spherical(geocentric)
+        if apparent and not observable_object.is_moon:  # the moon's aberration (< 1") is negligible
+            aberration_in_longitude, aberration_in_latitude = _annual_aberration(
+                t, longitude, latitude, geometric_sun_longitude
+            )
+            longitude, latitude = longitude + aberration_in_longitude, latitude + aberration_in_latitude
+        longitude = (longitude + precession + nutation_in_longitude) % 360
+        right_ascension, declination = ecliptic_to_equatorial(longitude, latitude, obliquity)
+
+        elongation = _angle_between(geocentric, -earth) * np.sign(_signed_difference(longitude, sun_longitude))
+        phase_angle = np.zeros_like(t) if observable_object.is_sun else _angle_between(-heliocentric, -geocentric)
+
+        phase = age = np.full_like(t, np.nan)
+        if observable_object.is_moon:
+            phase = elongation / 180
+            lunation = (longitude - sun_longitude) % 360
+            age = np.where(lunation > 180, lunation - 360, lunation) / 360 * _SYNODIC_MONTH_DAYS
+        if name == "saturn":
+            extra["ring_tilt"] = _saturn_ring_tilt(t, longitude, latitude)
+
+        distance_km = distance * _AU_IN_KM
+        result[observable_object] = EphemerisModel(
+            bound_object=observable_object,
+            date_and_time=date_and_time,
+            right_ascension=right_ascension,
+            declination=declination,
+            ecliptic_longitude=longitude,
+            ecliptic_latitude=latitude,
+            distance=distance_km if observable_object.is_moon else distance,
+            brightness=_magnitude(name, np.linalg.norm(heliocentric, axis=0), distance, phase_angle, **extra),
+            diameter=2 * np.arctan(_EQUATORIAL_RADIUS_KM[name] / distance_km) * _ARCSECONDS_PER_RADIAN,
+            elongation=elongation,
+            phase=phase,
+            age=age,
+        )
+    return result
+
+
+def compute_ephemeris(
+    observable_object: ObservableObjectModel,
+    date_and_time: npt.ArrayLike,
+    *,
+    delta_t: timedelta = timedelta(0),
+    equinox: float | None = 2000.0,
+) -> EphemerisModel:
+    """Shortcut for ``compute_ephemerides`` with a single object."""
+    return compute_ephemerides([observable_object], date_and_time, delta_t=delta_t, equinox=equinox)[observable_object]
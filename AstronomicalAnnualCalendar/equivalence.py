@@ -0,0 +1,439 @@
+# standard library
+import gzip
+import re
+import tempfile
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+# third party
+import numpy as np
+from pydantic import BaseModel
+from pydantic.config import ConfigDict
+
+# local
+from .archive import ArchiveStore
+from .columns import (
+    COLUMN_DECODERS,
+    COLUMN_ENCODERS,
+    WEEKDAYS,
+    column_difference,
+    decode_rows,
+    evaluate_header,
+    timezone_label,
+)
+from .enums import ObservableObjectEnum
+from .models import BoundToObservableObjectBaseModel, DataModel, ObservableObjectModel, RowModel
+from .parser import Parser
+from .regex import OBJECT_DATA_BODY_REGEX
+from .timezones import TIMEZONES
+from .utils import observable_object_from_alias
+
+
+__all__ = (
+    "DecodedModel",
+    "MismatchModel",
+    "EquivalenceReportModel",
+    "FAST_PATHS",
+    "register_fast_path",
+    "decoded_from_data",
+    "reference_decode",
+    "compare",
+    "shrink",
+    "check_equivalence",
+    "synthetic_export",
+)
+
+
+type Decoded = dict[ObservableObjectModel, "DecodedModel"]
+type FastPath = Callable[[str], Decoded]
+
+_EPSILON: float = 1e-9  # absorbs the float noise of summing the parts of a value in a different order
+_NUMBER_REGEX: re.Pattern[str] = re.compile(r"\d+(?:\.\d+)?")
+_LAYOUT_FIELDS: frozenset[str] = frozenset({"weekday", "date", "timezone"})
+_RANGES: dict[str, tuple[float, float]] = {  # of the random values; times of day are 0 to 24 hours
+    "right_ascension": (0, 24),
+    "declination": (-89, 89),
+    "ecliptic_longitude": (0, 359.99),
+    "ecliptic_latitude": (-89, 89),
+    "azimut_rise": (0, 179),
+    "azimut_set": (0, 359),
+    "distance": (0.3, 9.9),
+    "brightness": (-27, 15),
+    "diameter": (1, 2000),
+    "phase": (-1, 1),
+    "age": (-15, 15),
+    "elongation": (-179.9, 179.9),
+}
+
+
+class DecodedModel(BoundToObservableObjectBaseModel, BaseModel):
+    """The UTC timestamps and decoded columns (see ``columns.decode_rows``) of an object; paths get compared by them."""
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    date_and_time: np.ndarray  # datetime64[ns] (UTC)
+    columns: dict[str, np.ndarray]  # float64, ``nan`` where a value is missing
+
+
+class MismatchModel(BaseModel):
+    """A difference between the reference path and a fast path."""
+
+    model_config = ConfigDict(frozen=True)
+
+    observable_object: str = ""
+    field: str  # a column, or "objects", "rows", "date_and_time", "columns" and "exception"
+    rows: tuple[int, ...] = ()  # of the reference
+    reference: str = ""  # first differing value (or summary)
+    candidate: str = ""
+
+
+class EquivalenceReportModel(BaseModel):
+    """Result of checking a fast path against the reference path; ``reproducer`` is the shrunk failing export."""
+
+    model_config = ConfigDict(frozen=True)
+
+    path: str
+    mismatches: tuple[MismatchModel, ...] = ()
+    reproducer: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the fast path gave the same answers."""
+        return not self.mismatches
+
+
+FAST_PATHS: dict[str, FastPath] = {}
+"""Every registered fast path by name; each decodes an export (text) like ``reference_decode`` does."""
+
+
+def register_fast_path(name: str) -> Callable[[FastPath], FastPath]:
+    """Register the decorated function as fast path ``name``; it gets checked against ``reference_decode``."""
+
+    def decorator(function: FastPath) -> FastPath:
+        FAST_PATHS[name] = function
+        return function
+
+    return decorator
+
+
+def decoded_from_data(data: Iterable[DataModel]) -> Decoded:
+    """Decode parsed ``data`` (e.g. ``Parser.parse().values()``) column by column."""
+    return {
+        item.bound_object: DecodedModel(
+            bound_object=item.bound_object, date_and_time=item.date_and_time, columns=decode_rows(item.rows)
+        )
+        for item in data
+    }
+
+
+# reference path
+
+
+def _reference_value(value: float | str | None) -> float:
+    """Decode a single cell: sexagesimal parts (``18h42m04.3s``, ``- 7°37'28"``, ``8h44m``, ``131°``) or a number."""
+    if value is None:
+        return np.nan
+    if isinstance(value, float):
+        return value
+    if not value.strip("- "):
+        return np.nan
+    result = sum(float(number) / 60**index for index, number in enumerate(_NUMBER_REGEX.findall(value)))
+    return -result if value.strip().startswith("-") else result
+
+
+def reference_decode(export: str) -> Decoded:
+    """
+    Decode ``export`` the straightforward way: a regex per section, a ``RowModel`` per line, a cell at a time.
+
+    It's slow but simple enough to be obviously right, which makes it the reference for every fast path.
+    """
+    decoded: Decoded = {}
+    for match in OBJECT_DATA_BODY_REGEX.finditer(export if export.endswith("\n") else f"{export}\n"):
+        observable_object = observable_object_from_alias(match.group("name"))
+        header = match.group("header")
+        evaluated = evaluate_header(observable_object, header)
+        zone = ZoneInfo(TIMEZONES[timezone_label(header)])
+        rows: list[RowModel] = []
+        for line in match.group("body").splitlines():
+            cells = {field: evaluated[field].get_value(line).strip() for field in evaluated}
+            local = datetime.strptime(f"{cells['date']} {cells['timezone']}", "%d.%m.%Y %H:%M:%S")  # noqa: DTZ007
+            rows.append(
+                RowModel(
+                    bound_object=observable_object,
+                    date_and_time=local.replace(tzinfo=zone).astimezone(UTC),
+                    **{field: value for field, value in cells.items() if field not in _LAYOUT_FIELDS},
+                )
+            )
+        columns = {
+            field: np.array([_reference_value(getattr(row, field)) for row in rows], dtype=np.float64)
+            for field in COLUMN_DECODERS
+            if any(getattr(row, field) is not None for row in rows)
+        }
+        decoded[observable_object] = DecodedModel(
+            bound_object=observable_object,
+            date_and_time=np.array([row.date_and_time.replace(tzinfo=None) for row in rows], dtype="datetime64[ns]"),
+            columns=columns,
+        )
+    return decoded
+
+
+# fast paths
+
+
+@register_fast_path("parser")
+def _parser(export: str) -> Decoded:
+    return decoded_from_data(Parser.from_bytes(export).parse().values())
+
+
+@register_fast_path("gzip-stream")
+def _gzip_stream(export: str) -> Decoded:
+    return decoded_from_data(Parser.from_bytes(gzip.compress(export.encode("utf-8"))).parse().values())
+
+
+@register_fast_path("file-with-section-index")
+def _file_with_section_index(export: str) -> Decoded:
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "export.txt"
+        path.write_text(export, "utf-8")
+        return decoded_from_data(Parser(file_path=path, use_sidecar_index=True).parse().values())
+
+
+@register_fast_path("thread-pool")
+def _thread_pool(export: str) -> Decoded:
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        return decoded_from_data(Parser.from_bytes(export).parse(executor=executor).values())
+
+
+@register_fast_path("archive")
+def _archive(export: str) -> Decoded:
+    parsed = Parser.from_bytes(export).parse()
+    with tempfile.TemporaryDirectory() as directory:
+        store = ArchiveStore(directory)
+        store.ingest(parsed.values())
+        return {
+            result.bound_object: DecodedModel(
+                bound_object=result.bound_object, date_and_time=result.date_and_time, columns=result.columns
+            )
+            for observable_object in parsed
+            for result in store.query(observable_object)
+        }
+
+
+# comparison
+
+
+def _first(values: np.ndarray, rows: np.ndarray) -> str:
+    return str(values[rows[0]]) if rows.size else ""
+
+
+def compare(
+    reference: Decoded, candidate: Decoded, *, tolerances: Mapping[str, float] | None = None
+) -> list[MismatchModel]:
+    """
+    Compare two decoded exports object by object and field by field.
+
+    Timestamps have to be equal, columns may differ by their entry of ``tolerances`` (absolute, in the decoded unit;
+    defaults to float noise). Angles and times of day are compared wrap-aware (see ``COLUMN_PERIODS``) and ``nan``
+    has to be at the same rows.
+    """
+    tolerances = dict(tolerances or {})
+    mismatches: list[MismatchModel] = []
+    names = {item.name: item for item in reference}, {item.name: item for item in candidate}
+    if names[0].keys() != names[1].keys():
+        mismatches.append(
+            MismatchModel(field="objects", reference=", ".join(sorted(names[0])), candidate=", ".join(sorted(names[1])))
+        )
+    for name in sorted(names[0].keys() & names[1].keys()):
+        expected, actual = reference[names[0][name]], candidate[names[1][name]]
+        if len(expected.date_and_time) != len(actual.date_and_time):
+            mismatches.append(
+                MismatchModel(
+                    observable_object=name,
+                    field="rows",
+                    reference=str(len(expected.date_and_time)),
+                    candidate=str(len(actual.date_and_time)),
+                )
+            )
+            continue
+        if (rows := np.flatnonzero(expected.date_and_time != actual.date_and_time)).size:
+            mismatches.append(
+                MismatchModel(
+                    observable_object=name,
+                    field="date_and_time",
+                    rows=tuple(rows.tolist()),
+                    reference=_first(expected.date_and_time, rows),
+                    candidate=_first(actual.date_and_time, rows),
+                )
+            )
+        if expected.columns.keys() != actual.columns.keys():
+            mismatches.append(
+                MismatchModel(
+                    observable_object=name,
+                    field="columns",
+                    reference=", ".join(sorted(expected.columns)),
+                    candidate=", ".join(sorted(actual.columns)),
+                )
+            )
+        for field in sorted(expected.columns.keys() & actual.columns.keys()):
+            left, right = expected.columns[field], actual.columns[field]
+            difference = column_difference(field, left, right)
+            differing = (np.isnan(left) != np.isnan(right)) | (np.abs(difference) > tolerances.get(field, _EPSILON))
+            if (rows := np.flatnonzero(differing)).size:
+                mismatches.append(
+                    MismatchModel(
+                        observable_object=name,
+                        field=field,
+                        rows=tuple(rows.tolist()),
+                        reference=_first(left, rows),
+                        candidate=_first(right, rows),
+                    )
+                )
+    return mismatches
+
+
+def _mismatches(
+    path: FastPath, export: str, reference: Decoded, tolerances: Mapping[str, float] | None
+) -> list[MismatchModel]:
+    try:
+        candidate = path(export)
+    except Exception as error:  # noqa: BLE001  # a fast path failing where the reference doesn't is a mismatch too
+        return [MismatchModel(field="exception", candidate=f"{type(error).__name__}: {error}")]
+    return compare(reference, candidate, tolerances=tolerances)
+
+
+# shrinking
+
+
+def _split_export(export: str) -> tuple[str, list[tuple[str, str, list[str]]]]:
+    first_line = export.split("\n", 1)[0]
+    sections = [
+        (match.group("name"), match.group("header"), match.group("body").splitlines())
+        for match in OBJECT_DATA_BODY_REGEX.finditer(export if export.endswith("\n") else f"{export}\n")
+    ]
+    return first_line, sections
+
+
+def _join_export(first_line: str, sections: list[tuple[str, str, list[str]]]) -> str:
+    return "\n\n".join([first_line, *("\n".join([name, header, *rows]) for name, header, rows in sections)]) + "\n"
+
+
+def shrink(export: str, fails: Callable[[str], bool]) -> str:
+    """
+    Shrink the failing ``export`` to a minimal one ``fails`` still holds for.
+
+    Sections get dropped one at a time, then the rows of every section in halving chunks (delta debugging); every
+    section keeps at least one row. The result is a valid export which can't lose a section or a row anymore.
+    """
+    first_line, sections = _split_export(export)
+    index = 0
+    while len(sections) > 1 and index < len(sections):
+        candidate = sections[:index] + sections[index + 1 :]
+        if fails(_join_export(first_line, candidate)):
+            sections = candidate
+        else:
+            index += 1
+
+    for position in range(len(sections)):
+        name, header, rows = sections[position]
+        chunk = len(rows) // 2
+        while chunk:
+            start = 0
+            while start < len(rows) and len(rows) > 1:
+                kept = rows[:start] + rows[start + chunk :]
+                trial = [*sections[:position], (name, header, kept), *sections[position + 1 :]]
+                if kept and fails(_join_export(first_line, trial)):
+                    rows = kept
+                else:
+                    start += chunk
+            chunk //= 2
+        sections[position] = name, header, rows
+    return _join_export(first_line, sections)
+
+
+def check_equivalence(
+    export: str,
+    paths: Iterable[str] | None = None,
+    *,
+    tolerances: Mapping[str, float] | None = None,
+    minimize: bool = True,
+) -> dict[str, EquivalenceReportModel]:
+    """
+    Run the fast ``paths`` (defaults to every one of ``FAST_PATHS``) and ``reference_decode`` on ``export``.
+
+    The mismatches of every failing path get shrunk to a minimal reproducing export (unless ``minimize`` is off).
+    """
+    reference = reference_decode(export)
+    reports: dict[str, EquivalenceReportModel] = {}
+    for name in FAST_PATHS if paths is None else paths:
+        path = FAST_PATHS[name]
+        if not (mismatches := _mismatches(path, export, reference, tolerances)):
+            reports[name] = EquivalenceReportModel(path=name)
+            continue
+
+        def fails(text: str, path: FastPath = path) -> bool:
+            try:
+                expected = reference_decode(text)
+            except Exception:  # noqa: BLE001  # not a valid export anymore
+                return False
+            return bool(_mismatches(path, text, expected, tolerances))
+
+        reproducer = shrink(export, fails) if minimize else None
+        reports[name] = EquivalenceReportModel(path=name, mismatches=tuple(mismatches), reproducer=reproducer)
+    return reports
+
+
+# synthetic exports
+
+
+def _random_cells(field: str, rng: np.random.Generator, count: int, missing: float) -> list[str]:
+    """Random cells of ``field`` as they'd appear in an export; times of day are ``--`` by a chance of ``missing``."""
+    low, high = _RANGES.get(field, (0, 23.99))
+    values = rng.uniform(low, high, count)
+    if field not in _RANGES:  # times of day
+        values[rng.random(count) < missing] = np.nan
+    return [str(value) for value in COLUMN_ENCODERS[field](values)]
+
+
+def synthetic_export(template: str, seed: int, *, rows: int = 24, missing: float = 0.1) -> str:
+    """
+    Create a random export with the layout of the export ``template``.
+
+    Every section of ``template`` gets renamed to a random alias of a random object and its header's timezone to a
+    random label. Rows get timestamps an hour to 10 days apart (starting at a random hour of 2000 to 2039) and
+    random values in every known column; times of day are ``--`` by a chance of ``missing``. Equal seeds give equal
+    exports.
+    """
+    rng = np.random.default_rng(seed)
+    first_line, sections = _split_export(template)
+    members = [member.value for member in ObservableObjectEnum]
+    objects = [members[index] for index in rng.permutation(len(members))[: len(sections)].tolist()]
+    label = str(rng.choice(list(TIMEZONES)))
+    step = np.timedelta64(int(rng.choice([1, 7, 24, 240])), "h")
+    start = np.datetime64("2000-01-01T00", "h") + np.timedelta64(int(rng.integers(40 * 365 * 24)), "h")
+    moments = (start + step * np.arange(rows)).astype("datetime64[s]").tolist()
+
+    synthetic = []
+    for observable_object, (_, header, _) in zip(objects, sections, strict=True):
+        header = re.sub(r"MEZ |MESZ|UTC ", label.ljust(4), header, count=1)
+        evaluated = evaluate_header(observable_object, header)
+        cells = {
+            "weekday": [WEEKDAYS[moment.weekday()] for moment in moments],
+            "date": [moment.strftime("%d.%m.%Y") for moment in moments],
+            "timezone": [f"{moment.hour}:{moment.minute:02d}:{moment.second:02d}" for moment in moments],
+            **{field: _random_cells(field, rng, rows, missing) for field in evaluated if field in COLUMN_ENCODERS},
+        }
+        width = max(item.endpos + item.offset for item in evaluated.values())
+        lines = []
+        for row in range(rows):
+            line = [" "] * width
+            for field, values in cells.items():
+                item = evaluated[field]
+                end = item.endpos + item.offset
+                line[end - item.length : end] = values[row].rjust(item.length)
+            lines.append("".join(line).rstrip())
+        aliases = sorted(observable_object.aliases)
+        synthetic.append((aliases[int(rng.integers(len(aliases)))], header, lines))
+    return _join_export(first_line, synthetic)
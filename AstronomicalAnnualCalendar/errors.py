@@ -3,6 +3,14 @@ __all__ = (
     "UnitNotSupportedError",
     "AliasNotAssignedError",
     "EvaluatedHeaderValidationError",
+    "SectionNotFoundError",
+    "WeekdayMismatchError",
+    "ResamplingNotSupportedError",
+    "RowValidationError",
+    "ColumnNotFoundError",
+    "LayerNotSupportedError",
+    "MetaDataNotFoundError",
+    "ObjectNotSupportedError",
 )
 
 
@@ -49,3 +57,99 @@ class EvaluatedHeaderValidationError(AstronomicalAnnualCalendarException, ValueE
             f"The combination of `endpos` ({endpos}) and retrieved `offset` ({offset}) and "
             f"`length` ({length}) is invalid! Starting index would be {startpos}!"
         )
+
+
+class SectionNotFoundError(AstronomicalAnnualCalendarException, LookupError):
+    """
+    Error for ``index.SectionIndexModel``.
+
+    It's used to signify, that the requested observable object has no section in the indexed file.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(f"There is no section for {name!r} in the indexed file")
+
+
+class WeekdayMismatchError(AstronomicalAnnualCalendarException, ValueError):
+    """
+    Error for ``columns.check_weekdays``.
+
+    It's used to signify, that the weekday prefix of a row doesn't match its date.
+    """
+
+    def __init__(self, *, rows: list[int], weekdays: list[str], expected: list[str]):
+        details = ", ".join(
+            f"row {row}: {weekday!r} instead of {wanted!r}"
+            for row, weekday, wanted in zip(rows, weekdays, expected, strict=True)
+        )
+        super().__init__(f"The weekday doesn't match the date in {len(rows)} row(s) ({details})")
+
+
+class ResamplingNotSupportedError(AstronomicalAnnualCalendarException, ValueError):
+    """
+    Error for ``resample.resample``.
+
+    It's used to signify, that the data of an observable object can't be interpolated reliably.
+    """
+
+    def __init__(self, name: str, reason: str):
+        super().__init__(f"Refusing to resample the data of {name!r}: {reason}")
+
+
+class RowValidationError(AstronomicalAnnualCalendarException, ValueError):
+    """
+    Error for ``models.DataModel.from_raw_rows``.
+
+    It's used to signify, that rows of a section are invalid; ``errors`` holds the messages by row index.
+    """
+
+    def __init__(self, name: str, errors: dict[int, list[str]]):
+        self.errors = errors
+        details = "; ".join(f"row {row}: {", ".join(messages)}" for row, messages in errors.items())
+        super().__init__(f"{len(errors)} invalid row(s) for {name!r} ({details})")
+
+
+class ColumnNotFoundError(AstronomicalAnnualCalendarException, LookupError):
+    """
+    Error for computations on the columns of a ``models.DataModel``, e.g. ``transforms.normalized_equatorial``.
+
+    It's used to signify, that the export doesn't contain a column the computation needs.
+    """
+
+    def __init__(self, name: str, field: str):
+        super().__init__(f"The data of {name!r} has no {field!r}-column")
+
+
+class LayerNotSupportedError(AstronomicalAnnualCalendarException, TypeError):
+    """
+    Error for ``svg.write_svg``.
+
+    It's used to signify, that there's no SVG writer for a kind of layer (see ``svg.register_svg_writer``).
+    """
+
+    def __init__(self, kind: str):
+        super().__init__(f"There is no SVG writer for {kind!r}-layers", gh=True)
+
+
+class MetaDataNotFoundError(AstronomicalAnnualCalendarException, ValueError):
+    """
+    Error for ``parser.Parser``.
+
+    It's used to signify, that the input doesn't start with the metadata-line of an export (e.g. it's empty).
+    """
+
+    def __init__(self, line: str):
+        super().__init__(
+            f"The input doesn't start with the metadata of an export (got {line!r})" if line else "The input is empty"
+        )
+
+
+class ObjectNotSupportedError(AstronomicalAnnualCalendarException, NotImplementedError):
+    """
+    Error for ``ephemeris.compute_ephemerides``.
+
+    It's used to signify, that there's no theory to compute the positions of an observable object.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(f"The positions of {name!r} can't be computed", gh=True)
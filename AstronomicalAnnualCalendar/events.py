@@ -0,0 +1,260 @@
+# standard library
+from collections.abc import Iterable, Mapping
+from datetime import UTC, datetime
+from functools import reduce
+
+# third party
+import numpy as np
+import numpy.typing as npt
+from pydantic import BaseModel
+from pydantic.config import ConfigDict
+
+# local
+from .columns import decode_rows
+from .enums import EventKindEnum
+from .models import DataModel, ObservableObjectModel
+
+
+__all__ = (
+    "MINIMUM_GREATEST_ELONGATION",
+    "EventModel",
+    "find_conjunctions",
+    "find_stations",
+    "find_greatest_elongations",
+    "find_events",
+)
+
+
+type FloatArray = npt.NDArray[np.float64]
+type IndexArray = npt.NDArray[np.intp]
+
+MINIMUM_GREATEST_ELONGATION: float = 10
+"""Smallest elongation (degrees) taken as greatest elongation; mercury's are at least 18°."""
+
+_BISECTIONS: int = 32  # narrows a bracket of even a month down to well below a second
+_NEWTON_STEPS: int = 4
+_LAGRANGE: FloatArray = np.array(
+    # coefficients of 1, u, u², u³ of the lagrange basis polynomials through the samples u = 0, 1, 2 and 3
+    [[1, -11 / 6, 1, -1 / 6], [0, 3, -5 / 2, 1 / 2], [0, -3 / 2, 2, -1 / 2], [0, 1 / 3, -1 / 2, 1 / 6]]
+)
+
+
+class EventModel(BaseModel):
+    """An event of one object (elongations and stations) or of a pair of objects (conjunctions and oppositions)."""
+
+    model_config = ConfigDict(frozen=True)
+
+    kind: EventKindEnum
+    date_and_time: datetime  # UTC; to the minute
+    objects: tuple[ObservableObjectModel, ...]
+    value: float  # the elongation for greatest elongations, else the ecliptic longitude of the first object
+
+
+def _cubic(values: FloatArray, series: IndexArray, index: IndexArray, x: FloatArray, derivative: int = 0) -> FloatArray:
+    """Interpolate ``values[series]`` (or a derivative) at the fractional sample ``x`` near ``index`` (4 samples)."""
+    first = np.clip(index - 1, 0, values.shape[1] - 4)
+    coefficients = _LAGRANGE
+    for _ in range(derivative):
+        coefficients = coefficients[:, 1:] * np.arange(1, coefficients.shape[1])
+    weights = ((x - first)[:, None] ** np.arange(coefficients.shape[1])) @ coefficients.T
+    return (values[series[:, None], first[:, None] + np.arange(4)] * weights).sum(axis=1)
+
+
+def _interpolate(values: FloatArray, series: IndexArray, index: IndexArray, x: FloatArray) -> FloatArray:
+    """Cubic interpolation if there are enough samples, else linear."""
+    if values.shape[1] >= 4:
+        return _cubic(values, series, index, x)
+    fraction = x - index
+    return values[series, index] * (1 - fraction) + values[series, index + 1] * fraction
+
+
+def _crossings(values: FloatArray, target: FloatArray, series: IndexArray, index: IndexArray) -> FloatArray:
+    """Bisect the interpolated ``values[series]`` for ``target`` in the brackets ``[index, index + 1]``."""
+    low, high = index.astype(np.float64), index + 1.0
+    f_low = values[series, index] - target
+    for _ in range(_BISECTIONS):
+        middle = (low + high) / 2
+        f_middle = _interpolate(values, series, index, middle) - target
+        same_sign = np.signbit(f_middle) == np.signbit(f_low)
+        low, f_low, high = (
+            np.where(same_sign, middle, low),
+            np.where(same_sign, f_middle, f_low),
+            np.where(same_sign, high, middle),
+        )
+    return (low + high) / 2
+
+
+def _extrema(values: FloatArray) -> tuple[IndexArray, FloatArray, FloatArray, npt.NDArray[np.bool_]]:
+    """
+    Find the local extrema of every row of ``values``; returns the row, the fractional sample, the value and maxima.
+
+    Sign changes of the first differences bracket the extrema (flat stretches of rounded values count as the previous
+    slope). The vertex of the parabola through the three samples around it (Meeus 3.3) gets refined with a few Newton
+    steps on the cubic interpolation.
+    """
+    slope = np.sign(np.diff(values, axis=1))
+    last = np.where(slope != 0, np.arange(slope.shape[1]), 0)
+    slope = np.take_along_axis(slope, np.maximum.accumulate(last, axis=1), axis=1)
+    series, index = np.nonzero((slope[:, :-1] * slope[:, 1:]) < 0)
+    index = index + 1  # the sample in between
+    y1, y2, y3 = values[series, index - 1], values[series, index], values[series, index + 1]
+    a, b = y2 - y1, y3 - y2
+    maximum = b - a < 0
+    x = index - (a + b) / (2 * (b - a))
+    if values.shape[1] >= 4:
+        for _ in range(_NEWTON_STEPS):
+            base = np.clip(np.floor(x).astype(np.intp), index - 1, index)
+            curvature = _cubic(values, series, base, x, derivative=2)
+            step = np.divide(
+                _cubic(values, series, base, x, derivative=1), curvature, where=curvature != 0, out=np.zeros_like(x)
+            )
+            x = np.clip(x - step, index - 1, index + 1)
+    base = np.clip(np.floor(x).astype(np.intp), index - 1, index)
+    return series, x, _interpolate(values, series, base, x), maximum
+
+
+def _to_datetimes(days: FloatArray, x: FloatArray) -> list[datetime]:
+    """Convert fractional sample positions to UTC datetimes rounded to the minute."""
+    minutes = np.round(np.interp(x, np.arange(len(days)), days) * 1440).astype(np.int64)
+    return [moment.replace(tzinfo=UTC) for moment in minutes.astype("datetime64[m]").astype("datetime64[us]").tolist()]
+
+
+def _days(date_and_time: npt.ArrayLike) -> FloatArray:
+    """Days (UTC) since the unix epoch."""
+    return np.asarray(date_and_time, dtype="datetime64[ns]").astype(np.int64) / 86400e9
+
+
+def find_conjunctions(
+    date_and_time: npt.ArrayLike,
+    longitudes: Mapping[ObservableObjectModel, npt.ArrayLike],
+) -> list[EventModel]:
+    """
+    Find the conjunctions and oppositions in ecliptic longitude of every pair of objects.
+
+    ``longitudes`` (degrees) share the timestamps ``date_and_time`` (UTC); objects may move less than 180° relative
+    to each other between two timestamps. Every pair's difference of longitudes is scanned for crossings of a multiple
+    of 180° at once; the crossings get refined on a cubic interpolation.
+    """
+    objects = list(longitudes)
+    if len(objects) < 2:
+        return []
+    days = _days(date_and_time)
+    unwrapped = np.unwrap(np.array([longitudes[item] for item in objects], dtype=np.float64), period=360, axis=1)
+    first, second = np.triu_indices(len(objects), k=1)
+    difference = np.unwrap(unwrapped[first] - unwrapped[second], period=360, axis=1)
+    sector = np.floor(difference / 180)
+    pair, index = np.nonzero(sector[:, 1:] != sector[:, :-1])
+    target = 180 * np.maximum(sector[pair, index], sector[pair, index + 1])
+    x = _crossings(difference, target, pair, index)
+    longitude = _interpolate(unwrapped, first[pair], index, x) % 360
+    return [
+        EventModel(
+            kind=EventKindEnum.CONJUNCTION if multiple % 2 == 0 else EventKindEnum.OPPOSITION,
+            date_and_time=moment,
+            objects=(objects[first[p]], objects[second[p]]),
+            value=value,
+        )
+        for p, multiple, moment, value in zip(
+            pair.tolist(),
+            (target // 180).astype(np.int64).tolist(),
+            _to_datetimes(days, x),
+            longitude.tolist(),
+            strict=True,
+        )
+    ]
+
+
+def find_stations(
+    date_and_time: npt.ArrayLike,
+    longitudes: Mapping[ObservableObjectModel, npt.ArrayLike],
+) -> list[EventModel]:
+    """Find the stations (extrema of the ecliptic longitude, degrees) of every object; see ``find_conjunctions``."""
+    objects = list(longitudes)
+    if not objects:
+        return []
+    days = _days(date_and_time)
+    unwrapped = np.unwrap(np.array([longitudes[item] for item in objects], dtype=np.float64), period=360, axis=1)
+    series, x, value, maximum = _extrema(unwrapped)
+    return [
+        EventModel(
+            kind=EventKindEnum.RETROGRADE_STATION if is_maximum else EventKindEnum.DIRECT_STATION,
+            date_and_time=moment,
+            objects=(objects[s],),
+            value=longitude % 360,
+        )
+        for s, moment, longitude, is_maximum in zip(
+            series.tolist(), _to_datetimes(days, x), value.tolist(), maximum.tolist(), strict=True
+        )
+    ]
+
+
+def find_greatest_elongations(
+    date_and_time: npt.ArrayLike,
+    elongations: Mapping[ObservableObjectModel, npt.ArrayLike],
+) -> list[EventModel]:
+    """
+    Find the greatest elongations of every object from its signed elongation (degrees; negative west of the sun).
+
+    Only the inferior planets have them; the elongation of the superior planets runs through every value. Extrema
+    closer to the sun than ``MINIMUM_GREATEST_ELONGATION`` are skipped: around conjunctions the latitude dominates
+    the elongation, which wobbles while its sign flips.
+    """
+    objects = list(elongations)
+    if not objects:
+        return []
+    days = _days(date_and_time)
+    unwrapped = np.unwrap(np.array([elongations[item] for item in objects], dtype=np.float64), period=360, axis=1)
+    series, x, value, maximum = _extrema(unwrapped)
+    value = (value + 180) % 360 - 180
+    greatest = np.where(maximum, value > 0, value < 0) & (np.abs(value) >= MINIMUM_GREATEST_ELONGATION)
+    return [
+        EventModel(
+            kind=(
+                EventKindEnum.GREATEST_EASTERN_ELONGATION
+                if elongation > 0
+                else EventKindEnum.GREATEST_WESTERN_ELONGATION
+            ),
+            date_and_time=moment,
+            objects=(objects[s],),
+            value=elongation,
+        )
+        for s, moment, elongation, is_greatest in zip(
+            series.tolist(), _to_datetimes(days, x), value.tolist(), greatest.tolist(), strict=True
+        )
+        if is_greatest
+    ]
+
+
+def find_events(data: Iterable[DataModel]) -> list[EventModel]:
+    """
+    Find every event in parsed ``data`` (e.g. ``Parser.parse().values()``) sorted by time.
+
+    Uses the ``ecliptic_longitude``- and ``elongation``-columns (objects without them are skipped) at the timestamps
+    all objects have in common. The precision is bound by the interval of the rows: daily rows get the events right
+    to a few minutes.
+    """
+    data = [item for item in data if item.rows]
+    if not data:
+        return []
+    common = reduce(np.intersect1d, [item.date_and_time for item in data])
+    longitudes: dict[ObservableObjectModel, FloatArray] = {}
+    elongations: dict[ObservableObjectModel, FloatArray] = {}
+    for item in data:
+        _, rows, _ = np.intersect1d(item.date_and_time, common, return_indices=True)
+        columns = decode_rows([item.rows[row] for row in rows.tolist()], "ecliptic_longitude", "elongation")
+        if "ecliptic_longitude" in columns:
+            longitudes[item.bound_object] = columns["ecliptic_longitude"]
+        if "elongation" in columns and item.bound_object.is_planet:
+            elongations[item.bound_object] = columns["elongation"]
+    if len(common) < 3:
+        return []
+
+    planets = {
+        observable_object: column for observable_object, column in longitudes.items() if observable_object.is_planet
+    }
+    events = [
+        *find_conjunctions(common, longitudes),
+        *find_stations(common, planets),
+        *find_greatest_elongations(common, elongations),
+    ]
+    return sorted(events, key=lambda event: event.date_and_time)
@@ -0,0 +1,152 @@
+# standard library
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Self
+
+# third party
+from pydantic import BaseModel
+from pydantic.config import ConfigDict
+from pydantic.fields import Field
+
+# local
+from .errors import SectionNotFoundError
+from .models import ObservableObjectModel
+from .regex import SECTION_NAME_REGEX
+
+
+__all__ = (
+    "SECTION_INDEX_SUFFIX",
+    "SectionIndexEntryModel",
+    "SectionIndexModel",
+    "build_section_index",
+    "load_section_index",
+)
+
+
+SECTION_INDEX_SUFFIX: str = ".aacidx"
+
+_MAX_IN_MEMORY_INDICES: int = 128
+_in_memory_indices: OrderedDict[Path, "SectionIndexModel"] = OrderedDict()
+_in_memory_indices_lock = Lock()
+
+
+class SectionIndexEntryModel(BaseModel):
+    """Byte offsets of a single object section inside an export."""
+
+    model_config = ConfigDict(frozen=True)
+
+    name: str
+    name_offset: int = Field(ge=0)
+    header_offset: int = Field(ge=0)
+    body_start: int = Field(ge=0)
+    body_end: int = Field(ge=0)
+    # Note: ``body_end`` excludes the trailing new-line just like ``regex.OBJECT_DATA_BODY_REGEX`` does
+    row_count: int = Field(ge=0)
+
+
+class SectionIndexModel(BaseModel):
+    """Index of every object section in an export; bound to the size and mtime of the indexed file."""
+
+    model_config = ConfigDict(frozen=True)
+
+    size: int = Field(ge=0)
+    mtime_ns: int
+    sections: list[SectionIndexEntryModel]
+
+    def is_valid_for(self, path: Path) -> bool:
+        """Check whether the index still describes ``path``."""
+        stat = path.stat()
+        return self.size == stat.st_size and self.mtime_ns == stat.st_mtime_ns
+
+    def get(self, observable_object: ObservableObjectModel) -> SectionIndexEntryModel:
+        """Retrieve the section of ``observable_object`` by any of its aliases."""
+        aliases = observable_object.aliases
+        for section in self.sections:
+            if section.name in aliases:
+                return section
+        raise SectionNotFoundError(observable_object.name)
+
+    @classmethod
+    def from_sidecar(cls: type[Self], path: Path) -> Self | None:
+        """Load the sidecar index of ``path`` if it exists and is still valid."""
+        sidecar = path.with_name(path.name + SECTION_INDEX_SUFFIX)
+        try:
+            index = cls.model_validate_json(sidecar.read_bytes())
+        except (OSError, ValueError):
+            return None
+        return index if index.is_valid_for(path) else None
+
+    def to_sidecar(self, path: Path) -> None:
+        """Store the index next to ``path``."""
+        path.with_name(path.name + SECTION_INDEX_SUFFIX).write_text(self.model_dump_json(), "utf-8")
+
+
+def build_section_index(path: Path) -> SectionIndexModel:
+    """Pre-scan ``path`` line by line and record the byte offsets of every object section."""
+    stat = path.stat()
+    sections: list[SectionIndexEntryModel] = []
+    pending: tuple[bytes, int] | None = None  # name-line and its offset
+    current: dict | None = None
+
+    def close(end: int) -> None:
+        nonlocal current
+        if current is not None:
+            sections.append(SectionIndexEntryModel(body_end=max(end, current["body_start"]), **current))
+            current = None
+
+    offset, line = 0, b""
+    with path.open("rb") as f:
+        for line in f:
+            stripped = line.rstrip(b"\r\n")
+            if current is not None:
+                if stripped:
+                    current["row_count"] += 1
+                else:
+                    close(offset - 1)
+            elif pending is not None and stripped:
+                name, name_offset = pending
+                current = {
+                    "name": name.decode("utf-8"),
+                    "name_offset": name_offset,
+                    "header_offset": offset,
+                    "body_start": offset + len(line),
+                    "row_count": 0,
+                }
+                pending = None
+            elif SECTION_NAME_REGEX.match(stripped.decode("utf-8", "replace")):
+                pending = stripped, offset
+            else:
+                pending = None
+            offset += len(line)
+        close(offset - 1 if line.endswith(b"\n") else offset)  # ``line`` is the last line read
+
+    return SectionIndexModel(size=stat.st_size, mtime_ns=stat.st_mtime_ns, sections=sections)
+
+
+def load_section_index(path: Path, *, sidecar: bool = False) -> SectionIndexModel:
+    """
+    Return a valid section index for ``path``.
+
+    Indices are held in memory (up to the ``_MAX_IN_MEMORY_INDICES`` least recently used ones, so a long-running
+    server or watcher doesn't keep every file it has ever seen) and rebuilt once the size or mtime of the file changes.
+    If ``sidecar`` is set the index is additionally read from and written to ``<file>.aacidx``.
+    """
+    key = path.resolve()
+    with _in_memory_indices_lock:  # build (and write the sidecar) just once for concurrent parsers
+        index = _in_memory_indices.get(key)
+        if index is not None and index.is_valid_for(path):
+            _in_memory_indices.move_to_end(key)
+            return index
+
+        index = SectionIndexModel.from_sidecar(path) if sidecar else None
+        if index is None:
+            index = build_section_index(path)
+            if sidecar:
+                index.to_sidecar(path)
+
+        _in_memory_indices[key] = index
+        _in_memory_indices.move_to_end(key)
+        while len(_in_memory_indices) > _MAX_IN_MEMORY_INDICES:
+            _in_memory_indices.popitem(last=False)
+    return index
@@ -0,0 +1,288 @@
+# standard library
+from collections.abc import Iterable
+from datetime import UTC, date, timedelta
+from typing import TYPE_CHECKING, Self
+
+# third party
+import numpy as np
+import numpy.typing as npt
+from pydantic import BaseModel
+from pydantic.config import ConfigDict
+from pydantic.fields import Field
+
+# local
+from .events import EventModel
+from .timezones import local_to_utc, utc_to_local
+
+
+if TYPE_CHECKING:
+    # third party
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
+    # local
+    from .twilight import SolarAltitudeGridModel
+
+
+__all__ = (
+    "fixed_timezone",
+    "CanvasModel",
+    "LayoutModel",
+)
+
+
+type FloatArray = npt.NDArray[np.float64]
+
+_HOUR = np.timedelta64(3600_000_000_000, "ns")
+
+
+def fixed_timezone(utc_offset: timedelta) -> str:
+    """IANA-key of the fixed ``utc_offset`` (whole hours), e.g. ``Etc/GMT-1`` for MEZ; see ``timezones.TIMEZONES``."""
+    hours, rest = divmod(utc_offset, timedelta(hours=1))
+    if rest:
+        message = f"Only whole hours are supported, got {utc_offset}"
+        raise ValueError(message)
+    return "UTC" if not hours else f"Etc/GMT{-hours:+d}"  # the sign of the Etc-zones is inverted
+
+
+class CanvasModel(BaseModel):
+    """
+    Geometry of the calendar: one row per night of ``year`` and 24 hours starting at ``start_hour`` (local time).
+
+    ``plot_area`` is the ``(left, bottom, width, height)`` of the time/day area in figure fractions; annotations
+    go into the margins around it. ``start`` and ``stop`` limit the rows (e.g. to a month) and ``viewport`` selects
+    a window ``(x, y, width, height)`` (pixels from the top left) of the canvas, e.g. a tile of a poster.
+    The local time is the one of ``timezone`` (see ``timezones.TIMEZONES``); ``MESZ`` draws the legal time, which
+    jumps by an hour at the switches to and from daylight saving time.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    year: int
+    width: int = Field(default=1200, gt=0)  # pixel
+    height: int = Field(default=1600, gt=0)  # pixel
+    dpi: int = Field(default=100, gt=0)
+    start_hour: float = Field(default=12, ge=0, lt=24)
+    plot_area: tuple[float, float, float, float] = (0.08, 0.04, 0.88, 0.90)
+    start: date | None = None  # first row; defaults to the 1st of january
+    stop: date | None = None  # row after the last one; defaults to the 1st of january of the next year
+    viewport: tuple[int, int, int, int] | None = None
+    timezone: str = "MEZ"
+
+    @property
+    def days(self) -> np.ndarray:
+        """``datetime64[D]`` of every row."""
+        return np.arange(
+            np.datetime64(self.start or date(self.year, 1, 1), "D"),
+            np.datetime64(self.stop or date(self.year + 1, 1, 1), "D"),
+        )
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """``(width, height)`` in pixels of the produced image; the viewport's size if one is set."""
+        return (self.width, self.height) if self.viewport is None else self.viewport[2:]
+
+    @property
+    def visible_days(self) -> np.ndarray:
+        """The rows (``datetime64[D]``) which are (at least partially) inside the viewport."""
+        days = self.days
+        if self.viewport is None:
+            return days
+        _, y, _, height = self.viewport
+        _, bottom, _, plot_height = self.plot_area
+        top = (1 - bottom - plot_height) * self.height  # pixels above the plot area
+        rows_per_pixel = len(days) / (plot_height * self.height)
+        first = max(int(np.floor((y - top) * rows_per_pixel)), 0)
+        last = min(int(np.ceil((y + height - top) * rows_per_pixel)), len(days))
+        return days[first:last]
+
+    @property
+    def layout(self) -> "LayoutModel":
+        """Layout engine mapping timestamps and events onto this canvas."""
+        return LayoutModel.from_canvas(self)
+
+    def to_plot(self, day: np.ndarray, hours: FloatArray) -> tuple[FloatArray, FloatArray]:
+        """
+        Map local dates and hours of an event to the calendar's ``(x, y)``.
+
+        ``x`` are the hours since ``start_hour`` and ``y`` the row (night) index; an event before ``start_hour``
+        belongs to the night which started the day before.
+        """
+        hours = np.asarray(hours, dtype=np.float64)
+        row = (np.asarray(day, dtype="datetime64[D]") - self.days[0]).astype(np.float64)
+        before_start = hours < self.start_hour
+        return (hours - self.start_hour) % 24, row - before_start
+
+    def new_figure(self) -> tuple["Figure", "Axes"]:
+        """Create a transparent figure with the plot area set up; shared by every layer to keep them aligned."""
+        # matplotlib is imported on demand, backends which don't draw with it don't pay for its import
+        # third party
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        width, height = self.size
+        figure = Figure(figsize=(width / self.dpi, height / self.dpi), dpi=self.dpi)
+        FigureCanvasAgg(figure)
+        figure.patch.set_alpha(0)
+        return figure, self.add_axes(figure)
+
+    def add_axes(self, figure: "Figure") -> "Axes":
+        """Add an axes spanning the plot area to ``figure``; axes added later get drawn on top."""
+        width, height = self.size
+        left, bottom, plot_width, plot_height = self.plot_area
+        if self.viewport is not None:
+            # place the plot area relative to the window; everything outside of it simply doesn't get rasterized
+            x, y = self.viewport[:2]
+            window_bottom = self.height - y - height
+            left, bottom = (left * self.width - x) / width, (bottom * self.height - window_bottom) / height
+            plot_width, plot_height = plot_width * self.width / width, plot_height * self.height / height
+        axes = figure.add_axes((left, bottom, plot_width, plot_height))
+        axes.set_xlim(0, 24)
+        axes.set_ylim(len(self.days), 0)
+        axes.set_axis_off()
+        return axes
+
+
+class LayoutModel(BaseModel):
+    """
+    Maps whole arrays of timestamps and daily events onto a canvas in one pass; shared by every rendering backend.
+
+    Plot coordinates are ``x``, the hours since ``start_hour`` (0-24), and ``y``, the row (night) index, just like
+    ``CanvasModel.to_plot``; ``to_page`` turns them into pixels. Everything is drawn in the local time of the canvas'
+    ``timezone``: inputs of another timezone are converted through UTC, so an export in MEZ is drawn an hour later
+    during daylight saving time on a MESZ-canvas. Curves get broken (``nan``) wherever they'd jump: across the left/
+    right edge, at the switches of the UTC-offset and, optionally, at the first row of every month.
+    """
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    canvas: CanvasModel
+    days: np.ndarray  # datetime64[D] of every row
+    utc_offset: np.ndarray  # timedelta64[s] in effect at the ``start_hour`` of every row
+    month_starts: np.ndarray  # indices of the rows starting a month
+
+    @classmethod
+    def from_canvas(cls: type[Self], canvas: CanvasModel) -> Self:
+        """Set the layout of ``canvas`` up; the UTC-offsets of its timezone get looked up once for all rows."""
+        days = canvas.days
+        row_start = days.astype("datetime64[s]") + np.timedelta64(round(canvas.start_hour * 3600), "s")
+        utc_offset = (row_start - local_to_utc(row_start, canvas.timezone)).astype("timedelta64[s]")
+        return cls(
+            canvas=canvas,
+            days=days,
+            utc_offset=utc_offset,
+            month_starts=np.flatnonzero(days.astype("datetime64[M]") == days),
+        )
+
+    @property
+    def transitions(self) -> npt.NDArray[np.intp]:
+        """Indices of the rows (nights) during which the UTC-offset changes."""
+        return np.flatnonzero(self.utc_offset[1:] != self.utc_offset[:-1])
+
+    def offset_hours(self, days: npt.ArrayLike, utc_offset: timedelta = timedelta(hours=1)) -> FloatArray:
+        """
+        Hours to add to times of the fixed ``utc_offset`` to get the canvas' local time on the rows ``days``.
+
+        E.g. ``1`` in summer for MEZ-data on a MESZ-canvas; days outside of the canvas take the nearest row's offset.
+        """
+        row = (np.asarray(days, dtype="datetime64[D]") - self.days[0]).astype(np.int64)
+        offset = self.utc_offset[np.clip(row, 0, len(self.days) - 1)]
+        return (offset - np.timedelta64(utc_offset)) / np.timedelta64(1, "h")
+
+    def place(self, date_and_time: npt.ArrayLike) -> tuple[FloatArray, FloatArray]:
+        """Map UTC ``datetime64``-values (``NaT`` for missing ones) to plot coordinates."""
+        utc = np.asarray(date_and_time, dtype="datetime64[ns]")
+        valid = ~np.isnat(utc)
+        local = utc.copy()
+        local[valid] = utc_to_local(utc[valid], self.canvas.timezone)
+        day = local.astype("datetime64[D]")
+        x, y = self.canvas.to_plot(day, (local - day) / _HOUR)
+        return np.where(valid, x, np.nan), np.where(valid, y, np.nan)
+
+    def place_daily(
+        self,
+        day: npt.ArrayLike,
+        hours: npt.ArrayLike,
+        timezone: str = "MEZ",
+    ) -> tuple[FloatArray, FloatArray]:
+        """
+        Map daily events (local dates and hours of ``timezone``, ``nan`` if missing) to plot coordinates.
+
+        Hours may exceed 24 (or be negative) to refer to the following (or previous) day.
+        """
+        day = np.asarray(day, dtype="datetime64[D]")
+        hours = np.asarray(hours, dtype=np.float64)
+        if timezone == self.canvas.timezone:
+            whole = np.floor(np.nan_to_num(hours) / 24)
+            return self.canvas.to_plot(day + whole.astype("timedelta64[D]"), hours - 24 * whole)
+        missing = np.isnan(hours)
+        local = day.astype("datetime64[ns]") + np.round(np.where(missing, 0, hours) * 3.6e12).astype("timedelta64[ns]")
+        utc = local_to_utc(local, timezone)
+        return self.place(np.where(missing, np.datetime64("NaT", "ns"), utc))
+
+    def place_events(self, events: Iterable[EventModel]) -> tuple[FloatArray, FloatArray]:
+        """Map ``events`` (e.g. conjunctions, see ``events.find_events``) to plot coordinates, e.g. for markers."""
+        return self.place(
+            np.array(
+                [event.date_and_time.astimezone(UTC).replace(tzinfo=None) for event in events], dtype="datetime64[ns]"
+            )
+        )
+
+    def breaks(self, x: FloatArray, y: FloatArray, *, months: bool = False) -> npt.NDArray[np.bool_]:
+        """Whether a curve must not connect each point to the next one (length ``len(x) - 1``)."""
+        x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+        row = np.clip(np.nan_to_num(y, nan=-1).astype(np.int64), 0, len(self.days) - 1)
+        offset = self.utc_offset[row]
+        jumps = (np.abs(np.diff(x)) > 12) | (offset[1:] != offset[:-1])
+        if months:
+            month = self.days[row].astype("datetime64[M]")
+            jumps |= month[1:] != month[:-1]
+        return jumps
+
+    def curve(
+        self,
+        day: npt.ArrayLike,
+        hours: npt.ArrayLike,
+        timezone: str = "MEZ",
+        *,
+        months: bool = False,
+    ) -> tuple[FloatArray, FloatArray]:
+        """
+        Lay a daily event (e.g. the ``rise``-column) out as a polyline in plot coordinates.
+
+        ``nan`` separates the parts of the polyline (see ``breaks``); a missing event leaves a gap anyway.
+        """
+        x, y = self.place_daily(day, hours, timezone)
+        index = np.flatnonzero(self.breaks(x, y, months=months)) + 1
+        return np.insert(x, index, np.nan), np.insert(y, index, np.nan)
+
+    def twilight_boundaries(
+        self,
+        grid: "SolarAltitudeGridModel",
+        altitude: float,
+        *,
+        months: bool = False,
+    ) -> tuple[tuple[FloatArray, FloatArray], tuple[FloatArray, FloatArray]]:
+        """
+        Lay the morning and evening crossings of the sun through ``altitude`` out as polylines; see ``curve``.
+
+        Evening crossings after midnight (``SolarAltitudeGridModel.crossings`` wraps them) stay with their night.
+        """
+        morning, evening = grid.crossings(altitude)
+        timezone = fixed_timezone(grid.utc_offset)
+        evening = np.where(evening < 12, evening + 24, evening)  # the evening crossings are after noon
+        return (
+            self.curve(grid.day, morning, timezone, months=months),
+            self.curve(grid.day, evening, timezone, months=months),
+        )
+
+    def to_page(self, x: npt.ArrayLike, y: npt.ArrayLike) -> tuple[FloatArray, FloatArray]:
+        """Turn plot coordinates into pixels from the top left of the image (the viewport, if one is set)."""
+        canvas = self.canvas
+        left, bottom, plot_width, plot_height = canvas.plot_area
+        top = (1 - bottom - plot_height) * canvas.height
+        origin_x, origin_y = (0, 0) if canvas.viewport is None else canvas.viewport[:2]
+        return (
+            left * canvas.width - origin_x + np.asarray(x, dtype=np.float64) * (plot_width * canvas.width / 24),
+            top - origin_y + np.asarray(y, dtype=np.float64) * (plot_height * canvas.height / len(self.days)),
+        )
@@ -1,11 +1,13 @@
 # standard library
 import re
-from datetime import datetime, timedelta
-from typing import Self
+from collections.abc import Iterable, Mapping, Sequence
+from datetime import UTC, datetime, timedelta
+from typing import Any, Self
 
 # third party
+import numpy as np
 from annotated_types import LowerCase
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from pydantic.config import ConfigDict
 from pydantic.fields import Field
 from pydantic.functional_validators import model_validator
@@ -13,7 +15,7 @@ from pydantic.types import PositiveFloat
 from pydantic_extra_types.color import Color
 
 # local
-from .errors import EvaluatedHeaderValidationError
+from .errors import EvaluatedHeaderValidationError, RowValidationError
 from .regex import (
     DEGREE_180_REGEX,
     DEGREE_360_REGEX,
@@ -22,6 +24,7 @@ from .regex import (
     HMS_ANGLE_REGEX,
     OPTIONAL_HM_TIME_REGEX,
 )
+from .timezones import utc_to_local
 
 
 __all__ = (
@@ -36,6 +39,17 @@ __all__ = (
 
 
 _SUN_LINE_STRENGTH_MULTIPLIER: float = 2
+_NEGATIVE_HEMISPHERES: frozenset[str] = frozenset("SW")  # south and west are counted negative
+
+
+def _dms_coordinate_to_degrees(value: str) -> float:
+    """Convert a single coordinate like ``53°05' N`` to signed degrees (north and east being positive)."""
+    angle, hemisphere = value[:-1].strip(), value[-1].upper()
+    match = DMS_ANGLE_360_REGEX.match(angle)
+    degrees = (
+        float(match.group("degree")) + float(match.group("minute") or 0) / 60 + float(match.group("second") or 0) / 3600
+    )
+    return -degrees if hemisphere in _NEGATIVE_HEMISPHERES else degrees
 
 
 class ObservableObjectModel(BaseModel):
@@ -44,7 +58,7 @@ class ObservableObjectModel(BaseModel):
     model_config = ConfigDict(frozen=True)
 
     internal_id: LowerCase = Field(alias="id")
-    aliases_: set[str] = Field(default_factory=set, alias="aliases")
+    aliases_: frozenset[str] = Field(default_factory=frozenset, alias="aliases")  # frozenset to keep it hashable
     line_color: Color
     is_sun_: bool = Field(default=None, alias="is_sun")
     is_moon_: bool = Field(default=None, alias="is_moon")
@@ -131,6 +145,16 @@ class CoordinateModel(BaseModel):
         """Returns combined latitude and longitude."""
         return " ".join([self.lat, self.lon])
 
+    @property
+    def latitude(self) -> float:
+        """Returns the latitude in degrees (north being positive)."""
+        return _dms_coordinate_to_degrees(self.lat)
+
+    @property
+    def longitude(self) -> float:
+        """Returns the longitude in degrees (east being positive)."""
+        return _dms_coordinate_to_degrees(self.lon)
+
 
 class MetaDataModel(BaseModel):
     """Model to hold information about the metadata from the data."""
@@ -247,10 +271,83 @@ class RowModel(BoundToObservableObjectBaseModel, BaseModel):
         return self.diameter_unit_
 
 
+_ROWS_ADAPTER: TypeAdapter[list[RowModel]] = TypeAdapter(list[RowModel])
+
+
+def _row_errors(error: ValidationError) -> dict[int, list[str]]:
+    """Group the messages of ``error`` (raised for a list of rows) by row index."""
+    errors: dict[int, list[str]] = {}
+    for details in error.errors(include_url=False):
+        row, *location = details["loc"]
+        errors.setdefault(row, []).append(f"{".".join(map(str, location)) or "row"}: {details["msg"]}")
+    return dict(sorted(errors.items()))
+
+
 class DataModel(BoundToObservableObjectBaseModel, BaseModel):
     """Represents all data connected to an observable object."""
 
     model_config = ConfigDict(frozen=True)
 
     metadata: MetaDataModel
+    timezone: str = "MEZ"  # label of the time column, see ``timezones.TIMEZONES``
     rows: list[RowModel]
+
+    @classmethod
+    def from_raw_rows(
+        cls: type[Self],
+        rows: Iterable[Mapping[str, Any] | Sequence[Any]],
+        *,
+        bound_object: ObservableObjectModel,
+        metadata: MetaDataModel,
+        timezone: str = "MEZ",
+        fields: Sequence[str] | None = None,
+    ) -> Self:
+        """
+        Validate the raw rows of a whole section in a single pass inside pydantic-core; see ``validate_raw_rows``.
+
+        Every invalid row is reported at once by a ``RowValidationError``.
+        """
+        rows = cls.validate_raw_rows(rows, bound_object=bound_object, fields=fields)
+        return cls(bound_object=bound_object, metadata=metadata, timezone=timezone, rows=rows)
+
+    @staticmethod
+    def validate_raw_rows(
+        rows: Iterable[Mapping[str, Any] | Sequence[Any]],
+        *,
+        bound_object: ObservableObjectModel,
+        fields: Sequence[str] | None = None,
+    ) -> list[RowModel]:
+        """
+        Validate raw rows to ``RowModel``s without building the ``DataModel`` yet.
+
+        ``rows`` are either mappings of ``RowModel``-fields or, if ``fields`` is given, sequences of their values;
+        ``bound_object`` gets added to every row.
+        """
+        if fields is None:
+            raw = [{**row, "bound_object": bound_object} for row in rows]
+        else:
+            raw = [dict(zip(fields, row, strict=True), bound_object=bound_object) for row in rows]
+        try:
+            return _ROWS_ADAPTER.validate_python(raw)
+        except ValidationError as error:
+            raise RowValidationError(bound_object.name, _row_errors(error)) from None
+
+    @property
+    def date_and_time(self) -> np.ndarray:
+        """UTC ``datetime64[ns]``-values of the rows (naive datetimes are taken as UTC)."""
+        return np.array(
+            [
+                (
+                    row.date_and_time.astimezone(UTC).replace(tzinfo=None)
+                    if row.date_and_time.tzinfo
+                    else row.date_and_time
+                )
+                for row in self.rows
+            ],
+            dtype="datetime64[ns]",
+        )
+
+    @property
+    def local_date_and_time(self) -> np.ndarray:
+        """The rows' ``date_and_time`` in the local time of ``timezone``; e.g. for display."""
+        return utc_to_local(self.date_and_time, self.timezone)
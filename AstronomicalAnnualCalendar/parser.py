@@ -1,55 +1,225 @@
 # standard library
-from collections.abc import Iterator
+import io
+import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor
+from datetime import UTC
+from threading import Lock
+from typing import IO, Self
 
 # third party
 from pydantic import BaseModel
-from pydantic.fields import Field
+from pydantic.fields import Field, PrivateAttr
 from pydantic.types import FilePath
 
 # local
+from .columns import decode_date_and_time, extract_columns, timezone_label
+from .compression import is_compressed, open_decompressed
 from .enums import ObservableObjectEnum
-from .models import CoordinateModel, DataModel, MetaDataModel, ObservableObjectModel
-from .regex import METADATA_REGEX, OBJECT_DATA_BODY_REGEX
+from .errors import MetaDataNotFoundError, SectionNotFoundError
+from .index import SectionIndexModel, load_section_index
+from .models import CoordinateModel, DataModel, MetaDataModel, ObservableObjectModel, RowModel
+from .regex import METADATA_REGEX, OBJECT_DATA_BODY_REGEX, SECTION_NAME_REGEX
 from .utils import observable_object_from_alias, raw_delta_t_to_timedelta
 
 
-__all__ = ("Parser",)
+__all__ = (
+    "split_sections",
+    "decode_section_rows",
+    "decode_section",
+    "Parser",
+)
+
+
+def _metadata_from_line(line: str) -> MetaDataModel:
+    if (metadata := METADATA_REGEX.match(line)) is None:
+        raise MetaDataNotFoundError(line.rstrip("\r\n"))
+    return MetaDataModel(
+        place=metadata.group("place"),
+        coordinate=CoordinateModel(lat=metadata.group("lat"), lon=metadata.group("lon")),
+        equinox=metadata.group("equinox"),
+        delta_t=raw_delta_t_to_timedelta(metadata.group("delta_t"), metadata.group("delta_t_unit")),
+    )
+
+
+def _text_lines(stream: IO, encoding: str) -> Iterator[str]:
+    """Lines of a text or binary ``stream`` without their line break."""
+    for line in stream:
+        yield (line.decode(encoding) if isinstance(line, bytes) else line).rstrip("\r\n")
+
+
+def split_sections(lines: Iterable[str]) -> Iterator[tuple[str, str, str]]:
+    """
+    Split the lines of an export into ``(name, header, body)`` of every object section in a single pass.
+
+    Mirrors ``regex.OBJECT_DATA_BODY_REGEX``: a name, a header and every following line up to the next empty one.
+    """
+    name: str | None = None
+    header: str | None = None
+    body: list[str] = []
+    for line in lines:
+        if header is not None:
+            if line:
+                body.append(line)
+                continue
+            yield name, header, "\n".join(body)
+            name, header, body = None, None, []
+        elif name is not None and line:
+            header = line
+        else:
+            name = line if SECTION_NAME_REGEX.match(line) else None
+    if header is not None:
+        yield name, header, "\n".join(body)
+
+
+def decode_section_rows(observable_object: ObservableObjectModel, header: str, body: str) -> tuple[list[RowModel], str]:
+    """Decode the ``header`` and ``body`` of a section into validated rows and the label of their timezone."""
+    columns = extract_columns(observable_object, header, body)
+    timezone = timezone_label(header)
+    date_and_time = decode_date_and_time(
+        columns.pop("date"), columns.pop("timezone"), timezone, weekdays=columns.pop("weekday")
+    )
+    moments = [moment.replace(tzinfo=UTC) for moment in date_and_time.astype("datetime64[us]").tolist()]
+    rows = DataModel.validate_raw_rows(
+        zip(moments, *columns.values(), strict=True),
+        fields=("date_and_time", *columns),
+        bound_object=observable_object,
+    )
+    return rows, timezone
+
+
+def decode_section(
+    observable_object: ObservableObjectModel, header: str, body: str, metadata: MetaDataModel
+) -> DataModel:
+    """
+    Decode the ``header`` and ``body`` of a section into validated rows.
+
+    Doesn't touch any shared state, so sections can be decoded concurrently (in threads or processes).
+    """
+    rows, timezone = decode_section_rows(observable_object, header, body)
+    return DataModel(bound_object=observable_object, metadata=metadata, timezone=timezone, rows=rows)
 
 
 class Parser(BaseModel):  # noqa: D101  # ToDo: add documentation
-    file: FilePath = Field(alias="file_path")
+    file: FilePath | None = Field(default=None, alias="file_path")
+
+    use_sidecar_index: bool = False
 
     _cached_metadata: MetaDataModel = None
+    _metadata_lock: Lock = PrivateAttr(default_factory=Lock)
+    _sections: list[tuple[str, str, str]] | None = None  # ``(name, header, body)`` of in-memory input
+
+    @classmethod
+    def from_stream(cls: type[Self], stream: IO, *, encoding: str = "utf-8") -> Self:
+        """
+        Read an export from a text or binary ``stream`` (e.g. a pipe) in a single pass.
+
+        The stream gets consumed line by line and its sections are held in memory, no file is involved. Binary
+        streams compressed with gzip, bz2 or xz get decompressed on the fly.
+        """
+        parser = cls()
+        if not isinstance(stream, io.TextIOBase):
+            stream = open_decompressed(stream)
+        parser.populate_from_lines(_text_lines(stream, encoding))
+        return parser
+
+    @classmethod
+    def from_bytes(cls: type[Self], data: bytes | str, *, encoding: str = "utf-8") -> Self:
+        """Read an export held in memory, e.g. an upload."""
+        return cls.from_stream(io.StringIO(data) if isinstance(data, str) else io.BytesIO(data), encoding=encoding)
+
+    @classmethod
+    def from_stdin(cls: type[Self], *, encoding: str = "utf-8") -> Self:
+        """Read an export piped into the standard input."""
+        return cls.from_stream(sys.stdin.buffer, encoding=encoding)
 
     @property
     def metadata(self) -> MetaDataModel:
         """The information from the first line of the file."""
         if self._cached_metadata is None:  # pragma: no cover
-            self.populate_metadata()
+            with self._metadata_lock:
+                if self._cached_metadata is None:  # another thread might have populated it meanwhile
+                    self.populate_metadata()
         return self._cached_metadata
 
+    @property
+    def sections(self) -> list[tuple[str, str, str]] | None:
+        """``(name, header, body)`` of every section of in-memory input (streams, compressed files) or ``None``."""
+        return self._sections
+
+    @property
+    def section_index(self) -> SectionIndexModel:
+        """Byte offsets of every object section; rebuilt once the file changes."""
+        return load_section_index(self.file, sidecar=self.use_sidecar_index)
+
     def model_post_init(self, *args, **kwargs) -> None:  # noqa: D102, ANN002, ANN003
-        self.populate_metadata()
+        if self.file is None:
+            return
+        if is_compressed(self.file):
+            # compressed files can't be seeked into, so they're decompressed once as a stream and held in memory
+            with open_decompressed(self.file) as stream:
+                self.populate_from_lines(_text_lines(stream, "utf-8"))
+        else:
+            self.populate_metadata()
 
     def populate_metadata(self) -> None:  # noqa: D102  # ToDo: add documentation
         with self.file.open("r", encoding="utf-8") as f:
             first_file = f.readline()
 
-        metadata = METADATA_REGEX.match(first_file)
+        self._cached_metadata = _metadata_from_line(first_file)
+
+    def populate_from_lines(self, lines: Iterable[str]) -> None:
+        """Take the metadata and every section from ``lines`` (without line breaks) instead of the file."""
+        lines = iter(lines)
+        self._cached_metadata = _metadata_from_line(next(lines, ""))
+        self._sections = list(split_sections(lines))
 
-        self._cached_metadata = MetaDataModel(
-            place=metadata.group("place"),
-            coordinate=CoordinateModel(lat=metadata.group("lat"), lon=metadata.group("lon")),
-            equinox=metadata.group("equinox"),
-            delta_t=raw_delta_t_to_timedelta(metadata.group("delta_t"), metadata.group("delta_t_unit")),
-        )
+    def parse(
+        self,
+        only: Iterable[ObservableObjectModel] | None = None,
+        *,
+        executor: Executor | None = None,
+    ) -> dict[ObservableObjectModel, DataModel]:
+        """
+        Parse every section (or just the ones of ``only``) of the file.
 
-    def parse(self) -> dict[ObservableObjectModel, DataModel]:  # noqa: D102  # ToDo: add documentation
-        raise NotImplementedError
+        With an ``executor`` the sections get decoded concurrently: a ``ThreadPoolExecutor`` scales across cores on
+        free-threaded builds, a ``ProcessPoolExecutor`` on builds with the GIL (at the cost of pickling the rows).
+        """
+        metadata = self.metadata
+        sections = list(self._iter_observable_objects(only))
+        if executor is None:
+            decoded = [decode_section(*section, metadata) for section in sections]
+        else:
+            decoded = executor.map(decode_section, *zip(*sections, strict=True), [metadata] * len(sections))
+        return {section[0]: data for section, data in zip(sections, decoded, strict=True)}
 
-    def _parse_observable_objects(self):
-        raise NotImplementedError
+    def read_section(self, observable_object: ObservableObjectModel) -> tuple[str, str]:
+        """Seek straight to the section of ``observable_object`` and return its header and body."""
+        if self._sections is not None:
+            aliases = observable_object.aliases
+            for name, header, body in self._sections:
+                if name in aliases:
+                    return header, body
+            raise SectionNotFoundError(observable_object.name)
+        section = self.section_index.get(observable_object)
+        with self.file.open("rb") as f:
+            f.seek(section.header_offset)
+            raw = f.read(section.body_end - section.header_offset).decode("utf-8")
+        header, _, body = raw.partition("\n")
+        return header.rstrip("\r"), body
 
-    def _iter_observable_objects(self) -> Iterator[tuple[ObservableObjectEnum, str, str]]:
+    def _iter_observable_objects(
+        self,
+        only: Iterable[ObservableObjectModel] | None = None,
+    ) -> Iterator[tuple[ObservableObjectEnum, str, str]]:
+        if only is not None:
+            for observable_object in only:
+                yield observable_object, *self.read_section(observable_object)
+            return
+        if self._sections is not None:
+            for name, header, body in self._sections:
+                yield observable_object_from_alias(name), header, body
+            return
         for match in OBJECT_DATA_BODY_REGEX.finditer(self.file.read_text("utf-8")):
             yield observable_object_from_alias(match.group("name")), match.group("header"), match.group("body")
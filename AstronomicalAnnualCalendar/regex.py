@@ -17,6 +17,7 @@ __all__ = (
     "DMS_COORDINATE_REGEX",
     "METADATA_REGEX",
     "OBJECT_DATA_BODY_REGEX",
+    "SECTION_NAME_REGEX",
 )
 
 
@@ -108,3 +109,7 @@ OBJECT_DATA_BODY_REGEX: re.Pattern[str] = re.compile(
     r"^(?P<name>\S+)\n(?P<header>[^\n]+)\n(?P<body>([\s\S]*?(?=\n$)))",
     flags=re.MULTILINE,
 )  # the text requires a new-line ("\n") at the end of the input data/text
+
+SECTION_NAME_REGEX: re.Pattern[str] = re.compile(r"^\S+$")
+# mirrors the "name"-group of ``OBJECT_DATA_BODY_REGEX`` for a single line (``parser.split_sections`` and
+# ``index.build_section_index``)
@@ -0,0 +1,450 @@
+# standard library
+import calendar
+import hashlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Iterable
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, NamedTuple, Self
+
+# third party
+import numpy as np
+import numpy.typing as npt
+from matplotlib.axes import Axes
+from matplotlib.colors import ListedColormap
+from matplotlib.figure import Figure
+from matplotlib.image import imsave
+from pydantic import BaseModel
+from pydantic.config import ConfigDict
+from pydantic.fields import Field
+
+# local
+from .columns import decode_rows
+from .enums import TwilightBandEnum
+from .layout import CanvasModel
+from .models import BoundToObservableObjectBaseModel, DataModel, MetaDataModel
+from .riseset import RiseSetModel
+from .twilight import SolarAltitudeGridModel, compute_solar_altitude_grid
+from .visibility import VisibilityModel
+
+
+__all__ = (
+    "dominant_year",
+    "CanvasModel",
+    "LayerModel",
+    "BackgroundLayerModel",
+    "TwilightLayerModel",
+    "VisibilityLayerModel",
+    "ObjectLayerModel",
+    "AnnotationLayerModel",
+    "RasterModel",
+    "LayerCache",
+    "composite",
+    "LAYER_ORDER",
+    "sort_layers",
+    "EVENT_LINESTYLES",
+    "CALENDAR_GRID_RESOLUTION",
+    "calendar_layers",
+    "Renderer",
+)
+
+
+type FloatArray = npt.NDArray[np.float64]
+type ImageArray = npt.NDArray[np.uint8]
+
+_TWILIGHT_COLORS: tuple[tuple[float, float, float, float], ...] = (
+    (1.0, 1.0, 1.0, 0.0),  # day: transparent
+    (0.55, 0.65, 0.85, 0.35),  # civil
+    (0.30, 0.40, 0.70, 0.55),  # nautical
+    (0.15, 0.20, 0.45, 0.70),  # astronomical
+    (0.05, 0.07, 0.20, 0.80),  # night
+)
+
+EVENT_LINESTYLES: dict[str, str] = {"rise": "-", "culmination": ":", "set": "--"}
+"""Matplotlib linestyle of each event curve of an object; shared by every renderer."""
+
+
+def _digest(*parts: Any) -> str:  # noqa: ANN401
+    """Stable hash of ``parts``; arrays contribute their dtype, shape and raw bytes."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        if isinstance(part, np.ndarray):
+            digest.update(f"{part.dtype.str}{part.shape}".encode())
+            digest.update(np.ascontiguousarray(part).tobytes())
+        else:
+            digest.update(repr(part).encode())
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def dominant_year(data: Iterable[DataModel]) -> int:
+    """Return the (local) year most rows of ``data`` are in; e.g. the year a calendar of an export is drawn for."""
+    years = np.concatenate(
+        [np.empty(0, dtype="datetime64[Y]"), *(item.local_date_and_time.astype("datetime64[Y]") for item in data)]
+    )
+    if not years.size:
+        message = "There are no rows to take the year from"
+        raise ValueError(message)
+    values, counts = np.unique(years, return_counts=True)
+    return int(values[counts.argmax()].astype(np.int64)) + 1970
+
+
+class LayerModel(BaseModel, ABC):
+    """A part of the calendar which gets rendered (and cached) on its own."""
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    @abstractmethod
+    def _key_parts(self) -> tuple[Any, ...]:
+        """Everything the rendered layer depends on (input data and style)."""
+
+    @abstractmethod
+    def draw(self, figure: Figure, axes: Axes, canvas: CanvasModel) -> None:
+        """Draw the layer onto the (transparent) ``figure``."""
+
+    def cache_key(self, canvas: CanvasModel) -> str:
+        """Key of the rendered layer; changes whenever its data, its style or the canvas change."""
+        return _digest(type(self).__qualname__, canvas.model_dump_json(), *self._key_parts())
+
+    def rasterize(self, canvas: CanvasModel) -> "RasterModel":
+        """Render the layer to a straight-alpha RGBA image."""
+        figure, axes = canvas.new_figure()
+        self.draw(figure, axes, canvas)
+        figure.canvas.draw()
+        return RasterModel.from_image(np.asarray(figure.canvas.buffer_rgba()).copy())
+
+
+class BackgroundLayerModel(LayerModel):
+    """Opaque background with a grid of hours and months."""
+
+    color: str = "white"
+    grid_color: str = "#b0b0b0"
+
+    def _key_parts(self) -> tuple[Any, ...]:
+        return self.color, self.grid_color
+
+    def draw(self, figure: Figure, axes: Axes, canvas: CanvasModel) -> None:  # noqa: D102
+        figure.patch.set_facecolor(self.color)
+        figure.patch.set_alpha(1)
+        axes.vlines(np.arange(1, 24), 0, len(canvas.days), colors=self.grid_color, linewidth=0.5)
+        axes.hlines(canvas.layout.month_starts, 0, 24, colors=self.grid_color, linewidth=0.8)
+
+
+class TwilightLayerModel(LayerModel):
+    """Shading of the twilight bands of a ``SolarAltitudeGridModel``."""
+
+    grid: SolarAltitudeGridModel
+    colors: tuple[tuple[float, float, float, float], ...] = _TWILIGHT_COLORS
+
+    def _key_parts(self) -> tuple[Any, ...]:
+        return self.grid.day, self.grid.altitude, self.grid.resolution, self.colors
+
+    def night_bands(self, canvas: CanvasModel) -> tuple[npt.NDArray[np.uint8], int]:
+        """
+        Re-arrange the band codes to rows of nights starting at ``start_hour`` of the canvas' local time.
+
+        Returns the ``(nights, steps)`` codes and the canvas row of the first night; the canvas' local time may be
+        ahead of the grid's (e.g. during daylight saving time).
+        """
+        bands = self.grid.bands()
+        days, steps = bands.shape
+        ahead = canvas.layout.offset_hours(self.grid.day, self.grid.utc_offset)
+        shift = round(canvas.start_hour / 24 * steps) - np.round(ahead / 24 * steps).astype(np.intp)
+        padding = np.full(steps, TwilightBandEnum.DAY, dtype=np.uint8)
+        flat = np.concatenate([padding, bands.ravel(), padding])
+        nights = flat[steps + shift[:, None] + np.arange(days)[:, None] * steps + np.arange(steps)]
+        return nights, int((self.grid.day[0] - canvas.days[0]).astype(np.int64))
+
+    def draw(self, figure: Figure, axes: Axes, canvas: CanvasModel) -> None:  # noqa: D102
+        nights, offset = self.night_bands(canvas)
+        axes.imshow(
+            nights,
+            cmap=ListedColormap(self.colors),
+            vmin=-0.5,
+            vmax=len(self.colors) - 0.5,
+            extent=(0, 24, offset + len(nights), offset),
+            aspect="auto",
+            interpolation="nearest",
+        )
+
+
+class VisibilityLayerModel(BoundToObservableObjectBaseModel, LayerModel):
+    """Bars of the dark hours an observable object is above the horizon; in its ``line_color``."""
+
+    night: np.ndarray  # datetime64[D] (local date of the evening)
+    start: np.ndarray
+    stop: np.ndarray
+    alpha: float = Field(default=0.35, ge=0, le=1)
+    height: float = Field(default=0.6, gt=0, le=1)  # of a row
+
+    @classmethod
+    def from_visibility(cls: type[Self], model: VisibilityModel) -> Self:
+        """Create the layer from computed windows (see ``visibility.compute_visibility``)."""
+        return cls(bound_object=model.bound_object, night=model.night, start=model.start, stop=model.stop)
+
+    def _key_parts(self) -> tuple[Any, ...]:
+        style = self.bound_object.line_color.as_rgb_tuple(), self.alpha, self.height
+        return self.bound_object.name, *style, self.night, self.start, self.stop
+
+    def bars(self, canvas: CanvasModel) -> tuple[FloatArray, FloatArray, FloatArray]:
+        """Return the canvas row, left and right edge (plot coordinates) of every used window."""
+        # the windows are hours since the midnight before the evening; the rows start at ``start_hour`` that day
+        row = np.broadcast_to((self.night - canvas.days[0]).astype(np.float64)[:, None], self.start.shape)
+        ahead = canvas.layout.offset_hours(self.night)[:, None]  # the windows are in MEZ
+        left = np.clip(self.start + ahead - canvas.start_hour, 0, 24)
+        right = np.clip(self.stop + ahead - canvas.start_hour, 0, 24)
+        used = right > left
+        return row[used], left[used], right[used]
+
+    def draw(self, figure: Figure, axes: Axes, canvas: CanvasModel) -> None:  # noqa: D102
+        row, left, right = self.bars(canvas)
+        axes.barh(
+            row + 0.5,
+            right - left,
+            left=left,
+            height=self.height,
+            color=self.bound_object.line_color.as_hex(),
+            alpha=self.alpha,
+            linewidth=0,
+        )
+
+
+class ObjectLayerModel(BoundToObservableObjectBaseModel, LayerModel):
+    """Rise, culmination and set of an observable object; styled by its ``line_color`` and ``line_strength``."""
+
+    day: np.ndarray  # datetime64[D] (local date)
+    rise: np.ndarray
+    culmination: np.ndarray
+    set: np.ndarray
+    timezone: str = "MEZ"  # of the dates and hours, see ``timezones.TIMEZONES``
+
+    @classmethod
+    def from_data(cls: type[Self], data: DataModel) -> Self:
+        """Create the layer from parsed (or resampled) export data."""
+        decoded = decode_rows(data.rows, "rise", "culmination", "set")
+        missing = np.full(len(data.rows), np.nan)
+        return cls(
+            bound_object=data.bound_object,
+            day=data.local_date_and_time.astype("datetime64[D]"),
+            timezone=data.timezone,
+            **{field: decoded.get(field, missing) for field in EVENT_LINESTYLES},
+        )
+
+    @classmethod
+    def from_rise_set(cls: type[Self], model: RiseSetModel) -> Self:
+        """Create the layer from computed events (see ``riseset.solve_rise_set``)."""
+        return cls(
+            bound_object=model.bound_object,
+            day=model.day,
+            rise=model.rise,
+            culmination=model.culmination,
+            set=model.set,
+        )
+
+    def between(self, start: np.datetime64 | date | str, stop: np.datetime64 | date | str) -> Self:
+        """Layer of the local days ``start <= day < stop`` only (e.g. the rows of a single page)."""
+        selected = (self.day >= np.datetime64(start, "D")) & (self.day < np.datetime64(stop, "D"))
+        return self.model_copy(
+            update={field: getattr(self, field)[selected] for field in ("day", *EVENT_LINESTYLES)},
+        )
+
+    def _key_parts(self) -> tuple[Any, ...]:
+        style = self.bound_object.line_color.as_rgb_tuple(), self.bound_object.line_strength
+        return self.bound_object.name, *style, self.timezone, self.day, self.rise, self.culmination, self.set
+
+    def draw(self, figure: Figure, axes: Axes, canvas: CanvasModel) -> None:  # noqa: D102
+        color = self.bound_object.line_color.as_hex()
+        layout = canvas.layout
+        for field, linestyle in EVENT_LINESTYLES.items():
+            x, y = layout.curve(self.day, getattr(self, field), self.timezone)
+            axes.plot(
+                x,
+                y,
+                color=color,
+                linewidth=self.bound_object.line_strength,
+                linestyle=linestyle,
+            )
+
+
+class AnnotationLayerModel(LayerModel):
+    """Title, hour labels and month labels in the margins."""
+
+    title: str = ""
+    color: str = "black"
+    font_size: float = 10
+
+    def _key_parts(self) -> tuple[Any, ...]:
+        return self.title, self.color, self.font_size
+
+    def draw(self, figure: Figure, axes: Axes, canvas: CanvasModel) -> None:  # noqa: D102
+        text = {"color": self.color, "fontsize": self.font_size, "annotation_clip": False}
+        margin = self.font_size / 3  # points
+        for x in range(0, 25, 2):
+            hour = f"{int(canvas.start_hour + x) % 24}h"
+            for y, offset, va in ((1, margin, "bottom"), (0, -margin, "top")):
+                position = {"xycoords": ("data", "axes fraction"), "textcoords": "offset points"}
+                axes.annotate(hour, (x, y), (0, offset), ha="center", va=va, **position, **text)
+        months = canvas.days.astype("datetime64[M]")
+        for month in np.unique(months):
+            rows = np.flatnonzero(months == month)
+            label = calendar.month_abbr[int(month.astype(np.int64) % 12) + 1]
+            axes.annotate(
+                label, (0, rows.mean() + 0.5), (-margin, 0), textcoords="offset points", ha="right", va="center", **text
+            )
+        if self.title:
+            axes.annotate(
+                self.title,
+                (0.5, 1),
+                (0, 3 * self.font_size),
+                xycoords="axes fraction",
+                textcoords="offset points",
+                ha="center",
+                va="bottom",
+                **text | {"fontsize": self.font_size * 1.6},
+            )
+
+
+class RasterModel(NamedTuple):
+    """A rendered layer: its straight-alpha RGBA ``image`` and the flat indices of its ``visible`` pixels."""
+
+    image: ImageArray
+    visible: npt.NDArray[np.intp]
+
+    @classmethod
+    def from_image(cls: type[Self], image: ImageArray) -> Self:
+        """Wrap ``image`` (shape ``(height, width, 4)``); it's made read-only as rasters get shared via the cache."""
+        image.setflags(write=False)
+        return cls(image=image, visible=np.flatnonzero(image[..., 3]))
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the raster."""
+        return self.image.nbytes + self.visible.nbytes
+
+
+class LayerCache:
+    """Least recently used cache of rendered layers bounded by the total size of the stored images."""
+
+    def __init__(self, max_bytes: int = 256 * 2**20):
+        self.max_bytes = max_bytes
+        self.hits = self.misses = 0
+        self._rasters: OrderedDict[str, RasterModel] = OrderedDict()
+        self._size = 0
+
+    def __len__(self) -> int:  # noqa: D105
+        return len(self._rasters)
+
+    def __contains__(self, key: str) -> bool:  # noqa: D105
+        return key in self._rasters
+
+    @property
+    def size(self) -> int:
+        """Bytes of all cached images."""
+        return self._size
+
+    def get_or_render(self, layer: LayerModel, canvas: CanvasModel) -> RasterModel:
+        """Return the cached raster of ``layer`` or render (and cache) it."""
+        key = layer.cache_key(canvas)
+        if (raster := self._rasters.get(key)) is not None:
+            self.hits += 1
+            self._rasters.move_to_end(key)
+            return raster
+        self.misses += 1
+        raster = layer.rasterize(canvas)
+        self._rasters[key] = raster
+        self._size += raster.nbytes
+        while self._size > self.max_bytes and len(self._rasters) > 1:
+            _, evicted = self._rasters.popitem(last=False)
+            self._size -= evicted.nbytes
+        return raster
+
+    def clear(self) -> None:
+        """Drop every cached raster."""
+        self._rasters.clear()
+        self._size = 0
+
+
+def composite(rasters: Iterable[RasterModel]) -> ImageArray:
+    """
+    Stack ``rasters`` (bottom first) with the "over" operator.
+
+    Only the visible pixels of every raster get blended, so mostly transparent layers (like the thin curves of an
+    object) cost next to nothing.
+    """
+    result: npt.NDArray[np.float32] | None = None  # premultiplied alpha, shape (pixels, 4)
+    shape: tuple[int, ...] = ()
+    for raster in rasters:
+        if result is None:
+            shape = raster.image.shape
+            result = np.zeros((shape[0] * shape[1], 4), dtype=np.float32)
+        pixels = raster.image.reshape(-1, 4)[raster.visible].astype(np.float32)
+        pixels *= 1 / 255
+        alpha = pixels[:, 3:]
+        pixels[:, :3] *= alpha
+        result[raster.visible] = result[raster.visible] * (1 - alpha) + pixels
+    if result is None:
+        message = "There is nothing to composite"
+        raise ValueError(message)
+    alpha = result[:, 3:]
+    np.divide(result[:, :3], alpha, out=result[:, :3], where=alpha > 0)
+    return np.rint(result * 255).astype(np.uint8).reshape(shape)
+
+
+LAYER_ORDER: tuple[type[LayerModel], ...] = (
+    BackgroundLayerModel,
+    TwilightLayerModel,
+    VisibilityLayerModel,
+    ObjectLayerModel,
+    AnnotationLayerModel,
+)
+"""Kinds of layers from bottom to top."""
+
+
+def sort_layers(layers: Iterable[LayerModel]) -> list[LayerModel]:
+    """Order ``layers`` bottom first by ``LAYER_ORDER`` (stable within the same kind; unknown kinds go on top)."""
+    rank = {kind: index for index, kind in enumerate(LAYER_ORDER)}
+    return sorted(layers, key=lambda layer: rank.get(type(layer), len(rank)))
+
+
+CALENDAR_GRID_RESOLUTION: timedelta = timedelta(minutes=10)
+"""Resolution of the twilight grid of ``calendar_layers``; a pixel row of a calendar spans more than that."""
+
+
+def calendar_layers(
+    metadata: MetaDataModel,
+    data: Iterable[DataModel],
+    year: int,
+    *,
+    grid: SolarAltitudeGridModel | None = None,
+) -> list[LayerModel]:
+    """
+    Return the layers of the default calendar of ``data`` (an export of ``metadata``) for ``year``.
+
+    That's the background, the twilight of ``grid`` (computed at ``CALENDAR_GRID_RESOLUTION`` unless given), the
+    curves of every object and the annotation titled with the place and year.
+    """
+    if grid is None:
+        grid = compute_solar_altitude_grid(metadata, year, resolution=CALENDAR_GRID_RESOLUTION)
+    return [
+        BackgroundLayerModel(),
+        TwilightLayerModel(grid=grid),
+        *(ObjectLayerModel.from_data(item) for item in data),
+        AnnotationLayerModel(title=f"{metadata.place} {year}"),
+    ]
+
+
+class Renderer:
+    """Render calendars layer by layer; unchanged layers are taken from ``cache``."""
+
+    def __init__(self, canvas: CanvasModel, cache: LayerCache | None = None):
+        self.canvas = canvas
+        self.cache = LayerCache() if cache is None else cache
+
+    def render(self, layers: Iterable[LayerModel]) -> ImageArray:
+        """Composite ``layers`` into a single RGBA image of shape ``(height, width, 4)``."""
+        return composite(self.cache.get_or_render(layer, self.canvas) for layer in sort_layers(layers))
+
+    def save(self, layers: Iterable[LayerModel], path: Path | str) -> None:
+        """Render ``layers`` and save the image (format by the suffix of ``path``, e.g. ``.png``)."""
+        imsave(path, self.render(layers), dpi=self.canvas.dpi)
@@ -0,0 +1,180 @@
+# standard library
+from datetime import UTC, timedelta
+from typing import Literal
+
+# third party
+import numpy as np
+import numpy.typing as npt
+
+# local
+from .columns import COLUMN_ENCODERS, COLUMN_PERIODS, column_difference, decode_rows
+from .errors import ResamplingNotSupportedError
+from .models import DataModel, RowModel
+from .timezones import local_to_utc
+
+
+__all__ = (
+    "resample",
+    "resampling_errors",
+)
+
+
+type FloatArray = npt.NDArray[np.float64]
+type Method = Literal["hermite", "cubic"]
+
+# lower bound and period of every wrapping column
+_WRAPPING: dict[str, tuple[float, float]] = {
+    field: (-period / 2 if field == "elongation" else 0, period) for field, period in COLUMN_PERIODS.items()
+}
+_ORDER: dict[str, int] = {"hermite": 3, "cubic": 4}  # convergence order of the interpolation error
+
+
+def _hermite(x: FloatArray, y: FloatArray, at: FloatArray) -> FloatArray:
+    """Cubic Hermite interpolation with second order finite-difference slopes."""
+    if len(x) < 3:
+        return np.interp(at, x, y)
+    slopes = np.gradient(y, x)
+    index = np.clip(np.searchsorted(x, at, side="right") - 1, 0, len(x) - 2)
+    h = x[index + 1] - x[index]
+    t = (at - x[index]) / h
+    t2, t3 = t * t, t * t * t
+    return (
+        (2 * t3 - 3 * t2 + 1) * y[index]
+        + (t3 - 2 * t2 + t) * h * slopes[index]
+        + (-2 * t3 + 3 * t2) * y[index + 1]
+        + (t3 - t2) * h * slopes[index + 1]
+    )
+
+
+def _solve_tridiagonal(lower: FloatArray, diagonal: FloatArray, upper: FloatArray, rhs: FloatArray) -> FloatArray:
+    """
+    Solve a tridiagonal system with the Thomas algorithm in O(n) time and memory.
+
+    ``lower`` and ``upper`` are the sub- and superdiagonal (one shorter than ``diagonal``); no pivoting, so the
+    system has to be diagonally dominant (like the one of a spline).
+    """
+    n = len(diagonal)
+    factor, solution = np.empty(n), np.empty(n)
+    factor[0], solution[0] = diagonal[0], rhs[0]
+    for i in range(1, n):
+        weight = lower[i - 1] / factor[i - 1]
+        factor[i] = diagonal[i] - weight * upper[i - 1]
+        solution[i] = rhs[i] - weight * solution[i - 1]
+    solution[-1] /= factor[-1]
+    for i in range(n - 2, -1, -1):
+        solution[i] = (solution[i] - upper[i] * solution[i + 1]) / factor[i]
+    return solution
+
+
+def _cubic(x: FloatArray, y: FloatArray, at: FloatArray) -> FloatArray:
+    """Natural cubic spline interpolation."""
+    if len(x) < 3:
+        return np.interp(at, x, y)
+    h = np.diff(x)
+    # second derivatives at the nodes; they vanish at both ends, the inner ones solve a tridiagonal system
+    moments = np.zeros(len(x))
+    moments[1:-1] = _solve_tridiagonal(
+        h[1:-1], 2 * (h[:-1] + h[1:]), h[1:-1], 6 * (np.diff(y[1:]) / h[1:] - np.diff(y[:-1]) / h[:-1])
+    )
+
+    index = np.clip(np.searchsorted(x, at, side="right") - 1, 0, len(x) - 2)
+    h = h[index]
+    a, b = x[index + 1] - at, at - x[index]
+    return (
+        moments[index] * a**3 / (6 * h)
+        + moments[index + 1] * b**3 / (6 * h)
+        + (y[index] / h - moments[index] * h / 6) * a
+        + (y[index + 1] / h - moments[index + 1] * h / 6) * b
+    )
+
+
+_METHODS = {"hermite": _hermite, "cubic": _cubic}
+
+
+def _interpolate(field: str, x: FloatArray, y: FloatArray, at: FloatArray, method: Method) -> FloatArray:
+    """Interpolate a single column; wrapping columns get unwrapped first and values next to gaps stay ``nan``."""
+    valid = ~np.isnan(y)
+    result = np.full(at.shape, np.nan)
+    if valid.sum() < 2:
+        return result
+    values = y[valid]
+    if (wrapping := _WRAPPING.get(field)) is not None:
+        values = np.unwrap(values, period=wrapping[1])
+    result = _METHODS[method](x[valid], values, at)
+    if wrapping is not None:
+        lower, period = wrapping
+        result = (result - lower) % period + lower
+    # an interval bracketed by a gap (e.g. a "--"-cell of a circumpolar object) doesn't get interpolated
+    index = np.clip(np.searchsorted(x, at, side="right") - 1, 0, len(x) - 2)
+    exact = x[index] == at
+    usable = (valid[index] & (valid[index + 1] | exact)) & (at >= x[0]) & (at <= x[-1])
+    return np.where(usable, result, np.nan)
+
+
+def _local_days(data: DataModel) -> FloatArray:
+    return data.local_date_and_time.astype(np.int64) / 86400e9
+
+
+def _check_supported(data: DataModel) -> None:
+    if data.bound_object.is_moon:
+        raise ResamplingNotSupportedError(
+            data.bound_object.name, "the moon moves too fast for its position and events to be interpolated"
+        )
+    if len(data.rows) < 2:
+        raise ResamplingNotSupportedError(data.bound_object.name, "at least two rows are required")
+
+
+def resample(data: DataModel, step: timedelta = timedelta(days=1), *, method: Method = "hermite") -> DataModel:
+    """
+    Interpolate ``data`` onto a finer (or coarser) cadence of ``step`` local time.
+
+    Every numeric column gets interpolated in one vectorized pass per column with cubic ``hermite`` (local) or
+    ``cubic`` (natural spline) interpolation; right ascension, ecliptic longitude and elongation are unwrapped
+    first. Columns of daily events (rise, culmination, set, dawn and dusk) are interpolated as time of day (wrapping
+    at 24h, see ``columns.COLUMN_PERIODS``) and intervals next to an empty cell stay empty; a day an event skips
+    because it wraps past midnight isn't reproduced though. Columns without known meaning (e.g. ``phas_w``) are dropped.
+
+    Raises ``ResamplingNotSupportedError`` for the moon, whose position and events change too much between the
+    rows of a typical export.
+    """
+    _check_supported(data)
+    x = _local_days(data)
+    local = np.arange(
+        data.local_date_and_time[0],
+        data.local_date_and_time[-1] + np.timedelta64(1, "ns"),
+        np.timedelta64(step),
+    ).astype("datetime64[ns]")
+    at = local.astype(np.int64) / 86400e9
+
+    columns = {
+        field: COLUMN_ENCODERS[field](_interpolate(field, x, y, at, method))
+        for field, y in decode_rows(data.rows).items()
+    }
+    date_and_time = local_to_utc(local, data.timezone).astype("datetime64[us]").tolist()
+    rows = [
+        RowModel(
+            bound_object=data.bound_object,
+            date_and_time=moment.replace(tzinfo=UTC),
+            **{field: column[index] for field, column in columns.items()},
+        )
+        for index, moment in enumerate(date_and_time)
+    ]
+    return data.model_copy(update={"rows": rows})
+
+
+def resampling_errors(data: DataModel, *, method: Method = "hermite") -> dict[str, float]:
+    """
+    Estimate the maximum interpolation error of every column of ``data`` (in the column's unit, hours or degrees).
+
+    Every other row gets predicted from the remaining ones; the deviation of this doubled cadence gets scaled down by
+    the convergence order of ``method``. Raises ``ResamplingNotSupportedError`` just like ``resample``.
+    """
+    _check_supported(data)
+    x = _local_days(data)
+    errors: dict[str, float] = {}
+    for field, y in decode_rows(data.rows).items():
+        predicted = _interpolate(field, x[::2], y[::2], x[1::2], method)
+        difference = column_difference(field, predicted, y[1::2])
+        difference = np.abs(difference[~np.isnan(difference)])
+        errors[field] = float(difference.max()) / 2 ** _ORDER[method] if difference.size else float("nan")
+    return errors
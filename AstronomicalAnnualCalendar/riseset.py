@@ -0,0 +1,221 @@
+# standard library
+from collections.abc import Callable, Sequence
+from datetime import timedelta
+
+# third party
+import numpy as np
+import numpy.typing as npt
+from pydantic import BaseModel
+from pydantic.config import ConfigDict
+
+# local
+from .models import BoundToObservableObjectBaseModel, CoordinateModel, ObservableObjectModel
+from .transforms import (
+    datetime64_to_unix_days,
+    equatorial_to_horizontal,
+    greenwich_mean_sidereal_time,
+    unix_days_to_julian_day,
+)
+
+
+__all__ = (
+    "standard_altitude",
+    "PositionSeries",
+    "RiseSetModel",
+    "solve_rise_set",
+)
+
+
+type FloatArray = npt.NDArray[np.float64]
+
+_SUN_STANDARD_ALTITUDE: float = -0.8333  # refraction (34') and semi-diameter (16') of the upper limb
+_MOON_STANDARD_ALTITUDE: float = 0.125  # mean parallax minus refraction and semi-diameter
+_PLANET_STANDARD_ALTITUDE: float = -0.5667  # refraction only
+
+
+def standard_altitude(observable_object: ObservableObjectModel) -> float:
+    """Geometric altitude (degrees) of the object's center at apparent rise or set."""
+    if observable_object.is_sun:
+        return _SUN_STANDARD_ALTITUDE
+    if observable_object.is_moon:
+        return _MOON_STANDARD_ALTITUDE
+    return _PLANET_STANDARD_ALTITUDE
+
+
+class PositionSeries:
+    """
+    Interpolates an apparent-position time series at arbitrary times.
+
+    Times are given in days since the unix epoch (UTC, see ``transforms.datetime64_to_unix_days``) and the right
+    ascension is unwrapped, so a series crossing 0h interpolates smoothly.
+    """
+
+    def __init__(self, date_and_time: npt.ArrayLike, right_ascension: npt.ArrayLike, declination: npt.ArrayLike):
+        self.days = datetime64_to_unix_days(date_and_time)
+        self.right_ascension = np.unwrap(np.asarray(right_ascension, dtype=np.float64) * 15, period=360)
+        self.declination = np.asarray(declination, dtype=np.float64)
+
+    def at(self, days: FloatArray) -> tuple[FloatArray, FloatArray]:
+        """Right ascension (degrees, unwrapped) and declination (degrees) at ``days``."""
+        return np.interp(days, self.days, self.right_ascension), np.interp(days, self.days, self.declination)
+
+
+class RiseSetModel(BoundToObservableObjectBaseModel, BaseModel):
+    """
+    Daily rise, culmination and set of an observable object.
+
+    Times are given in hours of the local day and azimuths in degrees; events which don't take place on a day
+    (the ``--`` cells of an export) are ``nan``.
+    Every array has the shape ``(days,)`` or ``(locations, days)`` if several coordinates were solved at once.
+    """
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    day: np.ndarray  # datetime64[D] (local date)
+    rise: np.ndarray
+    culmination: np.ndarray
+    set: np.ndarray
+    azimut_rise: np.ndarray
+    azimut_set: np.ndarray
+
+
+def _hour_angle(series: PositionSeries, days: FloatArray, longitude: FloatArray) -> tuple[FloatArray, FloatArray]:
+    """Hour angle wrapped to -180° <-> 180° and declination."""
+    right_ascension, declination = series.at(days)
+    hour_angle = greenwich_mean_sidereal_time(unix_days_to_julian_day(days)) + longitude - right_ascension
+    return (hour_angle + 180) % 360 - 180, declination
+
+
+def _refine(
+    function: Callable[[FloatArray, npt.NDArray[np.intp]], FloatArray],
+    grid: FloatArray,
+    values: FloatArray,
+    location: npt.NDArray[np.intp],
+    index: npt.NDArray[np.intp],
+    iterations: int,
+) -> FloatArray:
+    """Refine the roots bracketed by ``grid[index]`` and ``grid[index + 1]`` with the regula falsi."""
+    t0, t1 = grid[index], grid[index + 1]
+    f0, f1 = values[location, index], values[location, index + 1]
+    for _ in range(iterations):
+        t = t0 - f0 * (t1 - t0) / (f1 - f0)
+        f = function(t, location)
+        same_sign = np.signbit(f) == np.signbit(f0)
+        t0, f0, t1, f1 = (
+            np.where(same_sign, t, t0),
+            np.where(same_sign, f, f0),
+            np.where(same_sign, t1, t),
+            np.where(same_sign, f1, f),
+        )
+    return t0 - f0 * (t1 - t0) / (f1 - f0)
+
+
+def _first_per_day(
+    times: FloatArray,
+    location: npt.NDArray[np.intp],
+    first_day: float,
+    shape: tuple[int, int],
+) -> tuple[FloatArray, npt.NDArray[np.intp]]:
+    """Local hours of the first event of each day and the index of the chosen events (-1 if none)."""
+    hours, chosen = np.full(shape, np.nan), np.full(shape, -1, dtype=np.intp)
+    day = np.floor(times).astype(np.intp) - int(first_day)
+    valid = np.flatnonzero((day >= 0) & (day < shape[1]))
+    key = location[valid] * shape[1] + day[valid]
+    key, first = np.unique(key, return_index=True)  # events are sorted by location and time
+    hours.flat[key] = (times[valid[first]] - np.floor(times[valid[first]])) * 24
+    chosen.flat[key] = valid[first]
+    return hours, chosen
+
+
+def solve_rise_set(
+    observable_object: ObservableObjectModel,
+    date_and_time: npt.ArrayLike,
+    right_ascension: npt.ArrayLike,
+    declination: npt.ArrayLike,
+    coordinates: CoordinateModel | Sequence[CoordinateModel],
+    *,
+    year: int,
+    utc_offset: timedelta = timedelta(hours=1),
+    altitude: float | None = None,
+    step: timedelta = timedelta(minutes=10),
+    iterations: int = 3,
+) -> RiseSetModel:
+    """
+    Compute rise, culmination and set for every (local) day of ``year`` in one batched pass.
+
+    ``date_and_time`` (UTC), ``right_ascension`` (hours) and ``declination`` (degrees) form the apparent-position
+    time series of the object (referred to the equinox of date); it gets interpolated linearly, so the moon needs
+    a dense series (an hour or less) whereas a 10-day series suffices for the planets.
+    The altitude is sampled every ``step`` for every location at once; sign changes of the altitude relative to
+    the horizon threshold (``altitude``, see ``standard_altitude``) and of the hour angle bracket the events which
+    then get refined by the regula falsi. Objects which stay above (circumpolar) or below the horizon simply
+    produce no sign change and therefore ``nan``.
+    Local days are defined by the fixed ``utc_offset`` (MEZ by default).
+    """
+    single = isinstance(coordinates, CoordinateModel)
+    coordinates = [coordinates] if single else list(coordinates)
+    latitude = np.array([coordinate.latitude for coordinate in coordinates])
+    longitude = np.array([coordinate.longitude for coordinate in coordinates])
+    threshold = standard_altitude(observable_object) if altitude is None else altitude
+    series = PositionSeries(date_and_time, right_ascension, declination)
+
+    offset = utc_offset.total_seconds() / 86400
+    first_day = np.datetime64(f"{year}-01-01", "D")
+    days = np.arange(first_day, np.datetime64(f"{year + 1}-01-01", "D"))
+    start = first_day.astype(np.int64) - offset
+    step_days = step.total_seconds() / 86400
+    grid = np.arange(start - step_days, start + len(days) + 2 * step_days, step_days)
+
+    sin_latitude, cos_latitude = np.sin(np.radians(latitude)), np.cos(np.radians(latitude))
+    sin_threshold = np.sin(np.radians(threshold))
+
+    def sin_hour_angle(t: FloatArray, location: npt.NDArray[np.intp]) -> FloatArray:
+        return np.sin(np.radians(_hour_angle(series, t, longitude[location])[0]))
+
+    def height(t: FloatArray, location: npt.NDArray[np.intp]) -> FloatArray:
+        hour_angle, declination = np.radians(_hour_angle(series, t, longitude[location]))
+        return (
+            sin_latitude[location] * np.sin(declination)
+            + cos_latitude[location] * np.cos(declination) * np.cos(hour_angle)
+            - sin_threshold
+        )
+
+    # coarse pass: the trigonometry only depends on the grid, the locations just need products and sums
+    right_ascension, declination = series.at(grid)
+    sidereal = np.radians(greenwich_mean_sidereal_time(unix_days_to_julian_day(grid)) - right_ascension)
+    sin_sidereal, cos_sidereal = np.sin(sidereal), np.cos(sidereal)
+    sin_longitude, cos_longitude = np.sin(np.radians(longitude))[:, None], np.cos(np.radians(longitude))[:, None]
+    grid_sin_hour_angle = sin_sidereal * cos_longitude + cos_sidereal * sin_longitude
+    grid_cos_hour_angle = cos_sidereal * cos_longitude - sin_sidereal * sin_longitude
+    declination = np.radians(declination)
+    grid_height = (
+        sin_latitude[:, None] * np.sin(declination)
+        + cos_latitude[:, None] * np.cos(declination) * grid_cos_hour_angle
+        - sin_threshold
+    )
+
+    before, after = grid_height[:, :-1], grid_height[:, 1:]
+    rising = np.nonzero((before < 0) & (after >= 0))
+    setting = np.nonzero((before >= 0) & (after < 0))
+    before, after = grid_sin_hour_angle[:, :-1], grid_sin_hour_angle[:, 1:]
+    transit = np.nonzero((before < 0) & (after >= 0) & (grid_cos_hour_angle[:, 1:] > 0))
+
+    shape = (len(coordinates), len(days))
+    result: dict[str, FloatArray] = {}
+    for name, function, values, (location, index) in (
+        ("rise", height, grid_height, rising),
+        ("culmination", sin_hour_angle, grid_sin_hour_angle, transit),
+        ("set", height, grid_height, setting),
+    ):
+        times = _refine(function, grid, values, location, index, iterations)
+        result[name], chosen = _first_per_day(times + offset, location, start + offset, shape)
+        if name != "culmination":
+            mask = chosen >= 0
+            h, dec = _hour_angle(series, times[chosen[mask]], longitude[location[chosen[mask]]])
+            azimuth = np.full(shape, np.nan)
+            azimuth[mask] = equatorial_to_horizontal(h, dec, latitude[location[chosen[mask]]])[1]
+            result[f"azimut_{name}"] = azimuth
+
+    if single:
+        result = {key: value[0] for key, value in result.items()}
+    return RiseSetModel(bound_object=observable_object, day=days, **result)
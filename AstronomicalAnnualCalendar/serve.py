@@ -0,0 +1,335 @@
+# standard library
+import hashlib
+import json
+import socket
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from io import BytesIO
+from pathlib import Path
+from threading import Lock
+from typing import Any, NamedTuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+# third party
+import numpy as np
+from matplotlib.image import imsave
+
+# local
+from .columns import COLUMN_DECODERS, decode_rows
+from .errors import AliasNotAssignedError
+from .models import DataModel, ObservableObjectModel
+from .parser import Parser
+from .render import CanvasModel, LayerCache, LayerModel, Renderer, calendar_layers, dominant_year
+from .svg import render_svg
+from .utils import observable_object_from_alias
+
+
+__all__ = (
+    "EXPORT_PATTERNS",
+    "LRUCache",
+    "DatasetModel",
+    "file_etag",
+    "DatasetCache",
+    "CalendarServer",
+    "CalendarRequestHandler",
+)
+
+
+EXPORT_PATTERNS: tuple[str, ...] = ("*.txt", "*.txt.gz", "*.txt.bz2", "*.txt.xz")
+"""Names of the served exports; compressed ones get decompressed on the fly."""
+
+_CALENDAR_LIMITS: dict[str, tuple[int, int]] = {
+    "width": (16, 4096),
+    "height": (16, 4096),
+    "dpi": (10, 600),
+    "year": (1, 9999),
+}
+
+
+class LRUCache[K, V]:
+    """Thread-safe least recently used cache holding up to ``max_entries`` entries."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.hits = self.misses = 0
+        self._entries: OrderedDict[K, V] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:  # noqa: D105
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        """Return the entry of ``key`` (and mark it as recently used) or ``None``."""
+        with self._lock:
+            if (value := self._entries.get(key)) is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        """Store ``value``; the least recently used entries get evicted once the cache is full."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+class DatasetModel(NamedTuple):
+    """A parsed export and the entity tag of the file version it was parsed from."""
+
+    parser: Parser
+    data: dict[ObservableObjectModel, DataModel]
+    etag: str
+
+
+def file_etag(path: Path) -> str:
+    """Entity tag of the current version (size and mtime) of ``path``."""
+    stat = path.stat()
+    return f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+
+
+class DatasetCache(LRUCache[tuple[Path, str], DatasetModel]):
+    """Parsed exports keyed by path, size and mtime; a changed file simply misses and gets parsed again."""
+
+    def load(self, path: Path) -> DatasetModel:
+        """Return the parsed export of ``path``, parsing it only if this version isn't cached yet."""
+        key = path.resolve(), file_etag(path)
+        if (dataset := self.get(key)) is not None:
+            return dataset
+        parser = Parser(file_path=path)
+        dataset = DatasetModel(parser=parser, data=parser.parse(), etag=key[1])
+        self.put(key, dataset)
+        return dataset
+
+
+class CalendarServer(HTTPServer):
+    """
+    HTTP server for the exports (see ``EXPORT_PATTERNS``) of ``directory``, handled by ``workers`` threads.
+
+    Parsed exports and rendered images are kept in LRU caches, see ``CalendarRequestHandler`` for the endpoints.
+    Connections are kept alive between requests, but a connection idle for ``idle_timeout`` seconds gets closed so
+    it doesn't block one of the workers forever.
+    """
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        directory: Path | str,
+        *,
+        workers: int = 8,
+        datasets: int = 32,
+        renders: int = 64,
+        idle_timeout: float = 15,
+    ):
+        super().__init__(address, CalendarRequestHandler)
+        self.idle_timeout = idle_timeout
+        self.directory = Path(directory).resolve()
+        self.datasets = DatasetCache(datasets)
+        self.renders: LRUCache[str, bytes] = LRUCache(renders)
+        self.layer_cache = LayerCache()
+        self.render_lock = Lock()  # the layer cache isn't thread-safe and rendering is CPU-bound anyway
+        self._pool = ThreadPoolExecutor(workers, thread_name_prefix="aac-serve")
+
+    def process_request(self, request: socket.socket, client_address: tuple[str, int]) -> None:  # noqa: D102
+        self._pool.submit(self._process_request, request, client_address)
+
+    def _process_request(self, request: socket.socket, client_address: tuple[str, int]) -> None:
+        try:
+            self.finish_request(request, client_address)
+        except Exception:  # noqa: BLE001
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self) -> None:  # noqa: D102
+        super().server_close()
+        self._pool.shutdown(wait=True)
+
+    def export(self, name: str) -> Path:
+        """Resolve the export ``name`` inside ``directory``; raises ``FileNotFoundError`` for anything else."""
+        path = (self.directory / name).resolve()
+        if path.parent != self.directory or not any(map(path.match, EXPORT_PATTERNS)) or not path.is_file():
+            raise FileNotFoundError(name)
+        return path
+
+
+def _json_value(value: float) -> float | None:
+    return None if np.isnan(value) else value
+
+
+def _calendar_parameter(query: dict[str, str], key: str) -> int:
+    """Integer ``key`` of ``query`` within ``_CALENDAR_LIMITS``; raises ``ValueError`` (a ``400``) otherwise."""
+    minimum, maximum = _CALENDAR_LIMITS[key]
+    try:
+        value = int(query[key])
+    except ValueError:
+        message = f"{key} must be an integer, got {query[key]!r}"
+        raise ValueError(message) from None
+    if not minimum <= value <= maximum:
+        message = f"{key} must be between {minimum} and {maximum}, got {value}"
+        raise ValueError(message)
+    return value
+
+
+class CalendarRequestHandler(BaseHTTPRequestHandler):
+    """
+    JSON and image endpoints of a ``CalendarServer``.
+
+    - ``/files``: the exports with their entity tags
+    - ``/files/<file>``: metadata and objects of an export
+    - ``/files/<file>/<object>?fields=rise,set&start=2024-03-01&stop=2024-04-01``: decoded columns of an object
+    - ``/files/<file>/calendar.png?objects=sun,moon&width=1200&height=1600&dpi=100&year=2024``: rendered calendar
+    - ``/files/<file>/calendar.svg?...``: the same calendar as SVG (see ``svg.render_svg``), e.g. for web previews
+
+    Every response of an export carries an ``ETag`` derived from the file's size and mtime and the request, so
+    ``If-None-Match`` gets answered with ``304 Not Modified`` without touching the file's content.
+    Invalid parameters (e.g. a calendar larger than the limits) get a ``400``, unexpected errors a ``500``.
+    """
+
+    server: CalendarServer
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def timeout(self) -> float:  # type: ignore
+        """Seconds a connection may idle (or a request take to arrive) before it gets closed."""
+        return self.server.idle_timeout
+
+    def do_GET(self) -> None:  # noqa: D102, N802
+        url = urlsplit(self.path)
+        parts = [unquote(part) for part in url.path.strip("/").split("/") if part]
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        try:
+            match parts:
+                case [] | ["files"]:
+                    self._send_json(self._list_files())
+                case ["files", name, *rest] if len(rest) <= 1:
+                    path = self.server.export(name)
+                    request = f"{file_etag(path)} {url.path} {sorted(query.items())}".encode()
+                    etag = f'"{hashlib.blake2b(request, digest_size=16).hexdigest()}"'
+                    if etag in {tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")}:
+                        self._send(HTTPStatus.NOT_MODIFIED, b"", etag=etag)
+                    elif not rest:
+                        self._send_json(self._describe(path), etag=etag)
+                    elif rest[0] == "calendar.png":
+                        self._send(HTTPStatus.OK, self._render(path, query, etag), "image/png", etag=etag)
+                    elif rest[0] == "calendar.svg":
+                        self._send(HTTPStatus.OK, self._render_svg(path, query, etag), "image/svg+xml", etag=etag)
+                    else:
+                        self._send_json(self._columns(path, rest[0], query), etag=etag)
+                case _:
+                    raise FileNotFoundError(url.path)
+        except (FileNotFoundError, LookupError, AliasNotAssignedError) as error:
+            self._send_json({"error": f"not found: {error}"}, HTTPStatus.NOT_FOUND)
+        except ValueError as error:
+            self._send_json({"error": str(error)}, HTTPStatus.BAD_REQUEST)
+        except Exception:  # noqa: BLE001
+            self.log_error("Error handling %s:\n%s", self.path, traceback.format_exc())
+            self._send_json({"error": "internal server error"}, HTTPStatus.INTERNAL_SERVER_ERROR)
+
+    do_HEAD = do_GET  # noqa: N815
+
+    def _list_files(self) -> dict[str, Any]:
+        paths = sorted({path for pattern in EXPORT_PATTERNS for path in self.server.directory.glob(pattern)})
+        return {"files": [{"name": path.name, "size": path.stat().st_size, "etag": file_etag(path)} for path in paths]}
+
+    def _describe(self, path: Path) -> dict[str, Any]:
+        dataset = self.server.datasets.load(path)
+        metadata = dataset.parser.metadata
+        return {
+            "name": path.name,
+            "place": metadata.place,
+            "latitude": metadata.coordinate.latitude,
+            "longitude": metadata.coordinate.longitude,
+            "delta_t": metadata.delta_t.total_seconds(),
+            "objects": {
+                observable_object.name: {"rows": len(data.rows), "timezone": data.timezone}
+                for observable_object, data in dataset.data.items()
+            },
+        }
+
+    def _columns(self, path: Path, name: str, query: dict[str, str]) -> dict[str, Any]:
+        data = self.server.datasets.load(path).data[observable_object_from_alias(name)]
+        date_and_time = data.date_and_time
+        selected = np.ones(len(date_and_time), dtype=bool)
+        if "start" in query:
+            selected &= date_and_time >= np.datetime64(query["start"])
+        if "stop" in query:
+            selected &= date_and_time < np.datetime64(query["stop"])
+        fields = [field for field in query.get("fields", "").split(",") if field]
+        rows = [row for row, keep in zip(data.rows, selected, strict=True) if keep]
+        if unknown := set(fields) - COLUMN_DECODERS.keys():
+            message = f"unknown fields: {", ".join(sorted(unknown))}"
+            raise ValueError(message)
+        columns = decode_rows(rows, *fields)
+        return {
+            "object": data.bound_object.name,
+            "timezone": data.timezone,
+            "date_and_time": [f"{moment}Z" for moment in date_and_time[selected].astype("datetime64[s]")],
+            "columns": {field: [_json_value(value) for value in column.tolist()] for field, column in columns.items()},
+        }
+
+    def _calendar(self, path: Path, query: dict[str, str]) -> tuple[CanvasModel, list[LayerModel]]:
+        dataset = self.server.datasets.load(path)
+        data = dataset.data
+        if names := [name for name in query.get("objects", "").split(",") if name]:
+            data = {
+                observable_object: data[observable_object]
+                for observable_object in map(observable_object_from_alias, names)
+            }
+        year = _calendar_parameter(query, "year") if query.get("year") else dominant_year(data.values())
+        canvas = CanvasModel(
+            year=year,
+            **{key: _calendar_parameter(query, key) for key in ("width", "height", "dpi") if key in query},
+        )
+        return canvas, calendar_layers(dataset.parser.metadata, data.values(), year)
+
+    def _render(self, path: Path, query: dict[str, str], etag: str) -> bytes:
+        if (image := self.server.renders.get(etag)) is not None:
+            return image
+        canvas, layers = self._calendar(path, query)
+        with self.server.render_lock:
+            image = Renderer(canvas, cache=self.server.layer_cache).render(layers)
+        buffer = BytesIO()
+        imsave(buffer, image, format="png", dpi=canvas.dpi)
+        self.server.renders.put(etag, buffer.getvalue())
+        return buffer.getvalue()
+
+    def _render_svg(self, path: Path, query: dict[str, str], etag: str) -> bytes:
+        if (document := self.server.renders.get(etag)) is not None:
+            return document
+        document = render_svg(*self._calendar(path, query)).encode("utf-8")
+        self.server.renders.put(etag, document)
+        return document
+
+    def _send_json(self, content: object, status: HTTPStatus = HTTPStatus.OK, *, etag: str | None = None) -> None:
+        self._send(status, json.dumps(content).encode("utf-8"), "application/json", etag=etag)
+
+    def _send(
+        self,
+        status: HTTPStatus,
+        body: bytes,
+        content_type: str | None = None,
+        *,
+        etag: str | None = None,
+    ) -> None:
+        self.send_response(status)
+        if content_type is not None:
+            self.send_header("Content-Type", content_type)
+        if etag is not None:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")  # always revalidate; unchanged files cost a ``stat`` only
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
@@ -0,0 +1,130 @@
+# standard library
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+
+# third party
+import numpy as np
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
+
+# local
+from .render import CanvasModel, ImageArray, LayerModel, ObjectLayerModel, TwilightLayerModel, sort_layers
+
+
+__all__ = (
+    "LayerProvider",
+    "month_pages",
+    "tile_pages",
+    "sliced_layers",
+    "draw_page",
+    "render_page",
+    "write_pdf",
+    "write_tiles",
+)
+
+
+type LayerProvider = Callable[[CanvasModel], Iterable[LayerModel]]
+"""Create the layers of a single page (canvas); called once per page, right before the page gets drawn."""
+
+_ONE_DAY = np.timedelta64(1, "D")
+
+
+def month_pages(canvas: CanvasModel) -> Iterator[CanvasModel]:
+    """Split ``canvas`` into one page per month, every page spanning the full size of ``canvas``."""
+    days = canvas.days
+    for month in np.unique(days.astype("datetime64[M]")):
+        start = max(month.astype("datetime64[D]"), days[0])
+        stop = min((month + np.timedelta64(1, "M")).astype("datetime64[D]"), days[-1] + _ONE_DAY)
+        yield canvas.model_copy(update={"start": start.item(), "stop": stop.item()})
+
+
+def tile_pages(canvas: CanvasModel, rows: int, columns: int) -> Iterator[tuple[int, int, CanvasModel]]:
+    """Split ``canvas`` into ``rows`` x ``columns`` tiles; yields ``(row, column, tile)`` row by row."""
+    x = np.linspace(0, canvas.width, columns + 1).round().astype(int)
+    y = np.linspace(0, canvas.height, rows + 1).round().astype(int)
+    for row in range(rows):
+        for column in range(columns):
+            viewport = (int(x[column]), int(y[row]), int(x[column + 1] - x[column]), int(y[row + 1] - y[row]))
+            yield row, column, canvas.model_copy(update={"viewport": viewport})
+
+
+def sliced_layers(layers: Iterable[LayerModel]) -> LayerProvider:
+    """
+    Provide ``layers`` (e.g. of a whole year) restricted to the rows visible on each page.
+
+    Object and twilight layers get sliced to the visible days (plus the following one, whose morning belongs to the
+    last night), every other layer is passed as is.
+    """
+    layers = tuple(layers)
+
+    def provider(canvas: CanvasModel) -> Iterator[LayerModel]:
+        days = canvas.visible_days
+        if not days.size:
+            return
+        start, stop = days[0], days[-1] + 2 * _ONE_DAY
+        for layer in layers:
+            if isinstance(layer, ObjectLayerModel):
+                yield layer.between(start, stop)
+            elif isinstance(layer, TwilightLayerModel):
+                yield layer.model_copy(update={"grid": layer.grid.between(start, stop)})
+            else:
+                yield layer
+
+    return provider
+
+
+def draw_page(canvas: CanvasModel, layers: Iterable[LayerModel]) -> Figure:
+    """Draw ``layers`` onto a single figure, one axes per layer in ``LAYER_ORDER`` (vector output stays vector)."""
+    figure, axes = canvas.new_figure()
+    for index, layer in enumerate(sort_layers(layers)):
+        layer.draw(figure, axes if index == 0 else canvas.add_axes(figure), canvas)
+    return figure
+
+
+def render_page(canvas: CanvasModel, layers: Iterable[LayerModel]) -> ImageArray:
+    """Rasterize a single page to an RGBA image of shape ``(height, width, 4)``."""
+    figure = draw_page(canvas, layers)
+    figure.canvas.draw()
+    return np.asarray(figure.canvas.buffer_rgba()).copy()
+
+
+def write_pdf(path: Path | str, pages: Iterable[CanvasModel], layers_for: LayerProvider) -> int:
+    """
+    Write every page of ``pages`` (e.g. ``month_pages``) to the multi-page PDF ``path``; returns the number of pages.
+
+    Pages get drawn, written and released one after another, so the memory peak is set by a single page.
+    """
+    count = 0
+    with PdfPages(path) as pdf:
+        for canvas in pages:
+            figure = draw_page(canvas, layers_for(canvas))
+            pdf.savefig(figure)
+            figure.clear()
+            count += 1
+    return count
+
+
+def write_tiles(
+    directory: Path | str,
+    canvas: CanvasModel,
+    layers_for: LayerProvider,
+    *,
+    rows: int,
+    columns: int,
+    stem: str = "tile",
+) -> list[Path]:
+    """
+    Render ``canvas`` as ``rows`` x ``columns`` PNG-tiles ``<stem>_r<row>_c<column>.png`` into ``directory``.
+
+    Tiles get rendered, written and released one after another, so a poster can be far larger than the memory.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    paths: list[Path] = []
+    for row, column, tile in tile_pages(canvas, rows, columns):
+        figure = draw_page(tile, layers_for(tile))
+        path = directory / f"{stem}_r{row}_c{column}.png"
+        figure.savefig(path, dpi=tile.dpi)
+        figure.clear()
+        paths.append(path)
+    return paths
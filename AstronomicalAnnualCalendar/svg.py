@@ -0,0 +1,236 @@
+# standard library
+import calendar
+from collections.abc import Callable, Iterable
+from io import StringIO
+from pathlib import Path
+from typing import Any, TextIO
+from xml.sax.saxutils import escape, quoteattr
+
+# third party
+import numpy as np
+import numpy.typing as npt
+
+# local
+from .errors import LayerNotSupportedError
+from .layout import CanvasModel, LayoutModel
+from .render import (
+    EVENT_LINESTYLES,
+    AnnotationLayerModel,
+    BackgroundLayerModel,
+    LayerModel,
+    ObjectLayerModel,
+    TwilightLayerModel,
+    VisibilityLayerModel,
+    sort_layers,
+)
+
+
+__all__ = (
+    "SVG_WRITERS",
+    "register_svg_writer",
+    "path_data",
+    "write_svg",
+    "render_svg",
+)
+
+
+type FloatArray = npt.NDArray[np.float64]
+type SvgWriter = Callable[[Any, LayoutModel, TextIO], None]
+
+# matplotlib's default dash patterns (``lines.dashed_pattern`` and ``lines.dotted_pattern``) in line widths
+_DASH_PATTERNS: dict[str, tuple[float, ...]] = {"-": (), "--": (3.7, 1.6), ":": (1, 1.65)}
+_CAP_STYLES: dict[str, str] = {"-": "square", "--": "butt", ":": "butt"}  # "projecting" solid lines, "butt" dashes
+_FONT_FAMILY: str = "DejaVu Sans, Bitstream Vera Sans, sans-serif"  # matplotlib's default font first
+_CLIP_ID: str = "plot-area"
+
+SVG_WRITERS: dict[type[LayerModel], SvgWriter] = {}
+"""Function writing the SVG elements of a kind of layer; see ``register_svg_writer``."""
+
+
+def register_svg_writer(kind: type[LayerModel]) -> Callable[[SvgWriter], SvgWriter]:
+    """Register the decorated function as SVG writer of ``kind`` (and its subclasses without writer of their own)."""
+
+    def decorator(function: SvgWriter) -> SvgWriter:
+        SVG_WRITERS[kind] = function
+        return function
+
+    return decorator
+
+
+def _points_to_pixels(layout: LayoutModel, points: float) -> float:
+    return points * layout.canvas.dpi / 72
+
+
+def _number(value: float) -> str:
+    return f"{value:.2f}".rstrip("0").rstrip(".")
+
+
+def _rgb(color: tuple[float, ...]) -> str:
+    return "#" + "".join(f"{round(channel * 255):02x}" for channel in color[:3])
+
+
+def path_data(x: npt.ArrayLike, y: npt.ArrayLike) -> str:
+    """
+    Build the ``d``-attribute of a ``<path>`` through the points ``(x, y)`` (pixels).
+
+    ``nan`` separates the parts (see ``layout.LayoutModel.curve``): each part starts with a move, single points
+    draw nothing, just like with matplotlib.
+    """
+    x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+    valid = ~(np.isnan(x) | np.isnan(y))
+    starts = valid & ~np.concatenate([[False], valid[:-1]])
+    commands = np.where(starts, "M", "L")[valid]
+    return "".join(
+        f"{command}{_number(px)} {_number(py)}"
+        for command, px, py in zip(commands.tolist(), x[valid].tolist(), y[valid].tolist(), strict=True)
+    )
+
+
+def _rectangles(left: FloatArray, top: FloatArray, right: FloatArray, bottom: FloatArray) -> str:
+    """``d``-attribute of closed rectangles (pixels)."""
+    return "".join(
+        f"M{_number(x0)} {_number(y0)}H{_number(x1)}V{_number(y1)}H{_number(x0)}Z"
+        for x0, y0, x1, y1 in zip(left.tolist(), top.tolist(), right.tolist(), bottom.tolist(), strict=True)
+    )
+
+
+@register_svg_writer(BackgroundLayerModel)
+def _write_background(layer: BackgroundLayerModel, layout: LayoutModel, stream: TextIO) -> None:
+    width, height = layout.canvas.size
+    rows = len(layout.days)
+    stream.write(f'<rect width="{width}" height="{height}" fill={quoteattr(layer.color)}/>\n')
+    hours = np.repeat(np.arange(1, 24, dtype=np.float64), 3)
+    hours[2::3] = np.nan
+    x, y = layout.to_page(hours, np.tile([0, rows, np.nan], 23))
+    months = np.repeat(layout.month_starts.astype(np.float64), 3)
+    months[2::3] = np.nan
+    month_x, month_y = layout.to_page(np.tile([0, 24, np.nan], len(layout.month_starts)), months)
+    for (line_x, line_y), points in (((x, y), 0.5), ((month_x, month_y), 0.8)):
+        stream.write(
+            f'<path d="{path_data(line_x, line_y)}" fill="none" stroke={quoteattr(layer.grid_color)}'
+            f' stroke-width="{_number(_points_to_pixels(layout, points))}"/>\n'
+        )
+
+
+@register_svg_writer(TwilightLayerModel)
+def _write_twilight(layer: TwilightLayerModel, layout: LayoutModel, stream: TextIO) -> None:
+    nights, offset = layer.night_bands(layout.canvas)
+    count, steps = nights.shape
+    # one rectangle per run of the same band within a night, one path per band
+    change = np.ones(nights.shape, dtype=bool)
+    change[:, 1:] = nights[:, 1:] != nights[:, :-1]
+    rows, starts = np.nonzero(change)
+    ends = np.append(rows[1:] * steps + starts[1:], count * steps) - rows * steps
+    bands = nights[rows, starts]
+    stream.write(f'<g clip-path="url(#{_CLIP_ID})" shape-rendering="crispEdges">\n')
+    for band, color in enumerate(layer.colors):
+        selected = bands == band
+        if not color[3] or not selected.any():
+            continue
+        left, top = layout.to_page(starts[selected] * (24 / steps), rows[selected] + offset)
+        right, bottom = layout.to_page(ends[selected] * (24 / steps), rows[selected] + offset + 1)
+        stream.write(
+            f'<path d="{_rectangles(left, top, right, bottom)}" fill="{_rgb(color)}"'
+            f' fill-opacity="{_number(color[3])}"/>\n'
+        )
+    stream.write("</g>\n")
+
+
+@register_svg_writer(VisibilityLayerModel)
+def _write_visibility(layer: VisibilityLayerModel, layout: LayoutModel, stream: TextIO) -> None:
+    row, left, right = layer.bars(layout.canvas)
+    if not row.size:
+        return
+    left, top = layout.to_page(left, row + (1 - layer.height) / 2)
+    right, bottom = layout.to_page(right, row + (1 + layer.height) / 2)
+    stream.write(
+        f'<path clip-path="url(#{_CLIP_ID})" d="{_rectangles(left, top, right, bottom)}"'
+        f' fill="{layer.bound_object.line_color.as_hex()}" fill-opacity="{_number(layer.alpha)}"/>\n'
+    )
+
+
+@register_svg_writer(ObjectLayerModel)
+def _write_object(layer: ObjectLayerModel, layout: LayoutModel, stream: TextIO) -> None:
+    width = _points_to_pixels(layout, layer.bound_object.line_strength)
+    stream.write(
+        f'<g clip-path="url(#{_CLIP_ID})" fill="none" stroke="{layer.bound_object.line_color.as_hex()}"'
+        f' stroke-width="{_number(width)}" stroke-linejoin="round">\n'
+    )
+    for field, linestyle in EVENT_LINESTYLES.items():
+        d = path_data(*layout.to_page(*layout.curve(layer.day, getattr(layer, field), layer.timezone)))
+        if not d:
+            continue
+        dashes = " ".join(_number(length * width) for length in _DASH_PATTERNS[linestyle])
+        stream.write(
+            f'<path d="{d}" stroke-linecap="{_CAP_STYLES[linestyle]}"'
+            + (f' stroke-dasharray="{dashes}"' if dashes else "")
+            + "/>\n"
+        )
+    stream.write("</g>\n")
+
+
+@register_svg_writer(AnnotationLayerModel)
+def _write_annotation(layer: AnnotationLayerModel, layout: LayoutModel, stream: TextIO) -> None:
+    canvas = layout.canvas
+    size = _points_to_pixels(layout, layer.font_size)
+    margin = size / 3
+    (left, right), (top, bottom) = layout.to_page([0, 24], [0, len(layout.days)])
+    stream.write(f'<g fill={quoteattr(layer.color)} font-family="{_FONT_FAMILY}" font-size="{_number(size)}">\n')
+
+    def text(content: str, x: float, y: float, anchor: str, baseline: str, extra: str = "") -> None:
+        stream.write(
+            f'<text x="{_number(x)}" y="{_number(y)}" text-anchor="{anchor}" dominant-baseline="{baseline}"{extra}>'
+            f"{escape(content)}</text>\n"
+        )
+
+    for x in range(0, 25, 2):
+        hour = f"{int(canvas.start_hour + x) % 24}h"
+        page_x = left + (right - left) * x / 24
+        text(hour, page_x, top - margin, "middle", "text-after-edge")
+        text(hour, page_x, bottom + margin, "middle", "text-before-edge")
+    months = layout.days.astype("datetime64[M]")
+    for month in np.unique(months):
+        rows = np.flatnonzero(months == month)
+        _, y = layout.to_page(0, rows.mean() + 0.5)
+        text(calendar.month_abbr[int(month.astype(np.int64) % 12) + 1], left - margin, float(y), "end", "central")
+    if layer.title:
+        title_size = f' font-size="{_number(size * 1.6)}"'
+        text(layer.title, (left + right) / 2, top - 3 * size, "middle", "text-after-edge", title_size)
+    stream.write("</g>\n")
+
+
+def _write(stream: TextIO, canvas: CanvasModel, layers: Iterable[LayerModel]) -> None:
+    layout = canvas.layout
+    width, height = canvas.size
+    (left, right), (top, bottom) = layout.to_page([0, 24], [0, len(layout.days)])
+    stream.write(
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}"'
+        f' viewBox="0 0 {width} {height}">\n'
+        f'<defs><clipPath id="{_CLIP_ID}"><rect x="{_number(left)}" y="{_number(top)}"'
+        f' width="{_number(right - left)}" height="{_number(bottom - top)}"/></clipPath></defs>\n'
+    )
+    for layer in sort_layers(layers):
+        writer = next((SVG_WRITERS[kind] for kind in type(layer).__mro__ if kind in SVG_WRITERS), None)
+        if writer is None:
+            raise LayerNotSupportedError(type(layer).__qualname__)
+        writer(layer, layout, stream)
+    stream.write("</svg>\n")
+
+
+def write_svg(path: Path | str, canvas: CanvasModel, layers: Iterable[LayerModel]) -> None:
+    """
+    Write the calendar of ``layers`` on ``canvas`` as SVG to ``path``.
+
+    Every layer gets written as soon as it's laid out, without figure or raster: each curve of an object is a
+    single ``<path>`` (rise, culmination and set differ in their dashes) styled from its ``line_color`` and
+    ``line_strength``, just like the matplotlib renderer draws them.
+    """
+    with Path(path).open("w", encoding="utf-8") as stream:
+        _write(stream, canvas, layers)
+
+
+def render_svg(canvas: CanvasModel, layers: Iterable[LayerModel]) -> str:
+    """Render the calendar of ``layers`` on ``canvas`` as SVG document; see ``write_svg``."""
+    stream = StringIO()
+    _write(stream, canvas, layers)
+    return stream.getvalue()
@@ -0,0 +1,103 @@
+# standard library
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+# third party
+import numpy as np
+import numpy.typing as npt
+
+
+__all__ = (
+    "TIMEZONES",
+    "transition_table",
+    "local_to_utc",
+    "utc_to_local",
+)
+
+
+TIMEZONES: dict[str, str] = {
+    "UTC": "UTC",
+    "MEZ": "Etc/GMT-1",  # fixed UTC+1 all year round (the sign of the Etc-zones is inverted)
+    "MESZ": "Europe/Berlin",  # German legal time, switching between MEZ and MESZ
+}
+"""IANA-key of every timezone label which may appear in the header (``HeaderEnum.TIMEZONE``)."""
+
+type DatetimeArray = npt.NDArray[np.datetime64]
+
+_PROBE_STEP: timedelta = timedelta(hours=1)
+
+
+def _zone(timezone: str) -> ZoneInfo:
+    return ZoneInfo(TIMEZONES.get(timezone, timezone))
+
+
+def _utc_offset(zone: ZoneInfo, moment: datetime) -> timedelta:
+    return moment.astimezone(zone).utcoffset()
+
+
+@lru_cache
+def transition_table(timezone: str, year: int) -> tuple[DatetimeArray, npt.NDArray[np.timedelta64]]:
+    """
+    UTC-moments at which the UTC-offset of ``timezone`` changes during ``year`` and the offsets from then on.
+
+    The first entry starts with the year (with the offset in effect back then), so every moment of the year is
+    covered. ``timezone`` is either a header label (see ``TIMEZONES``) or an IANA-key. Tables are cached per year.
+    """
+    zone = _zone(timezone)
+    moment, end = datetime(year, 1, 1, tzinfo=UTC), datetime(year + 1, 1, 1, tzinfo=UTC)
+    starts, offsets = [moment], [_utc_offset(zone, moment)]
+    while (moment := moment + _PROBE_STEP) < end:
+        if (offset := _utc_offset(zone, moment)) == offsets[-1]:
+            continue
+        # the offset changed within the last probe step: narrow it down to the minute
+        low = moment - _PROBE_STEP
+        while moment - low > timedelta(minutes=1):
+            middle = low + (moment - low) / 2
+            if _utc_offset(zone, middle) == offset:
+                moment = middle
+            else:
+                low = middle
+        moment = moment.replace(second=0, microsecond=0)
+        starts.append(moment)
+        offsets.append(offset)
+    table = (
+        np.array([start.replace(tzinfo=None) for start in starts], dtype="datetime64[s]"),
+        np.array(offsets, dtype="timedelta64[s]"),
+    )
+    for array in table:
+        array.setflags(write=False)  # shared via the cache
+    return table
+
+
+def _combined_table(timezone: str, date_and_time: DatetimeArray) -> tuple[DatetimeArray, npt.NDArray[np.timedelta64]]:
+    years = np.unique(date_and_time.astype("datetime64[Y]").astype(np.int64)) + 1970
+    tables = [transition_table(timezone, int(year)) for year in years]
+    return np.concatenate([starts for starts, _ in tables]), np.concatenate([offsets for _, offsets in tables])
+
+
+def local_to_utc(date_and_time: npt.ArrayLike, timezone: str) -> DatetimeArray:
+    """
+    Convert local (naive) ``datetime64``-values of ``timezone`` to UTC in bulk.
+
+    Just like ``zoneinfo`` with ``fold=0`` ambiguous times (when the clocks are set back) resolve to their first
+    occurrence and non-existent times (when the clocks are set forward) are shifted by the offset before the switch.
+    """
+    local = np.asarray(date_and_time, dtype="datetime64[ns]")
+    if local.size == 0:
+        return local
+    starts, offsets = _combined_table(timezone, local)
+    # a switch takes effect locally once the wall clock passes it in the later of both offsets
+    boundaries = starts + np.maximum(offsets, np.concatenate([offsets[:1], offsets[:-1]]))
+    index = np.searchsorted(boundaries, local, side="right") - 1
+    return local - offsets[np.clip(index, 0, None)]
+
+
+def utc_to_local(date_and_time: npt.ArrayLike, timezone: str) -> DatetimeArray:
+    """Convert UTC ``datetime64``-values to the local (naive) time of ``timezone`` in bulk; e.g. for display."""
+    utc = np.asarray(date_and_time, dtype="datetime64[ns]")
+    if utc.size == 0:
+        return utc
+    starts, offsets = _combined_table(timezone, utc)
+    index = np.searchsorted(starts, utc, side="right") - 1
+    return utc + offsets[np.clip(index, 0, None)]
@@ -0,0 +1,237 @@
+# standard library
+from collections.abc import Iterable, Iterator, Mapping
+from datetime import timedelta
+from typing import Self
+
+# third party
+import numpy as np
+import numpy.typing as npt
+from pydantic import BaseModel
+from pydantic.config import ConfigDict
+
+# local
+from .columns import available_fields
+from .models import BoundToObservableObjectBaseModel, CoordinateModel, DataModel, ObservableObjectModel
+from .riseset import PositionSeries
+from .timezones import local_to_utc
+from .transforms import (
+    datetime64_to_julian_day,
+    datetime64_to_unix_days,
+    equatorial_to_horizontal,
+    greenwich_mean_sidereal_time,
+    normalized_equatorial,
+)
+
+
+__all__ = (
+    "ALTITUDE_QUANTUM",
+    "AZIMUTH_QUANTUM",
+    "TrackModel",
+    "compute_tracks",
+    "iter_tracks",
+    "whats_up",
+)
+
+
+type FloatArray = npt.NDArray[np.float64]
+type Float32Array = npt.NDArray[np.float32]
+
+ALTITUDE_QUANTUM: float = 90 / 32767
+"""Degrees per step of a quantized (``int16``) altitude; ``-32768`` marks missing samples."""
+AZIMUTH_QUANTUM: float = 360 / 65536
+"""Degrees per step of a quantized (``uint16``) azimuth."""
+
+_MISSING: int = -32768
+_FIRST_HOUR: int = 12  # a night runs from noon to noon
+
+
+class TrackModel(BoundToObservableObjectBaseModel, BaseModel):
+    """
+    Altitude and azimuth (degrees, no refraction) of an observable object every ``resolution`` step of every night.
+
+    ``altitude`` and ``azimuth`` have the shape ``(nights, steps)``; row ``i`` belongs to the night after the evening
+    ``night[i]`` and column ``j`` to ``hours[j]``, the hours since the local midnight *before* the evening (``12`` to
+    ``36``, just like ``visibility.VisibilityModel``). The hours are on the clock of ``timezone`` (see
+    ``timezones.TIMEZONES``), so with ``MESZ`` 22:00 is legal time all year; in the nights the clocks get changed,
+    an hour of samples is skipped or repeated. The arrays are either ``float32`` (``nan`` where the data doesn't
+    reach) or quantized to ``int16``/``uint16`` (see ``ALTITUDE_QUANTUM`` and ``AZIMUTH_QUANTUM``), which halves
+    their size; ``degrees`` decodes both.
+    """
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    night: np.ndarray  # datetime64[D] (local date of the evening)
+    resolution: timedelta
+    timezone: str
+    altitude: np.ndarray  # float32 or int16, (nights, steps)
+    azimuth: np.ndarray  # float32 or uint16, (nights, steps)
+
+    @property
+    def hours(self) -> FloatArray:
+        """Hours since the local midnight before the evening of the columns."""
+        return _FIRST_HOUR + np.arange(self.altitude.shape[1]) * (self.resolution.total_seconds() / 3600)
+
+    @property
+    def quantized(self) -> bool:
+        """Whether the track is stored as integers."""
+        return self.altitude.dtype == np.int16
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the arrays."""
+        return self.altitude.nbytes + self.azimuth.nbytes
+
+    def quantize(self) -> Self:
+        """Copy with the arrays quantized to ``int16`` (altitude) and ``uint16`` (azimuth)."""
+        if self.quantized:
+            return self
+        missing = np.isnan(self.altitude)
+        altitude = np.where(missing, _MISSING, np.round(np.nan_to_num(self.altitude) / ALTITUDE_QUANTUM))
+        azimuth = np.round(np.nan_to_num(self.azimuth) / AZIMUTH_QUANTUM) % 65536
+        return self.model_copy(update={"altitude": altitude.astype(np.int16), "azimuth": azimuth.astype(np.uint16)})
+
+    def degrees(self, columns: slice | int | None = None) -> tuple[Float32Array, Float32Array]:
+        """Decode altitude and azimuth (of the ``columns``) to ``float32``-degrees; missing samples are ``nan``."""
+        columns = slice(None) if columns is None else columns
+        altitude, azimuth = self.altitude[:, columns], self.azimuth[:, columns]
+        if not self.quantized:
+            return altitude, azimuth
+        missing = altitude == _MISSING
+        return (
+            np.where(missing, np.nan, altitude * np.float32(ALTITUDE_QUANTUM)).astype(np.float32),
+            np.where(missing, np.nan, azimuth * np.float32(AZIMUTH_QUANTUM)).astype(np.float32),
+        )
+
+    def at(self, hour: float) -> tuple[Float32Array, Float32Array]:
+        """
+        Altitude and azimuth of every night at the sample nearest to ``hour``.
+
+        ``hour`` counts from the midnight before the evening, so ``22`` is 22:00 and ``26`` is 02:00 the next morning;
+        hours before noon are taken as the next morning.
+        """
+        hour = hour + 24 if hour < _FIRST_HOUR else hour
+        column = round((hour - _FIRST_HOUR) * 3600 / self.resolution.total_seconds())
+        if not 0 <= column < self.altitude.shape[1]:
+            message = f"{hour} is outside of the night ({_FIRST_HOUR} to {_FIRST_HOUR + 24})"
+            raise ValueError(message)
+        return self.degrees(column)
+
+
+def _position_series(data: Iterable[DataModel]) -> dict[ObservableObjectModel, PositionSeries]:
+    """Apparent positions (true equinox of date) of every object with ``right_ascension``- and ``declination``."""
+    return {
+        item.bound_object: PositionSeries(item.date_and_time, *normalized_equatorial(item))
+        for item in data
+        if available_fields(item.rows, "right_ascension", "declination") == {"right_ascension", "declination"}
+    }
+
+
+def _tracks(
+    series: Mapping[ObservableObjectModel, PositionSeries],
+    coordinate: CoordinateModel,
+    nights: np.ndarray,
+    resolution: timedelta,
+    timezone: str,
+    *,
+    quantize: bool,
+) -> dict[ObservableObjectModel, TrackModel]:
+    """Evaluate every series on the samples of ``nights``; the sidereal time is shared by all of them."""
+    steps = round(timedelta(days=1) / resolution)
+    local = nights.astype("datetime64[ns]")[:, None] + np.timedelta64(_FIRST_HOUR, "h")
+    utc = local_to_utc((local + np.arange(steps) * np.timedelta64(resolution)).ravel(), timezone)
+    times = datetime64_to_unix_days(utc)
+    sidereal = greenwich_mean_sidereal_time(datetime64_to_julian_day(utc)) + coordinate.longitude
+
+    tracks: dict[ObservableObjectModel, TrackModel] = {}
+    for observable_object, positions in series.items():
+        right_ascension, declination = positions.at(times)
+        altitude, azimuth = equatorial_to_horizontal(sidereal - right_ascension, declination, coordinate.latitude)
+        outside = (times < positions.days[0]) | (times > positions.days[-1])  # no extrapolation
+        altitude[outside] = azimuth[outside] = np.nan
+        track = TrackModel(
+            bound_object=observable_object,
+            night=nights,
+            resolution=resolution,
+            timezone=timezone,
+            altitude=altitude.astype(np.float32).reshape(len(nights), steps),
+            azimuth=azimuth.astype(np.float32).reshape(len(nights), steps),
+        )
+        tracks[observable_object] = track.quantize() if quantize else track
+    return tracks
+
+
+def compute_tracks(
+    data: Iterable[DataModel],
+    nights: npt.ArrayLike,
+    *,
+    resolution: timedelta = timedelta(minutes=1),
+    timezone: str | None = None,
+    quantize: bool = False,
+) -> dict[ObservableObjectModel, TrackModel]:
+    """
+    Compute the tracks of every object in parsed ``data`` (e.g. ``Parser.parse().values()``) for ``nights``.
+
+    ``nights`` are the local dates of the evenings on the clock of ``timezone``, the export's one
+    (``DataModel.timezone``) by default. Uses the ``right_ascension``- and ``declination``-columns (objects without
+    them are skipped) and the location of the export. The positions get interpolated linearly, so the moon needs a
+    dense series (an hour or less) whereas a 10-day series suffices for the planets; see ``iter_tracks`` for a whole
+    year.
+    """
+    data = list(data)
+    if not data:
+        return {}
+    nights = np.asarray(nights, dtype="datetime64[D]")
+    return _tracks(
+        _position_series(data),
+        data[0].metadata.coordinate,
+        nights,
+        resolution,
+        timezone or data[0].timezone,
+        quantize=quantize,
+    )
+
+
+def iter_tracks(
+    data: Iterable[DataModel],
+    year: int,
+    *,
+    chunk: int = 31,
+    resolution: timedelta = timedelta(minutes=1),
+    timezone: str | None = None,
+    quantize: bool = False,
+) -> Iterator[dict[ObservableObjectModel, TrackModel]]:
+    """
+    Compute the tracks of every night of ``year`` ``chunk`` nights at a time; see ``compute_tracks``.
+
+    The columns get decoded once, only the tracks of a single chunk are held at a time: a year in minutes takes
+    ~4 MB per object (``float32``), a month ~0.4 MB.
+    """
+    data = list(data)
+    if not data:
+        return
+    series, coordinate, timezone = _position_series(data), data[0].metadata.coordinate, timezone or data[0].timezone
+    nights = np.arange(np.datetime64(f"{year}-01-01", "D"), np.datetime64(f"{year + 1}-01-01", "D"))
+    for first in range(0, len(nights), chunk):
+        yield _tracks(series, coordinate, nights[first : first + chunk], resolution, timezone, quantize=quantize)
+
+
+def whats_up(
+    tracks: Mapping[ObservableObjectModel, TrackModel],
+    hour: float,
+    *,
+    minimum_altitude: float = 0,
+) -> dict[ObservableObjectModel, tuple[Float32Array, Float32Array]]:
+    """
+    Altitude and azimuth of every object at ``hour`` (see ``TrackModel.at``) of every night, e.g. at 22:00.
+
+    ``hour`` is on the clock of the tracks' ``timezone``, so for ``MESZ``-exports 22:00 is legal time in summer too.
+
+    Nights the object is lower than ``minimum_altitude`` are ``nan``; objects which never are high enough are left out.
+    """
+    table: dict[ObservableObjectModel, tuple[Float32Array, Float32Array]] = {}
+    for observable_object, track in tracks.items():
+        altitude, azimuth = track.at(hour)
+        up = altitude >= minimum_altitude
+        if up.any():
+            table[observable_object] = np.where(up, altitude, np.nan), np.where(up, azimuth, np.nan)
+    return table
@@ -0,0 +1,287 @@
+# standard library
+from datetime import timedelta
+
+# third party
+import numpy as np
+import numpy.typing as npt
+
+# local
+from .columns import decode_rows
+from .errors import ColumnNotFoundError
+from .models import DataModel
+
+
+__all__ = (
+    "J2000",
+    "datetime64_to_unix_days",
+    "unix_days_to_julian_day",
+    "datetime64_to_julian_day",
+    "julian_epoch_to_julian_day",
+    "julian_centuries",
+    "mean_obliquity",
+    "general_precession_in_longitude",
+    "ecliptic_to_equatorial",
+    "equatorial_to_ecliptic",
+    "precess_equatorial",
+    "nutation",
+    "nutate_equatorial",
+    "change_equinox",
+    "greenwich_mean_sidereal_time",
+    "equatorial_to_horizontal",
+    "equatorial_to_local_horizontal",
+    "normalized_equatorial",
+    "horizontal_coordinates",
+)
+
+
+J2000: float = 2451545.0
+"""Julian day of the J2000.0 epoch (2000-01-01 12:00 TT)."""
+
+_UNIX_EPOCH_JULIAN_DAY: float = 2440587.5
+_SECONDS_PER_DAY: float = 86400.0
+_DAYS_PER_CENTURY: float = 36525.0
+_DAYS_PER_JULIAN_YEAR: float = 365.25
+
+type FloatArray = npt.NDArray[np.float64]
+
+
+def datetime64_to_unix_days(date_and_time: npt.ArrayLike) -> FloatArray:
+    """Convert UTC ``datetime64``-values to (fractional) days since the unix epoch."""
+    return np.asarray(date_and_time, dtype="datetime64[ns]").astype(np.int64) / (_SECONDS_PER_DAY * 1e9)
+
+
+def unix_days_to_julian_day(days: npt.ArrayLike) -> FloatArray:
+    """Convert days since the unix epoch (see ``datetime64_to_unix_days``) to julian days."""
+    return _UNIX_EPOCH_JULIAN_DAY + np.asarray(days, dtype=np.float64)
+
+
+def datetime64_to_julian_day(date_and_time: npt.ArrayLike, delta_t: timedelta = timedelta(0)) -> FloatArray:
+    """
+    Convert UTC ``datetime64``-values to julian days.
+
+    If ``delta_t`` is given the result is in terrestrial time (TT = UT + DeltaT).
+    """
+    return unix_days_to_julian_day(datetime64_to_unix_days(date_and_time) + delta_t.total_seconds() / _SECONDS_PER_DAY)
+
+
+def julian_epoch_to_julian_day(epoch: float) -> float:
+    """Convert a julian epoch like the ``2000.0`` of ``MetaDataModel.equinox`` to a julian day."""
+    return J2000 + (epoch - 2000.0) * _DAYS_PER_JULIAN_YEAR
+
+
+def julian_centuries(julian_day: npt.ArrayLike) -> FloatArray:
+    """Julian centuries since J2000.0."""
+    return (np.asarray(julian_day, dtype=np.float64) - J2000) / _DAYS_PER_CENTURY
+
+
+def mean_obliquity(t: npt.ArrayLike) -> FloatArray:
+    """Mean obliquity of the ecliptic in degrees for ``t`` julian centuries since J2000.0 (Meeus 22.2)."""
+    t = np.asarray(t, dtype=np.float64)
+    return 23.43929111 + (-46.8150 * t - 0.00059 * t**2 + 0.001813 * t**3) / 3600
+
+
+def general_precession_in_longitude(t: npt.ArrayLike) -> FloatArray:
+    """Accumulated general precession in ecliptic longitude in degrees since J2000.0."""
+    t = np.asarray(t, dtype=np.float64)
+    return (5029.0966 * t + 1.11113 * t**2 - 0.000006 * t**3) / 3600
+
+
+def ecliptic_to_equatorial(
+    longitude: npt.ArrayLike,
+    latitude: npt.ArrayLike,
+    obliquity: npt.ArrayLike,
+) -> tuple[FloatArray, FloatArray]:
+    """Convert ecliptic longitude/latitude to right ascension (hours, 0-24) and declination (degrees)."""
+    lon, lat, eps = np.radians(longitude), np.radians(latitude), np.radians(obliquity)
+    ra = np.arctan2(np.sin(lon) * np.cos(eps) - np.tan(lat) * np.sin(eps), np.cos(lon))
+    dec = np.arcsin(np.sin(lat) * np.cos(eps) + np.cos(lat) * np.sin(eps) * np.sin(lon))
+    return np.degrees(ra) % 360 / 15, np.degrees(dec)
+
+
+def equatorial_to_ecliptic(
+    right_ascension: npt.ArrayLike,
+    declination: npt.ArrayLike,
+    obliquity: npt.ArrayLike,
+) -> tuple[FloatArray, FloatArray]:
+    """Convert right ascension (hours) and declination (degrees) to ecliptic longitude (0-360) and latitude."""
+    ra = np.radians(np.asarray(right_ascension, dtype=np.float64) * 15)
+    dec, eps = np.radians(declination), np.radians(obliquity)
+    lon = np.arctan2(np.sin(ra) * np.cos(eps) + np.tan(dec) * np.sin(eps), np.cos(ra))
+    lat = np.arcsin(np.sin(dec) * np.cos(eps) - np.cos(dec) * np.sin(eps) * np.sin(ra))
+    return np.degrees(lon) % 360, np.degrees(lat)
+
+
+def precess_equatorial(
+    right_ascension: npt.ArrayLike,
+    declination: npt.ArrayLike,
+    julian_day_from: npt.ArrayLike,
+    julian_day_to: npt.ArrayLike,
+) -> tuple[FloatArray, FloatArray]:
+    """
+    Precess right ascension (hours) and declination (degrees) from the mean equinox of one julian day to another.
+
+    Uses the rigorous method with the angles zeta, z and theta (Meeus 21.2 and 21.4); the julian days are in TT.
+    """
+    big_t = julian_centuries(julian_day_from)
+    t = julian_centuries(julian_day_to) - big_t
+    rate = 2306.2181 + 1.39656 * big_t - 0.000139 * big_t**2
+    zeta = np.radians((rate * t + (0.30188 - 0.000344 * big_t) * t**2 + 0.017998 * t**3) / 3600)
+    z = np.radians((rate * t + (1.09468 + 0.000066 * big_t) * t**2 + 0.018203 * t**3) / 3600)
+    theta = np.radians(
+        (
+            (2004.3109 - 0.85330 * big_t - 0.000217 * big_t**2) * t
+            - (0.42665 + 0.000217 * big_t) * t**2
+            - 0.041833 * t**3
+        )
+        / 3600
+    )
+    ra = np.radians(np.asarray(right_ascension, dtype=np.float64) * 15) + zeta
+    dec = np.radians(declination)
+    a = np.cos(dec) * np.sin(ra)
+    b = np.cos(theta) * np.cos(dec) * np.cos(ra) - np.sin(theta) * np.sin(dec)
+    c = np.sin(theta) * np.cos(dec) * np.cos(ra) + np.cos(theta) * np.sin(dec)
+    return np.degrees(np.arctan2(a, b) + z) % 360 / 15, np.degrees(np.arcsin(np.clip(c, -1, 1)))
+
+
+def nutation(t: npt.ArrayLike) -> tuple[FloatArray, FloatArray]:
+    """
+    Nutation in longitude and in obliquity in degrees for ``t`` julian centuries since J2000.0.
+
+    Uses the four largest terms (Meeus chapter 22), which are accurate to 0.5" and 0.1" respectively.
+    """
+    t = np.asarray(t, dtype=np.float64)
+    node = np.radians(125.04452 - 1934.136261 * t + 0.0020708 * t**2 + t**3 / 450000)
+    sun = np.radians(280.4665 + 36000.7698 * t)
+    moon = np.radians(218.3165 + 481267.8813 * t)
+    longitude = -17.20 * np.sin(node) - 1.32 * np.sin(2 * sun) - 0.23 * np.sin(2 * moon) + 0.21 * np.sin(2 * node)
+    obliquity = 9.20 * np.cos(node) + 0.57 * np.cos(2 * sun) + 0.10 * np.cos(2 * moon) - 0.09 * np.cos(2 * node)
+    return longitude / 3600, obliquity / 3600
+
+
+def nutate_equatorial(
+    right_ascension: npt.ArrayLike,
+    declination: npt.ArrayLike,
+    t: npt.ArrayLike,
+    *,
+    inverse: bool = False,
+) -> tuple[FloatArray, FloatArray]:
+    """
+    Move right ascension (hours) and declination (degrees) from the mean to the true equinox of date (``t``).
+
+    The coordinates are rotated via the ecliptic, so it's exact for any declination; ``inverse`` goes back.
+    """
+    nutation_in_longitude, nutation_in_obliquity = nutation(t)
+    mean, true = mean_obliquity(t), mean_obliquity(t) + nutation_in_obliquity
+    if inverse:
+        longitude, latitude = equatorial_to_ecliptic(right_ascension, declination, true)
+        return ecliptic_to_equatorial(longitude - nutation_in_longitude, latitude, mean)
+    longitude, latitude = equatorial_to_ecliptic(right_ascension, declination, mean)
+    return ecliptic_to_equatorial(longitude + nutation_in_longitude, latitude, true)
+
+
+def change_equinox(
+    right_ascension: npt.ArrayLike,
+    declination: npt.ArrayLike,
+    date_and_time: npt.ArrayLike,
+    *,
+    from_equinox: float | None,
+    to_equinox: float | None = None,
+    delta_t: timedelta = timedelta(0),
+) -> tuple[FloatArray, FloatArray]:
+    """
+    Refer right ascension (hours) and declination (degrees) at ``date_and_time`` (UTC) to another equinox.
+
+    An equinox is either a julian epoch like ``MetaDataModel.equinox`` (a mean equinox) or ``None`` for the true
+    equinox of date, i.e. including the nutation.
+    """
+    ra, dec = np.asarray(right_ascension, dtype=np.float64), np.asarray(declination, dtype=np.float64)
+    if from_equinox == to_equinox:
+        return ra, dec
+    julian_day = datetime64_to_julian_day(date_and_time, delta_t)
+    t = julian_centuries(julian_day)
+    if from_equinox is None:
+        ra, dec = nutate_equatorial(ra, dec, t, inverse=True)
+    julian_day_from = julian_day if from_equinox is None else julian_epoch_to_julian_day(from_equinox)
+    julian_day_to = julian_day if to_equinox is None else julian_epoch_to_julian_day(to_equinox)
+    ra, dec = precess_equatorial(ra, dec, julian_day_from, julian_day_to)
+    if to_equinox is None:
+        ra, dec = nutate_equatorial(ra, dec, t)
+    return ra, dec
+
+
+def greenwich_mean_sidereal_time(julian_day_ut: npt.ArrayLike) -> FloatArray:
+    """Greenwich mean sidereal time in degrees (0-360) for julian days in UT (Meeus 12.4)."""
+    days = np.asarray(julian_day_ut, dtype=np.float64) - J2000
+    t = days / _DAYS_PER_CENTURY
+    return (280.46061837 + 360.98564736629 * days + 0.000387933 * t**2 - t**3 / 38710000) % 360
+
+
+def equatorial_to_horizontal(
+    hour_angle: npt.ArrayLike,
+    declination: npt.ArrayLike,
+    latitude: npt.ArrayLike,
+) -> tuple[FloatArray, FloatArray]:
+    """
+    Convert hour angle and declination (degrees) to altitude and azimuth (degrees).
+
+    The azimuth is measured from north over east (0-360) just like the "Az Auf"/"Unt." columns.
+    """
+    h, dec, lat = np.radians(hour_angle), np.radians(declination), np.radians(latitude)
+    altitude = np.arcsin(np.sin(lat) * np.sin(dec) + np.cos(lat) * np.cos(dec) * np.cos(h))
+    azimuth = np.arctan2(-np.cos(dec) * np.sin(h), np.sin(dec) * np.cos(lat) - np.cos(dec) * np.cos(h) * np.sin(lat))
+    return np.degrees(altitude), np.degrees(azimuth) % 360
+
+
+def equatorial_to_local_horizontal(
+    right_ascension: npt.ArrayLike,
+    declination: npt.ArrayLike,
+    date_and_time: npt.ArrayLike,
+    latitude: float,
+    longitude: float,
+) -> tuple[FloatArray, FloatArray]:
+    """
+    Convert right ascension (hours) and declination (degrees) of date to altitude and azimuth (degrees).
+
+    ``date_and_time`` is in UTC and the location's ``longitude`` is positive towards the east; no refraction.
+    """
+    hour_angle = (
+        greenwich_mean_sidereal_time(datetime64_to_julian_day(date_and_time))
+        + longitude
+        - np.asarray(right_ascension, dtype=np.float64) * 15
+    )
+    return equatorial_to_horizontal(hour_angle, declination, latitude)
+
+
+def _equatorial_columns(data: DataModel) -> tuple[FloatArray, FloatArray]:
+    columns = decode_rows(data.rows, "right_ascension", "declination")
+    for field in ("right_ascension", "declination"):
+        if field not in columns:
+            raise ColumnNotFoundError(data.bound_object.name, field)
+    return columns["right_ascension"], columns["declination"]
+
+
+def normalized_equatorial(data: DataModel, equinox: float | None = None) -> tuple[FloatArray, FloatArray]:
+    """
+    Right ascension (hours) and declination (degrees) of ``data`` referred to ``equinox`` (see ``change_equinox``).
+
+    The equinox of the export is taken from ``MetaDataModel.equinox`` (``None`` meaning the equinox of date), so
+    exports with different equinox settings can be compared.
+    """
+    right_ascension, declination = _equatorial_columns(data)
+    return change_equinox(
+        right_ascension,
+        declination,
+        data.date_and_time,
+        from_equinox=data.metadata.equinox,
+        to_equinox=equinox,
+        delta_t=data.metadata.delta_t,
+    )
+
+
+def horizontal_coordinates(data: DataModel) -> tuple[FloatArray, FloatArray]:
+    """Geocentric altitude and azimuth (degrees) of ``data`` at every row for the export's location."""
+    right_ascension, declination = normalized_equatorial(data)
+    coordinate = data.metadata.coordinate
+    return equatorial_to_local_horizontal(
+        right_ascension, declination, data.date_and_time, coordinate.latitude, coordinate.longitude
+    )
@@ -0,0 +1,160 @@
+# standard library
+from datetime import timedelta
+from typing import Self
+
+# third party
+import numpy as np
+import numpy.typing as npt
+from pydantic import BaseModel
+from pydantic.config import ConfigDict
+
+# local
+from .enums import ObservableObjectEnum, TwilightBandEnum
+from .ephemeris import compute_ephemeris
+from .models import CoordinateModel, MetaDataModel
+from .riseset import PositionSeries
+from .transforms import equatorial_to_horizontal, greenwich_mean_sidereal_time, unix_days_to_julian_day
+
+
+__all__ = (
+    "SolarAltitudeGridModel",
+    "compute_solar_altitude_grid",
+)
+
+
+type FloatArray = npt.NDArray[np.float64]
+
+_SECONDS_PER_DAY: float = 86400.0
+# ascending lower limits of the bands ASTRONOMICAL..DAY; ``np.digitize`` against them counts how bright a sample is
+_BAND_LIMITS: FloatArray = np.array([band.lower_altitude for band in reversed(TwilightBandEnum)][1:])
+
+
+class SolarAltitudeGridModel(BaseModel):
+    """
+    Geometric altitude of the sun (degrees) for every ``resolution`` step of every local day of a year.
+
+    ``altitude`` has the shape ``(days, steps)``; row ``i`` belongs to ``day[i]`` and column ``j`` to the local time
+    ``j * resolution`` (local days are defined by the fixed ``utc_offset``, MEZ by default).
+    The grid is kept as ``float32`` (~2 MB for a year in minutes) and can be quantized to ``TwilightBandEnum``-codes
+    via ``bands``.
+    """
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    day: np.ndarray  # datetime64[D] (local date)
+    resolution: timedelta
+    utc_offset: timedelta
+    altitude: np.ndarray  # float32, (days, steps)
+
+    @property
+    def time_of_day(self) -> FloatArray:
+        """Local hours of the columns."""
+        return np.arange(self.altitude.shape[1]) * (self.resolution.total_seconds() / 3600)
+
+    @property
+    def date_and_time(self) -> np.ndarray:
+        """Local ``datetime64``-values of every sample; shape ``(days, steps)``."""
+        steps = np.arange(self.altitude.shape[1]) * np.timedelta64(self.resolution)
+        return self.day.astype("datetime64[s]")[:, None] + steps[None, :]
+
+    def bands(self) -> npt.NDArray[np.uint8]:
+        """Quantize the grid to ``TwilightBandEnum``-codes (``0`` = day ... ``4`` = night)."""
+        brightness = np.digitize(self.altitude, _BAND_LIMITS.astype(np.float32))
+        return (TwilightBandEnum.NIGHT - brightness).astype(np.uint8)
+
+    def mask(self, *bands: TwilightBandEnum) -> npt.NDArray[np.bool_]:
+        """Boolean grid of the samples which fall into any of ``bands``."""
+        return np.isin(self.bands(), np.array(bands, dtype=np.uint8))
+
+    def hours(self, *bands: TwilightBandEnum) -> FloatArray:
+        """Hours per day which fall into any of ``bands``."""
+        return self.mask(*bands).sum(axis=1) * (self.resolution.total_seconds() / 3600)
+
+    def between(self, start: np.datetime64 | str, stop: np.datetime64 | str) -> Self:
+        """Sub-grid of the local days ``start <= day < stop``."""
+        selected = (self.day >= np.datetime64(start, "D")) & (self.day < np.datetime64(stop, "D"))
+        return self.model_copy(update={"day": self.day[selected], "altitude": self.altitude[selected]})
+
+    def crossings(self, altitude: float) -> tuple[FloatArray, FloatArray]:
+        """
+        Local hours of the morning (upward) and evening (downward) crossing of ``altitude`` per day.
+
+        The morning crossing is the last one in the 24 hours before local noon and the evening crossing the first one
+        in the 24 hours after it, so an evening crossing after midnight still belongs to its day (and wraps around,
+        just like the export does). Interpolated linearly between the samples; days without such a crossing are
+        ``nan``. With ``TwilightBandEnum.ASTRONOMICAL.lower_altitude`` this yields the ``ADämm``/``EDämm`` columns.
+        """
+        days, steps = self.altitude.shape
+        half = steps // 2
+        padding = np.full(steps, np.nan, dtype=self.altitude.dtype)
+        flat = np.concatenate([padding, self.altitude.ravel(), padding])
+        # window ``i`` covers noon of day ``i - 1`` to noon of day ``i``, the last one noon to noon after the grid
+        windows = np.lib.stride_tricks.sliding_window_view(flat[half : half + (days + 1) * steps + 1], steps + 1)
+        windows = windows[::steps]
+
+        above = windows >= altitude
+        valid = ~np.isnan(windows[:, :-1]) & ~np.isnan(windows[:, 1:])
+        rising = ~above[:, :-1] & above[:, 1:] & valid
+        setting = above[:, :-1] & ~above[:, 1:] & valid
+        last_rising = steps - 1 - np.argmax(rising[:-1, ::-1], axis=1)
+        first_setting = np.argmax(setting[1:], axis=1)
+        morning = self._interpolate(windows[:-1], last_rising, altitude) + half - steps
+        evening = self._interpolate(windows[1:], first_setting, altitude) + half
+        step_hours = self.resolution.total_seconds() / 3600
+        return (
+            np.where(rising[:-1].any(axis=1), morning * step_hours % 24, np.nan),
+            np.where(setting[1:].any(axis=1), evening * step_hours % 24, np.nan),
+        )
+
+    @staticmethod
+    def _interpolate(windows: np.ndarray, index: npt.NDArray[np.intp], altitude: float) -> FloatArray:
+        """Fractional sample index of the crossing between ``index`` and ``index + 1``."""
+        rows = np.arange(len(index))
+        a0 = windows[rows, index].astype(np.float64)
+        a1 = windows[rows, index + 1].astype(np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fraction = np.clip((altitude - a0) / (a1 - a0), 0, 1)
+        return index + fraction
+
+
+def compute_solar_altitude_grid(
+    location: MetaDataModel | CoordinateModel,
+    year: int,
+    *,
+    resolution: timedelta = timedelta(minutes=1),
+    utc_offset: timedelta = timedelta(hours=1),
+    delta_t: timedelta | None = None,
+) -> SolarAltitudeGridModel:
+    """
+    Compute the solar altitude for every ``resolution`` step of every local day of ``year`` at ``location``.
+
+    The apparent position of the sun is computed hourly and interpolated onto the grid, so only the sidereal time
+    and the altitude formula get evaluated per sample.
+    If ``location`` is a ``MetaDataModel`` its ``delta_t`` is used unless given explicitly.
+    """
+    if isinstance(location, MetaDataModel):
+        delta_t = location.delta_t if delta_t is None else delta_t
+        location = location.coordinate
+    delta_t = timedelta(0) if delta_t is None else delta_t
+
+    first_day, next_year = np.datetime64(f"{year}-01-01", "D"), np.datetime64(f"{year + 1}-01-01", "D")
+    days = np.arange(first_day, next_year)
+    one_day = np.timedelta64(1, "D")
+    hourly = np.arange(first_day - one_day, next_year + 2 * one_day, np.timedelta64(1, "h")).astype("datetime64[ns]")
+    ephemeris = compute_ephemeris(ObservableObjectEnum.SUN, hourly, delta_t=delta_t, equinox=None)
+    series = PositionSeries(hourly, ephemeris.right_ascension, ephemeris.declination)
+
+    step = resolution.total_seconds() / _SECONDS_PER_DAY
+    steps = round(1 / step)
+    start = days.astype(np.int64) - utc_offset.total_seconds() / _SECONDS_PER_DAY
+    times = (start[:, None] + np.arange(steps)[None, :] * step).ravel()
+    right_ascension, declination = series.at(times)
+    hour_angle = greenwich_mean_sidereal_time(unix_days_to_julian_day(times)) + location.longitude - right_ascension
+    altitude = equatorial_to_horizontal(hour_angle, declination, location.latitude)[0]
+
+    return SolarAltitudeGridModel(
+        day=days,
+        resolution=resolution,
+        utc_offset=utc_offset,
+        altitude=altitude.astype(np.float32).reshape(len(days), steps),
+    )
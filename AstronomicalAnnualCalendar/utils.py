@@ -1,6 +1,7 @@
 # standard library
 import re
 from datetime import timedelta
+from threading import Lock
 from typing import Literal, SupportsFloat
 
 # local
@@ -28,15 +29,18 @@ try:  # pragma: no cover
 except ImportError:
     ObservableObjectModel = None
     ObservableObjectEnum = None
+    _fix_imports_lock = Lock()
 
     def _fix_imports():
-        global ObservableObjectModel, ObservableObjectEnum, _fix_imports
-        # local
-        from .enums import ObservableObjectEnum
-        from .models import ObservableObjectModel
-
-        def _fix_imports():
-            pass
+        global ObservableObjectModel, ObservableObjectEnum
+        if ObservableObjectEnum is not None:
+            return
+        with _fix_imports_lock:  # concurrent first calls must not see just one of the globals rebound
+            # local
+            from . import enums, models
+
+            ObservableObjectModel = models.ObservableObjectModel
+            ObservableObjectEnum = enums.ObservableObjectEnum  # bound last as it's the one getting checked above
 
 
 __all__ = (
@@ -0,0 +1,179 @@
+# standard library
+from collections.abc import Iterable
+
+# third party
+import numpy as np
+import numpy.typing as npt
+from pydantic import BaseModel
+from pydantic.config import ConfigDict
+
+# local
+from .columns import available_fields, decode_rows
+from .errors import ColumnNotFoundError
+from .models import BoundToObservableObjectBaseModel, DataModel, ObservableObjectModel
+
+
+__all__ = (
+    "WINDOWS",
+    "VisibilityModel",
+    "above_horizon",
+    "dark_windows",
+    "compute_visibility",
+    "compute_visibilities",
+)
+
+
+type FloatArray = npt.NDArray[np.float64]
+type BoolArray = npt.NDArray[np.bool_]
+type IndexArray = npt.NDArray[np.intp]
+
+WINDOWS: int = 2
+"""Windows per night; within a night an object sets and rises again (or vice versa) at most once."""
+
+
+class VisibilityModel(BoundToObservableObjectBaseModel, BaseModel):
+    """
+    When an observable object is above the horizon while the sky is dark, night by night.
+
+    ``start`` and ``stop`` have the shape ``(nights, WINDOWS)`` and are hours since the local midnight *before* the
+    night's evening, so a window from 22:00 to 02:30 is ``22.0`` to ``26.5``. The windows of a night are sorted and
+    unused ones are ``nan``.
+    """
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    night: np.ndarray  # datetime64[D] (local date of the evening)
+    start: np.ndarray
+    stop: np.ndarray
+
+    @property
+    def hours(self) -> FloatArray:
+        """Hours of visibility per night."""
+        return np.nansum(self.stop - self.start, axis=1)
+
+
+def _carry_forward(values: BoolArray, known: BoolArray) -> BoolArray:
+    """Replace every unknown value by the last known one before it (``False`` if there's none)."""
+    last = np.maximum.accumulate(np.where(known, np.arange(len(values)), -1))
+    return np.where(last >= 0, values[np.maximum(last, 0)], False)  # noqa: FBT003
+
+
+def above_horizon(rise: npt.ArrayLike, set_: npt.ArrayLike) -> tuple[FloatArray, FloatArray]:
+    """
+    Return the intervals ``(start, stop)`` (shape ``(days, WINDOWS)``, hours of the local day) an object is up.
+
+    ``rise`` and ``set_`` are the hours of consecutive days, ``nan`` for the ``--`` cells. Whether the object is up
+    at midnight follows from the first event of the day; days without any event (it stays up or down all day) carry
+    the state over from the last event before them, starting out below the horizon.
+    """
+    rise, set_ = np.asarray(rise, dtype=np.float64), np.asarray(set_, dtype=np.float64)
+    has_rise, has_set = ~np.isnan(rise), ~np.isnan(set_)
+    # comparisons with nan are false: a single event is both the first and the last one of its day
+    first_is_set = has_set & ~(rise < set_)
+    last_is_rise = has_rise & ~(set_ > rise)
+    up_at_end = _carry_forward(last_is_rise, has_rise | has_set)
+    up_at_start = np.where(has_rise | has_set, first_is_set, np.concatenate([[False], up_at_end[:-1]]))
+
+    start = np.full((len(rise), WINDOWS), np.nan)
+    stop = np.full((len(rise), WINDOWS), np.nan)
+    start[:, 0] = np.where(up_at_start, 0, rise)
+    stop[:, 0] = np.where(has_set & (set_ >= start[:, 0]), set_, 24)
+    start[:, 1] = np.where(up_at_start, rise, np.nan)
+    stop[:, 1] = 24
+    return start, np.where(np.isnan(start), np.nan, stop)
+
+
+def dark_windows(dusk: npt.ArrayLike, next_dawn: npt.ArrayLike) -> tuple[FloatArray, FloatArray]:
+    """
+    Return the dark part ``(start, stop)`` of every night in hours since the local midnight before its evening.
+
+    ``dusk`` (the end of the evening's twilight) may fall after midnight, ``next_dawn`` is the dawn of the following
+    morning. Nights which don't get dark (``--`` cells, e.g. the short nights of summer) are ``nan``.
+    """
+    dusk = np.asarray(dusk, dtype=np.float64)
+    start = dusk + 24 * (dusk < 12)
+    stop = 24 + np.asarray(next_dawn, dtype=np.float64)
+    dark = stop > start
+    return np.where(dark, start, np.nan), np.where(dark, stop, np.nan)
+
+
+def _compact(start: FloatArray, stop: FloatArray) -> tuple[FloatArray, FloatArray]:
+    """Move the used intervals of every row to the front (keeping their order)."""
+    order = np.argsort(np.isnan(start), axis=1, kind="stable")
+    return np.take_along_axis(start, order, axis=1), np.take_along_axis(stop, order, axis=1)
+
+
+def _merge(start: FloatArray, stop: FloatArray) -> tuple[FloatArray, FloatArray]:
+    """Merge the touching intervals of every row; the intervals of a row are sorted and don't overlap."""
+    start, stop = _compact(start, stop)
+    start, stop = start.copy(), stop.copy()
+    for column in range(1, start.shape[1]):
+        touching = start[:, column] <= stop[:, column - 1]
+        start[touching, column] = start[touching, column - 1]
+        start[touching, column - 1] = stop[touching, column - 1] = np.nan
+    return _compact(start, stop)
+
+
+def _by_day(data: DataModel, *fields: str) -> tuple[np.ndarray, dict[str, FloatArray]]:
+    """Return the local days of ``data`` and its ``fields``; only the first row of every day is taken."""
+    days, first = np.unique(data.local_date_and_time.astype("datetime64[D]"), return_index=True)
+    columns = decode_rows([data.rows[row] for row in first.tolist()], *fields)
+    for field in fields:
+        if field not in columns:
+            raise ColumnNotFoundError(data.bound_object.name, field)
+    return days, columns
+
+
+def _next_day(days: np.ndarray, nights: np.ndarray) -> IndexArray:
+    """Index of the day after every night in ``days``; the night's own day if it's missing (e.g. every 10th day)."""
+    index = np.searchsorted(days, nights)
+    following = np.minimum(index + 1, len(days) - 1)
+    return np.where(days[following] == nights + np.timedelta64(1, "D"), following, index)
+
+
+def compute_visibility(data: DataModel, sun: DataModel) -> VisibilityModel:
+    """
+    Compute when the object of ``data`` is above the horizon during the dark part of every night.
+
+    Uses the ``rise``- and ``set``-columns of ``data`` and the ``dawn``- and ``dusk``-columns of ``sun`` at the local
+    days both have. The following morning is taken from the next day's row; if there's none (e.g. rows every 10 days)
+    the events of the evening's day are taken again. Every night is intersected at once: the (up to four) intervals of
+    the evening's and the following day an object is up get clipped to the dark window and touching ones merged.
+    """
+    days, columns = _by_day(data, "rise", "set")
+    sun_days, sun_columns = _by_day(sun, "dawn", "dusk")
+    nights, rows, sun_rows = np.intersect1d(days, sun_days, return_indices=True)
+
+    dark_start, dark_stop = dark_windows(
+        sun_columns["dusk"][sun_rows], sun_columns["dawn"][_next_day(sun_days, nights)]
+    )
+    up_start, up_stop = above_horizon(columns["rise"], columns["set"])
+    following = _next_day(days, nights)
+    start = np.concatenate([up_start[rows], up_start[following] + 24], axis=1)
+    stop = np.concatenate([up_stop[rows], up_stop[following] + 24], axis=1)
+
+    start, stop = np.maximum(start, dark_start[:, None]), np.minimum(stop, dark_stop[:, None])
+    empty = ~(stop > start)  # includes every nan
+    start, stop = _merge(np.where(empty, np.nan, start), np.where(empty, np.nan, stop))
+    return VisibilityModel(
+        bound_object=data.bound_object, night=nights, start=start[:, :WINDOWS], stop=stop[:, :WINDOWS]
+    )
+
+
+def compute_visibilities(data: Iterable[DataModel]) -> dict[ObservableObjectModel, VisibilityModel]:
+    """
+    Compute the visibility of every object in parsed ``data`` (e.g. ``Parser.parse().values()``).
+
+    The twilight is taken from the sun's data, which is required; objects without ``rise``- and ``set``-columns are
+    skipped (and so is the sun).
+    """
+    data = [item for item in data if item.rows]
+    sun = next((item for item in data if item.bound_object.is_sun), None)
+    if sun is None:
+        message = "The sun's data is required for the twilight"
+        raise ValueError(message)
+    return {
+        item.bound_object: compute_visibility(item, sun)
+        for item in data
+        if item is not sun and available_fields(item.rows, "rise", "set") == {"rise", "set"}
+    }
@@ -0,0 +1,198 @@
+# standard library
+import hashlib
+import time
+from collections.abc import Callable, Iterable
+from datetime import timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+# third party
+from pydantic import BaseModel
+from pydantic.config import ConfigDict
+
+# local
+from .errors import AstronomicalAnnualCalendarException
+from .parser import Parser
+from .render import (
+    CALENDAR_GRID_RESOLUTION,
+    CanvasModel,
+    LayerCache,
+    Renderer,
+    calendar_layers,
+    dominant_year,
+)
+from .twilight import SolarAltitudeGridModel, compute_solar_altitude_grid
+from .utils import observable_object_from_alias
+
+
+if TYPE_CHECKING:
+    # local
+    from .models import DataModel, MetaDataModel, ObservableObjectModel
+
+
+__all__ = (
+    "section_digests",
+    "CycleReportModel",
+    "Watcher",
+)
+
+
+def section_digests(parser: Parser) -> dict[str, str]:
+    """
+    Digest of the header and body of every object section of the file of ``parser`` by the section's name.
+
+    Sections the parser holds in memory (e.g. of a compressed file) are digested as they are, so the file doesn't get
+    decompressed a second time; plain files are read section by section via their index.
+    """
+    if (sections := parser.sections) is not None:
+        return {name: hashlib.blake2b(f"{header}\n{body}".encode()).hexdigest() for name, header, body in sections}
+    digests: dict[str, str] = {}
+    with parser.file.open("rb") as f:
+        for section in parser.section_index.sections:
+            f.seek(section.header_offset)
+            digests[section.name] = hashlib.blake2b(f.read(section.body_end - section.header_offset)).hexdigest()
+    return digests
+
+
+class CycleReportModel(BaseModel):
+    """What a single watch cycle did and how long it took."""
+
+    model_config = ConfigDict(frozen=True)
+
+    parsed: dict[Path, list[str]]  # names of the re-parsed objects per changed file
+    errors: dict[Path, str] = {}  # changed files which couldn't be parsed; their last good output is kept
+    outputs: list[Path]
+    parse_time: timedelta
+    render_time: timedelta
+    latency: timedelta  # from the last (observed) write of an input to the updated output
+
+
+class _WatchedFileState:
+    """Everything known about a watched file since the last cycle."""
+
+    def __init__(self) -> None:
+        self.stat: tuple[int, int] | None = None  # size and mtime
+        self.digests: dict[str, str] = {}
+        self.metadata: MetaDataModel | None = None
+        self.data: dict[ObservableObjectModel, DataModel] = {}
+        self.grid: tuple[int, SolarAltitudeGridModel] | None = None  # year and twilight grid of the last output
+
+
+class Watcher:
+    """
+    Poll ``paths`` and re-render ``<output>/<file stem>.png`` whenever one of them changes.
+
+    Bursts of writes are merged: a cycle only starts once the files didn't change for ``debounce``. Only object
+    sections whose content changed get parsed again and, as layers are cached, only their layers get re-rendered.
+    A file which can't be parsed (e.g. a half-finished edit) is reported and keeps its last good output until it's
+    saved again.
+    """
+
+    def __init__(
+        self,
+        paths: Iterable[Path],
+        output: Path,
+        *,
+        canvas: dict[str, Any] | None = None,
+        interval: timedelta = timedelta(milliseconds=200),
+        debounce: timedelta = timedelta(milliseconds=300),
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.paths = [Path(path) for path in paths]
+        self.output = Path(output)
+        self.canvas = canvas or {}
+        self.interval = interval
+        self.debounce = debounce
+        self.cache = LayerCache()
+        self._sleep = sleep
+        self._states = {path: _WatchedFileState() for path in self.paths}
+
+    def poll(self) -> set[Path]:
+        """Return the watched files whose size or mtime changed since the last poll; missing files are skipped."""
+        changed: set[Path] = set()
+        for path, state in self._states.items():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if (stat.st_size, stat.st_mtime_ns) != state.stat:
+                state.stat = stat.st_size, stat.st_mtime_ns
+                changed.add(path)
+        return changed
+
+    def settle(self, changed: set[Path]) -> set[Path]:
+        """Wait until the files didn't change for ``debounce`` and return every file changed meanwhile."""
+        changed = set(changed)
+        while True:
+            self._sleep(self.debounce.total_seconds())
+            if not (more := self.poll()):
+                return changed
+            changed |= more
+
+    def cycle(self, changed: Iterable[Path]) -> CycleReportModel:
+        """Re-parse the changed sections of ``changed`` and re-render their outputs."""
+        started = time.perf_counter()
+        parsed: dict[Path, list[str]] = {}
+        errors: dict[Path, str] = {}
+        for path in changed:
+            try:
+                parsed[path] = self._reparse(path)
+            except (AstronomicalAnnualCalendarException, ValueError, LookupError, OSError) as error:
+                errors[path] = str(error)
+        parse_time = time.perf_counter() - started
+
+        outputs = [self._render(path) for path, names in parsed.items() if names]
+        render_time = time.perf_counter() - started - parse_time
+        written = max((self._states[path].stat[1] for path in parsed), default=time.time_ns())
+        return CycleReportModel(
+            parsed=parsed,
+            errors=errors,
+            outputs=outputs,
+            parse_time=timedelta(seconds=parse_time),
+            render_time=timedelta(seconds=render_time),
+            latency=timedelta(microseconds=max(time.time_ns() - written, 0) // 1000),
+        )
+
+    def run(self, on_cycle: Callable[[CycleReportModel], None], *, cycles: int | None = None) -> None:
+        """Watch until interrupted (or for ``cycles`` cycles); the first cycle renders every file."""
+        count = 0
+        while cycles is None or count < cycles:
+            if changed := self.poll():
+                on_cycle(self.cycle(self.settle(changed)))
+                count += 1
+            else:
+                self._sleep(self.interval.total_seconds())
+
+    def _reparse(self, path: Path) -> list[str]:
+        """Parse the changed sections of ``path``; the file's state is only updated if everything could be parsed."""
+        state = self._states[path]
+        parser = Parser(file_path=path)
+        digests = section_digests(parser)
+        same_metadata = parser.metadata == state.metadata
+        previous_digests, previous_data = (state.digests, state.data) if same_metadata else ({}, {})
+        changed = [name for name, digest in digests.items() if previous_digests.get(name) != digest]
+        observable_objects = [observable_object_from_alias(name) for name in changed]
+        state.data = {
+            observable_object: data
+            for observable_object, data in previous_data.items()
+            if observable_object.aliases & digests.keys()  # drop removed sections
+        } | parser.parse(observable_objects)
+        if not same_metadata:
+            state.grid = None
+        state.metadata, state.digests = parser.metadata, digests
+        return changed
+
+    def _grid(self, state: _WatchedFileState, year: int) -> SolarAltitudeGridModel:
+        """Twilight grid of the file's location; just the latest one is kept per file."""
+        if state.grid is None or state.grid[0] != year:
+            state.grid = year, compute_solar_altitude_grid(state.metadata, year, resolution=CALENDAR_GRID_RESOLUTION)
+        return state.grid[1]
+
+    def _render(self, path: Path) -> Path:
+        state = self._states[path]
+        year = dominant_year(state.data.values())
+        layers = calendar_layers(state.metadata, state.data.values(), year, grid=self._grid(state, year))
+        self.output.mkdir(parents=True, exist_ok=True)
+        output = self.output / f"{path.stem}.png"
+        Renderer(CanvasModel(year=year, **self.canvas), cache=self.cache).save(layers, output)
+        return output
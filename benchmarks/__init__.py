@@ -0,0 +1,6 @@
+"""
+Micro-benchmarks of hot paths; run a single one as module, e.g. ``python -m benchmarks.rows``.
+
+They aren't part of the test suite as their timings depend on the machine. ``python -m benchmarks.memory`` exits
+non-zero once the memory of a pipeline stage regresses past ``memory_thresholds.json`` (``--update`` to re-store it).
+"""
@@ -0,0 +1,51 @@
+# standard library
+import bz2
+import gzip
+import lzma
+import tempfile
+import timeit
+from functools import partial
+from pathlib import Path
+
+# first party
+from AstronomicalAnnualCalendar.compression import open_decompressed
+from AstronomicalAnnualCalendar.parser import Parser
+
+
+SAMPLE: Path = Path(__file__).parent.parent / "tests" / "sample_data" / "complete-10d.txt"
+REPEAT: int = 5
+NUMBER: int = 10
+COMPRESSORS = {"plain": lambda data: data, "gzip": gzip.compress, "bz2": bz2.compress, "xz": lzma.compress}
+
+
+def _decompress(path: Path) -> bytes:
+    with open_decompressed(path) as stream:
+        return stream.read()
+
+
+def _parse(path: Path) -> None:
+    Parser(file_path=path).parse()
+
+
+def _seconds(function: partial) -> float:
+    return min(timeit.repeat(function, repeat=REPEAT, number=NUMBER)) / NUMBER
+
+
+def main() -> None:
+    """Compare parsing an export with parsing its gzip, bz2 and xz compressed copies."""
+    content = SAMPLE.read_bytes()
+    print(f"{SAMPLE.name}: {len(content):,} bytes")
+    with tempfile.TemporaryDirectory() as directory:
+        for name, compress in COMPRESSORS.items():
+            path = Path(directory) / f"{SAMPLE.name}.{name}"
+            path.write_bytes(compress(content))
+            decompress, parse = _seconds(partial(_decompress, path)), _seconds(partial(_parse, path))
+            print(
+                f"{name:<6} {path.stat().st_size:>8,} bytes ({len(content) / path.stat().st_size:4.1f}x)"
+                f"  decompress {len(content) / decompress / 2**20:8.2f} MiB/s"
+                f"  parse {parse * 1e3:7.3f} ms ({len(content) / parse / 2**20:5.2f} MiB/s)"
+            )
+
+
+if __name__ == "__main__":
+    main()
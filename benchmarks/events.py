@@ -0,0 +1,51 @@
+# standard library
+import timeit
+from functools import partial
+
+# third party
+import numpy as np
+
+# first party
+from AstronomicalAnnualCalendar.enums import ObservableObjectEnum
+from AstronomicalAnnualCalendar.ephemeris import compute_ephemerides
+from AstronomicalAnnualCalendar.events import find_conjunctions, find_greatest_elongations, find_stations
+from AstronomicalAnnualCalendar.models import ObservableObjectModel
+
+
+YEAR: int = 2024
+STEPS: dict[str, np.timedelta64] = {"daily": np.timedelta64(1, "D"), "hourly": np.timedelta64(1, "h")}
+REPEAT: int = 5
+NUMBER: int = 3
+
+
+def _find(
+    date_and_time: np.ndarray,
+    longitudes: dict[ObservableObjectModel, np.ndarray],
+    planets: dict[ObservableObjectModel, np.ndarray],
+    elongations: dict[ObservableObjectModel, np.ndarray],
+) -> int:
+    return len(
+        find_conjunctions(date_and_time, longitudes)
+        + find_stations(date_and_time, planets)
+        + find_greatest_elongations(date_and_time, elongations)
+    )
+
+
+def main() -> None:
+    """Time finding every event of a year of every object (and pair of objects) from daily and hourly rows."""
+    objects = [member.value for member in ObservableObjectEnum]
+    for name, step in STEPS.items():
+        date_and_time = np.arange(np.datetime64(f"{YEAR}-01-01"), np.datetime64(f"{YEAR + 1}-01-01"), step)
+        ephemerides = compute_ephemerides(objects, date_and_time)
+        longitudes = {item: ephemerides[item].ecliptic_longitude for item in objects}
+        planets = {item: column for item, column in longitudes.items() if item.is_planet}
+        elongations = {item: ephemerides[item].elongation for item in planets}
+        find = partial(_find, date_and_time, longitudes, planets, elongations)
+        events = find()
+        seconds = min(timeit.repeat(find, repeat=REPEAT, number=NUMBER)) / NUMBER
+        pairs = len(objects) * (len(objects) - 1) // 2
+        print(f"{name:<7} {len(date_and_time):>6,} rows x {pairs} pairs: {events} events in {seconds * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+# standard library
+import gc
+import json
+import resource
+import sys
+import tempfile
+import tracemalloc
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+# third party
+import click
+import numpy as np
+
+# first party
+from AstronomicalAnnualCalendar.columns import WEEKDAYS
+from AstronomicalAnnualCalendar.models import DataModel
+from AstronomicalAnnualCalendar.parser import Parser, decode_section_rows, split_sections
+from AstronomicalAnnualCalendar.render import CanvasModel, ObjectLayerModel, Renderer
+from AstronomicalAnnualCalendar.utils import observable_object_from_alias
+
+
+TEMPLATE: Path = Path(__file__).parent.parent / "tests" / "sample_data" / "sun,moon,mercury-10d-everything.txt"
+THRESHOLDS: Path = Path(__file__).with_name("memory_thresholds.json")
+SIZES: tuple[int, ...] = (1_000, 10_000, 50_000)
+STAGES: tuple[str, ...] = ("raw text", "section split", "row models", "DataModel", "render")
+HEADROOM: float = 0.15  # allowed growth over the measured bytes per row when storing thresholds
+NOISE: int = 64 * 2**10  # bytes a stage may exceed its threshold by independent of the rows (allocator noise)
+CANVAS: dict[str, int] = {"width": 300, "height": 400, "dpi": 50}
+_YEAR: int = 2024
+_DATE_WIDTH: int = len("Mo 01.01.2024  0:00:00")
+
+type Stage = dict[str, float]
+
+
+def synthetic_export(rows: int) -> str:
+    """
+    Return an export of the sun with ``rows`` rows evenly spread over a (local) year.
+
+    The event columns are repeated from the sun's section of ``TEMPLATE``; every row gets its own date and time.
+    """
+    lines = TEMPLATE.read_text("utf-8").splitlines()
+    _, header, body = next(split_sections(lines[1:]))
+    template = [line[_DATE_WIDTH:] for line in body.splitlines()]
+    seconds = np.arange(rows, dtype=np.int64) * (366 * 86_400 // rows)
+    moments = np.datetime64(f"{_YEAR}-01-01", "s") + seconds
+    days = moments.astype("datetime64[D]")
+    weekdays = np.array(WEEKDAYS)[(days.astype(np.int64) + 3) % 7]  # 1970-01-01 was a thursday
+    body = "\n".join(
+        f"{weekday} {moment:%d.%m.%Y} {moment.hour:>2}:{moment:%M:%S}{template[index % len(template)]}"
+        for index, (weekday, moment) in enumerate(zip(weekdays, moments.tolist(), strict=True))
+    )
+    return f"{lines[0]}\n\nSonne\n{header}\n{body}\n"
+
+
+def _measure(function: Callable[[], Any]) -> tuple[Any, Stage]:
+    """Call ``function`` and return its result with the traced bytes it retained and peaked at."""
+    gc.collect()
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    result = function()
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    return result, {"retained": current - before, "peak": peak - before}
+
+
+def profile(rows: int) -> dict[str, Any]:
+    """
+    Run every stage of the pipeline on a synthetic export of ``rows`` rows and measure its memory.
+
+    The results of the earlier stages are kept alive (as they are by the parser), so each stage's figures are just
+    its own. Returns the stages' ``retained`` and ``peak`` bytes and the process's peak RSS in bytes.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "synthetic.txt"
+        path.write_text(synthetic_export(rows), "utf-8")
+
+        tracemalloc.start()
+        text, raw = _measure(lambda: path.read_text("utf-8"))
+        sections, split = _measure(lambda: list(split_sections(text.splitlines()[1:])))
+        metadata = Parser.from_bytes(text.partition("\n")[0]).metadata
+        name, header, body = sections[0]
+        observable_object = observable_object_from_alias(name)
+
+        # the parser's own code path: ``decode_section`` validates the rows and wraps them in a ``DataModel``
+        (row_models, timezone), validated = _measure(lambda: decode_section_rows(observable_object, header, body))
+
+        def wrap() -> DataModel:
+            data = DataModel(bound_object=observable_object, metadata=metadata, timezone=timezone, rows=row_models)
+            data.local_date_and_time  # noqa: B018  # derived by every consumer
+            return data
+
+        data, wrapped = _measure(wrap)
+        _, rendered = _measure(
+            lambda: Renderer(CanvasModel(year=_YEAR, **CANVAS)).render([ObjectLayerModel.from_data(data)])
+        )
+        tracemalloc.stop()
+
+    # ``ru_maxrss`` is in KiB on linux but in bytes on macOS
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+    stages = dict(zip(STAGES, (raw, split, validated, wrapped, rendered), strict=True))
+    return {"rows": rows, "stages": stages, "max_rss": max_rss}
+
+
+def regressions(result: dict[str, Any], thresholds: dict[str, dict[str, float]]) -> list[str]:
+    """Describe every stage of ``result`` peaking at more bytes per row than its stored threshold."""
+    limits = thresholds.get(str(result["rows"]), {})
+    messages = []
+    for stage, limit in limits.items():
+        peak = result["stages"][stage]["peak"]
+        measured = peak / result["rows"]
+        if peak > limit * result["rows"] + NOISE:
+            messages.append(f"{result['rows']:,} rows, {stage}: {measured:,.0f} B/row > {limit:,.0f} B/row")
+    return messages
+
+
+@click.command()
+@click.option("--size", "sizes", type=click.IntRange(min=1), multiple=True, help="Number of rows (repeatable).")
+@click.option("--update", is_flag=True, help="Store the measured figures (plus headroom) as new thresholds.")
+def main(sizes: tuple[int, ...], *, update: bool) -> None:
+    """Profile the memory of every pipeline stage and fail if it regressed past the stored thresholds."""
+    sizes = sizes or SIZES
+    thresholds = json.loads(THRESHOLDS.read_text("utf-8")) if THRESHOLDS.exists() else {}
+    # a fresh process per size, so the peak RSS isn't the one of an earlier (larger) run
+    with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as executor:
+        results = list(executor.map(profile, sizes))
+
+    print(f"{'rows':>8}  {'stage':<14}{'retained':>14}{'B/row':>10}{'peak':>14}{'B/row':>10}")
+    for result in results:
+        for stage, figures in result["stages"].items():
+            print(
+                f"{result['rows']:>8,}  {stage:<14}"
+                f"{figures['retained']:>14,}{figures['retained'] / result['rows']:>10,.0f}"
+                f"{figures['peak']:>14,}{figures['peak'] / result['rows']:>10,.0f}"
+            )
+        print(f"{result['rows']:>8,}  {'peak RSS':<14}{result['max_rss']:>14,}")
+
+    if update:
+        for result in results:
+            thresholds[str(result["rows"])] = {
+                stage: round(figures["peak"] / result["rows"] * (1 + HEADROOM))
+                for stage, figures in result["stages"].items()
+            }
+        THRESHOLDS.write_text(json.dumps(thresholds, indent=2) + "\n", "utf-8")
+        print(f"stored thresholds in {THRESHOLDS.name}")
+        return
+
+    if messages := [message for result in results for message in regressions(result, thresholds)]:
+        print("memory regressed:", *messages, sep="\n  ")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# standard library
+import timeit
+from datetime import UTC
+from pathlib import Path
+
+# first party
+from AstronomicalAnnualCalendar.columns import decode_date_and_time, extract_columns, timezone_label
+from AstronomicalAnnualCalendar.models import DataModel, RowModel
+from AstronomicalAnnualCalendar.parser import Parser
+
+
+SAMPLE: Path = Path(__file__).parent.parent / "tests" / "sample_data" / "neptune-1d.txt"
+REPEAT: int = 5
+NUMBER: int = 20
+
+
+def _raw_rows(parser: Parser) -> tuple[object, list[str], list[tuple]]:
+    observable_object, header, body = next(parser._iter_observable_objects())  # noqa: SLF001
+    columns = extract_columns(observable_object, header, body)
+    date_and_time = decode_date_and_time(
+        columns.pop("date"), columns.pop("timezone"), timezone_label(header), weekdays=columns.pop("weekday")
+    )
+    moments = [moment.replace(tzinfo=UTC) for moment in date_and_time.astype("datetime64[us]").tolist()]
+    return observable_object, ["date_and_time", *columns], list(zip(moments, *columns.values(), strict=True))
+
+
+def main() -> None:
+    """Compare validating a section row by row with validating it in a single ``TypeAdapter`` pass."""
+    parser = Parser(file_path=SAMPLE)
+    observable_object, fields, rows = _raw_rows(parser)
+
+    def per_row() -> DataModel:
+        return DataModel(
+            bound_object=observable_object,
+            metadata=parser.metadata,
+            rows=[RowModel(bound_object=observable_object, **dict(zip(fields, row, strict=True))) for row in rows],
+        )
+
+    def bulk() -> DataModel:
+        return DataModel.from_raw_rows(rows, fields=fields, bound_object=observable_object, metadata=parser.metadata)
+
+    print(f"{SAMPLE.name}: {len(rows)} rows, {len(fields)} fields")
+    for name, function in (("per row", per_row), ("bulk", bulk)):
+        seconds = min(timeit.repeat(function, repeat=REPEAT, number=NUMBER)) / NUMBER
+        print(f"{name:<10} {seconds * 1e3:8.3f} ms  {len(rows) / seconds:12,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# standard library
+import gc
+import tempfile
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+
+# first party
+from AstronomicalAnnualCalendar.parser import Parser
+from AstronomicalAnnualCalendar.render import CanvasModel, LayerModel, Renderer, calendar_layers
+from AstronomicalAnnualCalendar.svg import write_svg
+
+
+SAMPLE: Path = Path(__file__).parent.parent / "tests" / "sample_data" / "complete-10d.txt"
+YEAR: int = 2024
+CANVAS: dict[str, int] = {"width": 1200, "height": 1600, "dpi": 100}
+REPEAT: int = 5
+NUMBER: int = 3
+
+
+def _peak(function: Callable[[], None]) -> int:
+    """Traced bytes ``function`` peaked at."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _writers(canvas: CanvasModel, layers: list[LayerModel]) -> dict[str, Callable[[Path], None]]:
+    # a new renderer for every call, its layer cache would turn the repetitions into compositing only
+    return {
+        "write_svg": lambda path: write_svg(path, canvas, layers),
+        "Renderer.save": lambda path: Renderer(canvas).save(layers, path),
+    }
+
+
+def main() -> None:
+    """Compare writing a calendar with ``write_svg`` with rendering and saving it as SVG by ``Renderer.save``."""
+    parser = Parser(file_path=SAMPLE)
+    canvas = CanvasModel(year=YEAR, **CANVAS)
+    layers = calendar_layers(parser.metadata, parser.parse().values(), YEAR)
+    print(f"{SAMPLE.name}: {len(layers)} layers on {canvas.width}x{canvas.height} pixels")
+    with tempfile.TemporaryDirectory() as directory:
+        for name, writer in _writers(canvas, layers).items():
+            path = Path(directory) / f"{name}.svg"
+            function = partial(writer, path)
+            seconds = min(timeit.repeat(function, repeat=REPEAT, number=NUMBER)) / NUMBER
+            peak = _peak(function)
+            print(f"{name:<13} {seconds * 1e3:8.2f} ms  peak {peak / 2**20:7.2f} MiB  {path.stat().st_size:>10,} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+# standard library
+import os
+import sys
+import timeit
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+
+# first party
+from AstronomicalAnnualCalendar.parser import Parser, split_sections
+
+
+SAMPLE: Path = Path(__file__).parent.parent / "tests" / "sample_data" / "complete-10d.txt"
+SCALE: int = 40  # every section's body gets repeated this often
+REPEAT: int = 3
+NUMBER: int = 2
+
+
+def _scaled_export() -> bytes:
+    """Return ``SAMPLE`` with ``SCALE`` times the rows in every section, so decoding dominates."""
+    lines = SAMPLE.read_text("utf-8").splitlines()
+    sections = [f"{name}\n{header}\n" + "\n".join([body] * SCALE) for name, header, body in split_sections(lines[1:])]
+    return (lines[0] + "\n\n" + "\n\n".join(sections) + "\n").encode("utf-8")
+
+
+def main() -> None:
+    """Compare decoding the sections of an export serially, in a thread pool and in a process pool."""
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    workers = min(os.cpu_count() or 1, 8)
+    parser = Parser.from_bytes(_scaled_export())
+    rows = sum(len(data.rows) for data in parser.parse().values())
+    print(f"{SAMPLE.name} x{SCALE}: {rows:,} rows, {workers} workers, GIL {'enabled' if gil else 'disabled'}")
+
+    executors: dict[str, Executor | None] = {
+        "serial": None,
+        "threads": ThreadPoolExecutor(max_workers=workers),
+        "processes": ProcessPoolExecutor(max_workers=workers),
+    }
+    for name, executor in executors.items():
+        parser.parse(executor=executor)  # warm up (e.g. spawn the workers)
+        seconds = min(timeit.repeat(partial(parser.parse, executor=executor), repeat=REPEAT, number=NUMBER)) / NUMBER
+        print(f"{name:<10} {seconds * 1e3:9.1f} ms  {rows / seconds:12,.0f} rows/s")
+        if executor is not None:
+            executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,22 @@
 # standard library
+from datetime import timedelta
 from pathlib import Path
 
 # third party
 from pytest import fixture
 
+# first party
+from AstronomicalAnnualCalendar.layout import CanvasModel
+from AstronomicalAnnualCalendar.parser import Parser
+from AstronomicalAnnualCalendar.render import (
+    AnnotationLayerModel,
+    BackgroundLayerModel,
+    LayerModel,
+    ObjectLayerModel,
+    TwilightLayerModel,
+)
+from AstronomicalAnnualCalendar.twilight import compute_solar_altitude_grid
+
 
 _BASE_PATH: Path = Path(__file__).parent
 
@@ -42,3 +55,22 @@ def path_sun_10d() -> Path:
 def path_sun_moon_mercury_10d_everything() -> Path:
     """Sun, moon and mercury; 10-day interval; all calculations;"""
     return _BASE_PATH / Path("sample_data/sun,moon,mercury-10d-everything.txt")
+
+
+@fixture
+def canvas() -> CanvasModel:
+    """2024; small and quick to render;"""
+    return CanvasModel(year=2024, width=240, height=320, dpi=40)
+
+
+@fixture
+def layers(path_complete_10d: Path) -> list[LayerModel]:
+    """Annotation, background, twilight and every object of ``path_complete_10d``;"""
+    parser = Parser(file_path=path_complete_10d)
+    grid = compute_solar_altitude_grid(parser.metadata, 2024, resolution=timedelta(minutes=10))
+    return [
+        AnnotationLayerModel(title=parser.metadata.place),
+        BackgroundLayerModel(),
+        TwilightLayerModel(grid=grid),
+        *(ObjectLayerModel.from_data(data) for data in parser.parse().values()),
+    ]
@@ -0,0 +1,98 @@
+# standard library
+from typing import TYPE_CHECKING
+
+# third party
+import numpy as np
+import pytest
+from click.testing import CliRunner
+
+# first party
+from AstronomicalAnnualCalendar.__main__ import main
+from AstronomicalAnnualCalendar.archive import ArchiveStore, LocationModel
+from AstronomicalAnnualCalendar.columns import decode_rows
+from AstronomicalAnnualCalendar.enums import ObservableObjectEnum
+from AstronomicalAnnualCalendar.parser import Parser
+
+
+if TYPE_CHECKING:
+    # standard library
+    from pathlib import Path
+
+
+@pytest.fixture
+def store(tmp_path: "Path", path_complete_10d: "Path") -> ArchiveStore:
+    store = ArchiveStore(tmp_path / "archive")
+    store.ingest_file(path_complete_10d)
+    return store
+
+
+def test_ingest(store: ArchiveStore, path_complete_10d: "Path"):
+    manifest = store.manifest
+    # 9 objects with rows in 2024 and 2025 (local time)
+    assert len(manifest.partitions) == 18
+    assert {partition.year for partition in manifest.partitions} == {2024, 2025}
+    (location,) = store.locations()
+    assert location.place == "Papenburg"
+    assert location.key == "papenburg_+53.0833_+7.4167"
+
+    assert store.ingest_file(path_complete_10d) == 0  # deduplicated
+    assert store.manifest == manifest
+
+
+def test_query(store: ArchiveStore, path_complete_10d: "Path"):
+    sun = Parser(file_path=path_complete_10d).parse([ObservableObjectEnum.SUN])[ObservableObjectEnum.SUN]
+    expected = decode_rows(sun.rows)
+
+    (result,) = store.query("sun")
+    np.testing.assert_array_equal(result.date_and_time, sun.date_and_time)
+    assert result.columns.keys() == expected.keys()
+    for field, column in expected.items():
+        np.testing.assert_array_equal(result.columns[field], column)
+
+    (result,) = store.query(ObservableObjectEnum.SUN, start="2024-03-01", stop="2024-04-01", fields=["rise"])
+    selected = (sun.date_and_time >= np.datetime64("2024-03-01")) & (sun.date_and_time < np.datetime64("2024-04-01"))
+    np.testing.assert_array_equal(result.date_and_time, sun.date_and_time[selected])
+    np.testing.assert_array_equal(result.columns["rise"], expected["rise"][selected])
+    assert list(result.columns) == ["rise"]
+
+    assert store.query("sun", start="2030-01-01") == []
+    assert store.query("sun", locations=[LocationModel(place="Elsewhere", latitude=0, longitude=0)]) == []
+
+
+def test_overlapping_ingest_and_compact(store: ArchiveStore, path_neptune_1d: "Path", path_complete_10d: "Path"):
+    neptune = Parser(file_path=path_neptune_1d).parse()[ObservableObjectEnum.NEPTUNE]
+    assert store.ingest([neptune]) == 2  # 2024 and 2025
+    (before,) = store.query("neptune")
+    # the daily rows include every 10th day (but the last one), those of the later ingest win
+    assert len(before.date_and_time) == len(neptune.rows) + 1
+    daily = np.isin(before.date_and_time, neptune.date_and_time)
+    np.testing.assert_array_equal(before.date_and_time[daily], neptune.date_and_time)
+    np.testing.assert_array_equal(before.columns["rise"][daily], decode_rows(neptune.rows, "rise")["rise"])
+
+    old_segments = [
+        store.root / partition.path / segment.name
+        for partition in store.manifest.partitions
+        if partition.object == "neptune"
+        for segment in partition.segments
+    ]
+    assert store.compact() == 2
+    assert all(len(partition.segments) == 1 for partition in store.manifest.partitions)
+    assert not any(path.exists() for path in old_segments)
+    (after,) = store.query("neptune")
+    np.testing.assert_array_equal(after.date_and_time, before.date_and_time)
+    for field, column in before.columns.items():
+        np.testing.assert_array_equal(after.columns[field], column)
+
+    # the sources survive the compaction
+    assert store.ingest([neptune]) == 0
+    assert store.ingest_file(path_complete_10d) == 0
+    assert store.compact() == 0
+
+
+def test_archive_cli(tmp_path: "Path", path_sun_10d: "Path"):
+    runner = CliRunner()
+    result = runner.invoke(main, ["archive", "ingest", str(tmp_path), str(path_sun_10d), str(path_sun_10d)])
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines() == ["sun-10d.txt: 2 new segment(s)", "sun-10d.txt: 0 new segment(s)"]
+    result = runner.invoke(main, ["archive", "compact", str(tmp_path)])
+    assert result.output == "removed 0 segment(s)\n"
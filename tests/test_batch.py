@@ -0,0 +1,135 @@
+# standard library
+import shutil
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+# third party
+import pytest
+from click.testing import CliRunner
+
+# first party
+from AstronomicalAnnualCalendar.__main__ import main
+from AstronomicalAnnualCalendar.batch import JobQueue, add_jobs, output_path, run_workers, work
+from AstronomicalAnnualCalendar.enums import JobStateEnum, OutputFormatEnum
+
+
+if TYPE_CHECKING:
+    # standard library
+    from pathlib import Path
+
+
+_SIZE: dict[str, int] = {"width": 120, "height": 160}
+
+
+@pytest.fixture
+def queue(tmp_path: "Path") -> JobQueue:
+    return JobQueue(tmp_path / "queue.sqlite", max_attempts=2)
+
+
+def test_add(queue: JobQueue, path_complete_10d: "Path", tmp_path: "Path"):
+    output = tmp_path / "out.png"
+    job = queue.add(path_complete_10d, 2024, "png", output, **_SIZE)
+    assert job.state == JobStateEnum.PENDING
+    assert job.format == OutputFormatEnum.PNG
+    assert queue.add(path_complete_10d, 2024, "png", output, **_SIZE) == job
+    assert queue.add(path_complete_10d, 2025, "png", output, **_SIZE).id != job.id
+
+    claimed = queue.claim("worker")
+    assert claimed.id == job.id
+    assert queue.complete(job.id, "worker")
+    # done, but the output is missing
+    assert queue.add(path_complete_10d, 2024, "png", output, **_SIZE).state == JobStateEnum.PENDING
+
+    claimed = queue.claim("worker")
+    assert claimed.id == job.id
+    output.touch()
+    assert queue.complete(job.id, "worker")
+    assert queue.add(path_complete_10d, 2024, "png", output, **_SIZE).state == JobStateEnum.DONE
+    assert queue.add(path_complete_10d, 2024, "png", output, width=240, height=320).state == JobStateEnum.PENDING
+
+
+def test_claim_and_lease(queue: JobQueue, path_complete_10d: "Path", tmp_path: "Path"):
+    job = queue.add(path_complete_10d, 2024, "pdf", tmp_path / "out.pdf", **_SIZE)
+    queue.claim("crashed", lease=timedelta(0))
+    # the lease of the crashed worker expired: the job gets claimed again
+    claimed = queue.claim("second", lease=timedelta(0))
+    assert (claimed.id, claimed.owner, claimed.attempts) == (job.id, "second", 2)
+    assert not queue.complete(job.id, "crashed")
+    assert not queue.renew(job.id, "crashed")
+
+    # max_attempts reached
+    assert queue.claim("third") is None
+    (failed,) = queue.jobs(JobStateEnum.FAILED)
+    assert "lease expired" in failed.error
+    assert queue.retry_failed() == 1
+    assert queue.claim("third").attempts == 1
+    assert queue.renew(job.id, "third")
+    assert queue.fail(job.id, "third", "broken")
+    assert queue.jobs()[0].error == "broken"
+
+
+def test_progress(queue: JobQueue, path_complete_10d: "Path", tmp_path: "Path"):
+    add_jobs(queue, [path_complete_10d], [2023, 2024], ["png", "pdf"], tmp_path, **_SIZE)
+    assert queue.progress().total == 4
+    job = queue.claim("worker")
+    queue.complete(job.id, "worker")
+    progress = queue.progress()
+    assert (progress.pending, progress.running, progress.done, progress.failed) == (3, 0, 1, 0)
+    assert not progress.finished
+
+
+def test_work(queue: JobQueue, path_complete_10d: "Path", tmp_path: "Path"):
+    missing = tmp_path / "missing.txt"
+    jobs = add_jobs(queue, [path_complete_10d, missing], [2024], ["png", "pdf"], tmp_path / "out", **_SIZE)
+    claimed = []
+    assert work(queue, on_job=claimed.append) == 4
+    assert [job.id for job in claimed] == [job.id for job in jobs]
+
+    progress = queue.progress()
+    assert (progress.done, progress.failed, progress.finished) == (2, 2, True)
+    assert output_path(tmp_path / "out", path_complete_10d, 2024, "png").read_bytes().startswith(b"\x89PNG")
+    assert output_path(tmp_path / "out", path_complete_10d, 2024, "pdf").read_bytes().startswith(b"%PDF")
+    assert sorted(path.suffix for path in (tmp_path / "out").iterdir()) == [".pdf", ".png"]
+    assert all("missing.txt" in job.error for job in queue.jobs(JobStateEnum.FAILED))
+
+
+def test_sources_of_the_same_name(queue: JobQueue, path_complete_10d: "Path", tmp_path: "Path"):
+    sources = []
+    for location in ("a", "b"):
+        (tmp_path / location).mkdir()
+        sources.append(shutil.copy(path_complete_10d, tmp_path / location / path_complete_10d.name))
+    jobs = add_jobs(queue, sources, [2024], ["svg"], tmp_path / "out", **_SIZE)
+    assert len({job.output for job in jobs}) == 2
+    assert work(queue) == 2
+    assert all(job.output.exists() for job in jobs)
+    assert all(job.output.name.startswith("complete-10d-") for job in jobs)
+
+
+def test_run_workers(queue: JobQueue, path_complete_10d: "Path", tmp_path: "Path"):
+    add_jobs(queue, [path_complete_10d], [2024], ["png", "svg"], tmp_path, **_SIZE)
+    reported = []
+    progress = run_workers(queue, 1, on_progress=reported.append, interval=0.05)
+    assert progress.done == 2
+    assert reported[-1] == progress
+    assert output_path(tmp_path, path_complete_10d, 2024, "svg").read_text("utf-8").startswith("<svg")
+
+
+def test_cli(path_complete_10d: "Path", tmp_path: "Path"):
+    export = shutil.copy(path_complete_10d, tmp_path / "papenburg.txt")
+    arguments = ["batch", str(tmp_path / "queue.sqlite"), str(export), "-y", "2024", "-f", "png", "-f", "pdf"]
+    arguments += ["-o", str(tmp_path / "out"), "--width", "120", "--height", "160"]
+    runner = CliRunner()
+    result = runner.invoke(main, arguments)
+    assert result.exit_code == 0, result.output
+    assert "2/2 finished: 2 done" in result.output
+    assert output_path(tmp_path / "out", export, 2024, "pdf").exists()
+
+    result = runner.invoke(main, arguments)
+    assert result.exit_code == 0, result.output
+    assert "skipping 2 job(s) done before" in result.output
+
+    export.write_text("not an export", "utf-8")
+    result = runner.invoke(main, [*arguments, "-y", "2025"])
+    assert result.exit_code == 1
+    assert "4/4 finished: 2 done, 2 failed" in result.output
+    assert "papenburg.txt 2025 png" in result.output
@@ -0,0 +1,135 @@
+# third party
+import numpy as np
+import pytest
+
+# first party
+from AstronomicalAnnualCalendar.columns import (
+    check_weekdays,
+    column_difference,
+    decode_date,
+    decode_date_and_time,
+    decode_degree,
+    decode_dms,
+    decode_hm_time,
+    decode_hms,
+    encode_degree,
+    encode_dms,
+    encode_float,
+    encode_hm_time,
+    encode_hms,
+    extract_columns,
+)
+from AstronomicalAnnualCalendar.enums import ObservableObjectEnum
+from AstronomicalAnnualCalendar.errors import WeekdayMismatchError
+
+
+@pytest.mark.parametrize(
+    "values, expected",
+    [
+        (["18h42m04.3s", "0h01m48.1s"], [18 + 42 / 60 + 4.3 / 3600, 1 / 60 + 48.1 / 3600]),
+        ([None, "12h00m00.0s"], [np.nan, 12]),
+    ],
+)
+def test_decode_hms(values: list[str | None], expected: list[float]):
+    np.testing.assert_allclose(decode_hms(values), expected)
+
+
+@pytest.mark.parametrize(
+    "values, expected",
+    [
+        (["-23°05'10\"", "+ 7°37'28\""], [-(23 + 5 / 60 + 10 / 3600), 7 + 37 / 60 + 28 / 3600]),
+        (["- 0°00'12\"", "279°40'02\""], [-12 / 3600, 279 + 40 / 60 + 2 / 3600]),
+    ],
+)
+def test_decode_dms(values: list[str], expected: list[float]):
+    np.testing.assert_allclose(decode_dms(values), expected)
+
+
+def test_decode_hm_time_and_degree():
+    np.testing.assert_allclose(decode_hm_time(["8h44m", "-----", "0h10m"]), [8 + 44 / 60, np.nan, 10 / 60])
+    np.testing.assert_allclose(decode_degree(["131°", "49°", None]), [131, 49, np.nan])
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        ["18h42m04.3s", "0h01m48.1s", "23h59m59.9s"],
+    ],
+)
+def test_encode_hms_round_trip(values: list[str]):
+    assert encode_hms(decode_hms(values)) == values
+
+
+@pytest.mark.parametrize(
+    "values, signed",
+    [
+        (["-23°05'10\"", "+ 7°37'28\"", "- 0°00'12\""], True),
+        (["279°40'02\"", "0°29'27\""], False),
+    ],
+)
+def test_encode_dms_round_trip(values: list[str], signed: bool):
+    assert encode_dms(decode_dms(values), signed=signed) == values
+
+
+def test_encode_hm_time_round_trip():
+    values = ["8h44m", "-----", "0h10m"]
+    assert encode_hm_time(decode_hm_time(values)) == values
+
+
+def test_encode_degree_and_float():
+    assert encode_degree([131.4, np.nan, 49.6]) == ["131°", None, "50°"]
+    assert encode_float([0.983304, np.nan], 5) == [0.9833, None]
+
+
+def test_extract_columns():
+    header = "      Datum     MEZ      Aufg.  Kulm. Unterg  ADämm  EDämm"
+    body = (
+        "Mo 01.01.2024  0:00:00   8h44m 12h34m 16h23m  6h35m 18h32m\n"
+        "Mo 20.05.2024  0:00:00   4h23m 12h27m 20h31m  -----  -----"
+    )
+    columns = extract_columns(ObservableObjectEnum.SUN, header, body)
+    assert columns == {
+        "weekday": ["Mo", "Mo"],
+        "date": ["01.01.2024", "20.05.2024"],
+        "timezone": ["0:00:00", "0:00:00"],
+        "rise": ["8h44m", "4h23m"],
+        "culmination": ["12h34m", "12h27m"],
+        "set": ["16h23m", "20h31m"],
+        "dawn": ["6h35m", "-----"],
+        "dusk": ["18h32m", "-----"],
+    }
+
+
+def test_decode_date():
+    np.testing.assert_array_equal(
+        decode_date(["01.01.2024", "29.02.2024", "31.12.1999"]),
+        np.array(["2024-01-01", "2024-02-29", "1999-12-31"], "datetime64[D]"),
+    )
+
+
+@pytest.mark.parametrize(
+    "timezone, expected",
+    [
+        ("MEZ", ["2023-12-31T23:00", "2024-07-01T11:30:15"]),
+        ("MESZ", ["2023-12-31T23:00", "2024-07-01T10:30:15"]),
+        ("UTC", ["2024-01-01T00:00", "2024-07-01T12:30:15"]),
+    ],
+)
+def test_decode_date_and_time(timezone: str, expected: list[str]):
+    decoded = decode_date_and_time(
+        ["01.01.2024", "01.07.2024"], ["0:00:00", "12:30:15"], timezone, weekdays=["Mo", "Mo"]
+    )
+    np.testing.assert_array_equal(decoded, np.array(expected, "datetime64[ns]"))
+
+
+def test_check_weekdays():
+    days = decode_date(["01.01.2024", "02.01.2024", "07.01.2024"])
+    check_weekdays(["Mo", "Di", "So"], days)
+    with pytest.raises(WeekdayMismatchError, match="row 1: 'Mi' instead of 'Di'"):
+        check_weekdays(["Mo", "Mi", "So"], days)
+
+
+def test_column_difference():
+    np.testing.assert_allclose(column_difference("rise", [23.5, 1], [0.5, 22]), [-1, 3])  # wraps at 24h
+    np.testing.assert_allclose(column_difference("elongation", [179, -179], [-179, 179]), [-2, 2])
+    np.testing.assert_allclose(column_difference("declination", [-80, np.nan], [80, 1]), [-160, np.nan])
@@ -0,0 +1,72 @@
+# standard library
+import bz2
+import gzip
+import io
+import lzma
+from typing import TYPE_CHECKING
+
+# third party
+import pytest
+
+# first party
+from AstronomicalAnnualCalendar.compression import detect_compression, is_compressed, open_decompressed
+from AstronomicalAnnualCalendar.enums import ObservableObjectEnum
+from AstronomicalAnnualCalendar.parser import Parser
+from AstronomicalAnnualCalendar.watch import section_digests
+
+
+if TYPE_CHECKING:
+    # standard library
+    from collections.abc import Callable
+    from pathlib import Path
+
+
+_COMPRESSORS: dict[str, "Callable[[bytes], bytes]"] = {
+    "gzip": gzip.compress,
+    "bz2": bz2.compress,
+    "xz": lzma.compress,
+}
+
+
+class _Pipe(io.RawIOBase):
+    """Non-seekable binary stream, like a pipe."""
+
+    def __init__(self, data: bytes):
+        self._data = io.BytesIO(data)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: bytearray) -> int:
+        return self._data.readinto(buffer)
+
+
+@pytest.mark.parametrize("compression", [*_COMPRESSORS, None])
+def test_detect_compression(compression: str | None, path_sun_10d: "Path"):
+    content = path_sun_10d.read_bytes()
+    if compression is not None:
+        content = _COMPRESSORS[compression](content)
+    assert detect_compression(content[:8]) == compression
+    for stream in (io.BytesIO(content), _Pipe(content)):
+        with open_decompressed(stream) as decompressed:
+            assert decompressed.read() == path_sun_10d.read_bytes()
+
+
+@pytest.mark.parametrize("compression", _COMPRESSORS)
+def test_parse_compressed_file(compression: str, path_complete_10d: "Path", tmp_path: "Path"):
+    path = tmp_path / f"{path_complete_10d.name}.{compression}"
+    path.write_bytes(_COMPRESSORS[compression](path_complete_10d.read_bytes()))
+    assert is_compressed(path)
+    assert not is_compressed(path_complete_10d)
+
+    expected = Parser(file_path=path_complete_10d)
+    parser = Parser(file_path=path)
+    assert parser.metadata == expected.metadata
+    assert parser.parse() == expected.parse()
+    assert parser.parse([ObservableObjectEnum.MARS]) == expected.parse([ObservableObjectEnum.MARS])
+    assert section_digests(parser).keys() == section_digests(expected).keys()
+
+
+def test_parse_compressed_stream(path_neptune_10d: "Path"):
+    content = gzip.compress(path_neptune_10d.read_bytes())
+    assert Parser.from_stream(_Pipe(content)).parse() == Parser(file_path=path_neptune_10d).parse()
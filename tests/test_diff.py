@@ -0,0 +1,107 @@
+# standard library
+from typing import TYPE_CHECKING
+
+# third party
+import numpy as np
+from click.testing import CliRunner
+
+# first party
+from AstronomicalAnnualCalendar.__main__ import main
+from AstronomicalAnnualCalendar.diff import diff_data, diff_datasets
+from AstronomicalAnnualCalendar.enums import ObservableObjectEnum
+from AstronomicalAnnualCalendar.parser import Parser
+from AstronomicalAnnualCalendar.resample import resample
+
+
+if TYPE_CHECKING:
+    # standard library
+    from pathlib import Path
+
+
+def test_diff_identical(path_complete_10d: "Path"):
+    parsed = Parser(file_path=path_complete_10d).parse()
+    result = diff_datasets(parsed, parsed)
+
+    assert result.ok
+    assert len(result.objects) == 9
+    for object_diff in result.objects.values():
+        assert object_diff.aligned == 38
+        assert {"rise", "culmination", "set"} <= set(object_diff.columns)
+        assert all(column.max == 0 for column in object_diff.columns.values())
+
+
+def test_diff_aligns_by_time(path_neptune_10d: "Path", path_neptune_1d: "Path"):
+    (coarse,) = Parser(file_path=path_neptune_10d).parse().values()
+    (daily,) = Parser(file_path=path_neptune_1d).parse().values()
+    result = diff_data(coarse, daily)
+
+    assert result.aligned == 37
+    assert result.only_left.tolist() == [np.datetime64("2025-01-04T23:00", "ns").tolist()]
+    assert result.only_right.size == len(daily.rows) - 37
+    assert all(column.max == 0 and column.ok for column in result.columns.values())
+    assert not result.ok
+
+
+def test_diff_duplicate_timestamps(path_neptune_10d: "Path"):
+    (neptune,) = Parser(file_path=path_neptune_10d).parse().values()
+    repeated = neptune.model_copy(update={"rows": [neptune.rows[0], *neptune.rows[:3], *neptune.rows[2:]]})
+    result = diff_data(repeated, neptune)
+    assert result.aligned == len(neptune.rows)
+    assert result.only_left.size == result.only_right.size == 0
+    assert result.ok
+
+
+def test_diff_wrap_aware_and_tolerances(path_sun_moon_mercury_10d_everything: "Path"):
+    (mercury,) = Parser(file_path=path_sun_moon_mercury_10d_everything).parse([ObservableObjectEnum.MERCURY]).values()
+    resampled = resample(mercury, method="cubic")
+    # compare the resampled data at the original nodes: only the rounding of the export may differ
+    result = diff_data(mercury, resampled)
+    assert result.aligned == len(mercury.rows)
+    assert result.columns["right_ascension"].max < 1 / 3600
+    assert result.columns["ecliptic_longitude"].max < 1 / 3600
+
+    shifted = mercury.model_copy(
+        update={
+            "rows": [
+                row.model_copy(update={"ecliptic_longitude": "359°59'59\"" if index == 3 else row.ecliptic_longitude})
+                for index, row in enumerate(mercury.rows)
+            ]
+        }
+    )
+    result = diff_data(mercury, shifted, tolerances={"ecliptic_longitude": 400})
+    assert result.columns["ecliptic_longitude"].max < 360
+    assert result.columns["ecliptic_longitude"].ok
+    result = diff_data(mercury, shifted)
+    assert result.columns["ecliptic_longitude"].exceeding.tolist() == [mercury.date_and_time[3].tolist()]
+
+
+def test_diff_cli(path_neptune_10d: "Path", path_complete_10d: "Path"):
+    runner = CliRunner()
+    result = runner.invoke(main, ["diff", str(path_complete_10d), str(path_complete_10d), "-o", "Neptun"])
+    assert result.exit_code == 0, result.output
+    assert "neptune: 38 aligned rows" in result.output
+
+    result = runner.invoke(main, ["diff", str(path_neptune_10d), str(path_complete_10d), "-t", "rise=0.5"])
+    assert result.exit_code == 1
+    assert "sun: only in right" in result.output
+
+    result = runner.invoke(main, ["diff", "-", str(path_neptune_10d)], input=path_neptune_10d.read_bytes())
+    assert result.exit_code == 0, result.output
+    assert "left: <stdin>" in result.output
+
+    result = runner.invoke(main, ["diff", str(path_neptune_10d), str(path_complete_10d), "-t", "rise"])
+    assert result.exit_code == 2
+    assert "FIELD=VALUE" in result.output
+
+
+def test_diff_cli_objects(path_neptune_10d: "Path", path_complete_10d: "Path"):
+    runner = CliRunner()
+    arguments = ["diff", str(path_neptune_10d), str(path_complete_10d)]
+    result = runner.invoke(main, [*arguments, "-o", "Sonne", "-o", "Neptun"])
+    assert result.exit_code == 1, result.output
+    assert "sun: only in right" in result.output
+    assert "neptune: 38 aligned rows" in result.output
+
+    result = runner.invoke(main, [*arguments, "-o", "Pluto"])
+    assert result.exit_code == 2
+    assert "Invalid value for '--object'" in result.output
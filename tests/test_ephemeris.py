@@ -0,0 +1,155 @@
+# standard library
+from typing import TYPE_CHECKING
+
+# third party
+import numpy as np
+import pytest
+
+# first party
+from AstronomicalAnnualCalendar.columns import COLUMN_DECODERS, decode_rows, extract_columns
+from AstronomicalAnnualCalendar.enums import ObservableObjectEnum
+from AstronomicalAnnualCalendar.ephemeris import compute_ephemerides, compute_ephemeris
+from AstronomicalAnnualCalendar.errors import ObjectNotSupportedError
+from AstronomicalAnnualCalendar.models import ObservableObjectModel
+from AstronomicalAnnualCalendar.parser import Parser
+
+
+if TYPE_CHECKING:
+    # standard library
+    from pathlib import Path
+
+
+_MEZ_OFFSET: np.timedelta64 = np.timedelta64(1, "h")
+
+# maximum absolute deviation from the sample data (right ascension in hours, angles in degrees, diameter in ")
+_TOLERANCES: dict[str, dict[str, float]] = {
+    "sun": {
+        "right_ascension": 0.001,
+        "declination": 0.01,
+        "ecliptic_longitude": 0.01,
+        "ecliptic_latitude": 0.01,
+        "brightness": 0.1,
+        "diameter": 0.2,
+    },
+    "moon": {
+        "right_ascension": 0.002,
+        "declination": 0.02,
+        "ecliptic_longitude": 0.02,
+        "ecliptic_latitude": 0.02,
+        "diameter": 1.5,
+        "phase": 0.03,
+        "age": 0.1,
+    },
+    "mercury": {
+        "right_ascension": 0.001,
+        "declination": 0.01,
+        "ecliptic_longitude": 0.01,
+        "ecliptic_latitude": 0.01,
+        "brightness": 0.1,
+        "diameter": 0.2,
+        "elongation": 0.1,
+    },
+}
+_RELATIVE_DISTANCE_TOLERANCE: float = 1e-4
+_WRAPPING: dict[str, float] = {"right_ascension": 24, "ecliptic_longitude": 360}
+
+
+def test_compute_ephemeris_against_sample_data(path_sun_moon_mercury_10d_everything: "Path"):
+    parser = Parser(file_path=path_sun_moon_mercury_10d_everything)
+    for observable_object, header, body in parser._iter_observable_objects():  # noqa: SLF001
+        columns = extract_columns(observable_object, header, body)
+        date_and_time = np.array(["-".join(date.split(".")[::-1]) for date in columns["date"]], "datetime64[ns]")
+        ephemeris = compute_ephemeris(
+            observable_object,
+            date_and_time - _MEZ_OFFSET,
+            delta_t=parser.metadata.delta_t,
+            equinox=parser.metadata.equinox,
+        )
+
+        for field, tolerance in _TOLERANCES[observable_object.name].items():
+            difference = getattr(ephemeris, field) - COLUMN_DECODERS[field](columns[field])
+            if (period := _WRAPPING.get(field)) is not None:
+                difference = (difference + period / 2) % period - period / 2
+            assert np.abs(difference).max() < tolerance, field
+
+        expected_distance = COLUMN_DECODERS["distance"](columns["distance"])
+        assert np.abs(ephemeris.distance / expected_distance - 1).max() < _RELATIVE_DISTANCE_TOLERANCE
+
+
+def test_compute_ephemerides_every_object():
+    date_and_time = np.arange(np.datetime64("2024-01-01"), np.datetime64("2024-01-02"), np.timedelta64(1, "m"))
+    observable_objects = [member.value for member in ObservableObjectEnum]  # type: ignore
+    ephemerides = compute_ephemerides(observable_objects, date_and_time)
+
+    assert list(ephemerides) == observable_objects
+    for observable_object, ephemeris in ephemerides.items():
+        assert ephemeris.right_ascension.shape == date_and_time.shape
+        assert ((ephemeris.right_ascension >= 0) & (ephemeris.right_ascension < 24)).all()
+        assert (np.abs(ephemeris.declination) <= 90).all()
+        assert (np.abs(ephemeris.elongation) <= 180).all()
+        assert np.isnan(ephemeris.age).all() != observable_object.is_moon
+
+
+@pytest.mark.parametrize(
+    "observable_object",
+    [ObservableObjectEnum.SUN, ObservableObjectEnum.MOON, ObservableObjectEnum.MERCURY],
+)
+def test_ephemeris_to_rows_round_trip(observable_object: ObservableObjectModel):
+    date_and_time = np.arange(np.datetime64("2024-03-01"), np.datetime64("2024-04-01"), np.timedelta64(1, "D"))
+    ephemeris = compute_ephemeris(observable_object, date_and_time)
+    rows = ephemeris.to_rows()
+    decoded = decode_rows(rows, "right_ascension", "declination", "ecliptic_longitude")
+
+    assert len(rows) == len(date_and_time)
+    assert rows[0].bound_object == observable_object
+    assert np.abs(decoded["right_ascension"] - ephemeris.right_ascension).max() < 0.1 / 3600
+    assert np.abs(decoded["declination"] - ephemeris.declination).max() < 1 / 3600
+
+
+@pytest.mark.parametrize(
+    ("observable_object", "date_and_time", "right_ascension", "declination"),
+    [
+        # Meeus, Astronomical Algorithms, examples 25.a and 33.a (TD = UT)
+        (ObservableObjectEnum.SUN, "1992-10-13", 13 + 13 / 60 + 31.4 / 3600, -(7 + 47 / 60 + 6 / 3600)),
+        (ObservableObjectEnum.VENUS, "1992-12-20", 21 + 4 / 60 + 41.454 / 3600, -(18 + 53 / 60 + 16.84 / 3600)),
+    ],
+)
+def test_compute_ephemeris_apparent(
+    observable_object: ObservableObjectModel, date_and_time: str, right_ascension: float, declination: float
+):
+    ephemeris = compute_ephemeris(observable_object, np.array([date_and_time], "datetime64[ns]"), equinox=None)
+    assert ephemeris.right_ascension[0] == pytest.approx(right_ascension, abs=1 / 3600)  # 1s
+    assert ephemeris.declination[0] == pytest.approx(declination, abs=5 / 3600)  # 5"
+
+
+@pytest.mark.parametrize(
+    ("observable_object", "brightest", "faintest"),
+    [
+        (ObservableObjectEnum.SUN, -26.8, -26.69),
+        (ObservableObjectEnum.MOON, -12.9, -3.5),
+        (ObservableObjectEnum.MERCURY, -2.5, 5.7),
+        (ObservableObjectEnum.VENUS, -4.5, -3.8),
+        (ObservableObjectEnum.MARS, -1.5, 1.6),
+        (ObservableObjectEnum.JUPITER, -2.9, -1.9),
+        (ObservableObjectEnum.SATURN, 0.4, 1.1),
+        (ObservableObjectEnum.URANUS, 5.5, 5.9),
+        (ObservableObjectEnum.NEPTUNE, 7.7, 8.0),
+    ],
+)
+def test_compute_ephemeris_brightness(observable_object: ObservableObjectModel, brightest: float, faintest: float):
+    date_and_time = np.arange(np.datetime64("2024-01-01"), np.datetime64("2025-01-01"), np.timedelta64(1, "D"))
+    brightness = compute_ephemeris(observable_object, date_and_time).brightness
+    assert brightest <= brightness.min() <= brightness.max() <= faintest
+
+
+def test_compute_ephemeris_brightness_saturn_rings():
+    # both at opposition; the opened rings (2017) make up for the larger distance while they're edge-on in 2025
+    oppositions = np.array(["2017-06-15", "2025-09-21"], "datetime64[ns]")
+    brightness = compute_ephemeris(ObservableObjectEnum.SATURN, oppositions).brightness
+    np.testing.assert_allclose(brightness, [0.0, 0.6], atol=0.15)
+
+
+def test_compute_ephemeris_not_supported():
+    pluto = ObservableObjectModel(id="pluto", line_color="brown")
+    with pytest.raises(ObjectNotSupportedError, match="pluto"):
+        compute_ephemeris(pluto, np.array(["2024-01-01"], "datetime64[ns]"))
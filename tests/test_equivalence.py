@@ -0,0 +1,103 @@
+# standard library
+from typing import TYPE_CHECKING
+
+# third party
+import numpy as np
+import pytest
+
+# first party
+from AstronomicalAnnualCalendar.enums import ObservableObjectEnum
+from AstronomicalAnnualCalendar.equivalence import (
+    FAST_PATHS,
+    DecodedModel,
+    check_equivalence,
+    compare,
+    decoded_from_data,
+    reference_decode,
+    synthetic_export,
+)
+from AstronomicalAnnualCalendar.parser import Parser
+
+
+if TYPE_CHECKING:
+    # standard library
+    from pathlib import Path
+
+    # first party
+    from AstronomicalAnnualCalendar.equivalence import Decoded
+
+
+_SAMPLES: tuple[str, ...] = (
+    "path_complete_10d",
+    "path_mercury_10d",
+    "path_neptune_1d",
+    "path_neptune_10d",
+    "path_sun_10d",
+    "path_sun_moon_mercury_10d_everything",
+)
+
+
+def _assert_equivalent(export: str) -> None:
+    reports = check_equivalence(export)
+    assert reports.keys() == FAST_PATHS.keys()
+    for report in reports.values():
+        assert report.ok, (report.path, report.mismatches, report.reproducer)
+
+
+@pytest.mark.parametrize("path_fixture", _SAMPLES)
+def test_sample_data(path_fixture: str, request: pytest.FixtureRequest):
+    path: Path = request.getfixturevalue(path_fixture)
+    _assert_equivalent(path.read_text("utf-8"))
+
+
+@pytest.mark.parametrize("seed", range(6))
+@pytest.mark.parametrize("path_fixture", ["path_complete_10d", "path_sun_moon_mercury_10d_everything"])
+def test_synthetic_exports(path_fixture: str, seed: int, request: pytest.FixtureRequest):
+    template = request.getfixturevalue(path_fixture).read_text("utf-8")
+    export = synthetic_export(template, seed)
+    assert export == synthetic_export(template, seed)
+    assert "-----" in export
+    _assert_equivalent(export)
+
+
+def test_compare_wrap_aware():
+    def decoded(longitude: float, rise: float) -> "Decoded":
+        return {
+            ObservableObjectEnum.SUN: DecodedModel(
+                bound_object=ObservableObjectEnum.SUN,
+                date_and_time=np.array(["2024-01-01"], dtype="datetime64[ns]"),
+                columns={"ecliptic_longitude": np.array([longitude]), "rise": np.array([rise])},
+            )
+        }
+
+    assert compare(decoded(359.9999999999, 1), decoded(0, 1)) == []
+    (mismatch,) = compare(decoded(359.99, 1), decoded(0, 1))
+    assert (mismatch.observable_object, mismatch.field, mismatch.rows) == ("sun", "ecliptic_longitude", (0,))
+    assert compare(decoded(359.99, 1), decoded(0, 1), tolerances={"ecliptic_longitude": 0.1}) == []
+    assert [mismatch.field for mismatch in compare(decoded(0, np.nan), decoded(0, 1))] == ["rise"]
+
+
+def test_shrink_to_minimal_reproducer(path_complete_10d: "Path", monkeypatch: pytest.MonkeyPatch):
+    def off_by_a_minute_late_at_night(export: str) -> "Decoded":
+        decoded = decoded_from_data(Parser.from_bytes(export).parse().values())
+        for item in decoded.values():
+            if "set" in item.columns:
+                item.columns["set"][item.columns["set"] >= 23] += 1 / 60
+        return decoded
+
+    def crashing(export: str) -> "Decoded":
+        raise ZeroDivisionError
+
+    monkeypatch.setitem(FAST_PATHS, "off-by-a-minute", off_by_a_minute_late_at_night)
+    monkeypatch.setitem(FAST_PATHS, "crashing", crashing)
+    export = path_complete_10d.read_text("utf-8")
+    reports = check_equivalence(export, ["parser", "off-by-a-minute", "crashing"])
+
+    assert reports["parser"].ok
+    assert reports["crashing"].mismatches[0].field == "exception"
+    report = reports["off-by-a-minute"]
+    assert {mismatch.field for mismatch in report.mismatches} == {"set"}
+    (data,) = reference_decode(report.reproducer).values()
+    assert len(data.date_and_time) == 1
+    assert data.columns["set"][0] >= 23
+    assert len(report.reproducer) < len(export) / 50
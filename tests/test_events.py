@@ -0,0 +1,103 @@
+# standard library
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+# third party
+import numpy as np
+import pytest
+
+# first party
+from AstronomicalAnnualCalendar.enums import EventKindEnum, ObservableObjectEnum
+from AstronomicalAnnualCalendar.ephemeris import compute_ephemerides
+from AstronomicalAnnualCalendar.events import (
+    EventModel,
+    find_conjunctions,
+    find_events,
+    find_greatest_elongations,
+    find_stations,
+)
+from AstronomicalAnnualCalendar.parser import Parser
+
+
+if TYPE_CHECKING:
+    # standard library
+    from pathlib import Path
+
+
+_OBJECTS = [member.value for member in ObservableObjectEnum]
+
+
+def _events(step: np.timedelta64) -> list[EventModel]:
+    date_and_time = np.arange(np.datetime64("2024-03-01"), np.datetime64("2024-05-01"), step)
+    ephemerides = compute_ephemerides(_OBJECTS, date_and_time)
+    longitudes = {item: ephemerides[item].ecliptic_longitude for item in _OBJECTS}
+    return [
+        *find_conjunctions(date_and_time, longitudes),
+        *find_stations(date_and_time, {item: column for item, column in longitudes.items() if item.is_planet}),
+        *find_greatest_elongations(
+            date_and_time, {item: ephemerides[item].elongation for item in _OBJECTS if item.is_planet}
+        ),
+    ]
+
+
+def _key(event: EventModel) -> tuple:
+    return event.kind, tuple(item.name for item in event.objects)
+
+
+def test_refinement_to_the_minute():
+    daily = sorted(_events(np.timedelta64(1, "D")), key=_key)
+    fine = sorted(_events(np.timedelta64(10, "m")), key=_key)
+    assert [_key(event) for event in daily] == [_key(event) for event in fine]
+    for coarse, reference in zip(daily, fine, strict=True):
+        assert abs(coarse.date_and_time - reference.date_and_time) <= timedelta(minutes=3), coarse
+        assert coarse.value == pytest.approx(reference.value, abs=1e-3)
+
+
+@pytest.mark.parametrize(
+    "kind, objects, expected",
+    [
+        # the total solar eclipse; new moon at 18:21 UTC
+        (EventKindEnum.CONJUNCTION, ("sun", "moon"), datetime(2024, 4, 8, 18, 21, tzinfo=UTC)),
+        (EventKindEnum.OPPOSITION, ("sun", "moon"), datetime(2024, 3, 25, 7, 0, tzinfo=UTC)),
+        (EventKindEnum.GREATEST_EASTERN_ELONGATION, ("mercury",), datetime(2024, 3, 24, 23, 0, tzinfo=UTC)),
+        (EventKindEnum.RETROGRADE_STATION, ("mercury",), datetime(2024, 4, 1, 22, 14, tzinfo=UTC)),
+        (EventKindEnum.DIRECT_STATION, ("mercury",), datetime(2024, 4, 25, 12, 54, tzinfo=UTC)),
+    ],
+)
+def test_known_events(kind: EventKindEnum, objects: tuple[str, ...], expected: datetime):
+    event = min(
+        (event for event in _events(np.timedelta64(1, "D")) if _key(event) == (kind, objects)),
+        key=lambda event: abs(event.date_and_time - expected),
+    )
+    # the low-precision ephemeris and the flat extrema limit the agreement with published times
+    assert abs(event.date_and_time - expected) <= timedelta(hours=1 if kind == EventKindEnum.CONJUNCTION else 3)
+
+
+def test_find_events(path_sun_moon_mercury_10d_everything: "Path"):
+    events = find_events(Parser(file_path=path_sun_moon_mercury_10d_everything).parse().values())
+    assert [event.date_and_time for event in events] == sorted(event.date_and_time for event in events)
+    elongations = [
+        (event.kind, event.date_and_time.date(), round(event.value))
+        for event in events
+        if event.kind in (EventKindEnum.GREATEST_EASTERN_ELONGATION, EventKindEnum.GREATEST_WESTERN_ELONGATION)
+    ]
+    east, west = EventKindEnum.GREATEST_EASTERN_ELONGATION, EventKindEnum.GREATEST_WESTERN_ELONGATION
+    # even from rows every 10 days they are at most a day off
+    assert [(kind, value) for kind, _, value in elongations] == [
+        (west, -24),
+        (east, 19),
+        (west, -26),
+        (east, 27),
+        (west, -18),
+        (east, 23),
+        (west, -22),
+    ]
+    published = ["2024-01-12", "2024-03-24", "2024-05-09", "2024-07-22", "2024-09-05", "2024-11-16", "2024-12-25"]
+    for (_, day, _), expected in zip(elongations, published, strict=True):
+        assert abs(day - datetime.fromisoformat(expected).date()) <= timedelta(days=1)
+    new_moons = [event for event in events if _key(event) == (EventKindEnum.CONJUNCTION, ("sun", "moon"))]
+    assert len(new_moons) == 13
+
+
+def test_find_events_without_columns(path_complete_10d: "Path"):
+    assert find_events(Parser(file_path=path_complete_10d).parse().values()) == []
@@ -0,0 +1,100 @@
+# standard library
+import os
+import shutil
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+# third party
+import pytest
+
+# first party
+from AstronomicalAnnualCalendar import index as index_module
+from AstronomicalAnnualCalendar.enums import ObservableObjectEnum
+from AstronomicalAnnualCalendar.errors import SectionNotFoundError
+from AstronomicalAnnualCalendar.index import (
+    SECTION_INDEX_SUFFIX,
+    SectionIndexModel,
+    build_section_index,
+    load_section_index,
+)
+from AstronomicalAnnualCalendar.regex import OBJECT_DATA_BODY_REGEX
+
+
+if TYPE_CHECKING:
+    # standard library
+    from pathlib import Path
+
+
+@pytest.mark.parametrize(
+    "path_fixture",
+    [
+        "path_complete_10d",
+        "path_mercury_10d",
+        "path_neptune_1d",
+        "path_sun_10d",
+        "path_sun_moon_mercury_10d_everything",
+    ],
+)
+def test_build_section_index_matches_regex(path_fixture: str, request: pytest.FixtureRequest):
+    path: Path = request.getfixturevalue(path_fixture)
+    raw = path.read_bytes()
+    index = build_section_index(path)
+    matches = list(OBJECT_DATA_BODY_REGEX.finditer(raw.decode("utf-8")))
+
+    assert len(index.sections) == len(matches)
+    for section, match in zip(index.sections, matches, strict=True):
+        assert section.name == match.group("name")
+        assert raw[section.name_offset : section.header_offset].decode("utf-8") == match.group("name") + "\n"
+        assert raw[section.header_offset : section.body_start].decode("utf-8") == match.group("header") + "\n"
+        assert raw[section.body_start : section.body_end].decode("utf-8") == match.group("body")
+        assert section.row_count == len(match.group("body").splitlines())
+
+
+def test_section_index_get(path_complete_10d: "Path"):
+    index = build_section_index(path_complete_10d)
+    assert index.get(ObservableObjectEnum.NEPTUNE).name == "Neptun"
+    assert index.get(ObservableObjectEnum.SUN).name == "Sonne"
+
+
+def test_section_index_get_fail(path_neptune_10d: "Path"):
+    with pytest.raises(SectionNotFoundError):
+        build_section_index(path_neptune_10d).get(ObservableObjectEnum.SUN)
+
+
+def test_load_section_index_invalidation(path_mercury_10d: "Path", tmp_path: "Path"):
+    path = tmp_path / path_mercury_10d.name
+    shutil.copy(path_mercury_10d, path)
+
+    index = load_section_index(path)
+    assert load_section_index(path) is index
+
+    with path.open("a", encoding="utf-8") as f:
+        f.write("\n")
+    assert not index.is_valid_for(path)
+    assert load_section_index(path) is not index
+
+
+def test_load_section_index_sidecar(path_sun_10d: "Path", tmp_path: "Path"):
+    path = tmp_path / path_sun_10d.name
+    shutil.copy(path_sun_10d, path)
+    sidecar = tmp_path / (path.name + SECTION_INDEX_SUFFIX)
+
+    index = load_section_index(path, sidecar=True)
+    assert sidecar.is_file()
+    assert SectionIndexModel.from_sidecar(path) == index
+
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert SectionIndexModel.from_sidecar(path) is None
+
+
+def test_load_section_index_bounded(path_sun_10d: "Path", tmp_path: "Path", monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(index_module, "_in_memory_indices", OrderedDict())
+    monkeypatch.setattr(index_module, "_MAX_IN_MEMORY_INDICES", 2)
+    paths = [shutil.copy(path_sun_10d, tmp_path / f"{name}.txt") for name in "abc"]
+
+    first = load_section_index(paths[0])
+    load_section_index(paths[1])
+    assert load_section_index(paths[0]) is first  # now the most recently used one
+    load_section_index(paths[2])
+    assert list(index_module._in_memory_indices) == [paths[0].resolve(), paths[2].resolve()]  # noqa: SLF001
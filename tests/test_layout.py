@@ -0,0 +1,118 @@
+# standard library
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+# third party
+import numpy as np
+import pytest
+
+# first party
+from AstronomicalAnnualCalendar.enums import EventKindEnum, ObservableObjectEnum, TwilightBandEnum
+from AstronomicalAnnualCalendar.events import EventModel
+from AstronomicalAnnualCalendar.layout import CanvasModel, fixed_timezone
+from AstronomicalAnnualCalendar.parser import Parser
+from AstronomicalAnnualCalendar.render import ObjectLayerModel, Renderer, TwilightLayerModel
+from AstronomicalAnnualCalendar.twilight import compute_solar_altitude_grid
+
+
+if TYPE_CHECKING:
+    # standard library
+    from pathlib import Path
+
+
+_WINTER: CanvasModel = CanvasModel(year=2024, width=240, height=320, dpi=40)
+_LEGAL: CanvasModel = _WINTER.model_copy(update={"timezone": "MESZ"})
+_SPRING: int = 89  # row of the 30th of march; the clocks are set forward in its night
+_AUTUMN: int = 299  # row of the 26th of october
+
+
+def test_fixed_timezone():
+    assert fixed_timezone(timedelta(hours=1)) == "Etc/GMT-1"
+    assert fixed_timezone(timedelta(hours=-5)) == "Etc/GMT+5"
+    assert fixed_timezone(timedelta(0)) == "UTC"
+    with pytest.raises(ValueError, match="whole hours"):
+        fixed_timezone(timedelta(minutes=30))
+
+
+def test_layout():
+    layout = _LEGAL.layout
+    assert len(layout.days) == 366
+    np.testing.assert_array_equal(layout.transitions, [_SPRING, _AUTUMN])
+    assert layout.utc_offset[_SPRING] == np.timedelta64(1, "h")
+    assert layout.utc_offset[_SPRING + 1] == np.timedelta64(2, "h")
+    assert layout.month_starts[:3].tolist() == [0, 31, 60]
+    np.testing.assert_array_equal(layout.offset_hours(["2024-01-01", "2024-07-01"]), [0, 1])
+    assert not _WINTER.layout.transitions.size
+
+
+def test_place():
+    utc = np.array(["2024-07-01T20:00", "NaT", "2024-01-01T23:30"], dtype="datetime64[ns]")
+    x, y = _LEGAL.layout.place(utc)
+    np.testing.assert_array_equal(x, [10, np.nan, 12.5])
+    np.testing.assert_array_equal(y, [182, np.nan, 0])
+    assert _WINTER.layout.place(utc)[0][0] == 9
+
+    event = EventModel(
+        kind=EventKindEnum.CONJUNCTION,
+        date_and_time=datetime(2024, 7, 1, 20, tzinfo=UTC),
+        objects=(ObservableObjectEnum.MOON, ObservableObjectEnum.MARS),
+        value=0,
+    )
+    np.testing.assert_array_equal(_LEGAL.layout.place_events([event]), ([10], [182]))
+
+
+def test_place_daily():
+    day = np.array(["2024-01-01", "2024-01-02", "2024-07-01", "2024-07-01"], "datetime64[D]")
+    hours = np.array([18, 6, 22, np.nan])
+    np.testing.assert_array_equal(_WINTER.layout.place_daily(day, hours), _WINTER.to_plot(day, hours))
+    x, y = _LEGAL.layout.place_daily(day, hours, "MEZ")
+    np.testing.assert_array_equal(x, [6, 18, 11, np.nan])
+    np.testing.assert_array_equal(y, [0, 0, 182, np.nan])
+    # hours beyond midnight belong to the following day
+    np.testing.assert_array_equal(_WINTER.layout.place_daily(day[:1], [25.5]), ([13.5], [0]))
+
+
+def test_curve():
+    day = np.arange(np.datetime64("2024-01-01"), np.datetime64("2025-01-01"))
+    hours = np.full(len(day), 20.0)
+    x, y = _WINTER.layout.curve(day, hours)
+    assert not np.isnan(x).any()
+    x, y = _LEGAL.layout.curve(day, hours)
+    # broken where the clocks get changed: 21:00 during daylight saving time
+    breaks = np.flatnonzero(np.isnan(x))
+    np.testing.assert_array_equal(breaks, [_SPRING + 1, _AUTUMN + 2])
+    assert x[breaks[0] - 1] == 8
+    assert x[breaks[0] + 1] == 9
+    x, _ = _WINTER.layout.curve(day, hours, months=True)
+    assert np.isnan(x).sum() == 11
+
+
+def test_twilight_boundaries(path_sun_10d: "Path"):
+    grid = compute_solar_altitude_grid(Parser(file_path=path_sun_10d).metadata, 2024, resolution=timedelta(minutes=10))
+    layout = _WINTER.layout
+    (dawn_x, dawn_y), (dusk_x, dusk_y) = layout.twilight_boundaries(grid, TwilightBandEnum.ASTRONOMICAL.lower_altitude)
+    # no astronomical night around the summer solstice
+    assert np.isnan(dusk_x[170:190]).all()
+    # evening crossings after midnight stay with their night
+    assert np.nanmax(dusk_x) > 12
+    assert np.all(np.nan_to_num(np.diff(dusk_y), nan=1) <= 1)
+    assert np.nanmin(dawn_x) > 12
+
+
+def test_to_page():
+    layout = _WINTER.layout
+    x, y = layout.to_page([0, 24], [0, 366])
+    np.testing.assert_allclose(x, [0.08 * 240, 0.96 * 240])
+    np.testing.assert_allclose(y, [(1 - 0.94) * 320, 0.96 * 320])
+    tile = _WINTER.model_copy(update={"viewport": (100, 50, 100, 100)}).layout
+    np.testing.assert_allclose(tile.to_page([0], [0]), ([0.08 * 240 - 100], [(1 - 0.94) * 320 - 50]))
+
+
+def test_render_legal_time(path_complete_10d: "Path"):
+    parser = Parser(file_path=path_complete_10d)
+    grid = compute_solar_altitude_grid(parser.metadata, 2024, resolution=timedelta(minutes=10))
+    layers = [TwilightLayerModel(grid=grid), ObjectLayerModel.from_data(parser.parse()[ObservableObjectEnum.SUN])]
+    winter, legal = Renderer(_WINTER).render(layers), Renderer(_LEGAL).render(layers)
+    top, middle = slice(0, 70), slice(140, 220)  # until mid-march and summer months
+    np.testing.assert_array_equal(winter[top], legal[top])
+    assert (winter[middle] != legal[middle]).any()
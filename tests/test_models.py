@@ -1,10 +1,23 @@
+# standard library
+from datetime import UTC, datetime, timedelta
+
 # third party
 import pytest
 from pydantic_core import ValidationError
 from pydantic_extra_types.color import Color
 
 # first party
-from AstronomicalAnnualCalendar.models import ObservableObjectModel
+from AstronomicalAnnualCalendar.enums import ObservableObjectEnum
+from AstronomicalAnnualCalendar.errors import RowValidationError
+from AstronomicalAnnualCalendar.models import (
+    CoordinateModel,
+    DataModel,
+    ObservableObjectModel,
+    RowModel,
+)
+
+# local
+from .constants import sample_data_metadata_w_equinox
 
 
 def test_oom_internal_id():
@@ -72,3 +85,49 @@ def test_oom_is_moon(oom: ObservableObjectModel, expected: bool):
 )
 def test_oom_is_planet(oom: ObservableObjectModel, expected: bool):
     assert oom.is_planet == expected
+
+
+@pytest.mark.parametrize(
+    "lat, lon, latitude, longitude",
+    [
+        ("53°05' N", "7°25' O", 53 + 5 / 60, 7 + 25 / 60),
+        ("33°27' S", "70°40' W", -(33 + 27 / 60), -(70 + 40 / 60)),
+        ("1°1'1.5\"N", "1°1'1.5\"e", 1 + 1 / 60 + 1.5 / 3600, 1 + 1 / 60 + 1.5 / 3600),
+        ("0° n", "180° E", 0, 180),
+    ],
+)
+def test_coordinate_model_degrees(lat: str, lon: str, latitude: float, longitude: float):
+    coordinate = CoordinateModel(lat=lat, lon=lon)
+    assert coordinate.latitude == pytest.approx(latitude)
+    assert coordinate.longitude == pytest.approx(longitude)
+
+
+def test_data_model_from_raw_rows():
+    sun = ObservableObjectEnum.SUN
+    moment = datetime(2023, 12, 31, 23, tzinfo=UTC)
+    fields = ("date_and_time", "rise", "set")
+    raw = [(moment, "8h44m", "16h23m"), (moment + timedelta(days=1), "8h44m", "16h24m")]
+
+    data = DataModel.from_raw_rows(raw, fields=fields, bound_object=sun, metadata=sample_data_metadata_w_equinox)
+    expected = [RowModel(bound_object=sun, **dict(zip(fields, row, strict=True))) for row in raw]
+    assert data.rows == expected
+    assert data.timezone == "MEZ"
+
+    mappings = [dict(zip(fields, row, strict=True)) for row in raw]
+    assert DataModel.from_raw_rows(mappings, bound_object=sun, metadata=sample_data_metadata_w_equinox) == data
+
+
+def test_data_model_from_raw_rows_errors():
+    sun = ObservableObjectEnum.SUN
+    moment = datetime(2023, 12, 31, 23, tzinfo=UTC)
+    raw = [
+        {"date_and_time": moment, "rise": "8h44m"},
+        {"date_and_time": moment, "rise": "8:44"},
+        {"date_and_time": "yesterday", "rise": "8h44m", "phase": 2},
+    ]
+    with pytest.raises(RowValidationError) as error:
+        DataModel.from_raw_rows(raw, bound_object=sun, metadata=sample_data_metadata_w_equinox)
+    assert list(error.value.errors) == [1, 2]
+    assert error.value.errors[1][0].startswith("rise: ")
+    assert [message.partition(":")[0] for message in error.value.errors[2]] == ["date_and_time", "phase"]
+    assert "2 invalid row(s) for 'sun'" in str(error.value)
@@ -1,12 +1,19 @@
 # standard library
+import io
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
 # third party
+import numpy as np
 import pytest
 
 # first party
+from AstronomicalAnnualCalendar.enums import ObservableObjectEnum
+from AstronomicalAnnualCalendar.errors import MetaDataNotFoundError, SectionNotFoundError
 from AstronomicalAnnualCalendar.models import MetaDataModel
-from AstronomicalAnnualCalendar.parser import Parser
+from AstronomicalAnnualCalendar.parser import Parser, split_sections
+from AstronomicalAnnualCalendar.utils import observable_object_from_alias
 
 # local
 from .constants import sample_data_metadata_w_equinox, sample_data_metadata_wo_equinox
@@ -29,3 +36,120 @@ def test_model_post_init(path_fixture: str, metadata: MetaDataModel, request: py
     parser = Parser(file_path=path)
     assert parser.file == path
     assert parser.metadata == metadata
+
+
+@pytest.mark.parametrize(
+    "path_fixture",
+    [
+        "path_complete_10d",
+        "path_sun_moon_mercury_10d_everything",
+    ],
+)
+def test_read_section(path_fixture: str, request: pytest.FixtureRequest):
+    path: Path = request.getfixturevalue(path_fixture)
+    parser = Parser(file_path=path)
+    sections = list(parser._iter_observable_objects())  # noqa: SLF001
+    for observable_object, header, body in sections:
+        assert parser.read_section(observable_object) == (header, body)
+    only = [section[0] for section in reversed(sections)]
+    assert list(parser._iter_observable_objects(only=only)) == sections[::-1]  # noqa: SLF001
+
+
+@pytest.mark.parametrize(
+    "path_fixture, objects, rows",
+    [
+        ("path_complete_10d", 9, 38),
+        ("path_neptune_1d", 1, 367),
+        ("path_sun_moon_mercury_10d_everything", 3, 38),
+    ],
+)
+def test_parse(path_fixture: str, objects: int, rows: int, request: pytest.FixtureRequest):
+    path: Path = request.getfixturevalue(path_fixture)
+    parser = Parser(file_path=path)
+    parsed = parser.parse()
+    assert len(parsed) == objects
+    for observable_object, data in parsed.items():
+        assert data.bound_object == observable_object
+        assert data.metadata == parser.metadata
+        assert len(data.rows) == rows
+        assert data.rows[0].date_and_time == datetime(2023, 12, 31, 23, tzinfo=UTC)
+        assert data.date_and_time[0] == np.datetime64("2023-12-31T23:00")
+        assert data.local_date_and_time[0] == np.datetime64("2024-01-01T00:00")
+
+
+@pytest.mark.parametrize(
+    "path_fixture",
+    [
+        "path_complete_10d",
+        "path_neptune_1d",
+        "path_sun_moon_mercury_10d_everything",
+    ],
+)
+def test_split_sections(path_fixture: str, request: pytest.FixtureRequest):
+    path: Path = request.getfixturevalue(path_fixture)
+    expected = [
+        (observable_object.name, header, body)
+        for observable_object, header, body in Parser(file_path=path)._iter_observable_objects()  # noqa: SLF001
+    ]
+    sections = split_sections(path.read_text("utf-8").splitlines())
+    assert [(observable_object_from_alias(name).name, header, body) for name, header, body in sections] == expected
+
+
+def test_from_stream(path_sun_moon_mercury_10d_everything: "Path"):
+    path = path_sun_moon_mercury_10d_everything
+    expected = Parser(file_path=path)
+    content = path.read_bytes()
+    for parser in (
+        Parser.from_bytes(content),
+        Parser.from_bytes(content.decode("utf-8")),
+        Parser.from_stream(io.BytesIO(content.replace(b"\n", b"\r\n"))),
+        Parser.from_stream(io.TextIOWrapper(io.BytesIO(content), encoding="utf-8")),
+    ):
+        assert parser.file is None
+        assert parser.metadata == expected.metadata
+        assert parser.parse() == expected.parse()
+        assert parser.parse([ObservableObjectEnum.MOON]) == expected.parse([ObservableObjectEnum.MOON])
+        with pytest.raises(SectionNotFoundError):
+            parser.read_section(ObservableObjectEnum.NEPTUNE)
+
+
+@pytest.mark.parametrize(
+    ("content", "message"),
+    [
+        (b"", "empty"),
+        (b"Sonne\nDatum  Zeit\n", "'Sonne'"),
+    ],
+)
+def test_from_stream_without_metadata(content: bytes, message: str):
+    with pytest.raises(MetaDataNotFoundError, match=message):
+        Parser.from_bytes(content)
+
+
+def test_from_stdin(path_sun_10d: "Path", monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(path_sun_10d.read_bytes())))
+    assert Parser.from_stdin().parse() == Parser(file_path=path_sun_10d).parse()
+
+
+@pytest.mark.parametrize("executor_type", [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_parse_with_executor(executor_type: type, path_complete_10d: "Path"):
+    parser = Parser(file_path=path_complete_10d)
+    expected = parser.parse()
+    with executor_type(max_workers=2) as executor:
+        parsed = parser.parse(executor=executor)
+        assert list(parsed) == list(expected)
+        assert parsed == expected
+        only = [ObservableObjectEnum.MARS, ObservableObjectEnum.SUN]
+        assert list(parser.parse(only, executor=executor)) == only
+
+
+def test_concurrent_parsers(path_complete_10d: "Path"):
+    expected = Parser(file_path=path_complete_10d).parse()
+
+    def parse(_: int) -> dict:
+        parser = Parser(file_path=path_complete_10d)
+        return {"metadata": parser.metadata, "parsed": parser.parse([ObservableObjectEnum.MOON])}
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(parse, range(32)))
+    assert all(result["metadata"] == expected[ObservableObjectEnum.MOON].metadata for result in results)
+    assert all(result["parsed"][ObservableObjectEnum.MOON] == expected[ObservableObjectEnum.MOON] for result in results)
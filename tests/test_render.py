@@ -0,0 +1,119 @@
+# standard library
+from typing import TYPE_CHECKING
+
+# third party
+import numpy as np
+import pytest
+from pydantic_extra_types.color import Color
+
+# first party
+from AstronomicalAnnualCalendar.enums import ObservableObjectEnum
+from AstronomicalAnnualCalendar.parser import Parser
+from AstronomicalAnnualCalendar.render import (
+    CALENDAR_GRID_RESOLUTION,
+    AnnotationLayerModel,
+    BackgroundLayerModel,
+    CanvasModel,
+    LayerCache,
+    ObjectLayerModel,
+    RasterModel,
+    Renderer,
+    TwilightLayerModel,
+    calendar_layers,
+    composite,
+)
+
+
+if TYPE_CHECKING:
+    # standard library
+    from pathlib import Path
+
+    # first party
+    from AstronomicalAnnualCalendar.render import LayerModel
+
+
+def test_composite():
+    bottom = np.zeros((1, 3, 4), dtype=np.uint8)
+    bottom[..., 0], bottom[..., 3] = 200, 255
+    top = np.zeros((1, 3, 4), dtype=np.uint8)
+    top[0, 0] = 0, 0, 255, 128
+    top[0, 1] = 0, 255, 0, 255
+
+    result = composite([RasterModel.from_image(bottom), RasterModel.from_image(top)])
+    np.testing.assert_array_equal(result[0], [[100, 0, 128, 255], [0, 255, 0, 255], [200, 0, 0, 255]])
+    with pytest.raises(ValueError, match="nothing"):
+        composite([])
+
+
+def test_canvas_to_plot(canvas: CanvasModel):
+    day = np.array(["2024-01-01", "2024-01-02", "2024-01-02"], "datetime64[D]")
+    x, y = canvas.to_plot(day, np.array([18, 6, np.nan]))
+    np.testing.assert_array_equal(x, [6, 18, np.nan])
+    np.testing.assert_array_equal(y, [0, 0, 1])
+
+
+def test_render(canvas: CanvasModel, layers: list["LayerModel"]):
+    renderer = Renderer(canvas)
+    image = renderer.render(layers)
+
+    assert image.shape == (320, 240, 4)
+    assert image.dtype == np.uint8
+    assert (image[..., 3] == 255).all()  # opaque thanks to the background
+    assert renderer.cache.misses == len(layers)
+    np.testing.assert_array_equal(renderer.render(layers), image)
+    assert renderer.cache.hits == len(layers)
+
+
+def test_render_only_changed_layer(canvas: CanvasModel, layers: list["LayerModel"]):
+    renderer = Renderer(canvas)
+    image = renderer.render(layers)
+    index, layer = next(
+        (index, layer)
+        for index, layer in enumerate(layers)
+        if isinstance(layer, ObjectLayerModel) and layer.bound_object == ObservableObjectEnum.MARS
+    )
+    restyled = layer.model_copy(
+        update={"bound_object": layer.bound_object.model_copy(update={"line_color": Color("lime")})}
+    )
+    assert restyled.cache_key(canvas) != layer.cache_key(canvas)
+
+    changed = renderer.render([*layers[:index], restyled, *layers[index + 1 :]])
+    assert renderer.cache.misses == len(layers) + 1
+    assert renderer.cache.hits == len(layers) - 1
+    assert (changed != image).any()
+
+
+def test_layer_cache_lru(canvas: CanvasModel, layers: list["LayerModel"]):
+    annotation, background, twilight = layers[:3]
+    # room for the background and the annotations only
+    cache = LayerCache(max_bytes=background.rasterize(canvas).nbytes + annotation.rasterize(canvas).nbytes)
+    cache.get_or_render(background, canvas)
+    cache.get_or_render(twilight, canvas)
+    cache.get_or_render(background, canvas)  # background is the most recently used now
+    cache.get_or_render(annotation, canvas)
+
+    assert len(cache) == 2
+    assert background.cache_key(canvas) in cache
+    assert twilight.cache_key(canvas) not in cache
+    assert cache.size <= cache.max_bytes
+    cache.clear()
+    assert len(cache) == cache.size == 0
+
+
+def test_save(canvas: CanvasModel, layers: list["LayerModel"], tmp_path: "Path"):
+    path = tmp_path / "calendar.png"
+    Renderer(canvas).save(layers, path)
+    assert path.read_bytes().startswith(b"\x89PNG")
+
+
+def test_calendar_layers(path_complete_10d: "Path"):
+    parser = Parser(file_path=path_complete_10d)
+    layers = calendar_layers(parser.metadata, parser.parse().values(), 2024)
+    assert [type(layer) for layer in layers] == [
+        BackgroundLayerModel,
+        TwilightLayerModel,
+        *[ObjectLayerModel] * 9,
+        AnnotationLayerModel,
+    ]
+    assert layers[1].grid.resolution == CALENDAR_GRID_RESOLUTION
+    assert layers[-1].title == "Papenburg 2024"
@@ -0,0 +1,99 @@
+# standard library
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+# third party
+import numpy as np
+import pytest
+
+# first party
+from AstronomicalAnnualCalendar import resample as resample_module
+from AstronomicalAnnualCalendar.columns import decode_rows
+from AstronomicalAnnualCalendar.enums import ObservableObjectEnum
+from AstronomicalAnnualCalendar.errors import ResamplingNotSupportedError
+from AstronomicalAnnualCalendar.parser import Parser
+from AstronomicalAnnualCalendar.resample import resample, resampling_errors
+
+
+if TYPE_CHECKING:
+    # standard library
+    from pathlib import Path
+
+
+# deviation in minutes; the daily export carries jumps of several minutes itself
+_MEDIAN_TOLERANCE: float = 1
+_MAX_TOLERANCE: float = 5
+
+
+@pytest.mark.parametrize("method", ["hermite", "cubic"])
+def test_resample_against_daily_export(path_neptune_10d: "Path", path_neptune_1d: "Path", method: str):
+    (coarse,) = Parser(file_path=path_neptune_10d).parse().values()
+    (daily,) = Parser(file_path=path_neptune_1d).parse().values()
+    resampled = resample(coarse, timedelta(days=1), method=method)  # type: ignore
+
+    assert resampled.bound_object == coarse.bound_object
+    assert resampled.metadata == coarse.metadata
+    np.testing.assert_array_equal(resampled.date_and_time[: len(daily.rows)], daily.date_and_time)
+    expected = decode_rows(daily.rows)
+    actual = decode_rows(resampled.rows[: len(daily.rows)])
+    assert actual.keys() == expected.keys()
+    for field in expected:
+        difference = np.abs((actual[field] - expected[field] + 12) % 24 - 12) * 60
+        assert np.median(difference) <= _MEDIAN_TOLERANCE, field
+        assert difference.max() <= _MAX_TOLERANCE, field
+
+
+def test_resample_wrapping_columns(path_sun_moon_mercury_10d_everything: "Path"):
+    parsed = Parser(file_path=path_sun_moon_mercury_10d_everything).parse()
+    data = parsed[ObservableObjectEnum.MERCURY]
+    resampled = decode_rows(resample(data, timedelta(days=5)).rows)
+
+    assert len(resampled["right_ascension"]) == 2 * len(data.rows) - 1
+    assert ((resampled["right_ascension"] >= 0) & (resampled["right_ascension"] < 24)).all()
+    assert ((resampled["ecliptic_longitude"] >= 0) & (resampled["ecliptic_longitude"] < 360)).all()
+    assert (np.abs(resampled["elongation"]) <= 180).all()
+    # the nodes are reproduced
+    np.testing.assert_allclose(resampled["declination"][::2], decode_rows(data.rows)["declination"], atol=1 / 3600)
+
+
+def test_resample_refuses_moon(path_sun_moon_mercury_10d_everything: "Path"):
+    parsed = Parser(file_path=path_sun_moon_mercury_10d_everything).parse()
+    with pytest.raises(ResamplingNotSupportedError, match="moon"):
+        resample(parsed[ObservableObjectEnum.MOON])
+    with pytest.raises(ResamplingNotSupportedError, match="moon"):
+        resampling_errors(parsed[ObservableObjectEnum.MOON])
+
+
+def test_resampling_errors(path_sun_moon_mercury_10d_everything: "Path"):
+    parsed = Parser(file_path=path_sun_moon_mercury_10d_everything).parse()
+    sun = resampling_errors(parsed[ObservableObjectEnum.SUN])
+    mercury = resampling_errors(parsed[ObservableObjectEnum.MERCURY])
+
+    assert sun.keys() >= {"right_ascension", "declination", "rise", "dawn"}
+    assert sun["right_ascension"] < 0.001  # hours
+    assert sun["declination"] < 0.05  # degrees
+    # mercury moves much more irregularly than the sun
+    assert mercury["ecliptic_longitude"] > 10 * sun["ecliptic_longitude"]
+
+
+def test_cubic_spline():
+    rng = np.random.default_rng(0)
+    x = np.cumsum(rng.uniform(0.5, 1.5, 200))
+    y = np.sin(x / 10)
+    at = np.linspace(x[0], x[-1], 1000)
+    spline = resample_module._cubic(x, y, at)  # noqa: SLF001
+
+    # reference: the moments of a natural spline from the dense system
+    h = np.diff(x)
+    system = np.diag(np.r_[1, 2 * (h[:-1] + h[1:]), 1]) + np.diag(np.r_[0, h[1:]], 1) + np.diag(np.r_[h[:-1], 0], -1)
+    rhs = np.r_[0, 6 * (np.diff(y[1:]) / h[1:] - np.diff(y[:-1]) / h[:-1]), 0]
+    moments = np.linalg.solve(system, rhs)
+    index = np.clip(np.searchsorted(x, at, side="right") - 1, 0, len(x) - 2)
+    a, b, h = x[index + 1] - at, at - x[index], h[index]
+    expected = (
+        (moments[index] * a**3 + moments[index + 1] * b**3) / (6 * h)
+        + (y[index] / h - moments[index] * h / 6) * a
+        + (y[index + 1] / h - moments[index + 1] * h / 6) * b
+    )
+    np.testing.assert_allclose(spline, expected, atol=1e-12)
+    np.testing.assert_allclose(spline, np.sin(at / 10), atol=1e-3)
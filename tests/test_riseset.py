@@ -0,0 +1,102 @@
+# standard library
+from typing import TYPE_CHECKING
+
+# third party
+import numpy as np
+import pytest
+
+# first party
+from AstronomicalAnnualCalendar.columns import COLUMN_DECODERS, extract_columns
+from AstronomicalAnnualCalendar.enums import ObservableObjectEnum
+from AstronomicalAnnualCalendar.ephemeris import compute_ephemeris
+from AstronomicalAnnualCalendar.models import CoordinateModel
+from AstronomicalAnnualCalendar.parser import Parser
+from AstronomicalAnnualCalendar.riseset import solve_rise_set
+
+
+if TYPE_CHECKING:
+    # standard library
+    from pathlib import Path
+
+
+_DATE_AND_TIME: np.ndarray = np.arange(
+    np.datetime64("2023-12-30"), np.datetime64("2025-01-03"), np.timedelta64(1, "h")
+).astype("datetime64[ns]")
+
+# maximum deviation in minutes; the export's planet events carry jumps of several minutes themselves
+_TOLERANCES: dict[str, dict[str, float]] = {
+    "sun": {"rise": 1.5, "culmination": 1.5, "set": 1.5},
+    "moon": {"rise": 1.5, "culmination": 7.5, "set": 1.5},
+}
+_PLANET_TOLERANCE: float = 20
+
+
+def test_solve_rise_set_against_sample_data(path_complete_10d: "Path"):
+    parser = Parser(file_path=path_complete_10d)
+    for observable_object, header, body in parser._iter_observable_objects():  # noqa: SLF001
+        columns = extract_columns(observable_object, header, body)
+        ephemeris = compute_ephemeris(observable_object, _DATE_AND_TIME, delta_t=parser.metadata.delta_t, equinox=None)
+        events = solve_rise_set(
+            observable_object,
+            _DATE_AND_TIME,
+            ephemeris.right_ascension,
+            ephemeris.declination,
+            parser.metadata.coordinate,
+            year=2024,
+        )
+
+        days = np.array(["-".join(date.split(".")[::-1]) for date in columns["date"]], "datetime64[D]")
+        index = (days - events.day[0]).astype(np.intp)
+        index = index[index < len(events.day)]
+        for field in ("rise", "culmination", "set"):
+            expected = COLUMN_DECODERS[field](columns[field])[: len(index)]
+            actual = getattr(events, field)[index]
+            tolerance = _TOLERANCES.get(observable_object.name, {}).get(field, _PLANET_TOLERANCE)
+            assert (np.isnan(actual) == np.isnan(expected)).mean() > 0.9, field
+            assert np.nanmax(np.abs(actual - expected)) * 60 < tolerance, field
+
+
+def test_solve_rise_set_circumpolar():
+    ephemeris = compute_ephemeris(ObservableObjectEnum.SUN, _DATE_AND_TIME, equinox=None)
+    events = solve_rise_set(
+        ObservableObjectEnum.SUN,
+        _DATE_AND_TIME,
+        ephemeris.right_ascension,
+        ephemeris.declination,
+        CoordinateModel(lat="78°13' N", lon="15°39' O"),  # Longyearbyen
+        year=2024,
+    )
+    midsummer, midwinter = (np.array(["2024-06-21", "2024-12-21"], "datetime64[D]") - events.day[0]).astype(np.intp)
+    for day in (midsummer, midwinter):
+        assert np.isnan(events.rise[day])
+        assert np.isnan(events.set[day])
+        assert np.isnan(events.azimut_rise[day])
+    assert not np.isnan(events.culmination[midsummer])
+
+
+@pytest.mark.parametrize("locations", [1, 7])
+def test_solve_rise_set_many_locations(locations: int):
+    ephemeris = compute_ephemeris(ObservableObjectEnum.SUN, _DATE_AND_TIME, equinox=None)
+    coordinates = [CoordinateModel(lat=f"{40 + i}° N", lon=f"{i}° E") for i in range(locations)]
+    events = solve_rise_set(
+        ObservableObjectEnum.SUN,
+        _DATE_AND_TIME,
+        ephemeris.right_ascension,
+        ephemeris.declination,
+        coordinates,
+        year=2024,
+    )
+    single = solve_rise_set(
+        ObservableObjectEnum.SUN,
+        _DATE_AND_TIME,
+        ephemeris.right_ascension,
+        ephemeris.declination,
+        coordinates[-1],
+        year=2024,
+    )
+
+    assert events.rise.shape == (locations, 366)
+    assert single.rise.shape == (366,)
+    np.testing.assert_allclose(events.rise[-1], single.rise)
+    np.testing.assert_allclose(events.azimut_set[-1], single.azimut_set)
+    assert ((events.rise < events.culmination) & (events.culmination < events.set)).all()
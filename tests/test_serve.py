@@ -0,0 +1,165 @@
+# standard library
+import json
+import os
+import shutil
+import time
+from collections.abc import Iterator
+from http.client import HTTPConnection
+from threading import Thread
+from typing import TYPE_CHECKING
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+# third party
+import pytest
+
+# first party
+from AstronomicalAnnualCalendar.serve import CalendarServer, DatasetCache, LRUCache
+
+
+if TYPE_CHECKING:
+    # standard library
+    from http.client import HTTPResponse
+    from pathlib import Path
+
+
+@pytest.fixture
+def server(path_sun_10d: "Path", path_neptune_10d: "Path", tmp_path: "Path") -> Iterator[CalendarServer]:
+    for path in (path_sun_10d, path_neptune_10d):
+        shutil.copy(path, tmp_path / path.name)
+    server = CalendarServer(("127.0.0.1", 0), tmp_path, workers=2)
+    server.RequestHandlerClass.log_message = lambda *args: None
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def _get(server: CalendarServer, path: str, **headers: str) -> "HTTPResponse":
+    host, port = server.server_address[:2]
+    return urlopen(Request(f"http://{host}:{port}{path}", headers=headers), timeout=30)
+
+
+def test_lru_cache():
+    cache: LRUCache[str, int] = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)  # evicts "b", the least recently used
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    assert (cache.hits, cache.misses, len(cache)) == (3, 1, 2)
+
+
+def test_dataset_cache(path_sun_10d: "Path", tmp_path: "Path"):
+    path = shutil.copy(path_sun_10d, tmp_path / path_sun_10d.name)
+    cache = DatasetCache(4)
+    first = cache.load(path)
+    assert cache.load(path) is first
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    second = cache.load(path)
+    assert second is not first and second.etag != first.etag
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_files(server: CalendarServer):
+    with _get(server, "/files") as response:
+        files = json.load(response)["files"]
+    assert [file["name"] for file in files] == ["neptune-10d.txt", "sun-10d.txt"]
+
+    with _get(server, "/files/sun-10d.txt") as response:
+        description = json.load(response)
+    assert description["objects"] == {"sun": {"rows": 38, "timezone": "MEZ"}}
+
+
+def test_columns(server: CalendarServer):
+    with _get(server, "/files/sun-10d.txt/Sonne?fields=rise,set&start=2024-03-01&stop=2024-04-01") as response:
+        columns = json.load(response)
+    assert columns["object"] == "sun"
+    assert len(columns["date_and_time"]) == 3
+    assert set(columns["columns"]) == {"rise", "set"}
+    assert all(6 < value < 8 for value in columns["columns"]["rise"])
+
+
+def test_conditional_requests(server: CalendarServer):
+    with _get(server, "/files/neptune-10d.txt/neptune") as response:
+        etag = response.headers["ETag"]
+    with pytest.raises(HTTPError) as error:
+        _get(server, "/files/neptune-10d.txt/neptune", **{"If-None-Match": etag})
+    assert error.value.code == 304
+    with _get(server, "/files/neptune-10d.txt/neptune?fields=rise") as response:
+        assert response.headers["ETag"] != etag
+    assert server.datasets.misses == 1  # parsed once, the 304 didn't even look up the dataset
+
+
+def test_idle_connections(server: CalendarServer):
+    server.idle_timeout = 0.5
+    host, port = server.server_address[:2]
+    idle = [HTTPConnection(host, port, timeout=30) for _ in range(2)]  # as many as there are workers
+    try:
+        for connection in idle:
+            connection.request("GET", "/files")
+            response = connection.getresponse()
+            assert response.getheader("Connection") != "close"
+            response.read()
+        # the kept-alive connections get closed, the next client gets a worker
+        start = time.monotonic()
+        with _get(server, "/files") as response:
+            assert response.status == 200
+        assert time.monotonic() - start < 5
+    finally:
+        for connection in idle:
+            connection.close()
+
+
+def test_render(server: CalendarServer):
+    path = "/files/sun-10d.txt/calendar.png?width=120&height=160&dpi=20"
+    with _get(server, path) as response:
+        assert response.headers["Content-Type"] == "image/png"
+        image = response.read()
+    assert image.startswith(b"\x89PNG")
+    with _get(server, path) as response:
+        assert response.read() == image
+    assert (server.renders.hits, server.renders.misses) == (1, 1)
+
+    with _get(server, path.replace("calendar.png", "calendar.svg")) as response:
+        assert response.headers["Content-Type"] == "image/svg+xml"
+        assert response.read().startswith(b"<svg")
+
+
+@pytest.mark.parametrize(
+    ("path", "status"),
+    [
+        ("/files/missing.txt", 404),
+        ("/files/..%2Fsecret.txt", 404),
+        ("/files/sun-10d.txt/moon", 404),
+        ("/files/sun-10d.txt/pluto", 404),
+        ("/files/sun-10d.txt/sun?fields=nothing", 400),
+        ("/files/sun-10d.txt/calendar.png?width=wide", 400),
+        ("/files/sun-10d.txt/calendar.png?width=100000&height=100000", 400),
+        ("/files/sun-10d.txt/calendar.svg?dpi=0", 400),
+        ("/files/sun-10d.txt/calendar.png?year=2024.5", 400),
+        ("/elsewhere", 404),
+    ],
+)
+def test_errors(server: CalendarServer, path: str, status: int):
+    with pytest.raises(HTTPError) as error:
+        _get(server, path)
+    assert error.value.code == status
+    assert "error" in json.load(error.value)
+
+
+def test_unexpected_error(server: CalendarServer, monkeypatch: pytest.MonkeyPatch):
+    def fail(*args: object) -> None:
+        raise RuntimeError
+
+    monkeypatch.setattr(server.RequestHandlerClass, "_list_files", fail)
+    with pytest.raises(HTTPError) as error:
+        _get(server, "/files")
+    assert error.value.code == 500
+    assert json.load(error.value) == {"error": "internal server error"}
+    with _get(server, "/files/sun-10d.txt") as response:  # the server keeps going
+        assert response.status == 200
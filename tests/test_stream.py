@@ -0,0 +1,89 @@
+# standard library
+import re
+from datetime import date
+from typing import TYPE_CHECKING
+
+# third party
+import numpy as np
+from matplotlib.image import imread
+
+# first party
+from AstronomicalAnnualCalendar.render import (
+    CanvasModel,
+    ObjectLayerModel,
+    TwilightLayerModel,
+)
+from AstronomicalAnnualCalendar.stream import (
+    month_pages,
+    render_page,
+    sliced_layers,
+    tile_pages,
+    write_pdf,
+    write_tiles,
+)
+
+
+if TYPE_CHECKING:
+    # standard library
+    from pathlib import Path
+
+    # first party
+    from AstronomicalAnnualCalendar.render import LayerModel
+
+
+def test_month_pages(canvas: CanvasModel):
+    pages = list(month_pages(canvas))
+    assert len(pages) == 12
+    assert pages[0].start == date(2024, 1, 1) and pages[0].stop == date(2024, 2, 1)
+    assert pages[1].days.size == 29
+    assert sum(page.days.size for page in pages) == canvas.days.size
+
+
+def test_tile_pages(canvas: CanvasModel):
+    tiles = list(tile_pages(canvas, 2, 3))
+    assert [(row, column) for row, column, _ in tiles] == [(row, column) for row in range(2) for column in range(3)]
+    assert sum(tile.size[0] for _, _, tile in tiles[:3]) == canvas.width
+    assert sum(tile.size[1] for _, column, tile in tiles if column == 0) == canvas.height
+    # the top tiles show the first half of the year only
+    assert tiles[0][2].visible_days[0] == np.datetime64("2024-01-01")
+    assert tiles[0][2].visible_days[-1] < np.datetime64("2024-08-01")
+
+
+def test_sliced_layers(canvas: CanvasModel, layers: list["LayerModel"]):
+    page = next(month_pages(canvas))
+    sliced = list(sliced_layers(layers)(page))
+    assert len(sliced) == len(layers)
+    for layer in sliced:
+        if isinstance(layer, ObjectLayerModel):
+            assert layer.day.min() >= np.datetime64("2024-01-01") and layer.day.max() <= np.datetime64("2024-02-01")
+        elif isinstance(layer, TwilightLayerModel):
+            assert layer.grid.day.size == 32  # the morning of the last night is on the 1st of february
+
+
+def test_write_pdf(canvas: CanvasModel, layers: list["LayerModel"], tmp_path: "Path"):
+    pages: list[CanvasModel] = []
+    provider = sliced_layers(layers)
+
+    def layers_for(canvas: CanvasModel) -> list["LayerModel"]:
+        pages.append(canvas)
+        return list(provider(canvas))
+
+    path = tmp_path / "calendar.pdf"
+    assert write_pdf(path, month_pages(canvas), layers_for) == 12
+    assert len(pages) == 12  # one call per page
+    content = path.read_bytes()
+    assert content.startswith(b"%PDF")
+    assert len(re.findall(rb"/Type /Page\b", content)) == 12
+
+
+def test_write_tiles(canvas: CanvasModel, layers: list["LayerModel"], tmp_path: "Path"):
+    # dash patterns restart per tile, so compare without the objects' lines
+    layers = [layer for layer in layers if not isinstance(layer, ObjectLayerModel)]
+    paths = write_tiles(tmp_path, canvas, sliced_layers(layers), rows=2, columns=3, stem="poster")
+    assert [path.name for path in paths[:2]] == ["poster_r0_c0.png", "poster_r0_c1.png"]
+
+    tiles = [np.round(imread(path) * 255).astype(np.uint8) for path in paths]
+    stitched = np.concatenate([np.concatenate(tiles[row * 3 : (row + 1) * 3], axis=1) for row in range(2)])
+    full = render_page(canvas, layers)
+    assert stitched.shape == full.shape
+    assert np.abs(stitched.astype(int) - full).mean() < 0.5
@@ -0,0 +1,102 @@
+# standard library
+import re
+from typing import TYPE_CHECKING, Any
+from xml.etree import ElementTree
+
+# third party
+import numpy as np
+import pytest
+
+# first party
+from AstronomicalAnnualCalendar.enums import ObservableObjectEnum
+from AstronomicalAnnualCalendar.errors import LayerNotSupportedError
+from AstronomicalAnnualCalendar.layout import CanvasModel
+from AstronomicalAnnualCalendar.parser import Parser
+from AstronomicalAnnualCalendar.render import (
+    AnnotationLayerModel,
+    BackgroundLayerModel,
+    LayerModel,
+    ObjectLayerModel,
+)
+from AstronomicalAnnualCalendar.svg import path_data, render_svg, write_svg
+
+
+if TYPE_CHECKING:
+    # standard library
+    from pathlib import Path
+
+    # third party
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
+
+_NAMESPACE: dict[str, str] = {"svg": "http://www.w3.org/2000/svg"}
+
+
+def _vertices(d: str) -> list[list[tuple[float, float]]]:
+    """Split the ``d``-attribute of a ``<path>`` of ``path_data`` into its parts."""
+    parts: list[list[tuple[float, float]]] = []
+    for command, x, y in re.findall(r"([ML])([-\d.]+) ([-\d.]+)", d):
+        if command == "M":
+            parts.append([])
+        parts[-1].append((float(x), float(y)))
+    return parts
+
+
+def test_path_data():
+    assert path_data([1, 2, np.nan, 3.333, 4], [5, 6, 7, np.nan, 8.5]) == "M1 5L2 6M4 8.5"
+    assert path_data([], []) == ""
+
+
+def test_render_svg(canvas: CanvasModel, layers: list[LayerModel]):
+    layers = [AnnotationLayerModel(title="Papenburg <2024> & more"), *layers[1:]]
+    root = ElementTree.fromstring(render_svg(canvas, layers))  # noqa: S314
+    assert (root.get("width"), root.get("height")) == ("240", "320")
+    # drawn in the order of the layers' z
+    assert root[1].tag == "{http://www.w3.org/2000/svg}rect"
+    objects = [group for group in root.findall("svg:g", _NAMESPACE) if group.get("stroke")]
+    assert len(objects) == sum(isinstance(layer, ObjectLayerModel) for layer in layers)
+    # a single path per curve of an object, in its style
+    sun = next(group for group in objects if group.get("stroke") == "#ffa500")
+    assert len(sun.findall("svg:path", _NAMESPACE)) == 3
+    assert [path.get("stroke-dasharray") for path in sun] == [None, "2.22 3.67", "8.22 3.56"]
+    texts = [text.text for text in root.iter("{http://www.w3.org/2000/svg}text")]
+    assert "Papenburg <2024> & more" in texts
+    assert {"Jan", "Dec", "12h"} <= set(texts)
+
+
+def test_object_matches_matplotlib(canvas: CanvasModel, path_complete_10d: "Path"):
+    layer = ObjectLayerModel.from_data(Parser(file_path=path_complete_10d).parse()[ObservableObjectEnum.MOON])
+    legal = canvas.model_copy(update={"timezone": "MESZ"})
+    figure, axes = legal.new_figure()
+    layer.draw(figure, axes, legal)
+    figure.canvas.draw()
+    group = ElementTree.fromstring(render_svg(legal, [layer])).find("svg:g", _NAMESPACE)  # noqa: S314
+    assert group is not None
+    assert float(group.get("stroke-width", 0)) == pytest.approx(layer.bound_object.line_strength * 40 / 72, abs=0.01)
+    for line, path in zip(axes.lines, group, strict=True):
+        display = axes.transData.transform(line.get_xydata())
+        parts = np.split(display, np.flatnonzero(np.isnan(display[:, 0])))
+        expected = [points for part in parts if len(points := part[~np.isnan(part[:, 0])])]
+        drawn = _vertices(path.get("d", ""))
+        assert len(drawn) == len(expected)
+        for vertices, points in zip(drawn, expected, strict=True):
+            np.testing.assert_allclose(vertices, np.column_stack([points[:, 0], 320 - points[:, 1]]), atol=0.01)
+
+
+def test_write_svg(canvas: CanvasModel, tmp_path: "Path"):
+    path = tmp_path / "calendar.svg"
+    write_svg(path, canvas, [BackgroundLayerModel(), AnnotationLayerModel()])
+    assert path.read_text("utf-8") == render_svg(canvas, [BackgroundLayerModel(), AnnotationLayerModel()])
+
+
+def test_unsupported_layer(canvas: CanvasModel):
+    class MarkerLayerModel(LayerModel):
+        def _key_parts(self) -> tuple[Any, ...]:
+            return ()
+
+        def draw(self, figure: "Figure", axes: "Axes", canvas: CanvasModel) -> None:
+            pass
+
+    with pytest.raises(LayerNotSupportedError, match="MarkerLayerModel"):
+        render_svg(canvas, [MarkerLayerModel()])
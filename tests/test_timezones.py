@@ -0,0 +1,48 @@
+# standard library
+from datetime import UTC, datetime
+from zoneinfo import ZoneInfo
+
+# third party
+import numpy as np
+import pytest
+
+# first party
+from AstronomicalAnnualCalendar.timezones import local_to_utc, transition_table, utc_to_local
+
+
+def test_transition_table():
+    starts, offsets = transition_table("MESZ", 2024)
+    np.testing.assert_array_equal(
+        starts, np.array(["2024-01-01T00:00", "2024-03-31T01:00", "2024-10-27T01:00"], "datetime64[s]")
+    )
+    np.testing.assert_array_equal(offsets, np.array([1, 2, 1], "timedelta64[h]"))
+    assert transition_table("MESZ", 2024) is transition_table("MESZ", 2024)
+    assert len(transition_table("MEZ", 2024)[0]) == len(transition_table("UTC", 2024)[0]) == 1
+
+
+@pytest.mark.parametrize(
+    "local",
+    [
+        # around the switches (including the non-existent and the ambiguous hour) and the turn of the year
+        ["2024-03-31T01:59", "2024-03-31T02:30", "2024-03-31T03:00", "2024-07-01T12:00"],
+        ["2024-10-27T01:59", "2024-10-27T02:30", "2024-10-27T03:00", "2024-12-31T23:59"],
+        ["2023-12-31T23:30", "2024-01-01T00:30", "2025-01-01T00:30"],
+    ],
+)
+def test_local_to_utc_matches_zoneinfo(local: list[str]):
+    zone = ZoneInfo("Europe/Berlin")
+    expected = np.array(
+        [datetime.fromisoformat(moment).replace(tzinfo=zone).astimezone(UTC).replace(tzinfo=None) for moment in local],
+        "datetime64[ns]",
+    )
+    utc = local_to_utc(np.array(local, "datetime64[ns]"), "MESZ")
+    np.testing.assert_array_equal(utc, expected)
+
+
+def test_utc_to_local_round_trip():
+    utc = np.arange(np.datetime64("2024-01-01"), np.datetime64("2025-01-01"), np.timedelta64(15, "m"))
+    local = utc_to_local(utc, "MESZ")
+    # the ambiguous hour resolves to its first occurrence, hence the round trip through the local time
+    np.testing.assert_array_equal(utc_to_local(local_to_utc(local, "MESZ"), "MESZ"), local)
+    assert len(np.unique(local)) == len(local) - 4
+    np.testing.assert_array_equal(utc_to_local(utc, "MEZ") - utc, np.timedelta64(1, "h"))
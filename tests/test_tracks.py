@@ -0,0 +1,131 @@
+# standard library
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+# third party
+import numpy as np
+import pytest
+
+# first party
+from AstronomicalAnnualCalendar.columns import decode_rows
+from AstronomicalAnnualCalendar.enums import ObservableObjectEnum
+from AstronomicalAnnualCalendar.parser import Parser
+from AstronomicalAnnualCalendar.riseset import standard_altitude
+from AstronomicalAnnualCalendar.tracks import (
+    ALTITUDE_QUANTUM,
+    AZIMUTH_QUANTUM,
+    compute_tracks,
+    iter_tracks,
+    whats_up,
+)
+from AstronomicalAnnualCalendar.transforms import horizontal_coordinates
+
+
+if TYPE_CHECKING:
+    # standard library
+    from pathlib import Path
+
+
+def test_tracks_at_rows(path_sun_moon_mercury_10d_everything: "Path"):
+    data = Parser(file_path=path_sun_moon_mercury_10d_everything).parse()
+    mercury = data[ObservableObjectEnum.MERCURY]
+    nights = mercury.local_date_and_time.astype("datetime64[D]")[:-1] - np.timedelta64(1, "D")
+    track = compute_tracks([mercury], nights)[ObservableObjectEnum.MERCURY]
+    assert track.altitude.shape == (len(nights), 1440)
+    assert track.altitude.dtype == np.float32
+
+    # the rows are at local midnight, the end of the night before
+    altitude, azimuth = track.at(24)
+    expected_altitude, expected_azimuth = horizontal_coordinates(mercury)
+    np.testing.assert_allclose(altitude, expected_altitude[:-1], atol=1e-3)
+    np.testing.assert_allclose(azimuth, expected_azimuth[:-1], atol=1e-3)
+
+
+def test_tracks_against_rise_and_set(path_sun_moon_mercury_10d_everything: "Path"):
+    data = Parser(file_path=path_sun_moon_mercury_10d_everything).parse()
+    sun = data[ObservableObjectEnum.SUN]
+    nights = sun.local_date_and_time.astype("datetime64[D]")[:-1]
+    track = compute_tracks(data.values(), nights)[ObservableObjectEnum.SUN]
+    columns = decode_rows(sun.rows[:-1], "set", "azimut_set")
+    altitude, azimuth = track.degrees()
+    rows = np.arange(len(nights))
+    column = np.round((columns["set"] - 12) * 60).astype(np.intp)
+    # the set of the export is rounded to the minute
+    np.testing.assert_allclose(altitude[rows, column], standard_altitude(sun.bound_object), atol=0.2)
+    np.testing.assert_allclose(azimuth[rows, column], columns["azimut_set"], atol=2.5)
+
+
+def test_tracks_missing_first_position(path_sun_moon_mercury_10d_everything: "Path"):
+    data = Parser(file_path=path_sun_moon_mercury_10d_everything).parse()
+    mercury = data[ObservableObjectEnum.MERCURY]
+    # a "--"-cell in the first row doesn't mean the object has no right_ascension-column
+    rows = [mercury.rows[0].model_copy(update={"right_ascension": None}), *mercury.rows[1:]]
+    data[ObservableObjectEnum.MERCURY] = mercury.model_copy(update={"rows": rows})
+    nights = mercury.local_date_and_time.astype("datetime64[D]")[1:-1]
+    assert ObservableObjectEnum.MERCURY in compute_tracks(data.values(), nights)
+
+
+def test_iter_tracks(path_sun_moon_mercury_10d_everything: "Path"):
+    data = Parser(file_path=path_sun_moon_mercury_10d_everything).parse().values()
+    chunks = list(iter_tracks(data, 2024, chunk=100, resolution=timedelta(minutes=10)))
+    assert [len(chunk[ObservableObjectEnum.SUN].night) for chunk in chunks] == [100, 100, 100, 66]
+    assert all(len(chunk) == 3 for chunk in chunks)
+    whole = compute_tracks(data, chunks[1][ObservableObjectEnum.MOON].night, resolution=timedelta(minutes=10))
+    np.testing.assert_array_equal(
+        whole[ObservableObjectEnum.MOON].azimuth, chunks[1][ObservableObjectEnum.MOON].azimuth
+    )
+    assert chunks[0][ObservableObjectEnum.SUN].altitude.shape == (100, 144)
+
+    assert not np.isnan(chunks[0][ObservableObjectEnum.SUN].altitude).any()
+
+    # no extrapolation before the first row (local midnight of the 1st of january)
+    track = compute_tracks(data, ["2023-12-31"])[ObservableObjectEnum.SUN]
+    assert np.isnan(track.at(23.5)[0]).all()
+    assert not np.isnan(track.at(24.5)[0]).any()
+
+
+def test_quantize(path_sun_moon_mercury_10d_everything: "Path"):
+    data = Parser(file_path=path_sun_moon_mercury_10d_everything).parse().values()
+    (tracks,) = iter_tracks(data, 2024, chunk=366, quantize=True)
+    quantized = tracks[ObservableObjectEnum.MOON]
+    track = compute_tracks(data, quantized.night)[ObservableObjectEnum.MOON]
+    assert quantized.quantized
+    assert not track.quantized
+    assert quantized.nbytes * 2 == track.nbytes
+    assert quantized.quantize() is quantized
+
+    altitude, azimuth = quantized.degrees()
+    expected_altitude, expected_azimuth = track.degrees()
+    np.testing.assert_array_equal(np.isnan(altitude), np.isnan(expected_altitude))
+    np.testing.assert_allclose(altitude, expected_altitude, atol=ALTITUDE_QUANTUM)
+    difference = (azimuth - expected_azimuth + 180) % 360 - 180
+    assert np.nanmax(np.abs(difference)) <= AZIMUTH_QUANTUM
+
+
+def test_whats_up(path_sun_moon_mercury_10d_everything: "Path"):
+    data = Parser(file_path=path_sun_moon_mercury_10d_everything).parse().values()
+    tracks = compute_tracks(data, np.arange(np.datetime64("2024-06-01"), np.datetime64("2024-07-01")))
+    table = whats_up(tracks, 22)
+    # the sun sets after 21:00 around the summer solstice, it's below the horizon at 22:00
+    assert ObservableObjectEnum.SUN not in table
+    altitude, azimuth = table[ObservableObjectEnum.MOON]
+    assert altitude.shape == azimuth.shape == (30,)
+    assert np.nanmin(altitude) >= 0
+    assert np.isnan(altitude).any()
+    np.testing.assert_array_equal(
+        whats_up(tracks, 2, minimum_altitude=-90)[ObservableObjectEnum.MOON][0],
+        tracks[ObservableObjectEnum.MOON].at(26)[0],
+    )
+    with pytest.raises(ValueError, match="outside"):
+        tracks[ObservableObjectEnum.SUN].at(37)
+
+
+def test_tracks_in_legal_time(path_sun_moon_mercury_10d_everything: "Path"):
+    data = Parser(file_path=path_sun_moon_mercury_10d_everything).parse().values()
+    nights = ["2024-01-15", "2024-07-15"]
+    winter = compute_tracks(data, nights)[ObservableObjectEnum.MOON]
+    legal = compute_tracks(data, nights, timezone="MESZ")[ObservableObjectEnum.MOON]
+    assert winter.timezone == "MEZ"  # the export's
+    assert legal.timezone == "MESZ"
+    # 22:00 on the clock is 21:00 MEZ in summer, but the same in winter
+    np.testing.assert_array_equal(legal.at(22)[0], [winter.at(22)[0][0], winter.at(21)[0][1]])
@@ -0,0 +1,120 @@
+# standard library
+from typing import TYPE_CHECKING
+
+# third party
+import numpy as np
+import pytest
+
+# first party
+from AstronomicalAnnualCalendar.columns import decode_rows
+from AstronomicalAnnualCalendar.enums import ObservableObjectEnum
+from AstronomicalAnnualCalendar.errors import ColumnNotFoundError
+from AstronomicalAnnualCalendar.parser import Parser
+from AstronomicalAnnualCalendar.transforms import (
+    J2000,
+    change_equinox,
+    datetime64_to_julian_day,
+    datetime64_to_unix_days,
+    ecliptic_to_equatorial,
+    equatorial_to_ecliptic,
+    equatorial_to_local_horizontal,
+    horizontal_coordinates,
+    julian_centuries,
+    mean_obliquity,
+    normalized_equatorial,
+    nutation,
+    precess_equatorial,
+    unix_days_to_julian_day,
+)
+
+
+if TYPE_CHECKING:
+    # standard library
+    from pathlib import Path
+
+
+_ARCSECOND: float = 1 / 3600
+
+
+def _unit_vectors(right_ascension: np.ndarray, declination: np.ndarray) -> np.ndarray:
+    ra, dec = np.radians(right_ascension * 15), np.radians(declination)
+    return np.stack([np.cos(dec) * np.cos(ra), np.cos(dec) * np.sin(ra), np.sin(dec)], axis=-1)
+
+
+def test_julian_day():
+    # Meeus, example 7.a: 1957 Oct 4.81
+    date_and_time = np.datetime64("1957-10-04T19:26:24")
+    assert datetime64_to_julian_day(date_and_time) == pytest.approx(2436116.31)
+    assert unix_days_to_julian_day(datetime64_to_unix_days(date_and_time)) == pytest.approx(2436116.31)
+    assert datetime64_to_unix_days(np.datetime64("1970-01-02T06:00")) == 1.25
+
+
+def test_precess_equatorial():
+    # Meeus, example 21.b: theta Persei (proper motion already applied) from J2000.0 to 2028 Nov 13.19 TD
+    right_ascension, declination = precess_equatorial(41.054063 / 15, 49.227750, J2000, 2462088.69)
+    assert right_ascension * 15 == pytest.approx(41.547214, abs=1e-5)
+    assert declination == pytest.approx(49.348483, abs=1e-5)
+    back = precess_equatorial(right_ascension, declination, 2462088.69, J2000)
+    np.testing.assert_allclose(back, (41.054063 / 15, 49.227750), atol=1e-9)
+
+
+def test_nutation():
+    # Meeus, example 22.a (full theory): -3.788" and +9.443"; the four term series is good to 0.5" and 0.1"
+    nutation_in_longitude, nutation_in_obliquity = nutation(julian_centuries(2446895.5))
+    assert nutation_in_longitude == pytest.approx(-3.788 * _ARCSECOND, abs=0.5 * _ARCSECOND)
+    assert nutation_in_obliquity == pytest.approx(9.443 * _ARCSECOND, abs=0.1 * _ARCSECOND)
+
+
+def test_equatorial_to_local_horizontal():
+    # Meeus, example 13.b: venus from Washington (the azimuth measured from the north here)
+    altitude, azimuth = equatorial_to_local_horizontal(
+        347.3193375 / 15, -6.719892, np.datetime64("1987-04-10T19:21:00"), 38.921389, -77.065556
+    )
+    assert altitude == pytest.approx(15.1249, abs=1e-3)
+    assert azimuth == pytest.approx(248.0337, abs=1e-3)
+
+
+def test_ecliptic_round_trip(path_sun_moon_mercury_10d_everything: "Path"):
+    obliquity = mean_obliquity(0)  # of J2000.0
+    for data in Parser(file_path=path_sun_moon_mercury_10d_everything).parse().values():
+        columns = decode_rows(data.rows)
+        longitude, latitude = equatorial_to_ecliptic(columns["right_ascension"], columns["declination"], obliquity)
+        # the export's ecliptic latitudes deviate by up to 10" (they seem to refer to the ecliptic of date)
+        np.testing.assert_allclose(
+            (longitude - columns["ecliptic_longitude"] + 180) % 360 - 180, 0, atol=2 * _ARCSECOND
+        )
+        np.testing.assert_allclose(latitude, columns["ecliptic_latitude"], atol=15 * _ARCSECOND)
+        np.testing.assert_allclose(
+            ecliptic_to_equatorial(longitude, latitude, obliquity),
+            (columns["right_ascension"], columns["declination"]),
+            atol=1e-9,
+        )
+
+
+def test_change_equinox(path_sun_moon_mercury_10d_everything: "Path"):
+    data = Parser(file_path=path_sun_moon_mercury_10d_everything).parse([ObservableObjectEnum.MOON])[
+        ObservableObjectEnum.MOON
+    ]
+    assert data.metadata.equinox == 2000.0
+    columns = decode_rows(data.rows, "right_ascension", "declination")
+    of_date = normalized_equatorial(data)
+    # 24 years of precession: roughly 50" per year along the ecliptic
+    cosine = np.einsum("ij,ij->i", _unit_vectors(*of_date), _unit_vectors(*columns.values()))
+    assert np.degrees(np.arccos(np.clip(cosine, -1, 1))) == pytest.approx(24 * 50 * _ARCSECOND, rel=0.05)
+    np.testing.assert_allclose(
+        change_equinox(*of_date, data.date_and_time, from_equinox=None, to_equinox=2000.0),
+        tuple(columns.values()),
+        atol=1e-9,
+    )
+    np.testing.assert_array_equal(normalized_equatorial(data, 2000.0), tuple(columns.values()))
+
+    altitude, azimuth = horizontal_coordinates(data)
+    assert altitude.shape == azimuth.shape == (len(data.rows),)
+    assert np.all((altitude >= -90) & (altitude <= 90))
+    assert np.all((azimuth >= 0) & (azimuth < 360))
+
+
+def test_missing_columns(path_complete_10d: "Path"):
+    data = Parser(file_path=path_complete_10d).parse([ObservableObjectEnum.SUN])[ObservableObjectEnum.SUN]
+    with pytest.raises(ColumnNotFoundError):
+        normalized_equatorial(data)
@@ -0,0 +1,75 @@
+# standard library
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+# third party
+import numpy as np
+import pytest
+
+# first party
+from AstronomicalAnnualCalendar.columns import COLUMN_DECODERS, extract_columns
+from AstronomicalAnnualCalendar.enums import TwilightBandEnum
+from AstronomicalAnnualCalendar.models import CoordinateModel
+from AstronomicalAnnualCalendar.parser import Parser
+from AstronomicalAnnualCalendar.twilight import compute_solar_altitude_grid
+
+
+if TYPE_CHECKING:
+    # standard library
+    from pathlib import Path
+
+
+# maximum deviation in minutes; crossings close to the sun's lowest point are ill-conditioned (flat altitude curve)
+_TOLERANCE: float = 1.5
+_GRAZING_TOLERANCE: float = 15
+
+
+def test_twilight_against_sample_data(path_sun_10d: "Path"):
+    parser = Parser(file_path=path_sun_10d)
+    grid = compute_solar_altitude_grid(parser.metadata, 2024)
+    dawn, dusk = grid.crossings(TwilightBandEnum.ASTRONOMICAL.lower_altitude)
+    sunrise, sunset = grid.crossings(TwilightBandEnum.DAY.lower_altitude)
+
+    for observable_object, header, body in parser._iter_observable_objects():  # noqa: SLF001
+        columns = extract_columns(observable_object, header, body)
+        days = np.array(["-".join(date.split(".")[::-1]) for date in columns["date"]], "datetime64[D]")
+        index = (days - grid.day[0]).astype(np.intp)
+        index = index[index < len(grid.day)]
+        for field, actual in (("dawn", dawn), ("dusk", dusk), ("rise", sunrise), ("set", sunset)):
+            expected = COLUMN_DECODERS[field](columns[field])[: len(index)]
+            np.testing.assert_array_equal(np.isnan(actual[index]), np.isnan(expected), field)
+            difference = np.abs((actual[index] - expected + 12) % 24 - 12) * 60
+            assert np.nanmedian(difference) < _TOLERANCE, field
+            assert np.nanmax(difference) < _GRAZING_TOLERANCE, field
+
+
+def test_twilight_bands_and_queries():
+    grid = compute_solar_altitude_grid(CoordinateModel(lat="53°05' N", lon="7°25' O"), 2024)
+    bands = grid.bands()
+
+    assert grid.altitude.shape == (366, 1440)
+    assert grid.altitude.dtype == np.float32
+    assert bands.dtype == np.uint8
+    assert set(np.unique(bands)) == {band.value for band in TwilightBandEnum}
+    np.testing.assert_allclose(grid.hours(*TwilightBandEnum), 24)
+
+    # no astronomical night around midsummer at 53° N
+    june = grid.between("2024-06-10", "2024-07-01")
+    assert len(june.day) == 21
+    assert (june.hours(TwilightBandEnum.NIGHT) == 0).all()
+    march = grid.between("2024-03-01", "2024-04-01")
+    assert 250 < march.hours(TwilightBandEnum.NIGHT).sum() < 300
+
+    date_and_time = grid.date_and_time
+    assert date_and_time.shape == grid.altitude.shape
+    assert date_and_time[1, 90] == np.datetime64("2024-01-02T01:30")
+
+
+@pytest.mark.parametrize("minutes", [5, 15])
+def test_twilight_resolution(minutes: int):
+    fine = compute_solar_altitude_grid(CoordinateModel(lat="53°05' N", lon="7°25' O"), 2024)
+    coarse = compute_solar_altitude_grid(
+        CoordinateModel(lat="53°05' N", lon="7°25' O"), 2024, resolution=timedelta(minutes=minutes)
+    )
+    assert coarse.altitude.shape == (366, 1440 // minutes)
+    np.testing.assert_allclose(coarse.altitude, fine.altitude[:, ::minutes])
@@ -0,0 +1,98 @@
+# standard library
+from typing import TYPE_CHECKING
+
+# third party
+import numpy as np
+import pytest
+
+# first party
+from AstronomicalAnnualCalendar.enums import ObservableObjectEnum
+from AstronomicalAnnualCalendar.parser import Parser
+from AstronomicalAnnualCalendar.render import CanvasModel, VisibilityLayerModel
+from AstronomicalAnnualCalendar.visibility import above_horizon, compute_visibilities, dark_windows
+
+
+if TYPE_CHECKING:
+    # standard library
+    from pathlib import Path
+
+
+nan = np.nan
+
+
+def test_above_horizon():
+    start, stop = above_horizon(
+        [6, 20, 23, nan, nan, nan, nan],
+        [18, 4, nan, nan, 7, nan, 0],
+    )
+    np.testing.assert_array_equal(
+        start,
+        [
+            [6, nan],  # rises and sets
+            [0, 20],  # sets in the morning, rises in the evening
+            [23, nan],  # only rises
+            [0, nan],  # stays up
+            [0, nan],  # only sets
+            [nan, nan],  # stays down
+            [0, nan],  # sets at midnight
+        ],
+    )
+    np.testing.assert_array_equal(stop, [[18, nan], [4, 24], [24, nan], [24, nan], [7, nan], [nan, nan], [0, nan]])
+    # nothing known before the first event: below the horizon
+    np.testing.assert_array_equal(above_horizon([nan, 5], [nan, 9])[0], [[nan, nan], [5, nan]])
+
+
+def test_dark_windows():
+    start, stop = dark_windows([18.5, 0.5, nan, 23], [6, 2, 4, 1])
+    np.testing.assert_array_equal(start, [18.5, 24.5, nan, 23])
+    np.testing.assert_array_equal(stop, [30, 26, nan, 25])
+
+
+def test_compute_visibilities(path_complete_10d: "Path"):
+    visibilities = compute_visibilities(Parser(file_path=path_complete_10d).parse().values())
+    assert ObservableObjectEnum.SUN not in visibilities
+    assert len(visibilities) == 8
+
+    uranus = visibilities[ObservableObjectEnum.URANUS]
+    assert uranus.night[0] == np.datetime64("2024-01-01")
+    # up from 13h21m to 4h34m: from the end of the dusk (18h32m) over midnight until it sets
+    np.testing.assert_allclose(uranus.start[0], [18 + 32 / 60, nan])
+    np.testing.assert_allclose(uranus.stop[0], [24 + 4 + 34 / 60, nan])
+
+    moon = visibilities[ObservableObjectEnum.MOON]
+    # new moon on the 11th of january: up during the day only
+    assert moon.hours[1] == 0
+    assert np.all((moon.start >= 12) | np.isnan(moon.start))
+    assert np.all((moon.stop <= 36) | np.isnan(moon.stop))
+    assert np.all((moon.stop > moon.start) | np.isnan(moon.start))
+
+    summer = (uranus.night >= np.datetime64("2024-05-30")) & (uranus.night < np.datetime64("2024-07-15"))
+    for visibility in visibilities.values():
+        # the sky doesn't get astronomically dark around the summer solstice in papenburg
+        assert np.all(visibility.hours[summer] == 0)
+        assert np.all(visibility.hours <= 24)
+
+
+def test_compute_visibilities_missing_first_event(path_complete_10d: "Path"):
+    data = Parser(file_path=path_complete_10d).parse()
+    moon = data[ObservableObjectEnum.MOON]
+    # a "--"-cell in the first row doesn't mean the object has no rise-column
+    rows = [moon.rows[0].model_copy(update={"rise": None}), *moon.rows[1:]]
+    data[ObservableObjectEnum.MOON] = moon.model_copy(update={"rows": rows})
+    visibilities = compute_visibilities(data.values())
+    assert ObservableObjectEnum.MOON in visibilities
+    assert len(visibilities) == 8
+
+
+def test_compute_visibilities_without_sun(path_complete_10d: "Path"):
+    data = Parser(file_path=path_complete_10d).parse([ObservableObjectEnum.MOON]).values()
+    with pytest.raises(ValueError, match="sun"):
+        compute_visibilities(data)
+
+
+def test_visibility_layer(canvas: CanvasModel, path_complete_10d: "Path"):
+    visibilities = compute_visibilities(Parser(file_path=path_complete_10d).parse().values())
+    layer = VisibilityLayerModel.from_visibility(visibilities[ObservableObjectEnum.JUPITER])
+    raster = layer.rasterize(canvas)
+    assert raster.visible.size
+    assert layer.cache_key(canvas) != layer.model_copy(update={"alpha": 0.5}).cache_key(canvas)
@@ -0,0 +1,123 @@
+# standard library
+import gzip
+import os
+import shutil
+from datetime import timedelta
+from typing import IO, TYPE_CHECKING
+
+# third party
+import pytest
+
+# first party
+from AstronomicalAnnualCalendar import compression
+from AstronomicalAnnualCalendar import parser as parser_module
+from AstronomicalAnnualCalendar.parser import Parser
+from AstronomicalAnnualCalendar.watch import Watcher, section_digests
+
+
+if TYPE_CHECKING:
+    # standard library
+    from pathlib import Path
+
+    # first party
+    from AstronomicalAnnualCalendar.watch import CycleReportModel
+
+
+_CANVAS: dict[str, int] = {"width": 120, "height": 160, "dpi": 20}
+
+
+def _edit(path: "Path", old: str, new: str) -> None:
+    """Replace ``old`` by ``new`` and make sure the mtime moves on (coarse file system clocks)."""
+    stat = path.stat()
+    path.write_text(path.read_text("utf-8").replace(old, new, 1), "utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, max(path.stat().st_mtime_ns, stat.st_mtime_ns + 1_000_000)))
+
+
+@pytest.fixture
+def export(path_complete_10d: "Path", tmp_path: "Path") -> "Path":
+    return shutil.copy(path_complete_10d, tmp_path / path_complete_10d.name)
+
+
+def test_section_digests(export: "Path"):
+    before = section_digests(Parser(file_path=export))
+    _edit(export, "Merkur\n", "Merkur\n")  # untouched
+    assert section_digests(Parser(file_path=export)) == before
+    _edit(export, "Sa 10.02.2024  0:00:00   7h59m", "Sa 10.02.2024  0:00:00   7h58m")
+    after = section_digests(Parser(file_path=export))
+    assert [name for name in before if before[name] != after[name]] == ["Sonne"]
+
+
+def test_cycle(export: "Path", tmp_path: "Path"):
+    watcher = Watcher([export], tmp_path / "out", canvas=_CANVAS)
+    first = watcher.cycle(watcher.poll())
+    assert len(first.parsed[export]) == 9
+    assert first.outputs == [tmp_path / "out" / "complete-10d.png"]
+    assert first.outputs[0].read_bytes().startswith(b"\x89PNG")
+    misses = watcher.cache.misses
+
+    _edit(export, "Sa 10.02.2024  0:00:00   7h59m", "Sa 10.02.2024  0:00:00   7h58m")
+    second = watcher.cycle(watcher.poll())
+    assert second.parsed == {export: ["Sonne"]}
+    assert watcher.cache.misses == misses + 1  # just the sun's layer got rendered again
+    assert second.latency >= second.parse_time + second.render_time
+
+    assert watcher.poll() == set()
+
+
+def test_cycle_compressed(export: "Path", tmp_path: "Path", monkeypatch: pytest.MonkeyPatch):
+    compressed = tmp_path / f"{export.name}.gz"
+    compressed.write_bytes(gzip.compress(export.read_bytes()))
+    opened: list[object] = []
+
+    def open_decompressed(source: object) -> IO[bytes]:
+        opened.append(source)
+        return compression.open_decompressed(source)
+
+    monkeypatch.setattr(parser_module, "open_decompressed", open_decompressed)
+    watcher = Watcher([compressed], tmp_path / "out", canvas=_CANVAS)
+    report = watcher.cycle(watcher.poll())
+    assert len(report.parsed[compressed]) == 9
+    assert opened == [compressed]  # decompressed once for both the digests and the parser
+
+
+def test_invalid_save(export: "Path", tmp_path: "Path"):
+    watcher = Watcher([export], tmp_path / "out", canvas=_CANVAS)
+    (output,) = watcher.cycle(watcher.poll()).outputs
+    good = output.read_bytes()
+
+    _edit(export, "Sa 10.02.2024  0:00:00   7h59m", "Sa 10.02.2024  0:00:00   7hXXm")
+    broken = watcher.cycle(watcher.poll())
+    assert broken.parsed == {}
+    assert "invalid row(s) for 'sun'" in broken.errors[export]
+    assert broken.outputs == []
+    assert output.read_bytes() == good  # the last good output stays
+
+    _edit(export, "Sa 10.02.2024  0:00:00   7hXXm", "Sa 10.02.2024  0:00:00   7h58m")
+    fixed = watcher.cycle(watcher.poll())
+    assert fixed.errors == {}
+    assert fixed.parsed == {export: ["Sonne"]}
+    assert fixed.outputs == [output]
+    assert output.read_bytes() != good
+
+
+def test_run_debounces(export: "Path", tmp_path: "Path"):
+    edits = iter(["7h59m", "7h58m", "7h57m"])
+    previous = next(edits)
+    sleeps: list[float] = []
+
+    def sleep(seconds: float) -> None:
+        # every sleep while settling sees another write, until the edits run out
+        nonlocal previous
+        sleeps.append(seconds)
+        if (edit := next(edits, None)) is not None:
+            _edit(export, f"Sa 10.02.2024  0:00:00   {previous}", f"Sa 10.02.2024  0:00:00   {edit}")
+            previous = edit
+
+    reports: list[CycleReportModel] = []
+    watcher = Watcher(
+        [export], tmp_path, canvas=_CANVAS, debounce=timedelta(seconds=0.5), interval=timedelta(seconds=1), sleep=sleep
+    )
+    watcher.run(reports.append, cycles=1)
+    assert sleeps == [0.5, 0.5, 0.5]  # two writes during the burst, then quiet
+    assert len(reports) == 1
+    assert "7h57m" in export.read_text("utf-8")